@@ -0,0 +1,19 @@
+"""
+benchmarks for the zendriver protocol layer and automation helpers.
+
+the benchmarks run against :py:class:`benchmarks.mock_cdp.MockCDPServer`, an in-process
+CDP endpoint, so they don't need a browser. ``python -m benchmarks`` runs the suite,
+writes the results as json and compares them to an earlier run. each module can also be
+run on its own, eg:
+
+.. code-block::
+
+    python -m benchmarks --output baseline.json
+    python -m benchmarks --compare baseline.json
+    python -m benchmarks.bench_connection
+"""
+
+
+def description(doc: str) -> str:
+    """the description of a benchmark for --help: the first paragraph of its docstring"""
+    return doc.strip().split("\n\n")[0]
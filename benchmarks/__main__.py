@@ -0,0 +1,145 @@
+"""
+runs the benchmark suite and writes the results as json, optionally comparing them to
+the results of an earlier run. exits with status 1 when a benchmark regressed by more
+than the threshold.
+
+.. code-block::
+
+    python -m benchmarks --output baseline.json
+    # ... make changes ...
+    python -m benchmarks --output results.json --compare baseline.json
+
+without ``--browser`` everything runs against the mock endpoint, so the results measure
+the client side only and are comparable between machines of the same kind.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import sys
+from typing import Any, Dict, List, Optional
+
+import zendriver
+
+from . import bench_connection, bench_events, bench_import, bench_tab, description
+
+#: result fields which identify a benchmark, besides its name
+PARAMS = ("handlers", "handler", "metrics", "mode", "dom_mirror", "nodes", "pipe")
+#: result fields which are compared, and whether higher is better
+METRICS = {
+    "commands_per_second": True,
+    "events_per_second": True,
+    "calls_per_second": True,
+    "seconds_median": False,
+}
+
+
+def key(result: Dict[str, Any]) -> str:
+    """eg. tab.query_selector_all[mode=mock,nodes=1000]"""
+    params = ",".join(
+        "%s=%s" % (name, result[name]) for name in PARAMS if name in result
+    )
+    return "%s[%s]" % (result["name"], params) if params else result["name"]
+
+
+def metric(result: Dict[str, Any]) -> Optional[str]:
+    return next((name for name in METRICS if name in result), None)
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    results = [bench_import.bench_import(args.import_runs)]
+    results.extend(await bench_connection.run(args.commands, [0, 10, 100]))
+    results.append(await bench_events.bench_events(args.events))
+    results.extend(
+        await bench_tab.run(
+            args.nodes, args.calls, args.seconds, args.browser, args.startup_runs
+        )
+    )
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float
+) -> List[str]:
+    """prints the change of every benchmark in both runs, returns the regressions"""
+    before = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        name = key(result)
+        field = metric(result)
+        old = before.get(name)
+        if field is None or old is None or not old.get(field):
+            print("%-60s %12s" % (name, "new"))
+            continue
+        change = result[field] / old[field] - 1
+        if not METRICS[field]:
+            change = -change
+        status = ""
+        if change < -threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change > threshold:
+            status = "improved"
+        print("%-60s %+11.1f%% %s" % (name, change * 100, status))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--output", help="write the results to this json file")
+    parser.add_argument("--compare", help="json file of an earlier run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="percentage a benchmark may get slower before it is a regression",
+    )
+    parser.add_argument("--browser", action="store_true", help="use a local browser")
+    parser.add_argument("--quick", action="store_true", help="skip the largest sizes")
+    parser.add_argument("--import-runs", type=int, default=10)
+    parser.add_argument("--commands", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--nodes", type=int, nargs="+")
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--startup-runs", type=int, default=5)
+    args = parser.parse_args()
+    if args.nodes is None:
+        args.nodes = [1000, 10000] if args.quick else [1000, 10000, 100000]
+
+    results = asyncio.run(run(args))
+    for result in results:
+        field = metric(result)
+        if field is not None:
+            print("%-60s %14.3f %s" % (key(result), result[field], field))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "zendriver": zendriver.__version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        print()
+        regressions = compare(results, baseline, args.threshold / 100)
+        if regressions:
+            print("\n%d regression(s)" % len(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
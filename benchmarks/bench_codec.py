@@ -0,0 +1,160 @@
+"""
+measures encoding and decoding of large protocol messages with each installed json codec.
+
+by default it uses synthetic messages shaped like recorded ones: a ``DOM.getDocument``
+response with ``depth=-1``, a ``Network.getResponseBody`` response and a batch of
+``Network.requestWillBeSent`` events. recorded messages can be given instead, as a file with
+one json message per line.
+
+.. code-block::
+
+    python -m benchmarks.bench_codec
+    python -m benchmarks.bench_codec --payload recorded.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from zendriver.core.codec import CODECS, Codec
+
+from . import description
+from .bench_events import EVENT
+
+TAGS = ["div", "span", "a", "p", "li", "ul", "img", "button", "section", "input"]
+
+
+def dom_document(nodes: int, seed: int = 1) -> Dict[str, Any]:
+    """a DOM.getDocument response with a tree of roughly <nodes> nodes"""
+    rng = random.Random(seed)
+    node_id = 0
+
+    def node(depth: int, budget: int) -> Dict[str, Any]:
+        nonlocal node_id
+        node_id += 1
+        tag = rng.choice(TAGS)
+        result: Dict[str, Any] = {
+            "nodeId": node_id,
+            "parentId": node_id - 1,
+            "backendNodeId": node_id + 10_000,
+            "nodeType": 1,
+            "nodeName": tag.upper(),
+            "localName": tag,
+            "nodeValue": "",
+            "childNodeCount": 0,
+            "attributes": [
+                "class",
+                " ".join("c-%x" % rng.getrandbits(24) for _ in range(3)),
+                "data-id",
+                str(node_id),
+            ],
+        }
+        budget -= 1
+        if depth < 12 and budget > 0:
+            children = []
+            per_child = max(1, budget // rng.randint(2, 6))
+            while budget > 0:
+                children.append(node(depth + 1, min(per_child, budget)))
+                budget -= per_child
+            result["children"] = children
+            result["childNodeCount"] = len(children)
+        else:
+            node_id += 1
+            result["children"] = [
+                {
+                    "nodeId": node_id,
+                    "parentId": node_id - 1,
+                    "backendNodeId": node_id + 10_000,
+                    "nodeType": 3,
+                    "nodeName": "#text",
+                    "localName": "",
+                    "nodeValue": "lorem ipsum dolor sit amet, ünïcödé ✓ " * 2,
+                }
+            ]
+            result["childNodeCount"] = 1
+        return result
+
+    root = node(0, nodes)
+    return {"id": 12, "result": {"root": root}}
+
+
+def response_body(size: int) -> Dict[str, Any]:
+    """a Network.getResponseBody response with a base64 body of <size> bytes"""
+    body = base64.b64encode(random.Random(2).randbytes(size)).decode()
+    return {"id": 13, "result": {"body": body, "base64Encoded": True}}
+
+
+def payloads(nodes: int) -> List[Tuple[str, Any]]:
+    return [
+        ("DOM.getDocument", dom_document(nodes)),
+        ("Network.getResponseBody", response_body(8 * 2**20)),
+        ("Network.requestWillBeSent x1000", [EVENT] * 1000),
+    ]
+
+
+def bench(codec: Codec, payload: Any, seconds: float = 1.0) -> Dict[str, float]:
+    data = codec.dumps(payload)
+    text = data.decode()
+    result = {"size": len(data)}
+    for name, func, arg in (
+        ("dumps", codec.dumps, payload),
+        ("loads", codec.loads, text),
+    ):
+        runs = 0
+        start = time.perf_counter()
+        while True:
+            func(arg)
+            runs += 1
+            elapsed = time.perf_counter() - start
+            if elapsed > seconds:
+                break
+        result[name] = elapsed / runs
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--payload", help="file with one json message per line")
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload) as f:
+            messages = [json.loads(line) for line in f if line.strip()]
+        items = [(m.get("method") or "id %s" % m.get("id"), m) for m in messages]
+    else:
+        items = payloads(args.nodes)
+
+    codecs = []
+    for factory in CODECS.values():
+        try:
+            codecs.append(factory())
+        except ImportError:
+            continue
+
+    for name, payload in items:
+        for codec in codecs:
+            result = bench(codec, payload, args.seconds)
+            mib = result["size"] / 2**20
+            print(
+                "%-32s %-8s %7.2f MiB  dumps %8.2f ms (%6.0f MiB/s)  loads %8.2f ms (%6.0f MiB/s)"
+                % (
+                    name,
+                    codec.name,
+                    mib,
+                    result["dumps"] * 1000,
+                    mib / result["dumps"],
+                    result["loads"] * 1000,
+                    mib / result["loads"],
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+measures the throughput of :py:meth:`zendriver.Connection.send`, ie. how many commands
+per second a single connection can issue one after another, for a number of registered
+event handlers.
+
+.. code-block::
+
+    python -m benchmarks.bench_connection --commands 5000 --handlers 0 10 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from zendriver import cdp
+from zendriver.core.connection import Connection
+from zendriver.core.metrics import Metrics
+
+from . import description
+from .mock_cdp import MockCDPServer
+
+
+def event_types(count: int) -> List[type]:
+    """returns <count> distinct cdp event classes, spread over the cdp domains"""
+    # the domains are imported on first use, import all of them to register their events
+    for domain in cdp.util.DOMAIN_MODULES:
+        cdp.util.import_domain(domain)
+    types = list(dict.fromkeys(cdp.util._event_parsers.values()))
+    if count > len(types):
+        raise ValueError("only %d event types available" % len(types))
+    return types[:count]
+
+
+async def bench_send(
+    url: str, commands: int, handlers: int, metrics: bool = False
+) -> Dict[str, Any]:
+    connection = Connection(url)
+    if metrics:
+        connection.metrics = Metrics(connection)
+    for event_type in event_types(handlers):
+        connection.add_handler(event_type, lambda event: None)
+    try:
+        # warm up: opens the websocket and enables the domains of the handlers
+        for _ in range(10):
+            await connection.send(cdp.page.bring_to_front())
+        start = time.perf_counter()
+        for _ in range(commands):
+            await connection.send(cdp.page.bring_to_front())
+        elapsed = time.perf_counter() - start
+    finally:
+        await connection.aclose()
+    return {
+        "name": "connection.send",
+        "handlers": handlers,
+        "metrics": metrics,
+        "commands": commands,
+        "seconds": elapsed,
+        "commands_per_second": commands / elapsed,
+    }
+
+
+async def run(
+    commands: int, handlers: List[int], metrics: bool = False
+) -> List[Dict[str, Any]]:
+    results = []
+    async with MockCDPServer() as server:
+        for count in handlers:
+            results.append(
+                await bench_send(server.websocket_url, commands, count, metrics)
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--commands", type=int, default=5000)
+    parser.add_argument("--handlers", type=int, nargs="+", default=[0, 10, 100])
+    parser.add_argument("--metrics", action="store_true", help="collect metrics")
+    args = parser.parse_args()
+    for result in asyncio.run(run(args.commands, args.handlers, args.metrics)):
+        print(
+            "{name:<18} handlers={handlers:<4} metrics={metrics!s:<5} "
+            "{commands_per_second:>10.0f} commands/s".format(**result)
+        )
+
+
+if __name__ == "__main__":
+    main()
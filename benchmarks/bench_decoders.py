@@ -0,0 +1,284 @@
+"""
+checks that the cdp decoders (the ``from_json`` methods of the types, events and command
+responses) decode payloads into the expected objects, and measures how long they take.
+
+by default the payloads of a small recorded session (``fixtures/session.jsonl``) are decoded
+and compared to the stored repr and json encoding (``to_json``) of their objects
+(``fixtures/session.expected.json``). ``--update`` stores them again, after a change of the
+decoders that is meant to change them. exits with status 1 when an object differs.
+
+with ``--baseline``, the objects are compared to those of the decoders of an earlier
+revision instead, and both are timed, with the payloads of the fixture, of recordings (see
+:py:mod:`zendriver.core.recorder`), of a synthetic document of ``--nodes`` nodes and of a
+``Network.requestWillBeSent`` event.
+
+.. code-block::
+
+    python -m benchmarks.bench_decoders
+    python -m benchmarks.bench_decoders --baseline v0.5.0
+    python -m benchmarks.bench_decoders --baseline HEAD~1 --recording session.jsonl.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import enum
+import importlib
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from zendriver import cdp
+from zendriver.core.recorder import RECEIVED, SENT, read_recording
+
+from . import description
+from .bench_codec import dom_document
+from .bench_events import EVENT
+
+#: (kind, method, payload), kind being "event" or "result"
+Payload = Tuple[str, str, Dict[str, Any]]
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+#: the recording of the payloads checked by default
+FIXTURE = os.path.join(FIXTURES, "session.jsonl")
+#: the repr and json encoding of the objects of the payloads of FIXTURE
+EXPECTED = os.path.join(FIXTURES, "session.expected.json")
+
+
+def baseline_package(revision: str, directory: str) -> types.ModuleType:
+    """imports the zendriver.cdp package of a git revision, as cdp_baseline"""
+    names = subprocess.run(
+        ["git", "ls-tree", "--name-only", revision, "zendriver/cdp/"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    package = "%s/cdp_baseline" % directory
+    subprocess.run(["mkdir", "-p", package], check=True)
+    for name in names:
+        source = subprocess.run(
+            ["git", "show", "%s:%s" % (revision, name)], check=True, capture_output=True
+        ).stdout
+        with open("%s/%s" % (package, name.rsplit("/", 1)[-1]), "wb") as f:
+            f.write(source)
+    sys.path.insert(0, directory)
+    return importlib.import_module("cdp_baseline")
+
+
+def recorded_payloads(path: str) -> Iterator[Payload]:
+    """yields the events and the results of the commands of a recording"""
+    pending: Dict[Tuple[str, int], str] = {}
+    for entry in read_recording(path):
+        message = entry["m"]
+        if entry["d"] == SENT:
+            pending[(entry["c"], message["id"])] = message["method"]
+        elif entry["d"] == RECEIVED:
+            if "method" in message:
+                yield "event", message["method"], message.get("params", {})
+            elif "result" in message:
+                method = pending.pop((entry["c"], message.get("id")), None)
+                if method is not None:
+                    yield "result", method, message["result"]
+
+
+class _Argument:
+    """stands in for the arguments of a command, which are not looked at here"""
+
+    def to_json(self) -> None:
+        return None
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(())
+
+
+class Decoders:
+    """decodes payloads with the cdp package <package>"""
+
+    def __init__(self, package: types.ModuleType):
+        self.package = package
+        self.util = importlib.import_module(package.__name__ + ".util")
+        self.commands: Dict[str, Callable[..., Any]] = {}
+
+    def command(self, method: str) -> Callable[..., Any]:
+        """returns the function of a command, looking at the commands of its domain"""
+        if method not in self.commands:
+            module = self.util.import_domain(method.split(".", 1)[0])
+            for name, func in inspect.getmembers(module, inspect.isgeneratorfunction):
+                if func.__module__ != module.__name__:
+                    continue
+                signature = inspect.signature(func)
+                required = {
+                    name: _Argument()
+                    for name, parameter in signature.parameters.items()
+                    if parameter.default is inspect.Parameter.empty
+                }
+                command = next(func(**required))
+                self.commands[command["method"]] = lambda f=func, r=required: f(**r)
+        return self.commands[method]
+
+    def decode(self, kind: str, method: str, payload: Dict[str, Any]) -> Any:
+        if kind == "event":
+            return self.util.parse_json_event({"method": method, "params": payload})
+        generator = self.command(method)()
+        next(generator)
+        try:
+            generator.send(payload)
+        except StopIteration as e:
+            return e.value
+        raise RuntimeError("%s did not return after its response" % method)
+
+
+def describe(decoders: Decoders, payload: Payload) -> str:
+    """the repr of the decoded object, or of the exception decoding raised"""
+    try:
+        return repr(decoders.decode(*payload))
+    except Exception as e:
+        return "%s: %s" % (type(e).__name__, e)
+
+
+def encode(value: Any) -> Any:
+    """the json encoding of a decoded object, with to_json where there is one"""
+    # ids and headers subclass str, int and dict, and their to_json returns themselves
+    if value is None or isinstance(value, (str, int, float, enum.Enum)):
+        return value.value if isinstance(value, enum.Enum) else value
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    if hasattr(value, "to_json"):
+        return encode(value.to_json())
+    if hasattr(value, "__dataclass_fields__"):
+        # events have no to_json
+        return {
+            name: encode(getattr(value, name))
+            for name in value.__dataclass_fields__
+            if getattr(value, name) is not None
+        }
+    return value
+
+
+def expectation(decoders: Decoders, payload: Payload) -> Dict[str, Any]:
+    """what decoding <payload> gives, as stored in EXPECTED"""
+    kind, method, _ = payload
+    try:
+        value = decoders.decode(*payload)
+    except Exception as e:
+        return {
+            "kind": kind,
+            "method": method,
+            "error": "%s: %s" % (type(e).__name__, e),
+        }
+    return {"kind": kind, "method": method, "repr": repr(value), "json": encode(value)}
+
+
+def check(fixture: str, expected_path: str, update: bool) -> int:
+    """
+    compares the objects of the payloads of <fixture> to those stored in <expected_path>,
+    or stores them with <update>. returns the number of differences.
+    """
+    decoders = Decoders(cdp)
+    payloads = list(recorded_payloads(fixture))
+    actual = [expectation(decoders, payload) for payload in payloads]
+    if update:
+        with open(expected_path, "w", encoding="utf-8") as f:
+            json.dump(actual, f, indent=1, ensure_ascii=False)
+            f.write("\n")
+        print("%d payloads stored in %s" % (len(actual), expected_path))
+        return 0
+    with open(expected_path, encoding="utf-8") as f:
+        expected: List[Dict[str, Any]] = json.load(f)
+    different = 0
+    if len(expected) != len(actual):
+        print("%d payloads, %d expected" % (len(actual), len(expected)))
+        different += 1
+    for want, got in zip(expected, actual):
+        for key in ("repr", "json", "error"):
+            if want.get(key) != got.get(key):
+                different += 1
+                print(
+                    "%s %s: the %s differs\n  expected %s\n  got      %s"
+                    % (got["method"], got["kind"], key, want.get(key), got.get(key))
+                )
+    print("%d payloads, %d different" % (len(actual), different))
+    return different
+
+
+def seconds(decoders: Decoders, payloads: List[Payload], repeat: int) -> float:
+    """the shortest time decoding all payloads took"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            decoders.decode(*payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(baseline: str, payloads: List[Payload], repeat: int) -> int:
+    """
+    compares the objects of <payloads> to those of the decoders of git revision
+    <baseline>, and times both. returns the number of differences.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        old = Decoders(baseline_package(baseline, tmp))
+        new = Decoders(cdp)
+        different = []
+        decodable = []
+        for payload in payloads:
+            try:
+                expected = repr(old.decode(*payload))
+            except Exception as e:
+                expected = "%s: %s" % (type(e).__name__, e)
+            else:
+                decodable.append(payload)
+            if describe(new, payload) != expected:
+                different.append(payload)
+                print("%s %s decodes differently" % (payload[1], payload[0]))
+        before = seconds(old, decodable, repeat)
+        after = seconds(new, decodable, repeat)
+    print(
+        "%d payloads, %d different, decoded in %.3f s (%s: %.3f s, %.2fx)"
+        % (len(payloads), len(different), after, baseline, before, before / after)
+    )
+    return len(different)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument(
+        "--baseline", help="git revision of the decoders to compare to, and time"
+    )
+    parser.add_argument("--fixture", default=FIXTURE)
+    parser.add_argument("--expected", default=EXPECTED)
+    parser.add_argument(
+        "--update", action="store_true", help="store the objects of the fixture"
+    )
+    parser.add_argument("--recording", nargs="*", default=[])
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline: Optional[str] = args.baseline
+    if baseline is None:
+        different = check(args.fixture, args.expected, args.update)
+    else:
+        event: Dict[str, Any] = EVENT
+        payloads: List[Payload] = [
+            ("result", "DOM.getDocument", dom_document(args.nodes)["result"]),
+            ("event", event["method"], event["params"]),
+        ]
+        for path in [args.fixture] + args.recording:
+            payloads.extend(recorded_payloads(path))
+        different = compare(baseline, payloads, args.repeat)
+    if different:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+streams synthetic events through a :py:class:`zendriver.Connection` and reports the event
+throughput and the growth of the resident memory of the process. with ``--check``, it exits
+with an error when the memory grows by more than ``--max-growth`` MiB, or when the connection
+keeps state around for the events it received, or when a handler whose queue is full (with the
+block policy) doesn't get the response to a command it sends.
+
+``--handler`` selects how the events are received: a typed handler (parsed into
+:py:class:`cdp.network.RequestWillBeSent`), a raw handler (the message dict) or no handler
+for the streamed event at all, which shows the cost of events nobody listens to.
+
+.. code-block::
+
+    python -m benchmarks.bench_events --events 1000000 --check
+    python -m benchmarks.bench_events --events 200000 --handler raw
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import time
+from typing import Any, Dict, List
+
+from zendriver import cdp
+from zendriver.core.connection import BackpressurePolicy, Connection
+from zendriver.core.metrics import Metrics
+
+from . import description
+from .mock_cdp import MockCDPServer
+
+EVENT = {
+    "method": "Network.requestWillBeSent",
+    "params": {
+        "requestId": "1000.1",
+        "loaderId": "D3C0A5B6E3F1",
+        "documentURL": "https://example.com/",
+        "request": {
+            "url": "https://example.com/static/app.js",
+            "method": "GET",
+            "headers": {
+                "Accept": "*/*",
+                "Referer": "https://example.com/",
+                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Chrome/131.0.0.0",
+            },
+            "initialPriority": "High",
+            "referrerPolicy": "strict-origin-when-cross-origin",
+        },
+        "timestamp": 1234.5678,
+        "wallTime": 1731840000.123,
+        "initiator": {"type": "parser", "url": "https://example.com/"},
+        "redirectHasExtraInfo": False,
+        "type": "Script",
+        "frameId": "F1E2D3C4B5A6",
+        "hasUserGesture": False,
+    },
+}
+BATCH_SIZE = 10_000
+
+
+def rss() -> int:
+    """returns the resident memory of the process in bytes"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # no procfs, fall back to the peak resident memory
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+async def bench_events(
+    events: int, handler_kind: str = "typed", metrics: bool = False
+) -> Dict[str, Any]:
+    received = 0
+
+    def handler(event):
+        nonlocal received
+        received += 1
+
+    async def drain(expected: int):
+        # the response to a command is read after all events sent before it
+        await connection.send(cdp.page.bring_to_front())
+        while handler_kind != "none" and received < expected:
+            await asyncio.sleep(0.001)
+
+    async with MockCDPServer() as server:
+        connection = Connection(server.websocket_url)
+        if metrics:
+            connection.metrics = Metrics(connection)
+        if handler_kind == "typed":
+            connection.add_handler(cdp.network.RequestWillBeSent, handler)
+        elif handler_kind == "raw":
+            connection.add_handler(EVENT["method"], handler)
+        await connection.send(cdp.page.bring_to_front())
+        message = json.dumps(EVENT)
+
+        # let the first batch settle the allocations which are there to stay
+        await server.emit(message, BATCH_SIZE)
+        await drain(BATCH_SIZE)
+        rss_start = rss()
+
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        sent = BATCH_SIZE
+        while sent < events:
+            count = min(BATCH_SIZE, events - sent)
+            await server.emit(message, count)
+            sent += count
+            # don't let the socket buffers grow without bound
+            await drain(sent)
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+        rss_end = rss()
+        mapper_size = len(connection.mapper)
+        await connection.aclose()
+
+    return {
+        "name": "listener.events",
+        "handler": handler_kind,
+        "metrics": metrics,
+        "events": events,
+        "seconds": elapsed,
+        "events_per_second": (events - BATCH_SIZE) / elapsed,
+        "cpu_us_per_event": cpu / (events - BATCH_SIZE) * 1e6,
+        "rss_start": rss_start,
+        "rss_end": rss_end,
+        "rss_growth": rss_end - rss_start,
+        "mapper_size": mapper_size,
+    }
+
+
+async def check_blocked_handler(
+    queue_size: int = 5, events: int = 50, timeout: float = 5
+) -> Dict[str, Any]:
+    """
+    a handler with the block policy sends a command while its queue is full, which pauses
+    reading from the websocket. the response must arrive all the same, and the queue must
+    not grow beyond twice its size meanwhile.
+    """
+    received = 0
+    most_pending = 0
+    responded = asyncio.Event()
+    errors: List[Exception] = []
+
+    async def handler(event):
+        nonlocal received, most_pending
+        received += 1
+        most_pending = max(most_pending, connection.handler_stats()[handler]["pending"])
+        if received > 1:
+            return
+        while connection.handler_stats()[handler]["pending"] < queue_size:
+            await asyncio.sleep(0.001)
+        try:
+            await connection.send(cdp.page.bring_to_front(), timeout=timeout)
+            responded.set()
+        except Exception as e:
+            errors.append(e)
+
+    async with MockCDPServer() as server:
+        connection = Connection(server.websocket_url)
+        connection.add_handler(
+            cdp.network.RequestWillBeSent,
+            handler,
+            policy=BackpressurePolicy.BLOCK,
+            maxsize=queue_size,
+        )
+        await connection.send(cdp.page.bring_to_front())
+        start = time.perf_counter()
+        await server.emit(json.dumps(EVENT), events)
+        try:
+            await asyncio.wait_for(responded.wait(), timeout + 1)
+        except asyncio.TimeoutError:
+            pass
+        elapsed = time.perf_counter() - start
+        while (
+            responded.is_set()
+            and received + connection.handler_stats()[handler]["dropped"] < events
+        ):
+            await asyncio.sleep(0.001)
+        dropped = connection.handler_stats()[handler]["dropped"]
+        await connection.aclose()
+    return {
+        "responded": responded.is_set(),
+        "errors": errors,
+        "seconds": elapsed,
+        "received": received,
+        "dropped": dropped,
+        "most_pending": most_pending,
+        "queue_size": queue_size,
+        "events": events,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--handler", choices=("typed", "raw", "none"), default="typed")
+    parser.add_argument("--metrics", action="store_true", help="collect metrics")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--max-growth", type=float, default=32, help="MiB")
+    args = parser.parse_args()
+    if args.events <= BATCH_SIZE:
+        parser.error("--events must be larger than %d" % BATCH_SIZE)
+
+    result = asyncio.run(bench_events(args.events, args.handler, args.metrics))
+    growth = result["rss_growth"] / 2**20
+    print(
+        "{name:<18} handler={handler:<6} metrics={metrics!s:<5} {events} events "
+        "{events_per_second:>10.0f} events/s {cpu_us_per_event:>6.1f} us cpu/event".format(
+            **result
+        )
+    )
+    print(
+        "rss %.1f MiB => %.1f MiB (%+.1f MiB), %d pending transactions"
+        % (
+            result["rss_start"] / 2**20,
+            result["rss_end"] / 2**20,
+            growth,
+            result["mapper_size"],
+        )
+    )
+    if args.check:
+        blocked = asyncio.run(check_blocked_handler())
+        print(
+            "blocked handler: response %s after %.3f s, %d/%d events, %d dropped, "
+            "%d queued at most"
+            % (
+                "received" if blocked["responded"] else "missing",
+                blocked["seconds"],
+                blocked["received"],
+                blocked["events"],
+                blocked["dropped"],
+                blocked["most_pending"],
+            )
+        )
+        if not blocked["responded"]:
+            sys.exit(
+                "FAIL: a handler with a full queue didn't get a response: %s"
+                % blocked["errors"]
+            )
+        if blocked["most_pending"] > 2 * blocked["queue_size"]:
+            sys.exit("FAIL: the queue of a blocking handler grew beyond twice its size")
+        if result["mapper_size"]:
+            sys.exit(
+                "FAIL: the connection holds on to %d items" % result["mapper_size"]
+            )
+        if growth > args.max_growth:
+            sys.exit("FAIL: memory grew by %.1f MiB" % growth)
+        print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+measures the time ``import zendriver`` takes in a new interpreter, and the number of cdp
+domain modules it imports. the cdp domains are imported on first use, so ``--max-domains``
+can check that no change makes the import pull in all of them again.
+
+.. code-block::
+
+    python -m benchmarks.bench_import --runs 20
+    python -m benchmarks.bench_import --max-domains 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Any, Dict
+
+from . import description
+
+CODE = """
+import json, sys, time
+start = time.perf_counter()
+import zendriver
+elapsed = time.perf_counter() - start
+domains = [
+    name for name in sys.modules
+    if name.startswith("zendriver.cdp.") and name != "zendriver.cdp.util"
+]
+print(json.dumps({"seconds": elapsed, "domains": sorted(domains)}))
+"""
+
+
+def bench_import(runs: int) -> Dict[str, Any]:
+    durations = []
+    domains = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", CODE], check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        durations.append(result["seconds"])
+        domains = result["domains"]
+    durations.sort()
+    return {
+        "name": "import.zendriver",
+        "runs": runs,
+        "seconds_min": durations[0],
+        "seconds_median": durations[len(durations) // 2],
+        "seconds_max": durations[-1],
+        "domains": len(domains),
+        "domain_modules": domains,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--max-domains",
+        type=int,
+        help="fail when importing zendriver imports more cdp domains than this",
+    )
+    args = parser.parse_args()
+    result = bench_import(args.runs)
+    print(
+        "{name:<18} {seconds_median:>8.3f} s median ({seconds_min:.3f} - "
+        "{seconds_max:.3f}), {domains} cdp domains imported".format(**result)
+    )
+    if args.max_domains is not None and result["domains"] > args.max_domains:
+        print(
+            "importing zendriver imports %d cdp domains, more than %d: %s"
+            % (result["domains"], args.max_domains, ", ".join(result["domain_modules"]))
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+measures the memory used by the :py:class:`zendriver.cdp.dom.Node` objects of a document,
+ie. of the result of ``DOM.getDocument(-1, True)``, and the time it takes to parse it,
+and the same for a :py:class:`zendriver.core.snapshot.Snapshot` of the document.
+
+the document is a synthetic one of ``--nodes`` nodes, or the first ``DOM.getDocument``
+response found in a recording (see :py:mod:`zendriver.core.recorder`).
+
+.. code-block::
+
+    python -m benchmarks.bench_memory --nodes 100000
+    python -m benchmarks.bench_memory --recording session.jsonl.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from zendriver import cdp
+from zendriver.core.recorder import RECEIVED, SENT, read_recording
+from zendriver.core.snapshot import COMPUTED_STYLES, Snapshot
+
+from . import description
+from .bench_codec import dom_document
+
+
+def recorded_document(path: str) -> Optional[Dict[str, Any]]:
+    """returns the result of the first DOM.getDocument command in a recording"""
+    pending = set()
+    for entry in read_recording(path):
+        message = entry["m"]
+        if entry["d"] == SENT and message.get("method") == "DOM.getDocument":
+            pending.add((entry["c"], message["id"]))
+        elif entry["d"] == RECEIVED and (entry["c"], message.get("id")) in pending:
+            if "result" in message:
+                return message["result"]
+    return None
+
+
+def count_nodes(node: cdp.dom.Node) -> int:
+    count = 1
+    for child in node.children or ():
+        count += count_nodes(child)
+    for child in node.shadow_roots or ():
+        count += count_nodes(child)
+    if node.content_document:
+        count += count_nodes(node.content_document)
+    return count
+
+
+def snapshot_result(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    the result DOMSnapshot.captureSnapshot would have for a DOM.getDocument result,
+    with a layout box for every element
+    """
+    strings: List[str] = []
+    indexes: Dict[str, int] = {}
+
+    def string(value: str) -> int:
+        if value not in indexes:
+            indexes[value] = len(strings)
+            strings.append(value)
+        return indexes[value]
+
+    nodes: Dict[str, List[Any]] = {
+        "parentIndex": [],
+        "nodeType": [],
+        "nodeName": [],
+        "nodeValue": [],
+        "backendNodeId": [],
+        "attributes": [],
+    }
+    layout: Dict[str, List[Any]] = {"nodeIndex": [], "bounds": [], "styles": []}
+    styles = [string("block"), string("visible")]
+    stack = [(document["root"], -1)]
+    while stack:
+        node, parent = stack.pop()
+        index = len(nodes["nodeType"])
+        nodes["parentIndex"].append(parent)
+        nodes["nodeType"].append(node["nodeType"])
+        nodes["nodeName"].append(string(node["nodeName"]))
+        value = node.get("nodeValue")
+        nodes["nodeValue"].append(string(value) if value else -1)
+        nodes["backendNodeId"].append(node["backendNodeId"])
+        nodes["attributes"].append([string(a) for a in node.get("attributes", ())])
+        if node["nodeType"] == 1:
+            layout["nodeIndex"].append(index)
+            layout["bounds"].append([0, index * 10.0, 800, 10.0])
+            layout["styles"].append(styles)
+        for child in reversed(node.get("children", ())):
+            stack.append((child, index))
+    return {"documents": [{"nodes": nodes, "layout": layout}], "strings": strings}
+
+
+def bench_memory(document: Dict[str, Any]) -> Dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    root = cdp.dom.Node.from_json(document["root"])
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nodes = count_nodes(root)
+    return {
+        "name": "dom.node_memory",
+        "nodes": nodes,
+        "bytes": size,
+        "bytes_per_node": size / nodes,
+        "peak_bytes": peak,
+        "parse_seconds": elapsed,
+    }
+
+
+def bench_snapshot(result: Dict[str, Any]) -> Dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    snapshot = Snapshot(result["documents"], result["strings"], COMPUTED_STYLES)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the json decoded result is not part of the snapshot, but the string table is
+    size += sum(sys.getsizeof(s) for s in snapshot.strings)
+    return {
+        "name": "snapshot.memory",
+        "nodes": len(snapshot),
+        "bytes": size,
+        "bytes_per_node": size / len(snapshot),
+        "peak_bytes": peak,
+        "parse_seconds": elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--recording", help="take the document from a recording")
+    args = parser.parse_args()
+
+    if args.recording:
+        recorded = recorded_document(args.recording)
+        if recorded is None:
+            parser.error("no DOM.getDocument response in %s" % args.recording)
+        document = recorded
+    else:
+        document = dom_document(args.nodes)["result"]
+    for result in (
+        bench_memory(document),
+        bench_snapshot(snapshot_result(document)),
+    ):
+        print(
+            "{name:<18} {nodes} nodes {bytes_per_node:>8.0f} bytes/node "
+            "{bytes:>12,} bytes, parsed in {parse_seconds:.3f} s "
+            "(under tracemalloc)".format(**result)
+        )
+
+
+if __name__ == "__main__":
+    main()
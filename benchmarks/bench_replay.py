@@ -0,0 +1,156 @@
+"""
+replays a recorded session with :py:class:`zendriver.core.recorder.ReplayServer`, which
+measures the client side deterministically, without a browser or network.
+
+without ``--recording``, a tab running :py:meth:`zendriver.Tab.query_selector_all` on a
+synthetic document is recorded against the mock endpoint first, and then replayed.
+with ``--recording``, the commands of every recorded connection are sent again in recorded
+order, and the events replayed along with the responses are received by the connection.
+
+.. code-block::
+
+    python -m benchmarks.bench_replay --calls 20 --nodes 5000
+    python -m benchmarks.bench_replay --recording session.jsonl.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from zendriver import cdp
+from zendriver.core.connection import Connection, ProtocolException, _command
+from zendriver.core.metrics import Metrics
+from zendriver.core.recorder import SENT, Recorder, ReplayServer, read_recording
+from zendriver.core.tab import Tab
+
+from . import description
+from .bench_codec import dom_document
+from .mock_cdp import MockCDPServer
+
+TARGET = cdp.target.TargetInfo(
+    target_id=cdp.target.TargetID("BENCH"),
+    type_="page",
+    title="",
+    url="about:blank",
+    attached=True,
+    can_access_opener=False,
+)
+PAGE_PATH = "/devtools/page/BENCH"
+
+
+async def query_selector_all(tab: Tab, calls: int) -> int:
+    found = 0
+    for _ in range(calls):
+        found += len(await tab.query_selector_all("div"))
+    return found
+
+
+async def record_query_selector_all(path: str, calls: int, nodes: int):
+    """records a tab calling query_selector_all against the mock endpoint"""
+    document = dom_document(nodes)["result"]
+    async with MockCDPServer() as server:
+        server.responses["DOM.getDocument"] = document
+        # every 10th node of the document matches
+        server.responses["DOM.querySelectorAll"] = {
+            "nodeIds": list(range(1, nodes, 10))
+        }
+        tab = Tab(f"ws://{server.host}:{server.port}{PAGE_PATH}", target=TARGET)
+        with Recorder(path) as recorder:
+            tab.recorder = recorder
+            await query_selector_all(tab, calls)
+            await tab.aclose()
+
+
+async def bench_query_selector_all(path: str, calls: int) -> Dict[str, Any]:
+    async with ReplayServer(path) as server:
+        tab = Tab(f"ws://{server.host}:{server.port}{PAGE_PATH}", target=TARGET)
+        # warm up: opens the websocket
+        await query_selector_all(tab, 1)
+        start = time.perf_counter()
+        found = await query_selector_all(tab, calls)
+        elapsed = time.perf_counter() - start
+        await tab.aclose()
+    return {
+        "name": "replay.query_selector_all",
+        "calls": calls,
+        "elements": found,
+        "seconds": elapsed,
+        "calls_per_second": calls / elapsed,
+        "unmatched": server.unmatched,
+    }
+
+
+async def bench_recording(path: str) -> Dict[str, Any]:
+    """sends the recorded commands of each connection again, in recorded order"""
+    commands: Dict[str, List[dict]] = {}
+    for entry in read_recording(path):
+        if entry["d"] == SENT:
+            commands.setdefault(entry["c"], []).append(entry["m"])
+    async with ReplayServer(path) as server:
+        connections = {
+            label: Connection(f"ws://{server.host}:{server.port}{label}")
+            for label in commands
+        }
+        for connection in connections.values():
+            connection.metrics = Metrics(connection)
+        start = time.perf_counter()
+        sent = 0
+        for label, messages in commands.items():
+            connection = connections[label]
+            for message in messages:
+                try:
+                    await connection.send(
+                        _command(message["method"], message.get("params"))
+                    )
+                except ProtocolException:
+                    # recorded errors are replayed as well
+                    pass
+                sent += 1
+        elapsed = time.perf_counter() - start
+        events = sum(c.metrics.snapshot()["events_total"] for c in connections.values())
+        for connection in connections.values():
+            await connection.aclose()
+    return {
+        "name": "replay.recording",
+        "commands": sent,
+        "events": events,
+        "seconds": elapsed,
+        "commands_per_second": sent / elapsed,
+        "unmatched": server.unmatched,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--recording", help="recording to replay")
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--nodes", type=int, default=5000)
+    args = parser.parse_args()
+
+    if args.recording:
+        result = asyncio.run(bench_recording(args.recording))
+        print(
+            "{name:<26} {commands} commands {events} events "
+            "{commands_per_second:>10.0f} commands/s, {unmatched} unmatched".format(
+                **result
+            )
+        )
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "query_selector_all.jsonl.gz")
+        asyncio.run(record_query_selector_all(path, args.calls, args.nodes))
+        result = asyncio.run(bench_query_selector_all(path, args.calls))
+    print(
+        "{name:<26} {calls} calls {elements} elements "
+        "{calls_per_second:>8.1f} calls/s, {unmatched} unmatched".format(**result)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""
+measures the automation helpers of :py:class:`zendriver.Tab` and
+:py:class:`zendriver.Element`: query_selector_all, find_element_by_text(best_match=True),
+Element.update, Element.apply on every match against Tab.apply_all, Tab.extract and
+save_screenshot, on synthetic documents of a number of nodes.
+
+by default the tab is connected to the mock endpoint, which answers with a synthetic
+document, so only the client side is measured. with ``--browser`` the same document is
+built in a headless browser, and the browser startup time is measured as well.
+with ``--dom-mirror`` the helpers use the local copy of the document
+(:py:meth:`zendriver.Tab.enable_dom_mirror`) instead of fetching it for every call.
+
+.. code-block::
+
+    python -m benchmarks.bench_tab --nodes 1000 10000 100000
+    python -m benchmarks.bench_tab --browser --nodes 1000 10000
+    python -m benchmarks.bench_tab --dom-mirror
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import contextlib
+import json
+import random
+import tempfile
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List
+
+import zendriver
+from zendriver import cdp
+from zendriver.core.tab import Tab
+
+from . import description
+from .bench_codec import dom_document
+from .mock_cdp import MockCDPServer
+
+TARGET = cdp.target.TargetInfo(
+    target_id=cdp.target.TargetID("BENCH"),
+    type_="page",
+    title="",
+    url="about:blank",
+    attached=True,
+    can_access_opener=False,
+)
+FRAME = {
+    "id": "BENCH",
+    "loaderId": "BENCH",
+    "url": "about:blank",
+    "domainAndRegistry": "",
+    "securityOrigin": "://",
+    "mimeType": "text/html",
+    "secureContextType": "Secure",
+    "crossOriginIsolatedContextType": "NotIsolated",
+    "gatedAPIFeatures": [],
+}
+#: number of elements matching the selector, and of text nodes matching the search
+MATCHES = 100
+#: size in bytes of the captured screenshot
+SCREENSHOT_SIZE = 2**20
+
+#: builds a document like :py:func:`benchmarks.bench_codec.dom_document` in a browser
+BUILD_DOCUMENT = """
+(nodes, matches) => {
+    const tags = ["div", "span", "a", "p", "li", "ul", "button", "section"];
+    document.body.replaceChildren();
+    let made = 0;
+    const build = (parent, depth, budget) => {
+        while (budget > 0 && made < nodes) {
+            const el = document.createElement(tags[made % tags.length]);
+            el.className = "c-" + made.toString(16);
+            el.dataset.id = made;
+            parent.appendChild(el);
+            made++;
+            budget--;
+            if (depth < 12 && budget > 1) {
+                const share = Math.max(1, Math.floor(budget / (2 + (made % 5))));
+                build(el, depth + 1, share);
+                budget -= share;
+            } else {
+                el.textContent = "lorem ipsum dolor sit amet ".repeat(2);
+            }
+        }
+    };
+    build(document.body, 0, nodes);
+    // a fraction of the elements match the benchmarked selector
+    const all = document.body.querySelectorAll("*");
+    const step = Math.max(1, Math.floor(all.length / matches));
+    for (let i = 0; i < all.length; i += step) all[i].classList.add("match");
+    return all.length;
+}
+"""
+
+
+def walk(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("children", ()):
+        yield from walk(child)
+
+
+def spread(items: List[int], count: int) -> List[int]:
+    """returns <count> items evenly spread over <items>"""
+    step = max(1, len(items) // count)
+    return items[::step][:count]
+
+
+def mock_responses(nodes: int) -> Dict[str, Any]:
+    """the responses of the mock endpoint for a synthetic document of <nodes> nodes"""
+    document = dom_document(nodes)["result"]
+    elements: List[int] = []
+    texts: List[int] = []
+    for node in walk(document["root"]):
+        (texts if node["nodeType"] == 3 else elements).append(node["nodeId"])
+    text_matches = spread(texts, MATCHES)
+    # the parent of the first text node, the element the text search finds
+    parent = next(
+        node
+        for node in walk(document["root"])
+        if any(child["nodeType"] == 3 for child in node.get("children", ()))
+    )
+    found = {"nodeType": 1, "backendNodeId": parent["backendNodeId"]}
+    # and its ancestors, fetched for Element.parent
+    ancestors = [
+        {"nodeType": 1, "backendNodeId": parent["backendNodeId"] - 1},
+        {"nodeType": 9, "backendNodeId": document["root"]["backendNodeId"]},
+    ]
+
+    def call_function_on(params: Dict[str, Any]) -> Dict[str, Any]:
+        if "findText" in params["functionDeclaration"]:
+            return {
+                "result": {
+                    "type": "object",
+                    "deepSerializedValue": {
+                        "type": "array",
+                        "value": [
+                            {"type": "node", "value": found},
+                            *({"type": "node", "value": node} for node in ancestors),
+                            {"type": "null"},
+                        ],
+                    },
+                }
+            }
+        if "extract" in params["functionDeclaration"]:
+            records = [{"title": "lorem ipsum", "href": "#"}] * MATCHES
+            return {"result": {"type": "object", "value": records}}
+        # Element.apply and Tab.apply_all, with a result for every element
+        values = [{"value": "1"}] * len(params.get("arguments", ()))
+        return {"result": {"type": "object", "value": values}}
+
+    screenshot = base64.b64encode(random.Random(3).randbytes(SCREENSHOT_SIZE))
+    return {
+        # encoded once, the mock endpoint would otherwise dominate the measurement
+        "DOM.getDocument": json.dumps(document),
+        "DOM.querySelectorAll": {"nodeIds": spread(elements, MATCHES)},
+        "DOM.performSearch": {"searchId": "1", "resultCount": len(text_matches)},
+        "DOM.getSearchResults": {"nodeIds": text_matches},
+        # the isolated world of the helpers, see zendriver.core.isolated_world
+        "Page.getFrameTree": {"frameTree": {"frame": FRAME}},
+        "Page.addScriptToEvaluateOnNewDocument": {"identifier": "1"},
+        "Page.createIsolatedWorld": {"executionContextId": 1},
+        "Runtime.evaluate": {"result": {"type": "string", "value": "object"}},
+        "Runtime.callFunctionOn": call_function_on,
+        "Runtime.releaseObjectGroup": {},
+        "DOM.describeNode": {"node": parent},
+        "DOM.resolveNode": {"object": {"type": "object", "objectId": "1"}},
+        "Page.captureScreenshot": json.dumps({"data": screenshot.decode()}),
+        "Target.getTargetInfo": {"targetInfo": TARGET.to_json()},
+    }
+
+
+@contextlib.asynccontextmanager
+async def mock_tab(nodes: int) -> AsyncIterator[Tab]:
+    """a tab connected to the mock endpoint, answering with a document of <nodes> nodes"""
+    async with MockCDPServer() as server:
+        server.responses.update(mock_responses(nodes))
+        tab = Tab(
+            f"ws://{server.host}:{server.port}/devtools/page/BENCH", target=TARGET
+        )
+        try:
+            yield tab
+        finally:
+            await tab.aclose()
+
+
+@contextlib.asynccontextmanager
+async def browser_tab(browser: zendriver.Browser, nodes: int) -> AsyncIterator[Tab]:
+    """the main tab of a browser, with a document of <nodes> nodes"""
+    tab = browser.main_tab
+    await tab.get("about:blank")
+    await tab.evaluate("(%s)(%d, %d)" % (BUILD_DOCUMENT, nodes, MATCHES))
+    yield tab
+
+
+async def measure(
+    func: Callable[[], Awaitable[Any]], calls: int, seconds: float
+) -> Dict[str, Any]:
+    """
+    awaits func() up to <calls> times, or until <seconds> have passed,
+    after a call to warm up. when the warm up call alone takes longer than <seconds>,
+    it is the only call measured.
+    """
+    start = time.perf_counter()
+    await func()
+    if time.perf_counter() - start >= seconds:
+        elapsed = time.perf_counter() - start
+        return {
+            "calls": 1,
+            "seconds": elapsed,
+            "calls_per_second": 1 / elapsed,
+            "seconds_per_call": elapsed,
+        }
+    done = 0
+    start = time.perf_counter()
+    while done < calls:
+        await func()
+        done += 1
+        if time.perf_counter() - start >= seconds:
+            break
+    elapsed = time.perf_counter() - start
+    return {
+        "calls": done,
+        "seconds": elapsed,
+        "calls_per_second": done / elapsed,
+        "seconds_per_call": elapsed / done,
+    }
+
+
+async def apply_each(elements: List[zendriver.Element], js_function: str) -> List[Any]:
+    return [await elem.apply(js_function) for elem in elements]
+
+
+async def bench_tab(
+    tab: Tab, selector: str, calls: int, seconds: float
+) -> List[Dict[str, Any]]:
+    """runs the tab benchmarks on a tab with a document loaded"""
+    found = await tab.query_selector_all(selector)
+    elem = found[len(found) // 2]
+    with tempfile.TemporaryDirectory() as tmp:
+        workloads = {
+            "tab.query_selector_all": lambda: tab.query_selector_all(selector),
+            "tab.find_element_by_text": lambda: tab.find_element_by_text(
+                "lorem ipsum", best_match=True
+            ),
+            "element.update": lambda: elem.update(),
+            "element.apply (each)": lambda: apply_each(found, "(e) => e.id"),
+            "tab.apply_all": lambda: tab.apply_all(found, "(e) => e.id"),
+            "tab.extract": lambda: tab.extract(
+                {
+                    "selector": selector,
+                    "fields": {"title": {}, "href": {"attribute": "href"}},
+                }
+            ),
+            "tab.save_screenshot": lambda: tab.save_screenshot(
+                "%s/screenshot.jpg" % tmp
+            ),
+        }
+        results = []
+        for name, func in workloads.items():
+            result = await measure(func, calls, seconds)
+            results.append(dict(result, name=name, matches=len(found)))
+    return results
+
+
+async def bench_startup(runs: int, pipe: bool = False) -> Dict[str, Any]:
+    """measures starting a headless browser until its main tab can be used"""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        browser = await zendriver.start(zendriver.Config(headless=True, pipe=pipe))
+        await browser.main_tab.evaluate("1")
+        durations.append(time.perf_counter() - start)
+        await browser.stop()
+    durations.sort()
+    return {
+        "name": "browser.start",
+        "pipe": pipe,
+        "runs": runs,
+        "seconds_min": durations[0],
+        "seconds_median": durations[len(durations) // 2],
+        "seconds_max": durations[-1],
+    }
+
+
+async def run(
+    nodes: List[int],
+    calls: int = 50,
+    seconds: float = 5.0,
+    browser: bool = False,
+    startup_runs: int = 5,
+    dom_mirror: bool = False,
+) -> List[Dict[str, Any]]:
+    results = []
+    if browser:
+        for pipe in (False, True):
+            results.append(await bench_startup(startup_runs, pipe))
+        instance = await zendriver.start(headless=True)
+    try:
+        for count in nodes:
+            tab: Any
+            if browser:
+                # the mock endpoint matches any selector
+                tab, selector = browser_tab(instance, count), ".match"
+            else:
+                tab, selector = mock_tab(count), "div"
+            async with tab as t:
+                if dom_mirror:
+                    await t.enable_dom_mirror()
+                for result in await bench_tab(t, selector, calls, seconds):
+                    result["nodes"] = count
+                    result["mode"] = "browser" if browser else "mock"
+                    if dom_mirror:
+                        result["dom_mirror"] = True
+                    results.append(result)
+                if dom_mirror:
+                    await t.disable_dom_mirror()
+    finally:
+        if browser:
+            await instance.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--calls", type=int, default=50, help="maximum calls")
+    parser.add_argument(
+        "--seconds", type=float, default=5.0, help="time budget per benchmark"
+    )
+    parser.add_argument("--browser", action="store_true", help="use a local browser")
+    parser.add_argument("--startup-runs", type=int, default=5)
+    parser.add_argument(
+        "--dom-mirror", action="store_true", help="keep a local copy of the document"
+    )
+    args = parser.parse_args()
+    results = asyncio.run(
+        run(
+            args.nodes,
+            args.calls,
+            args.seconds,
+            args.browser,
+            args.startup_runs,
+            args.dom_mirror,
+        )
+    )
+    for result in results:
+        if result["name"] == "browser.start":
+            print(
+                "{name:<26} pipe={pipe!s:<5} {seconds_median:>8.3f} s median "
+                "({seconds_min:.3f} - {seconds_max:.3f})".format(**result)
+            )
+        else:
+            print(
+                "{name:<26} nodes={nodes:<7} {calls_per_second:>10.1f} calls/s "
+                "{seconds_per_call:>10.4f} s/call".format(**result)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+a minimal in-process CDP endpoint, which answers commands without a browser.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+import websockets
+
+Response = Union[
+    str, Dict[str, Any], Callable[[Dict[str, Any]], Union[str, Dict[str, Any]]]
+]
+
+
+class MockCDPServer:
+    """
+    answers every CDP command with an empty result, unless a response is registered
+    for its method in :py:attr:`responses`. a response is either a result dict, or a
+    callable receiving the command params and returning the result dict. a result can
+    also be given as a json encoded string, so large results aren't encoded every time.
+    methods in :py:attr:`unanswered` never get a response, like a hanging target.
+
+    .. code-block::
+
+        server = await MockCDPServer().start()
+        server.responses["DOM.getDocument"] = {"root": {...}}
+        connection = Connection(server.websocket_url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.responses: Dict[str, Response] = {
+            "Target.attachToTarget": self._attach_to_target,
+            "Debugger.enable": {"debuggerId": "mock"},
+        }
+        self.unanswered: Set[str] = set()
+        self.commands_received = 0
+        self.clients: List[websockets.WebSocketServerProtocol] = []
+        self._server: Optional[websockets.WebSocketServer] = None
+        self._sessions = 0
+
+    @property
+    def websocket_url(self) -> str:
+        return f"ws://{self.host}:{self.port}/devtools/browser/mock"
+
+    async def start(self) -> MockCDPServer:
+        self._server = await websockets.serve(
+            self._handler, self.host, self.port, max_size=2**28
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def emit(self, message: Union[str, Dict[str, Any]], count: int = 1):
+        """
+        send an (event) message to all connected clients, <count> times.
+
+        :param message: the event message, eg {"method": "...", "params": {...}}
+        :param count: the number of times to send it
+        """
+        if not isinstance(message, str):
+            message = json.dumps(message)
+        for client in self.clients:
+            for _ in range(count):
+                await client.send(message)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    def _attach_to_target(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._sessions += 1
+        return {"sessionId": f"session-{self._sessions}"}
+
+    async def _handler(self, websocket, path=None):
+        self.clients.append(websocket)
+        try:
+            async for frame in websocket:
+                message = json.loads(frame)
+                self.commands_received += 1
+                if message["method"] in self.unanswered:
+                    continue
+                response = self.responses.get(message["method"], {})
+                if callable(response):
+                    response = response(message.get("params") or {})
+                if isinstance(response, str):
+                    head = '{"id":%d' % message["id"]
+                    if "sessionId" in message:
+                        head += ',"sessionId":%s' % json.dumps(message["sessionId"])
+                    await websocket.send('%s,"result":%s}' % (head, response))
+                    continue
+                reply = {"id": message["id"], "result": response}
+                if "sessionId" in message:
+                    reply["sessionId"] = message["sessionId"]
+                await websocket.send(json.dumps(reply))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            self.clients.remove(websocket)
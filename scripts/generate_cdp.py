@@ -5,6 +5,7 @@
 # ]
 # ///
 import builtins
+import io
 import itertools
 import json
 import logging
@@ -12,6 +13,7 @@ import operator
 import os
 import re
 import subprocess
+import tokenize
 import typing
 import urllib.parse
 import urllib.request
@@ -45,18 +47,176 @@ INIT_HEADER = """{}
 
 """.format(SHARED_HEADER)
 
+INIT_BODY = """\
+# the domain modules are imported on first access (eg. cdp.page),
+# so that importing this package doesn't import all of the domains.
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from . import ({modules})
+
+__all__ = [{names}]
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
+"""
+
+UTIL_TEMPLATE = """\
+import dataclasses
+import importlib
+import types
+import typing
+
+T_JSON_DICT = typing.Dict[str, typing.Any]
+# JSON key => (attribute name, decoder, optional) of the members of a class
+T_MEMBERS = typing.Dict[
+    str, typing.Tuple[str, typing.Callable[[typing.Any], typing.Any], bool]
+]
+_event_parsers = dict()
+# class => (its member map, the keyword arguments of its absent optional members)
+_members: typing.Dict[type, typing.Tuple[T_MEMBERS, T_JSON_DICT]] = dict()
+
+# CDP domain => the module of this package implementing it
+DOMAIN_MODULES = {{{domain_modules}}}
+
+
+def event_class(method):
+    ''' A decorator that registers a class as an event class. '''
+    def decorate(cls):
+        _event_parsers[method] = cls
+        return cls
+    return decorate
+
+
+def identity(value: typing.Any) -> typing.Any:
+    ''' The decoder of members which can have any JSON value. '''
+    return value
+
+
+def decode_members(cls: typing.Any, json: T_JSON_DICT) -> T_JSON_DICT:
+    '''
+    Decode the members of a JSON object into the keyword arguments of a class,
+    using the member map of the class. Optional members which are absent or null
+    are None.
+    '''
+    cached = _members.get(cls)
+    if cached is None:
+        members = cls._members()
+        absent = {{name: None for name, _, optional in members.values() if optional}}
+        cached = _members[cls] = (members, absent)
+    members, kwargs = cached
+    kwargs = kwargs.copy()
+    for key, value in json.items():
+        member = members.get(key)
+        if member is None:
+            continue
+        name, decode, optional = member
+        if value is None and optional:
+            continue
+        kwargs[name] = decode(value)
+    return kwargs
+
+
+def _getstate(self):
+    return {{name: getattr(self, name) for name in self.__slots__}}
+
+
+def _setstate(self, state):
+    # also restores instances pickled before the types had __slots__
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+if typing.TYPE_CHECKING:
+    from dataclasses import dataclass as slotted_dataclass
+else:
+
+    def slotted_dataclass(cls):
+        '''
+        A decorator that turns a class into a dataclass with __slots__ instead of a
+        __dict__ per instance, like dataclass(slots=True) in Python 3.10+.
+        '''
+        cls = dataclasses.dataclass(cls)
+        names = tuple(field.name for field in dataclasses.fields(cls))
+        namespace = {{
+            key: value
+            for key, value in cls.__dict__.items()
+            if key not in names and key not in ("__dict__", "__weakref__")
+        }}
+        namespace["__slots__"] = names
+        namespace["__getstate__"] = _getstate
+        namespace["__setstate__"] = _setstate
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def import_domain(domain: str) -> typing.Optional[types.ModuleType]:
+    ''' Import the module of a CDP domain (eg. "DOMStorage"), or None if unknown. '''
+    module = DOMAIN_MODULES.get(domain)
+    if module is None:
+        return None
+    return importlib.import_module("." + module, __package__)
+
+
+def get_event_class(method: str) -> typing.Optional[typing.Type[typing.Any]]:
+    ''' Return the event class of a method, importing its domain when needed. '''
+    cls = _event_parsers.get(method)
+    if cls is None and import_domain(method.split(".", 1)[0]) is not None:
+        cls = _event_parsers.get(method)
+    return cls
+
+
+def parse_json_event(json: T_JSON_DICT) -> typing.Any:
+    ''' Parse a JSON dictionary into a CDP event. '''
+    cls = get_event_class(json['method'])
+    if cls is None:
+        raise KeyError(json['method'])
+    return cls.from_json(json['params'])
+"""
+
 MODULE_HEADER = """{}
 #
 # CDP domain: {{}}{{}}
 
 from __future__ import annotations
-import enum
-import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
-
 """.format(SHARED_HEADER)
 
+# the names a domain module may import from .util, in the order they are imported
+UTIL_NAMES = (
+    "event_class",
+    "slotted_dataclass",
+    "decode_members",
+    "identity",
+    "T_JSON_DICT",
+    "T_MEMBERS",
+)
+
+
+def generate_module_imports(code: str) -> str:
+    """the imports of the standard library and of .util which <code> uses"""
+    # the names in the code, leaving out those in strings and docstrings
+    used = {
+        token.string
+        for token in tokenize.generate_tokens(io.StringIO(code).readline)
+        if token.type == tokenize.NAME
+    }
+    lines = [f"import {module}" for module in ("enum", "typing") if module in used]
+    names = [name for name in UTIL_NAMES if name in used]
+    if names:
+        lines.append(
+            "from .util import (\n" + "".join(f"    {name},\n" for name in names) + ")"
+        )
+    return "\n".join(lines) + "\n"
+
+
 current_version = ""
 
 BACKTICK_RE = re.compile(r"`([^`]+)`(\w+)?")
@@ -150,6 +310,20 @@ def ref_to_python_domain(ref: str, domain: str) -> str:
     return ref_to_python(ref)
 
 
+# the refs (eg. "DOM.Node") of the types which are generated as classes with
+# properties. every other type is decoded by calling the type itself.
+object_types: typing.Set[str] = set()
+
+
+def ref_to_decoder(ref: str, domain: str) -> str:
+    """Return the code of a function that decodes a JSON value into a ``$ref``."""
+    py_ref = ref_to_python_domain(ref, domain)
+    qualified = ref if "." in ref else f"{domain}.{ref}"
+    if qualified in object_types:
+        return f"{py_ref}.from_json"
+    return py_ref
+
+
 class CdpPrimitiveType(Enum):
     """All of the CDP types that map directly to a Python type."""
 
@@ -167,6 +341,14 @@ class CdpPrimitiveType(Enum):
         else:
             return cls[cdp_type].value
 
+    @classmethod
+    def get_decoder(cls, cdp_type):
+        """Return the code of a function that decodes a JSON value of the CDP type."""
+        if cdp_type == "any":
+            return "identity"
+        else:
+            return cls[cdp_type].value
+
     @classmethod
     def get_constructor(cls, cdp_type, val):
         """Return the code to construct a value for a given CDP type."""
@@ -177,6 +359,29 @@ class CdpPrimitiveType(Enum):
             return f"{cons}({val})"
 
 
+def generate_from_json(class_name: str, props) -> str:
+    """
+    Generate the ``from_json()`` method of a class, and the ``_members()`` map it
+    decodes with. Only the members present in the JSON object are looked at, which
+    is faster than looking up every property, as most properties are optional.
+    The map is built on first use, when the modules it refers to are imported.
+    """
+    code = dedent(
+        f"""\
+        @classmethod
+        def from_json(cls, json: T_JSON_DICT) -> {class_name}:
+            return cls(**decode_members(cls, json))
+
+        @staticmethod
+        def _members() -> T_MEMBERS:
+            return {{
+        """
+    )
+    code += indent("\n".join(p.generate_member() for p in props), 8)
+    code += "\n" + indent("}", 4)
+    return code
+
+
 @dataclass
 class CdpItems:
     """Represents the type of a repeated item."""
@@ -282,6 +487,23 @@ class CdpProperty:
             code = assign
         return code
 
+    def generate_member(self) -> str:
+        """
+        Generate the entry of this property in the member map of its class:
+        the JSON key => (attribute name, decoder, optional).
+        """
+        if self.items:
+            if self.items.ref:
+                item = ref_to_decoder(self.items.ref, self.domain) + "(i)"
+            else:
+                item = CdpPrimitiveType.get_constructor(self.items.type, "i")
+            decoder = f"lambda v: [{item} for i in v]"
+        elif self.ref:
+            decoder = ref_to_decoder(self.ref, self.domain)
+        else:
+            decoder = CdpPrimitiveType.get_decoder(self.type)
+        return f'"{self.name}": ("{self.py_name}", {decoder}, {self.optional}),'
+
     def generate_from_json(self, dict_) -> str:
         """Generate the code that creates an instance from a JSON dict named
         ``dict_``."""
@@ -421,12 +643,12 @@ class CdpType:
         Generate a class type.
 
         Top-level types that are defined as a CDP ``object`` are turned into Python
-        dataclasses.
+        dataclasses with ``__slots__``.
         """
         # children = set()
         code = dedent(
             f"""\
-            @dataclass
+            @slotted_dataclass
             class {self.id}:\n"""
         )
         doc = docstring(self.description)
@@ -455,23 +677,10 @@ class CdpType:
         def_to_json += indent("return json", 4)
         code += indent(def_to_json, 4) + "\n\n"
 
-        # Emit from_json() method. The properties are sorted in the same order
-        # as above for readability.
-        def_from_json = dedent(
-            f"""\
-            @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> {self.id}:
-                return cls(
-        """
-        )
-        from_jsons = list()
-        for p in props:
-            from_json = p.generate_from_json(dict_="json")
-            from_jsons.append(f"{p.py_name}={from_json},")
-        def_from_json += indent("\n".join(from_jsons), 8)
-        def_from_json += "\n"
-        def_from_json += indent(")", 4)
-        code += indent(def_from_json, 4)
+        # Emit from_json() method, which decodes the members present in the
+        # JSON object using the member map. The properties are sorted in the same
+        # order as above for readability.
+        code += indent(generate_from_json(self.id, props), 4)
 
         return code
 
@@ -766,7 +975,7 @@ class CdpEvent:
         code = dedent(
             f"""\
             @event_class('{self.domain}.{self.name}')
-            @dataclass
+            @slotted_dataclass
             class {self.py_name}:"""
         )
 
@@ -786,20 +995,7 @@ class CdpEvent:
             code += "\n"
         code += indent("\n".join(p.generate_decl() for p in self.parameters), 4)
         code += "\n\n"
-        def_from_json = dedent(
-            f"""\
-            @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> {self.py_name}:
-                return cls(
-        """
-        )
-        code += indent(def_from_json, 4)
-        from_json = ",\n".join(
-            p.generate_from_json(dict_="json") for p in self.parameters
-        )
-        code += indent(from_json, 12)
-        code += "\n"
-        code += indent(")", 8)
+        code += indent(generate_from_json(self.py_name, self.parameters), 4)
         return code
 
     def get_refs(self):
@@ -851,12 +1047,6 @@ class CdpDomain:
     def generate_code(self) -> str:
         """Generate the Python module code for a given CDP domain."""
         exp = " (experimental)" if self.experimental else ""
-        code = MODULE_HEADER.format(self.domain, exp)
-        import_code = self.generate_imports()
-        if import_code:
-            code += import_code
-            code += "\n\n"
-        code += "\n"
         item_iter: typing.Iterator[typing.Union[CdpEvent, CdpCommand, CdpType]] = (
             itertools.chain(
                 iter(self.types),
@@ -864,7 +1054,16 @@ class CdpDomain:
                 iter(self.events),
             )
         )
-        code += "\n\n\n".join(item.generate_code() for item in item_iter)
+        body = "\n\n\n".join(item.generate_code() for item in item_iter)
+        code = MODULE_HEADER.format(self.domain, exp)
+        code += generate_module_imports(body)
+        code += "\n"
+        import_code = self.generate_imports()
+        if import_code:
+            code += import_code
+            code += "\n\n"
+        code += "\n"
+        code += body
         code += "\n"
         return code
 
@@ -928,19 +1127,40 @@ def parse(json_path, output_path):
 
 def generate_init(init_path, domains):
     """
-    Generate an ``__init__.py`` that exports the specified modules.
+    Generate an ``__init__.py`` that exports the specified modules. The modules are
+    imported on first attribute access, so importing the package stays cheap.
 
     :param Path init_path: a file path to create the init file in
-    :param list[tuple] modules: a list of modules each represented as tuples
-        of (name, list_of_exported_symbols)
+    :param list[CdpDomain] domains: the domains to export
     """
+    modules = [domain.module for domain in domains]
     with init_path.open("w") as init_file:
         init_file.write(INIT_HEADER)
         init_file.write(
-            "from . import ({})".format(", ".join(domain.module for domain in domains))
+            INIT_BODY.format(
+                modules=", ".join(modules),
+                names=", ".join('"{}"'.format(module) for module in modules),
+            )
         )
 
 
+def generate_util(util_path, domains):
+    """
+    Generate ``util.py``, which registers the event classes and imports the module
+    of a domain when one of its events is parsed.
+
+    :param Path util_path: a file path to create the util module in
+    :param list[CdpDomain] domains: the domains to map to their modules
+    """
+    util_path.write_text(
+        UTIL_TEMPLATE.format(
+            domain_modules=", ".join(
+                '"{}": "{}"'.format(domain.domain, domain.module) for domain in domains
+            )
+        )
+    )
+
+
 def fix_protocol_spec(domains):
     """Fixes following errors in the official CDP spec:
     1. DOM includes an erroneous $ref that refers to itself.
@@ -1003,6 +1223,10 @@ def main():
             domains.extend(parse(json_path, output_path))
         domains.sort(key=operator.attrgetter("domain"))
         fix_protocol_spec(domains)
+        for domain in domains:
+            for type_ in domain.types:
+                if type_.properties and not type_.enum:
+                    object_types.add(f"{domain.domain}.{type_.id}")
         for domain in domains:
             logger.info("Generating module: %s → %s.py", domain.domain, domain.module)
             module_path = output_path / f"{domain.module}.py"
@@ -1013,34 +1237,7 @@ def main():
         (output_path / "README.md").write_text(GENERATED_PACKAGE_NOTICE)
         (output_path / "py.typed").touch()
 
-        from textwrap import dedent
-
-        util_path = output_path / "util.py"
-        util_path.unlink(missing_ok=True)
-        util_path.touch(exist_ok=True)
-        util_path.write_text(
-            dedent(
-                """
-            import typing
-
-            T_JSON_DICT = typing.Dict[str, typing.Any]
-            _event_parsers = dict()
-
-
-            def event_class(method):
-                ''' A decorator that registers a class as an event class. '''
-                def decorate(cls):
-                    _event_parsers[method] = cls
-                    return cls
-                return decorate
-
-
-            def parse_json_event(json: T_JSON_DICT) -> typing.Any:
-                ''' Parse a JSON dictionary into a CDP event. '''
-                return _event_parsers[json['method']].from_json(json['params'])
-            """
-            )
-        )
+        generate_util(output_path / "util.py", domains)
         format(output_path)
 
     finally:
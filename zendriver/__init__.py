@@ -7,7 +7,7 @@ from zendriver.core._contradict import (
 )
 from zendriver.core.browser import Browser
 from zendriver.core.config import Config
-from zendriver.core.connection import Connection
+from zendriver.core.connection import BackpressurePolicy, Connection, ReconnectPolicy
 from zendriver.core.element import Element
 from zendriver.core.tab import Tab
 from zendriver.core.util import loop, start
@@ -25,4 +25,6 @@ __all__ = [
     "ContraDict",
     "cdict",
     "Connection",
+    "BackpressurePolicy",
+    "ReconnectPolicy",
 ]
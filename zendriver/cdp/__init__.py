@@ -3,59 +3,133 @@
 # This file is generated from the CDP specification. If you need to make
 # changes, edit the generator and regenerate all of the modules.
 
-from . import (
-    accessibility,
-    animation,
-    audits,
-    autofill,
-    background_service,
-    bluetooth_emulation,
-    browser,
-    css,
-    cache_storage,
-    cast,
-    console,
-    dom,
-    dom_debugger,
-    dom_snapshot,
-    dom_storage,
-    database,
-    debugger,
-    device_access,
-    device_orientation,
-    emulation,
-    event_breakpoints,
-    extensions,
-    fed_cm,
-    fetch,
-    file_system,
-    headless_experimental,
-    heap_profiler,
-    io,
-    indexed_db,
-    input_,
-    inspector,
-    layer_tree,
-    log,
-    media,
-    memory,
-    network,
-    overlay,
-    pwa,
-    page,
-    performance,
-    performance_timeline,
-    preload,
-    profiler,
-    runtime,
-    schema,
-    security,
-    service_worker,
-    storage,
-    system_info,
-    target,
-    tethering,
-    tracing,
-    web_audio,
-    web_authn,
-)
+# the domain modules are imported on first access (eg. cdp.page),
+# so that importing this package doesn't import all of the domains.
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from . import (
+        accessibility,
+        animation,
+        audits,
+        autofill,
+        background_service,
+        bluetooth_emulation,
+        browser,
+        css,
+        cache_storage,
+        cast,
+        console,
+        dom,
+        dom_debugger,
+        dom_snapshot,
+        dom_storage,
+        database,
+        debugger,
+        device_access,
+        device_orientation,
+        emulation,
+        event_breakpoints,
+        extensions,
+        fed_cm,
+        fetch,
+        file_system,
+        headless_experimental,
+        heap_profiler,
+        io,
+        indexed_db,
+        input_,
+        inspector,
+        layer_tree,
+        log,
+        media,
+        memory,
+        network,
+        overlay,
+        pwa,
+        page,
+        performance,
+        performance_timeline,
+        preload,
+        profiler,
+        runtime,
+        schema,
+        security,
+        service_worker,
+        storage,
+        system_info,
+        target,
+        tethering,
+        tracing,
+        web_audio,
+        web_authn,
+    )
+
+__all__ = [
+    "accessibility",
+    "animation",
+    "audits",
+    "autofill",
+    "background_service",
+    "bluetooth_emulation",
+    "browser",
+    "css",
+    "cache_storage",
+    "cast",
+    "console",
+    "dom",
+    "dom_debugger",
+    "dom_snapshot",
+    "dom_storage",
+    "database",
+    "debugger",
+    "device_access",
+    "device_orientation",
+    "emulation",
+    "event_breakpoints",
+    "extensions",
+    "fed_cm",
+    "fetch",
+    "file_system",
+    "headless_experimental",
+    "heap_profiler",
+    "io",
+    "indexed_db",
+    "input_",
+    "inspector",
+    "layer_tree",
+    "log",
+    "media",
+    "memory",
+    "network",
+    "overlay",
+    "pwa",
+    "page",
+    "performance",
+    "performance_timeline",
+    "preload",
+    "profiler",
+    "runtime",
+    "schema",
+    "security",
+    "service_worker",
+    "storage",
+    "system_info",
+    "target",
+    "tethering",
+    "tracing",
+    "web_audio",
+    "web_authn",
+]
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,8 +8,14 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    identity,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import page
@@ -107,7 +113,7 @@ class AXValueNativeSourceType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class AXValueSource:
     """
     A single source for a computed AX property.
@@ -163,36 +169,24 @@ class AXValueSource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXValueSource:
-        return cls(
-            type_=AXValueSourceType.from_json(json["type"]),
-            value=AXValue.from_json(json["value"])
-            if json.get("value", None) is not None
-            else None,
-            attribute=str(json["attribute"])
-            if json.get("attribute", None) is not None
-            else None,
-            attribute_value=AXValue.from_json(json["attributeValue"])
-            if json.get("attributeValue", None) is not None
-            else None,
-            superseded=bool(json["superseded"])
-            if json.get("superseded", None) is not None
-            else None,
-            native_source=AXValueNativeSourceType.from_json(json["nativeSource"])
-            if json.get("nativeSource", None) is not None
-            else None,
-            native_source_value=AXValue.from_json(json["nativeSourceValue"])
-            if json.get("nativeSourceValue", None) is not None
-            else None,
-            invalid=bool(json["invalid"])
-            if json.get("invalid", None) is not None
-            else None,
-            invalid_reason=str(json["invalidReason"])
-            if json.get("invalidReason", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", AXValueSourceType, False),
+            "value": ("value", AXValue.from_json, True),
+            "attribute": ("attribute", str, True),
+            "attributeValue": ("attribute_value", AXValue.from_json, True),
+            "superseded": ("superseded", bool, True),
+            "nativeSource": ("native_source", AXValueNativeSourceType, True),
+            "nativeSourceValue": ("native_source_value", AXValue.from_json, True),
+            "invalid": ("invalid", bool, True),
+            "invalidReason": ("invalid_reason", str, True),
+        }
+
+
+@slotted_dataclass
 class AXRelatedNode:
     #: The BackendNodeId of the related DOM node.
     backend_dom_node_id: dom.BackendNodeId
@@ -214,14 +208,18 @@ class AXRelatedNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXRelatedNode:
-        return cls(
-            backend_dom_node_id=dom.BackendNodeId.from_json(json["backendDOMNodeId"]),
-            idref=str(json["idref"]) if json.get("idref", None) is not None else None,
-            text=str(json["text"]) if json.get("text", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "backendDOMNodeId": ("backend_dom_node_id", dom.BackendNodeId, False),
+            "idref": ("idref", str, True),
+            "text": ("text", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AXProperty:
     #: The name of this property.
     name: AXPropertyName
@@ -237,13 +235,17 @@ class AXProperty:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXProperty:
-        return cls(
-            name=AXPropertyName.from_json(json["name"]),
-            value=AXValue.from_json(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", AXPropertyName, False),
+            "value": ("value", AXValue.from_json, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AXValue:
     """
     A single computed AX property.
@@ -274,16 +276,24 @@ class AXValue:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXValue:
-        return cls(
-            type_=AXValueType.from_json(json["type"]),
-            value=json["value"] if json.get("value", None) is not None else None,
-            related_nodes=[AXRelatedNode.from_json(i) for i in json["relatedNodes"]]
-            if json.get("relatedNodes", None) is not None
-            else None,
-            sources=[AXValueSource.from_json(i) for i in json["sources"]]
-            if json.get("sources", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", AXValueType, False),
+            "value": ("value", identity, True),
+            "relatedNodes": (
+                "related_nodes",
+                lambda v: [AXRelatedNode.from_json(i) for i in v],
+                True,
+            ),
+            "sources": (
+                "sources",
+                lambda v: [AXValueSource.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
 class AXPropertyName(enum.Enum):
@@ -346,7 +356,7 @@ class AXPropertyName(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class AXNode:
     """
     A node in the accessibility tree.
@@ -421,43 +431,33 @@ class AXNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXNode:
-        return cls(
-            node_id=AXNodeId.from_json(json["nodeId"]),
-            ignored=bool(json["ignored"]),
-            ignored_reasons=[AXProperty.from_json(i) for i in json["ignoredReasons"]]
-            if json.get("ignoredReasons", None) is not None
-            else None,
-            role=AXValue.from_json(json["role"])
-            if json.get("role", None) is not None
-            else None,
-            chrome_role=AXValue.from_json(json["chromeRole"])
-            if json.get("chromeRole", None) is not None
-            else None,
-            name=AXValue.from_json(json["name"])
-            if json.get("name", None) is not None
-            else None,
-            description=AXValue.from_json(json["description"])
-            if json.get("description", None) is not None
-            else None,
-            value=AXValue.from_json(json["value"])
-            if json.get("value", None) is not None
-            else None,
-            properties=[AXProperty.from_json(i) for i in json["properties"]]
-            if json.get("properties", None) is not None
-            else None,
-            parent_id=AXNodeId.from_json(json["parentId"])
-            if json.get("parentId", None) is not None
-            else None,
-            child_ids=[AXNodeId.from_json(i) for i in json["childIds"]]
-            if json.get("childIds", None) is not None
-            else None,
-            backend_dom_node_id=dom.BackendNodeId.from_json(json["backendDOMNodeId"])
-            if json.get("backendDOMNodeId", None) is not None
-            else None,
-            frame_id=page.FrameId.from_json(json["frameId"])
-            if json.get("frameId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", AXNodeId, False),
+            "ignored": ("ignored", bool, False),
+            "ignoredReasons": (
+                "ignored_reasons",
+                lambda v: [AXProperty.from_json(i) for i in v],
+                True,
+            ),
+            "role": ("role", AXValue.from_json, True),
+            "chromeRole": ("chrome_role", AXValue.from_json, True),
+            "name": ("name", AXValue.from_json, True),
+            "description": ("description", AXValue.from_json, True),
+            "value": ("value", AXValue.from_json, True),
+            "properties": (
+                "properties",
+                lambda v: [AXProperty.from_json(i) for i in v],
+                True,
+            ),
+            "parentId": ("parent_id", AXNodeId, True),
+            "childIds": ("child_ids", lambda v: [AXNodeId(i) for i in v], True),
+            "backendDOMNodeId": ("backend_dom_node_id", dom.BackendNodeId, True),
+            "frameId": ("frame_id", page.FrameId, True),
+        }
 
 
 def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -662,7 +662,7 @@ def query_ax_tree(
 
 
 @event_class("Accessibility.loadComplete")
-@dataclass
+@slotted_dataclass
 class LoadComplete:
     """
     **EXPERIMENTAL**
@@ -676,11 +676,17 @@ class LoadComplete:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadComplete:
-        return cls(root=AXNode.from_json(json["root"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "root": ("root", AXNode.from_json, False),
+        }
 
 
 @event_class("Accessibility.nodesUpdated")
-@dataclass
+@slotted_dataclass
 class NodesUpdated:
     """
     **EXPERIMENTAL**
@@ -693,4 +699,10 @@ class NodesUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodesUpdated:
-        return cls(nodes=[AXNode.from_json(i) for i in json["nodes"]])
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodes": ("nodes", lambda v: [AXNode.from_json(i) for i in v], False),
+        }
@@ -6,16 +6,20 @@
 # CDP domain: Animation (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import runtime
 
 
-@dataclass
+@slotted_dataclass
 class Animation:
     """
     Animation instance.
@@ -78,28 +82,30 @@ class Animation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Animation:
-        return cls(
-            id_=str(json["id"]),
-            name=str(json["name"]),
-            paused_state=bool(json["pausedState"]),
-            play_state=str(json["playState"]),
-            playback_rate=float(json["playbackRate"]),
-            start_time=float(json["startTime"]),
-            current_time=float(json["currentTime"]),
-            type_=str(json["type"]),
-            source=AnimationEffect.from_json(json["source"])
-            if json.get("source", None) is not None
-            else None,
-            css_id=str(json["cssId"]) if json.get("cssId", None) is not None else None,
-            view_or_scroll_timeline=ViewOrScrollTimeline.from_json(
-                json["viewOrScrollTimeline"]
-            )
-            if json.get("viewOrScrollTimeline", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", str, False),
+            "name": ("name", str, False),
+            "pausedState": ("paused_state", bool, False),
+            "playState": ("play_state", str, False),
+            "playbackRate": ("playback_rate", float, False),
+            "startTime": ("start_time", float, False),
+            "currentTime": ("current_time", float, False),
+            "type": ("type_", str, False),
+            "source": ("source", AnimationEffect.from_json, True),
+            "cssId": ("css_id", str, True),
+            "viewOrScrollTimeline": (
+                "view_or_scroll_timeline",
+                ViewOrScrollTimeline.from_json,
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class ViewOrScrollTimeline:
     """
     Timeline instance
@@ -139,24 +145,20 @@ class ViewOrScrollTimeline:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ViewOrScrollTimeline:
-        return cls(
-            axis=dom.ScrollOrientation.from_json(json["axis"]),
-            source_node_id=dom.BackendNodeId.from_json(json["sourceNodeId"])
-            if json.get("sourceNodeId", None) is not None
-            else None,
-            start_offset=float(json["startOffset"])
-            if json.get("startOffset", None) is not None
-            else None,
-            end_offset=float(json["endOffset"])
-            if json.get("endOffset", None) is not None
-            else None,
-            subject_node_id=dom.BackendNodeId.from_json(json["subjectNodeId"])
-            if json.get("subjectNodeId", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "axis": ("axis", dom.ScrollOrientation, False),
+            "sourceNodeId": ("source_node_id", dom.BackendNodeId, True),
+            "startOffset": ("start_offset", float, True),
+            "endOffset": ("end_offset", float, True),
+            "subjectNodeId": ("subject_node_id", dom.BackendNodeId, True),
+        }
+
+
+@slotted_dataclass
 class AnimationEffect:
     """
     AnimationEffect instance
@@ -213,25 +215,25 @@ class AnimationEffect:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationEffect:
-        return cls(
-            delay=float(json["delay"]),
-            end_delay=float(json["endDelay"]),
-            iteration_start=float(json["iterationStart"]),
-            iterations=float(json["iterations"]),
-            duration=float(json["duration"]),
-            direction=str(json["direction"]),
-            fill=str(json["fill"]),
-            easing=str(json["easing"]),
-            backend_node_id=dom.BackendNodeId.from_json(json["backendNodeId"])
-            if json.get("backendNodeId", None) is not None
-            else None,
-            keyframes_rule=KeyframesRule.from_json(json["keyframesRule"])
-            if json.get("keyframesRule", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "delay": ("delay", float, False),
+            "endDelay": ("end_delay", float, False),
+            "iterationStart": ("iteration_start", float, False),
+            "iterations": ("iterations", float, False),
+            "duration": ("duration", float, False),
+            "direction": ("direction", str, False),
+            "fill": ("fill", str, False),
+            "easing": ("easing", str, False),
+            "backendNodeId": ("backend_node_id", dom.BackendNodeId, True),
+            "keyframesRule": ("keyframes_rule", KeyframesRule.from_json, True),
+        }
+
+
+@slotted_dataclass
 class KeyframesRule:
     """
     Keyframes Rule
@@ -252,13 +254,21 @@ class KeyframesRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyframesRule:
-        return cls(
-            keyframes=[KeyframeStyle.from_json(i) for i in json["keyframes"]],
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "keyframes": (
+                "keyframes",
+                lambda v: [KeyframeStyle.from_json(i) for i in v],
+                False,
+            ),
+            "name": ("name", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class KeyframeStyle:
     """
     Keyframe Style
@@ -278,10 +288,14 @@ class KeyframeStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyframeStyle:
-        return cls(
-            offset=str(json["offset"]),
-            easing=str(json["easing"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "offset": ("offset", str, False),
+            "easing": ("easing", str, False),
+        }
 
 
 def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -447,7 +461,7 @@ def set_timing(
 
 
 @event_class("Animation.animationCanceled")
-@dataclass
+@slotted_dataclass
 class AnimationCanceled:
     """
     Event for when an animation has been cancelled.
@@ -458,11 +472,17 @@ class AnimationCanceled:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationCanceled:
-        return cls(id_=str(json["id"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", str, False),
+        }
 
 
 @event_class("Animation.animationCreated")
-@dataclass
+@slotted_dataclass
 class AnimationCreated:
     """
     Event for each animation that has been created.
@@ -473,11 +493,17 @@ class AnimationCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationCreated:
-        return cls(id_=str(json["id"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", str, False),
+        }
 
 
 @event_class("Animation.animationStarted")
-@dataclass
+@slotted_dataclass
 class AnimationStarted:
     """
     Event for animation that has been started.
@@ -488,11 +514,17 @@ class AnimationStarted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationStarted:
-        return cls(animation=Animation.from_json(json["animation"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "animation": ("animation", Animation.from_json, False),
+        }
 
 
 @event_class("Animation.animationUpdated")
-@dataclass
+@slotted_dataclass
 class AnimationUpdated:
     """
     Event for animation that has been updated.
@@ -503,4 +535,10 @@ class AnimationUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationUpdated:
-        return cls(animation=Animation.from_json(json["animation"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "animation": ("animation", Animation.from_json, False),
+        }
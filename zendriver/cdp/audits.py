@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import network
@@ -17,7 +22,7 @@ from . import page
 from . import runtime
 
 
-@dataclass
+@slotted_dataclass
 class AffectedCookie:
     """
     Information about a cookie that is affected by an inspector issue.
@@ -39,14 +44,18 @@ class AffectedCookie:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AffectedCookie:
-        return cls(
-            name=str(json["name"]),
-            path=str(json["path"]),
-            domain=str(json["domain"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "path": ("path", str, False),
+            "domain": ("domain", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AffectedRequest:
     """
     Information about a request that is affected by an inspector issue.
@@ -66,13 +75,17 @@ class AffectedRequest:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AffectedRequest:
-        return cls(
-            request_id=network.RequestId.from_json(json["requestId"]),
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", network.RequestId, False),
+            "url": ("url", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AffectedFrame:
     """
     Information about the frame affected by an inspector issue.
@@ -87,9 +100,13 @@ class AffectedFrame:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AffectedFrame:
-        return cls(
-            frame_id=page.FrameId.from_json(json["frameId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", page.FrameId, False),
+        }
 
 
 class CookieExclusionReason(enum.Enum):
@@ -161,7 +178,7 @@ class CookieOperation(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class CookieIssueDetails:
     """
     This information is currently necessary, as the front-end has a difficult
@@ -214,31 +231,28 @@ class CookieIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookieIssueDetails:
-        return cls(
-            cookie_warning_reasons=[
-                CookieWarningReason.from_json(i) for i in json["cookieWarningReasons"]
-            ],
-            cookie_exclusion_reasons=[
-                CookieExclusionReason.from_json(i)
-                for i in json["cookieExclusionReasons"]
-            ],
-            operation=CookieOperation.from_json(json["operation"]),
-            cookie=AffectedCookie.from_json(json["cookie"])
-            if json.get("cookie", None) is not None
-            else None,
-            raw_cookie_line=str(json["rawCookieLine"])
-            if json.get("rawCookieLine", None) is not None
-            else None,
-            site_for_cookies=str(json["siteForCookies"])
-            if json.get("siteForCookies", None) is not None
-            else None,
-            cookie_url=str(json["cookieUrl"])
-            if json.get("cookieUrl", None) is not None
-            else None,
-            request=AffectedRequest.from_json(json["request"])
-            if json.get("request", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "cookieWarningReasons": (
+                "cookie_warning_reasons",
+                lambda v: [CookieWarningReason(i) for i in v],
+                False,
+            ),
+            "cookieExclusionReasons": (
+                "cookie_exclusion_reasons",
+                lambda v: [CookieExclusionReason(i) for i in v],
+                False,
+            ),
+            "operation": ("operation", CookieOperation, False),
+            "cookie": ("cookie", AffectedCookie.from_json, True),
+            "rawCookieLine": ("raw_cookie_line", str, True),
+            "siteForCookies": ("site_for_cookies", str, True),
+            "cookieUrl": ("cookie_url", str, True),
+            "request": ("request", AffectedRequest.from_json, True),
+        }
 
 
 class MixedContentResolutionStatus(enum.Enum):
@@ -293,7 +307,7 @@ class MixedContentResourceType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class MixedContentIssueDetails:
     #: The way the mixed content issue is being resolved.
     resolution_status: MixedContentResolutionStatus
@@ -332,22 +346,22 @@ class MixedContentIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MixedContentIssueDetails:
-        return cls(
-            resolution_status=MixedContentResolutionStatus.from_json(
-                json["resolutionStatus"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "resolutionStatus": (
+                "resolution_status",
+                MixedContentResolutionStatus,
+                False,
             ),
-            insecure_url=str(json["insecureURL"]),
-            main_resource_url=str(json["mainResourceURL"]),
-            resource_type=MixedContentResourceType.from_json(json["resourceType"])
-            if json.get("resourceType", None) is not None
-            else None,
-            request=AffectedRequest.from_json(json["request"])
-            if json.get("request", None) is not None
-            else None,
-            frame=AffectedFrame.from_json(json["frame"])
-            if json.get("frame", None) is not None
-            else None,
-        )
+            "insecureURL": ("insecure_url", str, False),
+            "mainResourceURL": ("main_resource_url", str, False),
+            "resourceType": ("resource_type", MixedContentResourceType, True),
+            "request": ("request", AffectedRequest.from_json, True),
+            "frame": ("frame", AffectedFrame.from_json, True),
+        }
 
 
 class BlockedByResponseReason(enum.Enum):
@@ -380,7 +394,7 @@ class BlockedByResponseReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class BlockedByResponseIssueDetails:
     """
     Details for a request that has been blocked with the BLOCKED_BY_RESPONSE
@@ -408,16 +422,16 @@ class BlockedByResponseIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BlockedByResponseIssueDetails:
-        return cls(
-            request=AffectedRequest.from_json(json["request"]),
-            reason=BlockedByResponseReason.from_json(json["reason"]),
-            parent_frame=AffectedFrame.from_json(json["parentFrame"])
-            if json.get("parentFrame", None) is not None
-            else None,
-            blocked_frame=AffectedFrame.from_json(json["blockedFrame"])
-            if json.get("blockedFrame", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "request": ("request", AffectedRequest.from_json, False),
+            "reason": ("reason", BlockedByResponseReason, False),
+            "parentFrame": ("parent_frame", AffectedFrame.from_json, True),
+            "blockedFrame": ("blocked_frame", AffectedFrame.from_json, True),
+        }
 
 
 class HeavyAdResolutionStatus(enum.Enum):
@@ -445,7 +459,7 @@ class HeavyAdReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class HeavyAdIssueDetails:
     #: The resolution status, either blocking the content or warning.
     resolution: HeavyAdResolutionStatus
@@ -465,11 +479,15 @@ class HeavyAdIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HeavyAdIssueDetails:
-        return cls(
-            resolution=HeavyAdResolutionStatus.from_json(json["resolution"]),
-            reason=HeavyAdReason.from_json(json["reason"]),
-            frame=AffectedFrame.from_json(json["frame"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "resolution": ("resolution", HeavyAdResolutionStatus, False),
+            "reason": ("reason", HeavyAdReason, False),
+            "frame": ("frame", AffectedFrame.from_json, False),
+        }
 
 
 class ContentSecurityPolicyViolationType(enum.Enum):
@@ -488,7 +506,7 @@ class ContentSecurityPolicyViolationType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class SourceCodeLocation:
     url: str
 
@@ -509,17 +527,19 @@ class SourceCodeLocation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SourceCodeLocation:
-        return cls(
-            url=str(json["url"]),
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"]),
-            script_id=runtime.ScriptId.from_json(json["scriptId"])
-            if json.get("scriptId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, False),
+            "scriptId": ("script_id", runtime.ScriptId, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class ContentSecurityPolicyIssueDetails:
     #: Specific directive that is violated, causing the CSP issue.
     violated_directive: str
@@ -556,27 +576,27 @@ class ContentSecurityPolicyIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContentSecurityPolicyIssueDetails:
-        return cls(
-            violated_directive=str(json["violatedDirective"]),
-            is_report_only=bool(json["isReportOnly"]),
-            content_security_policy_violation_type=ContentSecurityPolicyViolationType.from_json(
-                json["contentSecurityPolicyViolationType"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "violatedDirective": ("violated_directive", str, False),
+            "isReportOnly": ("is_report_only", bool, False),
+            "contentSecurityPolicyViolationType": (
+                "content_security_policy_violation_type",
+                ContentSecurityPolicyViolationType,
+                False,
             ),
-            blocked_url=str(json["blockedURL"])
-            if json.get("blockedURL", None) is not None
-            else None,
-            frame_ancestor=AffectedFrame.from_json(json["frameAncestor"])
-            if json.get("frameAncestor", None) is not None
-            else None,
-            source_code_location=SourceCodeLocation.from_json(
-                json["sourceCodeLocation"]
-            )
-            if json.get("sourceCodeLocation", None) is not None
-            else None,
-            violating_node_id=dom.BackendNodeId.from_json(json["violatingNodeId"])
-            if json.get("violatingNodeId", None) is not None
-            else None,
-        )
+            "blockedURL": ("blocked_url", str, True),
+            "frameAncestor": ("frame_ancestor", AffectedFrame.from_json, True),
+            "sourceCodeLocation": (
+                "source_code_location",
+                SourceCodeLocation.from_json,
+                True,
+            ),
+            "violatingNodeId": ("violating_node_id", dom.BackendNodeId, True),
+        }
 
 
 class SharedArrayBufferIssueType(enum.Enum):
@@ -591,7 +611,7 @@ class SharedArrayBufferIssueType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class SharedArrayBufferIssueDetails:
     """
     Details for a issue arising from an SAB being instantiated in, or
@@ -613,16 +633,22 @@ class SharedArrayBufferIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedArrayBufferIssueDetails:
-        return cls(
-            source_code_location=SourceCodeLocation.from_json(
-                json["sourceCodeLocation"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sourceCodeLocation": (
+                "source_code_location",
+                SourceCodeLocation.from_json,
+                False,
             ),
-            is_warning=bool(json["isWarning"]),
-            type_=SharedArrayBufferIssueType.from_json(json["type"]),
-        )
+            "isWarning": ("is_warning", bool, False),
+            "type": ("type_", SharedArrayBufferIssueType, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class LowTextContrastIssueDetails:
     violating_node_id: dom.BackendNodeId
 
@@ -651,18 +677,22 @@ class LowTextContrastIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LowTextContrastIssueDetails:
-        return cls(
-            violating_node_id=dom.BackendNodeId.from_json(json["violatingNodeId"]),
-            violating_node_selector=str(json["violatingNodeSelector"]),
-            contrast_ratio=float(json["contrastRatio"]),
-            threshold_aa=float(json["thresholdAA"]),
-            threshold_aaa=float(json["thresholdAAA"]),
-            font_size=str(json["fontSize"]),
-            font_weight=str(json["fontWeight"]),
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "violatingNodeId": ("violating_node_id", dom.BackendNodeId, False),
+            "violatingNodeSelector": ("violating_node_selector", str, False),
+            "contrastRatio": ("contrast_ratio", float, False),
+            "thresholdAA": ("threshold_aa", float, False),
+            "thresholdAAA": ("threshold_aaa", float, False),
+            "fontSize": ("font_size", str, False),
+            "fontWeight": ("font_weight", str, False),
+        }
+
+
+@slotted_dataclass
 class CorsIssueDetails:
     """
     Details for a CORS related issue, e.g. a warning or error related to
@@ -700,29 +730,31 @@ class CorsIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CorsIssueDetails:
-        return cls(
-            cors_error_status=network.CorsErrorStatus.from_json(
-                json["corsErrorStatus"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "corsErrorStatus": (
+                "cors_error_status",
+                network.CorsErrorStatus.from_json,
+                False,
             ),
-            is_warning=bool(json["isWarning"]),
-            request=AffectedRequest.from_json(json["request"]),
-            location=SourceCodeLocation.from_json(json["location"])
-            if json.get("location", None) is not None
-            else None,
-            initiator_origin=str(json["initiatorOrigin"])
-            if json.get("initiatorOrigin", None) is not None
-            else None,
-            resource_ip_address_space=network.IPAddressSpace.from_json(
-                json["resourceIPAddressSpace"]
-            )
-            if json.get("resourceIPAddressSpace", None) is not None
-            else None,
-            client_security_state=network.ClientSecurityState.from_json(
-                json["clientSecurityState"]
-            )
-            if json.get("clientSecurityState", None) is not None
-            else None,
-        )
+            "isWarning": ("is_warning", bool, False),
+            "request": ("request", AffectedRequest.from_json, False),
+            "location": ("location", SourceCodeLocation.from_json, True),
+            "initiatorOrigin": ("initiator_origin", str, True),
+            "resourceIPAddressSpace": (
+                "resource_ip_address_space",
+                network.IPAddressSpace,
+                True,
+            ),
+            "clientSecurityState": (
+                "client_security_state",
+                network.ClientSecurityState.from_json,
+                True,
+            ),
+        }
 
 
 class AttributionReportingIssueType(enum.Enum):
@@ -795,7 +827,7 @@ class SharedDictionaryError(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingIssueDetails:
     """
     Details for issues around "Attribution Reporting API" usage.
@@ -823,23 +855,19 @@ class AttributionReportingIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingIssueDetails:
-        return cls(
-            violation_type=AttributionReportingIssueType.from_json(
-                json["violationType"]
-            ),
-            request=AffectedRequest.from_json(json["request"])
-            if json.get("request", None) is not None
-            else None,
-            violating_node_id=dom.BackendNodeId.from_json(json["violatingNodeId"])
-            if json.get("violatingNodeId", None) is not None
-            else None,
-            invalid_parameter=str(json["invalidParameter"])
-            if json.get("invalidParameter", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "violationType": ("violation_type", AttributionReportingIssueType, False),
+            "request": ("request", AffectedRequest.from_json, True),
+            "violatingNodeId": ("violating_node_id", dom.BackendNodeId, True),
+            "invalidParameter": ("invalid_parameter", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class QuirksModeIssueDetails:
     """
     Details for issues about documents in Quirks Mode
@@ -869,16 +897,20 @@ class QuirksModeIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> QuirksModeIssueDetails:
-        return cls(
-            is_limited_quirks_mode=bool(json["isLimitedQuirksMode"]),
-            document_node_id=dom.BackendNodeId.from_json(json["documentNodeId"]),
-            url=str(json["url"]),
-            frame_id=page.FrameId.from_json(json["frameId"]),
-            loader_id=network.LoaderId.from_json(json["loaderId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "isLimitedQuirksMode": ("is_limited_quirks_mode", bool, False),
+            "documentNodeId": ("document_node_id", dom.BackendNodeId, False),
+            "url": ("url", str, False),
+            "frameId": ("frame_id", page.FrameId, False),
+            "loaderId": ("loader_id", network.LoaderId, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class NavigatorUserAgentIssueDetails:
     url: str
 
@@ -893,15 +925,17 @@ class NavigatorUserAgentIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NavigatorUserAgentIssueDetails:
-        return cls(
-            url=str(json["url"]),
-            location=SourceCodeLocation.from_json(json["location"])
-            if json.get("location", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "location": ("location", SourceCodeLocation.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SharedDictionaryIssueDetails:
     shared_dictionary_error: SharedDictionaryError
 
@@ -915,12 +949,18 @@ class SharedDictionaryIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedDictionaryIssueDetails:
-        return cls(
-            shared_dictionary_error=SharedDictionaryError.from_json(
-                json["sharedDictionaryError"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sharedDictionaryError": (
+                "shared_dictionary_error",
+                SharedDictionaryError,
+                False,
             ),
-            request=AffectedRequest.from_json(json["request"]),
-        )
+            "request": ("request", AffectedRequest.from_json, False),
+        }
 
 
 class GenericIssueErrorType(enum.Enum):
@@ -952,7 +992,7 @@ class GenericIssueErrorType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class GenericIssueDetails:
     """
     Depending on the concrete errorType, different properties are set.
@@ -984,24 +1024,20 @@ class GenericIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GenericIssueDetails:
-        return cls(
-            error_type=GenericIssueErrorType.from_json(json["errorType"]),
-            frame_id=page.FrameId.from_json(json["frameId"])
-            if json.get("frameId", None) is not None
-            else None,
-            violating_node_id=dom.BackendNodeId.from_json(json["violatingNodeId"])
-            if json.get("violatingNodeId", None) is not None
-            else None,
-            violating_node_attribute=str(json["violatingNodeAttribute"])
-            if json.get("violatingNodeAttribute", None) is not None
-            else None,
-            request=AffectedRequest.from_json(json["request"])
-            if json.get("request", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "errorType": ("error_type", GenericIssueErrorType, False),
+            "frameId": ("frame_id", page.FrameId, True),
+            "violatingNodeId": ("violating_node_id", dom.BackendNodeId, True),
+            "violatingNodeAttribute": ("violating_node_attribute", str, True),
+            "request": ("request", AffectedRequest.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class DeprecationIssueDetails:
     """
     This issue tracks information needed to print a deprecation message.
@@ -1025,18 +1061,22 @@ class DeprecationIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DeprecationIssueDetails:
-        return cls(
-            source_code_location=SourceCodeLocation.from_json(
-                json["sourceCodeLocation"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sourceCodeLocation": (
+                "source_code_location",
+                SourceCodeLocation.from_json,
+                False,
             ),
-            type_=str(json["type"]),
-            affected_frame=AffectedFrame.from_json(json["affectedFrame"])
-            if json.get("affectedFrame", None) is not None
-            else None,
-        )
+            "type": ("type_", str, False),
+            "affectedFrame": ("affected_frame", AffectedFrame.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class BounceTrackingIssueDetails:
     """
     This issue warns about sites in the redirect chain of a finished navigation
@@ -1055,12 +1095,16 @@ class BounceTrackingIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BounceTrackingIssueDetails:
-        return cls(
-            tracking_sites=[str(i) for i in json["trackingSites"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "trackingSites": ("tracking_sites", lambda v: [str(i) for i in v], False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CookieDeprecationMetadataIssueDetails:
     """
     This issue warns about third-party sites that are accessing cookies on the
@@ -1088,12 +1132,16 @@ class CookieDeprecationMetadataIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookieDeprecationMetadataIssueDetails:
-        return cls(
-            allowed_sites=[str(i) for i in json["allowedSites"]],
-            opt_out_percentage=float(json["optOutPercentage"]),
-            is_opt_out_top_level=bool(json["isOptOutTopLevel"]),
-            operation=CookieOperation.from_json(json["operation"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "allowedSites": ("allowed_sites", lambda v: [str(i) for i in v], False),
+            "optOutPercentage": ("opt_out_percentage", float, False),
+            "isOptOutTopLevel": ("is_opt_out_top_level", bool, False),
+            "operation": ("operation", CookieOperation, False),
+        }
 
 
 class ClientHintIssueReason(enum.Enum):
@@ -1108,7 +1156,7 @@ class ClientHintIssueReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class FederatedAuthRequestIssueDetails:
     federated_auth_request_issue_reason: FederatedAuthRequestIssueReason
 
@@ -1121,11 +1169,17 @@ class FederatedAuthRequestIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FederatedAuthRequestIssueDetails:
-        return cls(
-            federated_auth_request_issue_reason=FederatedAuthRequestIssueReason.from_json(
-                json["federatedAuthRequestIssueReason"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "federatedAuthRequestIssueReason": (
+                "federated_auth_request_issue_reason",
+                FederatedAuthRequestIssueReason,
+                False,
             ),
-        )
+        }
 
 
 class FederatedAuthRequestIssueReason(enum.Enum):
@@ -1190,7 +1244,7 @@ class FederatedAuthRequestIssueReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class FederatedAuthUserInfoRequestIssueDetails:
     federated_auth_user_info_request_issue_reason: (
         FederatedAuthUserInfoRequestIssueReason
@@ -1205,11 +1259,17 @@ class FederatedAuthUserInfoRequestIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FederatedAuthUserInfoRequestIssueDetails:
-        return cls(
-            federated_auth_user_info_request_issue_reason=FederatedAuthUserInfoRequestIssueReason.from_json(
-                json["federatedAuthUserInfoRequestIssueReason"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "federatedAuthUserInfoRequestIssueReason": (
+                "federated_auth_user_info_request_issue_reason",
+                FederatedAuthUserInfoRequestIssueReason,
+                False,
             ),
-        )
+        }
 
 
 class FederatedAuthUserInfoRequestIssueReason(enum.Enum):
@@ -1237,7 +1297,7 @@ class FederatedAuthUserInfoRequestIssueReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ClientHintIssueDetails:
     """
     This issue tracks client hints related issues. It's used to deprecate old
@@ -1256,17 +1316,25 @@ class ClientHintIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ClientHintIssueDetails:
-        return cls(
-            source_code_location=SourceCodeLocation.from_json(
-                json["sourceCodeLocation"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sourceCodeLocation": (
+                "source_code_location",
+                SourceCodeLocation.from_json,
+                False,
             ),
-            client_hint_issue_reason=ClientHintIssueReason.from_json(
-                json["clientHintIssueReason"]
+            "clientHintIssueReason": (
+                "client_hint_issue_reason",
+                ClientHintIssueReason,
+                False,
             ),
-        )
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FailedRequestInfo:
     #: The URL that failed to load.
     url: str
@@ -1286,13 +1354,15 @@ class FailedRequestInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FailedRequestInfo:
-        return cls(
-            url=str(json["url"]),
-            failure_message=str(json["failureMessage"]),
-            request_id=network.RequestId.from_json(json["requestId"])
-            if json.get("requestId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "failureMessage": ("failure_message", str, False),
+            "requestId": ("request_id", network.RequestId, True),
+        }
 
 
 class StyleSheetLoadingIssueReason(enum.Enum):
@@ -1307,7 +1377,7 @@ class StyleSheetLoadingIssueReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class StylesheetLoadingIssueDetails:
     """
     This issue warns when a referenced stylesheet couldn't be loaded.
@@ -1334,17 +1404,27 @@ class StylesheetLoadingIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StylesheetLoadingIssueDetails:
-        return cls(
-            source_code_location=SourceCodeLocation.from_json(
-                json["sourceCodeLocation"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sourceCodeLocation": (
+                "source_code_location",
+                SourceCodeLocation.from_json,
+                False,
             ),
-            style_sheet_loading_issue_reason=StyleSheetLoadingIssueReason.from_json(
-                json["styleSheetLoadingIssueReason"]
+            "styleSheetLoadingIssueReason": (
+                "style_sheet_loading_issue_reason",
+                StyleSheetLoadingIssueReason,
+                False,
             ),
-            failed_request_info=FailedRequestInfo.from_json(json["failedRequestInfo"])
-            if json.get("failedRequestInfo", None) is not None
-            else None,
-        )
+            "failedRequestInfo": (
+                "failed_request_info",
+                FailedRequestInfo.from_json,
+                True,
+            ),
+        }
 
 
 class PropertyRuleIssueReason(enum.Enum):
@@ -1361,7 +1441,7 @@ class PropertyRuleIssueReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class PropertyRuleIssueDetails:
     """
     This issue warns about errors in property rules that lead to property
@@ -1387,17 +1467,23 @@ class PropertyRuleIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PropertyRuleIssueDetails:
-        return cls(
-            source_code_location=SourceCodeLocation.from_json(
-                json["sourceCodeLocation"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sourceCodeLocation": (
+                "source_code_location",
+                SourceCodeLocation.from_json,
+                False,
             ),
-            property_rule_issue_reason=PropertyRuleIssueReason.from_json(
-                json["propertyRuleIssueReason"]
+            "propertyRuleIssueReason": (
+                "property_rule_issue_reason",
+                PropertyRuleIssueReason,
+                False,
             ),
-            property_value=str(json["propertyValue"])
-            if json.get("propertyValue", None) is not None
-            else None,
-        )
+            "propertyValue": ("property_value", str, True),
+        }
 
 
 class InspectorIssueCode(enum.Enum):
@@ -1437,7 +1523,7 @@ class InspectorIssueCode(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class InspectorIssueDetails:
     """
     This struct holds a list of optional fields with additional information
@@ -1583,111 +1669,117 @@ class InspectorIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectorIssueDetails:
-        return cls(
-            cookie_issue_details=CookieIssueDetails.from_json(
-                json["cookieIssueDetails"]
-            )
-            if json.get("cookieIssueDetails", None) is not None
-            else None,
-            mixed_content_issue_details=MixedContentIssueDetails.from_json(
-                json["mixedContentIssueDetails"]
-            )
-            if json.get("mixedContentIssueDetails", None) is not None
-            else None,
-            blocked_by_response_issue_details=BlockedByResponseIssueDetails.from_json(
-                json["blockedByResponseIssueDetails"]
-            )
-            if json.get("blockedByResponseIssueDetails", None) is not None
-            else None,
-            heavy_ad_issue_details=HeavyAdIssueDetails.from_json(
-                json["heavyAdIssueDetails"]
-            )
-            if json.get("heavyAdIssueDetails", None) is not None
-            else None,
-            content_security_policy_issue_details=ContentSecurityPolicyIssueDetails.from_json(
-                json["contentSecurityPolicyIssueDetails"]
-            )
-            if json.get("contentSecurityPolicyIssueDetails", None) is not None
-            else None,
-            shared_array_buffer_issue_details=SharedArrayBufferIssueDetails.from_json(
-                json["sharedArrayBufferIssueDetails"]
-            )
-            if json.get("sharedArrayBufferIssueDetails", None) is not None
-            else None,
-            low_text_contrast_issue_details=LowTextContrastIssueDetails.from_json(
-                json["lowTextContrastIssueDetails"]
-            )
-            if json.get("lowTextContrastIssueDetails", None) is not None
-            else None,
-            cors_issue_details=CorsIssueDetails.from_json(json["corsIssueDetails"])
-            if json.get("corsIssueDetails", None) is not None
-            else None,
-            attribution_reporting_issue_details=AttributionReportingIssueDetails.from_json(
-                json["attributionReportingIssueDetails"]
-            )
-            if json.get("attributionReportingIssueDetails", None) is not None
-            else None,
-            quirks_mode_issue_details=QuirksModeIssueDetails.from_json(
-                json["quirksModeIssueDetails"]
-            )
-            if json.get("quirksModeIssueDetails", None) is not None
-            else None,
-            navigator_user_agent_issue_details=NavigatorUserAgentIssueDetails.from_json(
-                json["navigatorUserAgentIssueDetails"]
-            )
-            if json.get("navigatorUserAgentIssueDetails", None) is not None
-            else None,
-            generic_issue_details=GenericIssueDetails.from_json(
-                json["genericIssueDetails"]
-            )
-            if json.get("genericIssueDetails", None) is not None
-            else None,
-            deprecation_issue_details=DeprecationIssueDetails.from_json(
-                json["deprecationIssueDetails"]
-            )
-            if json.get("deprecationIssueDetails", None) is not None
-            else None,
-            client_hint_issue_details=ClientHintIssueDetails.from_json(
-                json["clientHintIssueDetails"]
-            )
-            if json.get("clientHintIssueDetails", None) is not None
-            else None,
-            federated_auth_request_issue_details=FederatedAuthRequestIssueDetails.from_json(
-                json["federatedAuthRequestIssueDetails"]
-            )
-            if json.get("federatedAuthRequestIssueDetails", None) is not None
-            else None,
-            bounce_tracking_issue_details=BounceTrackingIssueDetails.from_json(
-                json["bounceTrackingIssueDetails"]
-            )
-            if json.get("bounceTrackingIssueDetails", None) is not None
-            else None,
-            cookie_deprecation_metadata_issue_details=CookieDeprecationMetadataIssueDetails.from_json(
-                json["cookieDeprecationMetadataIssueDetails"]
-            )
-            if json.get("cookieDeprecationMetadataIssueDetails", None) is not None
-            else None,
-            stylesheet_loading_issue_details=StylesheetLoadingIssueDetails.from_json(
-                json["stylesheetLoadingIssueDetails"]
-            )
-            if json.get("stylesheetLoadingIssueDetails", None) is not None
-            else None,
-            property_rule_issue_details=PropertyRuleIssueDetails.from_json(
-                json["propertyRuleIssueDetails"]
-            )
-            if json.get("propertyRuleIssueDetails", None) is not None
-            else None,
-            federated_auth_user_info_request_issue_details=FederatedAuthUserInfoRequestIssueDetails.from_json(
-                json["federatedAuthUserInfoRequestIssueDetails"]
-            )
-            if json.get("federatedAuthUserInfoRequestIssueDetails", None) is not None
-            else None,
-            shared_dictionary_issue_details=SharedDictionaryIssueDetails.from_json(
-                json["sharedDictionaryIssueDetails"]
-            )
-            if json.get("sharedDictionaryIssueDetails", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "cookieIssueDetails": (
+                "cookie_issue_details",
+                CookieIssueDetails.from_json,
+                True,
+            ),
+            "mixedContentIssueDetails": (
+                "mixed_content_issue_details",
+                MixedContentIssueDetails.from_json,
+                True,
+            ),
+            "blockedByResponseIssueDetails": (
+                "blocked_by_response_issue_details",
+                BlockedByResponseIssueDetails.from_json,
+                True,
+            ),
+            "heavyAdIssueDetails": (
+                "heavy_ad_issue_details",
+                HeavyAdIssueDetails.from_json,
+                True,
+            ),
+            "contentSecurityPolicyIssueDetails": (
+                "content_security_policy_issue_details",
+                ContentSecurityPolicyIssueDetails.from_json,
+                True,
+            ),
+            "sharedArrayBufferIssueDetails": (
+                "shared_array_buffer_issue_details",
+                SharedArrayBufferIssueDetails.from_json,
+                True,
+            ),
+            "lowTextContrastIssueDetails": (
+                "low_text_contrast_issue_details",
+                LowTextContrastIssueDetails.from_json,
+                True,
+            ),
+            "corsIssueDetails": (
+                "cors_issue_details",
+                CorsIssueDetails.from_json,
+                True,
+            ),
+            "attributionReportingIssueDetails": (
+                "attribution_reporting_issue_details",
+                AttributionReportingIssueDetails.from_json,
+                True,
+            ),
+            "quirksModeIssueDetails": (
+                "quirks_mode_issue_details",
+                QuirksModeIssueDetails.from_json,
+                True,
+            ),
+            "navigatorUserAgentIssueDetails": (
+                "navigator_user_agent_issue_details",
+                NavigatorUserAgentIssueDetails.from_json,
+                True,
+            ),
+            "genericIssueDetails": (
+                "generic_issue_details",
+                GenericIssueDetails.from_json,
+                True,
+            ),
+            "deprecationIssueDetails": (
+                "deprecation_issue_details",
+                DeprecationIssueDetails.from_json,
+                True,
+            ),
+            "clientHintIssueDetails": (
+                "client_hint_issue_details",
+                ClientHintIssueDetails.from_json,
+                True,
+            ),
+            "federatedAuthRequestIssueDetails": (
+                "federated_auth_request_issue_details",
+                FederatedAuthRequestIssueDetails.from_json,
+                True,
+            ),
+            "bounceTrackingIssueDetails": (
+                "bounce_tracking_issue_details",
+                BounceTrackingIssueDetails.from_json,
+                True,
+            ),
+            "cookieDeprecationMetadataIssueDetails": (
+                "cookie_deprecation_metadata_issue_details",
+                CookieDeprecationMetadataIssueDetails.from_json,
+                True,
+            ),
+            "stylesheetLoadingIssueDetails": (
+                "stylesheet_loading_issue_details",
+                StylesheetLoadingIssueDetails.from_json,
+                True,
+            ),
+            "propertyRuleIssueDetails": (
+                "property_rule_issue_details",
+                PropertyRuleIssueDetails.from_json,
+                True,
+            ),
+            "federatedAuthUserInfoRequestIssueDetails": (
+                "federated_auth_user_info_request_issue_details",
+                FederatedAuthUserInfoRequestIssueDetails.from_json,
+                True,
+            ),
+            "sharedDictionaryIssueDetails": (
+                "shared_dictionary_issue_details",
+                SharedDictionaryIssueDetails.from_json,
+                True,
+            ),
+        }
 
 
 class IssueId(str):
@@ -1707,7 +1799,7 @@ class IssueId(str):
         return "IssueId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class InspectorIssue:
     """
     An inspector issue reported from the back-end.
@@ -1731,13 +1823,15 @@ class InspectorIssue:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectorIssue:
-        return cls(
-            code=InspectorIssueCode.from_json(json["code"]),
-            details=InspectorIssueDetails.from_json(json["details"]),
-            issue_id=IssueId.from_json(json["issueId"])
-            if json.get("issueId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "code": ("code", InspectorIssueCode, False),
+            "details": ("details", InspectorIssueDetails.from_json, False),
+            "issueId": ("issue_id", IssueId, True),
+        }
 
 
 def get_encoded_response(
@@ -1838,10 +1932,16 @@ def check_forms_issues() -> (
 
 
 @event_class("Audits.issueAdded")
-@dataclass
+@slotted_dataclass
 class IssueAdded:
     issue: InspectorIssue
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IssueAdded:
-        return cls(issue=InspectorIssue.from_json(json["issue"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "issue": ("issue", InspectorIssue.from_json, False),
+        }
@@ -8,14 +8,19 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import page
 
 
-@dataclass
+@slotted_dataclass
 class CreditCard:
     #: 16-digit credit card number.
     number: str
@@ -43,16 +48,20 @@ class CreditCard:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CreditCard:
-        return cls(
-            number=str(json["number"]),
-            name=str(json["name"]),
-            expiry_month=str(json["expiryMonth"]),
-            expiry_year=str(json["expiryYear"]),
-            cvc=str(json["cvc"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "number": ("number", str, False),
+            "name": ("name", str, False),
+            "expiryMonth": ("expiry_month", str, False),
+            "expiryYear": ("expiry_year", str, False),
+            "cvc": ("cvc", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AddressField:
     #: address field name, for example GIVEN_NAME.
     name: str
@@ -68,13 +77,17 @@ class AddressField:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddressField:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AddressFields:
     """
     A list of address fields.
@@ -89,12 +102,20 @@ class AddressFields:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddressFields:
-        return cls(
-            fields=[AddressField.from_json(i) for i in json["fields"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "fields": (
+                "fields",
+                lambda v: [AddressField.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Address:
     #: fields and values defining an address.
     fields: typing.List[AddressField]
@@ -106,12 +127,20 @@ class Address:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Address:
-        return cls(
-            fields=[AddressField.from_json(i) for i in json["fields"]],
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "fields": (
+                "fields",
+                lambda v: [AddressField.from_json(i) for i in v],
+                False,
+            ),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AddressUI:
     """
     Defines how an address can be displayed like in chrome://settings/addresses.
@@ -133,9 +162,17 @@ class AddressUI:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddressUI:
-        return cls(
-            address_fields=[AddressFields.from_json(i) for i in json["addressFields"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "addressFields": (
+                "address_fields",
+                lambda v: [AddressFields.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 class FillingStrategy(enum.Enum):
@@ -154,7 +191,7 @@ class FillingStrategy(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class FilledField:
     #: The type of the field, e.g text, password etc.
     html_type: str
@@ -194,16 +231,20 @@ class FilledField:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FilledField:
-        return cls(
-            html_type=str(json["htmlType"]),
-            id_=str(json["id"]),
-            name=str(json["name"]),
-            value=str(json["value"]),
-            autofill_type=str(json["autofillType"]),
-            filling_strategy=FillingStrategy.from_json(json["fillingStrategy"]),
-            frame_id=page.FrameId.from_json(json["frameId"]),
-            field_id=dom.BackendNodeId.from_json(json["fieldId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "htmlType": ("html_type", str, False),
+            "id": ("id_", str, False),
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+            "autofillType": ("autofill_type", str, False),
+            "fillingStrategy": ("filling_strategy", FillingStrategy, False),
+            "frameId": ("frame_id", page.FrameId, False),
+            "fieldId": ("field_id", dom.BackendNodeId, False),
+        }
 
 
 def trigger(
@@ -269,7 +310,7 @@ def enable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
 
 
 @event_class("Autofill.addressFormFilled")
-@dataclass
+@slotted_dataclass
 class AddressFormFilled:
     """
     Emitted when an address form is filled.
@@ -283,7 +324,15 @@ class AddressFormFilled:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddressFormFilled:
-        return cls(
-            filled_fields=[FilledField.from_json(i) for i in json["filledFields"]],
-            address_ui=AddressUI.from_json(json["addressUi"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "filledFields": (
+                "filled_fields",
+                lambda v: [FilledField.from_json(i) for i in v],
+                False,
+            ),
+            "addressUi": ("address_ui", AddressUI.from_json, False),
+        }
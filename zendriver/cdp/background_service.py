@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import network
 from . import service_worker
@@ -37,7 +42,7 @@ class ServiceName(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class EventMetadata:
     """
     A key-value pair for additional event information to pass along.
@@ -55,13 +60,17 @@ class EventMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventMetadata:
-        return cls(
-            key=str(json["key"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", str, False),
+            "value": ("value", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class BackgroundServiceEvent:
     #: Timestamp of the event (in seconds).
     timestamp: network.TimeSinceEpoch
@@ -103,18 +112,28 @@ class BackgroundServiceEvent:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackgroundServiceEvent:
-        return cls(
-            timestamp=network.TimeSinceEpoch.from_json(json["timestamp"]),
-            origin=str(json["origin"]),
-            service_worker_registration_id=service_worker.RegistrationID.from_json(
-                json["serviceWorkerRegistrationId"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "timestamp": ("timestamp", network.TimeSinceEpoch, False),
+            "origin": ("origin", str, False),
+            "serviceWorkerRegistrationId": (
+                "service_worker_registration_id",
+                service_worker.RegistrationID,
+                False,
             ),
-            service=ServiceName.from_json(json["service"]),
-            event_name=str(json["eventName"]),
-            instance_id=str(json["instanceId"]),
-            event_metadata=[EventMetadata.from_json(i) for i in json["eventMetadata"]],
-            storage_key=str(json["storageKey"]),
-        )
+            "service": ("service", ServiceName, False),
+            "eventName": ("event_name", str, False),
+            "instanceId": ("instance_id", str, False),
+            "eventMetadata": (
+                "event_metadata",
+                lambda v: [EventMetadata.from_json(i) for i in v],
+                False,
+            ),
+            "storageKey": ("storage_key", str, False),
+        }
 
 
 def start_observing(
@@ -188,7 +207,7 @@ def clear_events(
 
 
 @event_class("BackgroundService.recordingStateChanged")
-@dataclass
+@slotted_dataclass
 class RecordingStateChanged:
     """
     Called when the recording state for the service has been updated.
@@ -199,14 +218,18 @@ class RecordingStateChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RecordingStateChanged:
-        return cls(
-            is_recording=bool(json["isRecording"]),
-            service=ServiceName.from_json(json["service"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "isRecording": ("is_recording", bool, False),
+            "service": ("service", ServiceName, False),
+        }
 
 
 @event_class("BackgroundService.backgroundServiceEventReceived")
-@dataclass
+@slotted_dataclass
 class BackgroundServiceEventReceived:
     """
     Called with all existing backgroundServiceEvents when enabled, and all new
@@ -217,8 +240,14 @@ class BackgroundServiceEventReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackgroundServiceEventReceived:
-        return cls(
-            background_service_event=BackgroundServiceEvent.from_json(
-                json["backgroundServiceEvent"]
-            )
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "backgroundServiceEvent": (
+                "background_service_event",
+                BackgroundServiceEvent.from_json,
+                False,
+            ),
+        }
@@ -8,8 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class CentralState(enum.Enum):
@@ -29,7 +33,7 @@ class CentralState(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ManufacturerData:
     """
     Stores the manufacturer data
@@ -51,13 +55,17 @@ class ManufacturerData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ManufacturerData:
-        return cls(
-            key=int(json["key"]),
-            data=str(json["data"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", int, False),
+            "data": ("data", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class ScanRecord:
     """
     Stores the byte data of the advertisement packet sent by a Bluetooth device.
@@ -93,26 +101,24 @@ class ScanRecord:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScanRecord:
-        return cls(
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-            uuids=[str(i) for i in json["uuids"]]
-            if json.get("uuids", None) is not None
-            else None,
-            appearance=int(json["appearance"])
-            if json.get("appearance", None) is not None
-            else None,
-            tx_power=int(json["txPower"])
-            if json.get("txPower", None) is not None
-            else None,
-            manufacturer_data=[
-                ManufacturerData.from_json(i) for i in json["manufacturerData"]
-            ]
-            if json.get("manufacturerData", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, True),
+            "uuids": ("uuids", lambda v: [str(i) for i in v], True),
+            "appearance": ("appearance", int, True),
+            "txPower": ("tx_power", int, True),
+            "manufacturerData": (
+                "manufacturer_data",
+                lambda v: [ManufacturerData.from_json(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class ScanEntry:
     """
     Stores the advertisement packet information that is sent by a Bluetooth device.
@@ -133,11 +139,15 @@ class ScanEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScanEntry:
-        return cls(
-            device_address=str(json["deviceAddress"]),
-            rssi=int(json["rssi"]),
-            scan_record=ScanRecord.from_json(json["scanRecord"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "deviceAddress": ("device_address", str, False),
+            "rssi": ("rssi", int, False),
+            "scanRecord": ("scan_record", ScanRecord.from_json, False),
+        }
 
 
 def enable(state: CentralState) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
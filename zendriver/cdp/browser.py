@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import page
 from . import target
@@ -57,7 +62,7 @@ class WindowState(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class Bounds:
     """
     Browser window bounds information
@@ -94,17 +99,17 @@ class Bounds:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Bounds:
-        return cls(
-            left=int(json["left"]) if json.get("left", None) is not None else None,
-            top=int(json["top"]) if json.get("top", None) is not None else None,
-            width=int(json["width"]) if json.get("width", None) is not None else None,
-            height=int(json["height"])
-            if json.get("height", None) is not None
-            else None,
-            window_state=WindowState.from_json(json["windowState"])
-            if json.get("windowState", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "left": ("left", int, True),
+            "top": ("top", int, True),
+            "width": ("width", int, True),
+            "height": ("height", int, True),
+            "windowState": ("window_state", WindowState, True),
+        }
 
 
 class PermissionType(enum.Enum):
@@ -160,7 +165,7 @@ class PermissionSetting(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class PermissionDescriptor:
     """
     Definition of PermissionDescriptor defined in the Permissions API:
@@ -204,22 +209,18 @@ class PermissionDescriptor:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PermissionDescriptor:
-        return cls(
-            name=str(json["name"]),
-            sysex=bool(json["sysex"]) if json.get("sysex", None) is not None else None,
-            user_visible_only=bool(json["userVisibleOnly"])
-            if json.get("userVisibleOnly", None) is not None
-            else None,
-            allow_without_sanitization=bool(json["allowWithoutSanitization"])
-            if json.get("allowWithoutSanitization", None) is not None
-            else None,
-            allow_without_gesture=bool(json["allowWithoutGesture"])
-            if json.get("allowWithoutGesture", None) is not None
-            else None,
-            pan_tilt_zoom=bool(json["panTiltZoom"])
-            if json.get("panTiltZoom", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "sysex": ("sysex", bool, True),
+            "userVisibleOnly": ("user_visible_only", bool, True),
+            "allowWithoutSanitization": ("allow_without_sanitization", bool, True),
+            "allowWithoutGesture": ("allow_without_gesture", bool, True),
+            "panTiltZoom": ("pan_tilt_zoom", bool, True),
+        }
 
 
 class BrowserCommandId(enum.Enum):
@@ -238,7 +239,7 @@ class BrowserCommandId(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class Bucket:
     """
     Chrome histogram bucket.
@@ -262,14 +263,18 @@ class Bucket:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Bucket:
-        return cls(
-            low=int(json["low"]),
-            high=int(json["high"]),
-            count=int(json["count"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "low": ("low", int, False),
+            "high": ("high", int, False),
+            "count": ("count", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Histogram:
     """
     Chrome histogram.
@@ -297,12 +302,16 @@ class Histogram:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Histogram:
-        return cls(
-            name=str(json["name"]),
-            sum_=int(json["sum"]),
-            count=int(json["count"]),
-            buckets=[Bucket.from_json(i) for i in json["buckets"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "sum": ("sum_", int, False),
+            "count": ("count", int, False),
+            "buckets": ("buckets", lambda v: [Bucket.from_json(i) for i in v], False),
+        }
 
 
 def set_permission(
@@ -689,7 +698,7 @@ def add_privacy_sandbox_enrollment_override(
 
 
 @event_class("Browser.downloadWillBegin")
-@dataclass
+@slotted_dataclass
 class DownloadWillBegin:
     """
     **EXPERIMENTAL**
@@ -708,16 +717,20 @@ class DownloadWillBegin:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadWillBegin:
-        return cls(
-            frame_id=page.FrameId.from_json(json["frameId"]),
-            guid=str(json["guid"]),
-            url=str(json["url"]),
-            suggested_filename=str(json["suggestedFilename"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", page.FrameId, False),
+            "guid": ("guid", str, False),
+            "url": ("url", str, False),
+            "suggestedFilename": ("suggested_filename", str, False),
+        }
 
 
 @event_class("Browser.downloadProgress")
-@dataclass
+@slotted_dataclass
 class DownloadProgress:
     """
     **EXPERIMENTAL**
@@ -736,9 +749,13 @@ class DownloadProgress:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadProgress:
-        return cls(
-            guid=str(json["guid"]),
-            total_bytes=float(json["totalBytes"]),
-            received_bytes=float(json["receivedBytes"]),
-            state=str(json["state"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "guid": ("guid", str, False),
+            "totalBytes": ("total_bytes", float, False),
+            "receivedBytes": ("received_bytes", float, False),
+            "state": ("state", str, False),
+        }
@@ -8,8 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import storage
 
@@ -50,7 +54,7 @@ class CachedResponseType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class DataEntry:
     """
     Data entry.
@@ -94,19 +98,31 @@ class DataEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataEntry:
-        return cls(
-            request_url=str(json["requestURL"]),
-            request_method=str(json["requestMethod"]),
-            request_headers=[Header.from_json(i) for i in json["requestHeaders"]],
-            response_time=float(json["responseTime"]),
-            response_status=int(json["responseStatus"]),
-            response_status_text=str(json["responseStatusText"]),
-            response_type=CachedResponseType.from_json(json["responseType"]),
-            response_headers=[Header.from_json(i) for i in json["responseHeaders"]],
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestURL": ("request_url", str, False),
+            "requestMethod": ("request_method", str, False),
+            "requestHeaders": (
+                "request_headers",
+                lambda v: [Header.from_json(i) for i in v],
+                False,
+            ),
+            "responseTime": ("response_time", float, False),
+            "responseStatus": ("response_status", int, False),
+            "responseStatusText": ("response_status_text", str, False),
+            "responseType": ("response_type", CachedResponseType, False),
+            "responseHeaders": (
+                "response_headers",
+                lambda v: [Header.from_json(i) for i in v],
+                False,
+            ),
+        }
+
+
+@slotted_dataclass
 class Cache:
     """
     Cache identifier.
@@ -139,18 +155,20 @@ class Cache:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Cache:
-        return cls(
-            cache_id=CacheId.from_json(json["cacheId"]),
-            security_origin=str(json["securityOrigin"]),
-            storage_key=str(json["storageKey"]),
-            cache_name=str(json["cacheName"]),
-            storage_bucket=storage.StorageBucket.from_json(json["storageBucket"])
-            if json.get("storageBucket", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "cacheId": ("cache_id", CacheId, False),
+            "securityOrigin": ("security_origin", str, False),
+            "storageKey": ("storage_key", str, False),
+            "cacheName": ("cache_name", str, False),
+            "storageBucket": ("storage_bucket", storage.StorageBucket.from_json, True),
+        }
+
+
+@slotted_dataclass
 class Header:
     name: str
 
@@ -164,13 +182,17 @@ class Header:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Header:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class CachedResponse:
     """
     Cached response
@@ -186,9 +208,13 @@ class CachedResponse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CachedResponse:
-        return cls(
-            body=str(json["body"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "body": ("body", str, False),
+        }
 
 
 def delete_cache(cache_id: CacheId) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
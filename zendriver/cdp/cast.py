@@ -6,13 +6,17 @@
 # CDP domain: Cast (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
-@dataclass
+@slotted_dataclass
 class Sink:
     name: str
 
@@ -32,13 +36,15 @@ class Sink:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Sink:
-        return cls(
-            name=str(json["name"]),
-            id_=str(json["id"]),
-            session=str(json["session"])
-            if json.get("session", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "id": ("id_", str, False),
+            "session": ("session", str, True),
+        }
 
 
 def enable(
@@ -139,7 +145,7 @@ def stop_casting(sink_name: str) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, N
 
 
 @event_class("Cast.sinksUpdated")
-@dataclass
+@slotted_dataclass
 class SinksUpdated:
     """
     This is fired whenever the list of available sinks changes. A sink is a
@@ -150,11 +156,17 @@ class SinksUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SinksUpdated:
-        return cls(sinks=[Sink.from_json(i) for i in json["sinks"]])
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sinks": ("sinks", lambda v: [Sink.from_json(i) for i in v], False),
+        }
 
 
 @event_class("Cast.issueUpdated")
-@dataclass
+@slotted_dataclass
 class IssueUpdated:
     """
     This is fired whenever the outstanding issue/error message changes.
@@ -165,4 +177,10 @@ class IssueUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IssueUpdated:
-        return cls(issue_message=str(json["issueMessage"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "issueMessage": ("issue_message", str, False),
+        }
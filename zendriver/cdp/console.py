@@ -6,13 +6,17 @@
 # CDP domain: Console
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
-@dataclass
+@slotted_dataclass
 class ConsoleMessage:
     """
     Console message.
@@ -51,16 +55,18 @@ class ConsoleMessage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleMessage:
-        return cls(
-            source=str(json["source"]),
-            level=str(json["level"]),
-            text=str(json["text"]),
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            line=int(json["line"]) if json.get("line", None) is not None else None,
-            column=int(json["column"])
-            if json.get("column", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "source": ("source", str, False),
+            "level": ("level", str, False),
+            "text": ("text", str, False),
+            "url": ("url", str, True),
+            "line": ("line", int, True),
+            "column": ("column", int, True),
+        }
 
 
 def clear_messages() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -95,7 +101,7 @@ def enable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
 
 
 @event_class("Console.messageAdded")
-@dataclass
+@slotted_dataclass
 class MessageAdded:
     """
     Issued when new console message is added.
@@ -106,4 +112,10 @@ class MessageAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MessageAdded:
-        return cls(message=ConsoleMessage.from_json(json["message"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "message": ("message", ConsoleMessage.from_json, False),
+        }
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import page
@@ -47,7 +52,7 @@ class StyleSheetOrigin(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class PseudoElementMatches:
     """
     CSS rule collection for a single pseudo style.
@@ -72,16 +77,22 @@ class PseudoElementMatches:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementMatches:
-        return cls(
-            pseudo_type=dom.PseudoType.from_json(json["pseudoType"]),
-            matches=[RuleMatch.from_json(i) for i in json["matches"]],
-            pseudo_identifier=str(json["pseudoIdentifier"])
-            if json.get("pseudoIdentifier", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "pseudoType": ("pseudo_type", dom.PseudoType, False),
+            "matches": (
+                "matches",
+                lambda v: [RuleMatch.from_json(i) for i in v],
+                False,
+            ),
+            "pseudoIdentifier": ("pseudo_identifier", str, True),
+        }
+
+
+@slotted_dataclass
 class InheritedStyleEntry:
     """
     Inherited CSS rule collection from ancestor node.
@@ -102,15 +113,21 @@ class InheritedStyleEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InheritedStyleEntry:
-        return cls(
-            matched_css_rules=[RuleMatch.from_json(i) for i in json["matchedCSSRules"]],
-            inline_style=CSSStyle.from_json(json["inlineStyle"])
-            if json.get("inlineStyle", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "matchedCSSRules": (
+                "matched_css_rules",
+                lambda v: [RuleMatch.from_json(i) for i in v],
+                False,
+            ),
+            "inlineStyle": ("inline_style", CSSStyle.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class InheritedPseudoElementMatches:
     """
     Inherited pseudo element matches from pseudos of an ancestor node.
@@ -126,14 +143,20 @@ class InheritedPseudoElementMatches:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InheritedPseudoElementMatches:
-        return cls(
-            pseudo_elements=[
-                PseudoElementMatches.from_json(i) for i in json["pseudoElements"]
-            ],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "pseudoElements": (
+                "pseudo_elements",
+                lambda v: [PseudoElementMatches.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class RuleMatch:
     """
     Match data for a CSS rule.
@@ -153,13 +176,21 @@ class RuleMatch:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleMatch:
-        return cls(
-            rule=CSSRule.from_json(json["rule"]),
-            matching_selectors=[int(i) for i in json["matchingSelectors"]],
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "rule": ("rule", CSSRule.from_json, False),
+            "matchingSelectors": (
+                "matching_selectors",
+                lambda v: [int(i) for i in v],
+                False,
+            ),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class Value:
     """
     Data for a simple selector (these are delimited by commas in a selector list).
@@ -185,18 +216,18 @@ class Value:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Value:
-        return cls(
-            text=str(json["text"]),
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-            specificity=Specificity.from_json(json["specificity"])
-            if json.get("specificity", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "text": ("text", str, False),
+            "range": ("range_", SourceRange.from_json, True),
+            "specificity": ("specificity", Specificity.from_json, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class Specificity:
     """
     Specificity:
@@ -222,14 +253,18 @@ class Specificity:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Specificity:
-        return cls(
-            a=int(json["a"]),
-            b=int(json["b"]),
-            c=int(json["c"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "a": ("a", int, False),
+            "b": ("b", int, False),
+            "c": ("c", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SelectorList:
     """
     Selector list data.
@@ -249,13 +284,21 @@ class SelectorList:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SelectorList:
-        return cls(
-            selectors=[Value.from_json(i) for i in json["selectors"]],
-            text=str(json["text"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "selectors": (
+                "selectors",
+                lambda v: [Value.from_json(i) for i in v],
+                False,
+            ),
+            "text": ("text", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSStyleSheetHeader:
     """
     CSS stylesheet metainformation.
@@ -350,37 +393,33 @@ class CSSStyleSheetHeader:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSStyleSheetHeader:
-        return cls(
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"]),
-            frame_id=page.FrameId.from_json(json["frameId"]),
-            source_url=str(json["sourceURL"]),
-            origin=StyleSheetOrigin.from_json(json["origin"]),
-            title=str(json["title"]),
-            disabled=bool(json["disabled"]),
-            is_inline=bool(json["isInline"]),
-            is_mutable=bool(json["isMutable"]),
-            is_constructed=bool(json["isConstructed"]),
-            start_line=float(json["startLine"]),
-            start_column=float(json["startColumn"]),
-            length=float(json["length"]),
-            end_line=float(json["endLine"]),
-            end_column=float(json["endColumn"]),
-            source_map_url=str(json["sourceMapURL"])
-            if json.get("sourceMapURL", None) is not None
-            else None,
-            owner_node=dom.BackendNodeId.from_json(json["ownerNode"])
-            if json.get("ownerNode", None) is not None
-            else None,
-            has_source_url=bool(json["hasSourceURL"])
-            if json.get("hasSourceURL", None) is not None
-            else None,
-            loading_failed=bool(json["loadingFailed"])
-            if json.get("loadingFailed", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "styleSheetId": ("style_sheet_id", StyleSheetId, False),
+            "frameId": ("frame_id", page.FrameId, False),
+            "sourceURL": ("source_url", str, False),
+            "origin": ("origin", StyleSheetOrigin, False),
+            "title": ("title", str, False),
+            "disabled": ("disabled", bool, False),
+            "isInline": ("is_inline", bool, False),
+            "isMutable": ("is_mutable", bool, False),
+            "isConstructed": ("is_constructed", bool, False),
+            "startLine": ("start_line", float, False),
+            "startColumn": ("start_column", float, False),
+            "length": ("length", float, False),
+            "endLine": ("end_line", float, False),
+            "endColumn": ("end_column", float, False),
+            "sourceMapURL": ("source_map_url", str, True),
+            "ownerNode": ("owner_node", dom.BackendNodeId, True),
+            "hasSourceURL": ("has_source_url", bool, True),
+            "loadingFailed": ("loading_failed", bool, True),
+        }
+
+
+@slotted_dataclass
 class CSSRule:
     """
     CSS rule representation.
@@ -456,42 +495,40 @@ class CSSRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSRule:
-        return cls(
-            selector_list=SelectorList.from_json(json["selectorList"]),
-            origin=StyleSheetOrigin.from_json(json["origin"]),
-            style=CSSStyle.from_json(json["style"]),
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-            nesting_selectors=[str(i) for i in json["nestingSelectors"]]
-            if json.get("nestingSelectors", None) is not None
-            else None,
-            media=[CSSMedia.from_json(i) for i in json["media"]]
-            if json.get("media", None) is not None
-            else None,
-            container_queries=[
-                CSSContainerQuery.from_json(i) for i in json["containerQueries"]
-            ]
-            if json.get("containerQueries", None) is not None
-            else None,
-            supports=[CSSSupports.from_json(i) for i in json["supports"]]
-            if json.get("supports", None) is not None
-            else None,
-            layers=[CSSLayer.from_json(i) for i in json["layers"]]
-            if json.get("layers", None) is not None
-            else None,
-            scopes=[CSSScope.from_json(i) for i in json["scopes"]]
-            if json.get("scopes", None) is not None
-            else None,
-            rule_types=[CSSRuleType.from_json(i) for i in json["ruleTypes"]]
-            if json.get("ruleTypes", None) is not None
-            else None,
-            starting_styles=[
-                CSSStartingStyle.from_json(i) for i in json["startingStyles"]
-            ]
-            if json.get("startingStyles", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "selectorList": ("selector_list", SelectorList.from_json, False),
+            "origin": ("origin", StyleSheetOrigin, False),
+            "style": ("style", CSSStyle.from_json, False),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+            "nestingSelectors": (
+                "nesting_selectors",
+                lambda v: [str(i) for i in v],
+                True,
+            ),
+            "media": ("media", lambda v: [CSSMedia.from_json(i) for i in v], True),
+            "containerQueries": (
+                "container_queries",
+                lambda v: [CSSContainerQuery.from_json(i) for i in v],
+                True,
+            ),
+            "supports": (
+                "supports",
+                lambda v: [CSSSupports.from_json(i) for i in v],
+                True,
+            ),
+            "layers": ("layers", lambda v: [CSSLayer.from_json(i) for i in v], True),
+            "scopes": ("scopes", lambda v: [CSSScope.from_json(i) for i in v], True),
+            "ruleTypes": ("rule_types", lambda v: [CSSRuleType(i) for i in v], True),
+            "startingStyles": (
+                "starting_styles",
+                lambda v: [CSSStartingStyle.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
 class CSSRuleType(enum.Enum):
@@ -516,7 +553,7 @@ class CSSRuleType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class RuleUsage:
     """
     CSS coverage information.
@@ -545,15 +582,19 @@ class RuleUsage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleUsage:
-        return cls(
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"]),
-            start_offset=float(json["startOffset"]),
-            end_offset=float(json["endOffset"]),
-            used=bool(json["used"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "styleSheetId": ("style_sheet_id", StyleSheetId, False),
+            "startOffset": ("start_offset", float, False),
+            "endOffset": ("end_offset", float, False),
+            "used": ("used", bool, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SourceRange:
     """
     Text range within a resource. All numbers are zero-based.
@@ -581,15 +622,19 @@ class SourceRange:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SourceRange:
-        return cls(
-            start_line=int(json["startLine"]),
-            start_column=int(json["startColumn"]),
-            end_line=int(json["endLine"]),
-            end_column=int(json["endColumn"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "startLine": ("start_line", int, False),
+            "startColumn": ("start_column", int, False),
+            "endLine": ("end_line", int, False),
+            "endColumn": ("end_column", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ShorthandEntry:
     #: Shorthand name.
     name: str
@@ -610,16 +655,18 @@ class ShorthandEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShorthandEntry:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-            important=bool(json["important"])
-            if json.get("important", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+            "important": ("important", bool, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class CSSComputedStyleProperty:
     #: Computed style property name.
     name: str
@@ -635,13 +682,17 @@ class CSSComputedStyleProperty:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSComputedStyleProperty:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSStyle:
     """
     CSS style representation.
@@ -677,24 +728,28 @@ class CSSStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSStyle:
-        return cls(
-            css_properties=[CSSProperty.from_json(i) for i in json["cssProperties"]],
-            shorthand_entries=[
-                ShorthandEntry.from_json(i) for i in json["shorthandEntries"]
-            ],
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-            css_text=str(json["cssText"])
-            if json.get("cssText", None) is not None
-            else None,
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "cssProperties": (
+                "css_properties",
+                lambda v: [CSSProperty.from_json(i) for i in v],
+                False,
+            ),
+            "shorthandEntries": (
+                "shorthand_entries",
+                lambda v: [ShorthandEntry.from_json(i) for i in v],
+                False,
+            ),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+            "cssText": ("css_text", str, True),
+            "range": ("range_", SourceRange.from_json, True),
+        }
+
+
+@slotted_dataclass
 class CSSProperty:
     """
     CSS property declaration data.
@@ -750,34 +805,28 @@ class CSSProperty:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSProperty:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-            important=bool(json["important"])
-            if json.get("important", None) is not None
-            else None,
-            implicit=bool(json["implicit"])
-            if json.get("implicit", None) is not None
-            else None,
-            text=str(json["text"]) if json.get("text", None) is not None else None,
-            parsed_ok=bool(json["parsedOk"])
-            if json.get("parsedOk", None) is not None
-            else None,
-            disabled=bool(json["disabled"])
-            if json.get("disabled", None) is not None
-            else None,
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-            longhand_properties=[
-                CSSProperty.from_json(i) for i in json["longhandProperties"]
-            ]
-            if json.get("longhandProperties", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+            "important": ("important", bool, True),
+            "implicit": ("implicit", bool, True),
+            "text": ("text", str, True),
+            "parsedOk": ("parsed_ok", bool, True),
+            "disabled": ("disabled", bool, True),
+            "range": ("range_", SourceRange.from_json, True),
+            "longhandProperties": (
+                "longhand_properties",
+                lambda v: [CSSProperty.from_json(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class CSSMedia:
     """
     CSS media rule descriptor.
@@ -821,25 +870,25 @@ class CSSMedia:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSMedia:
-        return cls(
-            text=str(json["text"]),
-            source=str(json["source"]),
-            source_url=str(json["sourceURL"])
-            if json.get("sourceURL", None) is not None
-            else None,
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-            media_list=[MediaQuery.from_json(i) for i in json["mediaList"]]
-            if json.get("mediaList", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "text": ("text", str, False),
+            "source": ("source", str, False),
+            "sourceURL": ("source_url", str, True),
+            "range": ("range_", SourceRange.from_json, True),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+            "mediaList": (
+                "media_list",
+                lambda v: [MediaQuery.from_json(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class MediaQuery:
     """
     Media query descriptor.
@@ -859,15 +908,21 @@ class MediaQuery:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaQuery:
-        return cls(
-            expressions=[
-                MediaQueryExpression.from_json(i) for i in json["expressions"]
-            ],
-            active=bool(json["active"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "expressions": (
+                "expressions",
+                lambda v: [MediaQueryExpression.from_json(i) for i in v],
+                False,
+            ),
+            "active": ("active", bool, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class MediaQueryExpression:
     """
     Media query expression descriptor.
@@ -901,20 +956,20 @@ class MediaQueryExpression:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaQueryExpression:
-        return cls(
-            value=float(json["value"]),
-            unit=str(json["unit"]),
-            feature=str(json["feature"]),
-            value_range=SourceRange.from_json(json["valueRange"])
-            if json.get("valueRange", None) is not None
-            else None,
-            computed_length=float(json["computedLength"])
-            if json.get("computedLength", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "value": ("value", float, False),
+            "unit": ("unit", str, False),
+            "feature": ("feature", str, False),
+            "valueRange": ("value_range", SourceRange.from_json, True),
+            "computedLength": ("computed_length", float, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSContainerQuery:
     """
     CSS container query rule descriptor.
@@ -961,28 +1016,22 @@ class CSSContainerQuery:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSContainerQuery:
-        return cls(
-            text=str(json["text"]),
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-            physical_axes=dom.PhysicalAxes.from_json(json["physicalAxes"])
-            if json.get("physicalAxes", None) is not None
-            else None,
-            logical_axes=dom.LogicalAxes.from_json(json["logicalAxes"])
-            if json.get("logicalAxes", None) is not None
-            else None,
-            queries_scroll_state=bool(json["queriesScrollState"])
-            if json.get("queriesScrollState", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "text": ("text", str, False),
+            "range": ("range_", SourceRange.from_json, True),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+            "name": ("name", str, True),
+            "physicalAxes": ("physical_axes", dom.PhysicalAxes, True),
+            "logicalAxes": ("logical_axes", dom.LogicalAxes, True),
+            "queriesScrollState": ("queries_scroll_state", bool, True),
+        }
+
+
+@slotted_dataclass
 class CSSSupports:
     """
     CSS Supports at-rule descriptor.
@@ -1013,19 +1062,19 @@ class CSSSupports:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSSupports:
-        return cls(
-            text=str(json["text"]),
-            active=bool(json["active"]),
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "text": ("text", str, False),
+            "active": ("active", bool, False),
+            "range": ("range_", SourceRange.from_json, True),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSScope:
     """
     CSS Scope at-rule descriptor.
@@ -1052,18 +1101,18 @@ class CSSScope:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSScope:
-        return cls(
-            text=str(json["text"]),
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "text": ("text", str, False),
+            "range": ("range_", SourceRange.from_json, True),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSLayer:
     """
     CSS Layer at-rule descriptor.
@@ -1090,18 +1139,18 @@ class CSSLayer:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSLayer:
-        return cls(
-            text=str(json["text"]),
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "text": ("text", str, False),
+            "range": ("range_", SourceRange.from_json, True),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class CSSStartingStyle:
     """
     CSS Starting Style at-rule descriptor.
@@ -1124,17 +1173,17 @@ class CSSStartingStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSStartingStyle:
-        return cls(
-            range_=SourceRange.from_json(json["range"])
-            if json.get("range", None) is not None
-            else None,
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "range": ("range_", SourceRange.from_json, True),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSLayerData:
     """
     CSS Layer data.
@@ -1160,16 +1209,22 @@ class CSSLayerData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSLayerData:
-        return cls(
-            name=str(json["name"]),
-            order=float(json["order"]),
-            sub_layers=[CSSLayerData.from_json(i) for i in json["subLayers"]]
-            if json.get("subLayers", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "order": ("order", float, False),
+            "subLayers": (
+                "sub_layers",
+                lambda v: [CSSLayerData.from_json(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class PlatformFontUsage:
     """
     Information about amount of glyphs that were rendered with given font.
@@ -1197,15 +1252,19 @@ class PlatformFontUsage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlatformFontUsage:
-        return cls(
-            family_name=str(json["familyName"]),
-            post_script_name=str(json["postScriptName"]),
-            is_custom_font=bool(json["isCustomFont"]),
-            glyph_count=float(json["glyphCount"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "familyName": ("family_name", str, False),
+            "postScriptName": ("post_script_name", str, False),
+            "isCustomFont": ("is_custom_font", bool, False),
+            "glyphCount": ("glyph_count", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FontVariationAxis:
     """
     Information about font variation axes for variable fonts
@@ -1237,16 +1296,20 @@ class FontVariationAxis:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontVariationAxis:
-        return cls(
-            tag=str(json["tag"]),
-            name=str(json["name"]),
-            min_value=float(json["minValue"]),
-            max_value=float(json["maxValue"]),
-            default_value=float(json["defaultValue"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "tag": ("tag", str, False),
+            "name": ("name", str, False),
+            "minValue": ("min_value", float, False),
+            "maxValue": ("max_value", float, False),
+            "defaultValue": ("default_value", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FontFace:
     """
     Properties of a web font: https://www.w3.org/TR/2008/REC-CSS2-20080411/fonts.html#font-descriptions
@@ -1300,25 +1363,29 @@ class FontFace:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontFace:
-        return cls(
-            font_family=str(json["fontFamily"]),
-            font_style=str(json["fontStyle"]),
-            font_variant=str(json["fontVariant"]),
-            font_weight=str(json["fontWeight"]),
-            font_stretch=str(json["fontStretch"]),
-            font_display=str(json["fontDisplay"]),
-            unicode_range=str(json["unicodeRange"]),
-            src=str(json["src"]),
-            platform_font_family=str(json["platformFontFamily"]),
-            font_variation_axes=[
-                FontVariationAxis.from_json(i) for i in json["fontVariationAxes"]
-            ]
-            if json.get("fontVariationAxes", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "fontFamily": ("font_family", str, False),
+            "fontStyle": ("font_style", str, False),
+            "fontVariant": ("font_variant", str, False),
+            "fontWeight": ("font_weight", str, False),
+            "fontStretch": ("font_stretch", str, False),
+            "fontDisplay": ("font_display", str, False),
+            "unicodeRange": ("unicode_range", str, False),
+            "src": ("src", str, False),
+            "platformFontFamily": ("platform_font_family", str, False),
+            "fontVariationAxes": (
+                "font_variation_axes",
+                lambda v: [FontVariationAxis.from_json(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class CSSTryRule:
     """
     CSS try rule representation.
@@ -1344,16 +1411,18 @@ class CSSTryRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSTryRule:
-        return cls(
-            origin=StyleSheetOrigin.from_json(json["origin"]),
-            style=CSSStyle.from_json(json["style"]),
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", StyleSheetOrigin, False),
+            "style": ("style", CSSStyle.from_json, False),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSPositionTryRule:
     """
     CSS @position-try rule representation.
@@ -1386,18 +1455,20 @@ class CSSPositionTryRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSPositionTryRule:
-        return cls(
-            name=Value.from_json(json["name"]),
-            origin=StyleSheetOrigin.from_json(json["origin"]),
-            style=CSSStyle.from_json(json["style"]),
-            active=bool(json["active"]),
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", Value.from_json, False),
+            "origin": ("origin", StyleSheetOrigin, False),
+            "style": ("style", CSSStyle.from_json, False),
+            "active": ("active", bool, False),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSKeyframesRule:
     """
     CSS keyframes rule representation.
@@ -1417,13 +1488,21 @@ class CSSKeyframesRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSKeyframesRule:
-        return cls(
-            animation_name=Value.from_json(json["animationName"]),
-            keyframes=[CSSKeyframeRule.from_json(i) for i in json["keyframes"]],
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "animationName": ("animation_name", Value.from_json, False),
+            "keyframes": (
+                "keyframes",
+                lambda v: [CSSKeyframeRule.from_json(i) for i in v],
+                False,
+            ),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class CSSPropertyRegistration:
     """
     Representation of a custom property registration through CSS.registerProperty
@@ -1448,17 +1527,19 @@ class CSSPropertyRegistration:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSPropertyRegistration:
-        return cls(
-            property_name=str(json["propertyName"]),
-            inherits=bool(json["inherits"]),
-            syntax=str(json["syntax"]),
-            initial_value=Value.from_json(json["initialValue"])
-            if json.get("initialValue", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "propertyName": ("property_name", str, False),
+            "inherits": ("inherits", bool, False),
+            "syntax": ("syntax", str, False),
+            "initialValue": ("initial_value", Value.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSFontPaletteValuesRule:
     """
     CSS font-palette-values rule representation.
@@ -1488,17 +1569,19 @@ class CSSFontPaletteValuesRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSFontPaletteValuesRule:
-        return cls(
-            origin=StyleSheetOrigin.from_json(json["origin"]),
-            font_palette_name=Value.from_json(json["fontPaletteName"]),
-            style=CSSStyle.from_json(json["style"]),
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", StyleSheetOrigin, False),
+            "fontPaletteName": ("font_palette_name", Value.from_json, False),
+            "style": ("style", CSSStyle.from_json, False),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSPropertyRule:
     """
     CSS property at-rule representation.
@@ -1528,17 +1611,19 @@ class CSSPropertyRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSPropertyRule:
-        return cls(
-            origin=StyleSheetOrigin.from_json(json["origin"]),
-            property_name=Value.from_json(json["propertyName"]),
-            style=CSSStyle.from_json(json["style"]),
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", StyleSheetOrigin, False),
+            "propertyName": ("property_name", Value.from_json, False),
+            "style": ("style", CSSStyle.from_json, False),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class CSSKeyframeRule:
     """
     CSS keyframe rule representation.
@@ -1568,17 +1653,19 @@ class CSSKeyframeRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSKeyframeRule:
-        return cls(
-            origin=StyleSheetOrigin.from_json(json["origin"]),
-            key_text=Value.from_json(json["keyText"]),
-            style=CSSStyle.from_json(json["style"]),
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"])
-            if json.get("styleSheetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", StyleSheetOrigin, False),
+            "keyText": ("key_text", Value.from_json, False),
+            "style": ("style", CSSStyle.from_json, False),
+            "styleSheetId": ("style_sheet_id", StyleSheetId, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class StyleDeclarationEdit:
     """
     A descriptor of operation to mutate style declaration text.
@@ -1602,11 +1689,15 @@ class StyleDeclarationEdit:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleDeclarationEdit:
-        return cls(
-            style_sheet_id=StyleSheetId.from_json(json["styleSheetId"]),
-            range_=SourceRange.from_json(json["range"]),
-            text=str(json["text"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "styleSheetId": ("style_sheet_id", StyleSheetId, False),
+            "range": ("range_", SourceRange.from_json, False),
+            "text": ("text", str, False),
+        }
 
 
 def add_rule(
@@ -2381,7 +2472,7 @@ def set_local_fonts_enabled(
 
 
 @event_class("CSS.fontsUpdated")
-@dataclass
+@slotted_dataclass
 class FontsUpdated:
     """
     Fires whenever a web font is updated.  A non-empty font parameter indicates a successfully loaded
@@ -2393,15 +2484,17 @@ class FontsUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontsUpdated:
-        return cls(
-            font=FontFace.from_json(json["font"])
-            if json.get("font", None) is not None
-            else None
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "font": ("font", FontFace.from_json, True),
+        }
 
 
 @event_class("CSS.mediaQueryResultChanged")
-@dataclass
+@slotted_dataclass
 class MediaQueryResultChanged:
     """
     Fires whenever a MediaQuery result changes (for example, after a browser window has been
@@ -2410,11 +2503,15 @@ class MediaQueryResultChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaQueryResultChanged:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("CSS.styleSheetAdded")
-@dataclass
+@slotted_dataclass
 class StyleSheetAdded:
     """
     Fired whenever an active document stylesheet is added.
@@ -2425,11 +2522,17 @@ class StyleSheetAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetAdded:
-        return cls(header=CSSStyleSheetHeader.from_json(json["header"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "header": ("header", CSSStyleSheetHeader.from_json, False),
+        }
 
 
 @event_class("CSS.styleSheetChanged")
-@dataclass
+@slotted_dataclass
 class StyleSheetChanged:
     """
     Fired whenever a stylesheet is changed as a result of the client operation.
@@ -2439,11 +2542,17 @@ class StyleSheetChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetChanged:
-        return cls(style_sheet_id=StyleSheetId.from_json(json["styleSheetId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "styleSheetId": ("style_sheet_id", StyleSheetId, False),
+        }
 
 
 @event_class("CSS.styleSheetRemoved")
-@dataclass
+@slotted_dataclass
 class StyleSheetRemoved:
     """
     Fired whenever an active document stylesheet is removed.
@@ -2454,11 +2563,17 @@ class StyleSheetRemoved:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetRemoved:
-        return cls(style_sheet_id=StyleSheetId.from_json(json["styleSheetId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "styleSheetId": ("style_sheet_id", StyleSheetId, False),
+        }
 
 
 @event_class("CSS.computedStyleUpdated")
-@dataclass
+@slotted_dataclass
 class ComputedStyleUpdated:
     """
     **EXPERIMENTAL**
@@ -2471,4 +2586,10 @@ class ComputedStyleUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ComputedStyleUpdated:
-        return cls(node_id=dom.NodeId.from_json(json["nodeId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", dom.NodeId, False),
+        }
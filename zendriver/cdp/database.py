@@ -6,10 +6,14 @@
 # CDP domain: Database (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class DatabaseId(str):
@@ -28,7 +32,7 @@ class DatabaseId(str):
         return "DatabaseId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class Database:
     """
     Database object.
@@ -56,15 +60,19 @@ class Database:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Database:
-        return cls(
-            id_=DatabaseId.from_json(json["id"]),
-            domain=str(json["domain"]),
-            name=str(json["name"]),
-            version=str(json["version"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", DatabaseId, False),
+            "domain": ("domain", str, False),
+            "name": ("name", str, False),
+            "version": ("version", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Error:
     """
     Database error.
@@ -84,10 +92,14 @@ class Error:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Error:
-        return cls(
-            message=str(json["message"]),
-            code=int(json["code"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "message": ("message", str, False),
+            "code": ("code", int, False),
+        }
 
 
 def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -167,10 +179,16 @@ def get_database_table_names(
 
 
 @event_class("Database.addDatabase")
-@dataclass
+@slotted_dataclass
 class AddDatabase:
     database: Database
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddDatabase:
-        return cls(database=Database.from_json(json["database"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "database": ("database", Database.from_json, False),
+        }
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import runtime
 from deprecated.sphinx import deprecated  # type: ignore
@@ -47,7 +52,7 @@ class CallFrameId(str):
         return "CallFrameId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class Location:
     """
     Location in the source code.
@@ -72,16 +77,18 @@ class Location:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Location:
-        return cls(
-            script_id=runtime.ScriptId.from_json(json["scriptId"]),
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"])
-            if json.get("columnNumber", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scriptId": ("script_id", runtime.ScriptId, False),
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ScriptPosition:
     """
     Location in the source code.
@@ -99,13 +106,17 @@ class ScriptPosition:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptPosition:
-        return cls(
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class LocationRange:
     """
     Location range within one script.
@@ -126,14 +137,18 @@ class LocationRange:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LocationRange:
-        return cls(
-            script_id=runtime.ScriptId.from_json(json["scriptId"]),
-            start=ScriptPosition.from_json(json["start"]),
-            end=ScriptPosition.from_json(json["end"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scriptId": ("script_id", runtime.ScriptId, False),
+            "start": ("start", ScriptPosition.from_json, False),
+            "end": ("end", ScriptPosition.from_json, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class CallFrame:
     """
     JavaScript call frame. Array of call frames form the call stack.
@@ -189,26 +204,28 @@ class CallFrame:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallFrame:
-        return cls(
-            call_frame_id=CallFrameId.from_json(json["callFrameId"]),
-            function_name=str(json["functionName"]),
-            location=Location.from_json(json["location"]),
-            url=str(json["url"]),
-            scope_chain=[Scope.from_json(i) for i in json["scopeChain"]],
-            this=runtime.RemoteObject.from_json(json["this"]),
-            function_location=Location.from_json(json["functionLocation"])
-            if json.get("functionLocation", None) is not None
-            else None,
-            return_value=runtime.RemoteObject.from_json(json["returnValue"])
-            if json.get("returnValue", None) is not None
-            else None,
-            can_be_restarted=bool(json["canBeRestarted"])
-            if json.get("canBeRestarted", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "callFrameId": ("call_frame_id", CallFrameId, False),
+            "functionName": ("function_name", str, False),
+            "location": ("location", Location.from_json, False),
+            "url": ("url", str, False),
+            "scopeChain": (
+                "scope_chain",
+                lambda v: [Scope.from_json(i) for i in v],
+                False,
+            ),
+            "this": ("this", runtime.RemoteObject.from_json, False),
+            "functionLocation": ("function_location", Location.from_json, True),
+            "returnValue": ("return_value", runtime.RemoteObject.from_json, True),
+            "canBeRestarted": ("can_be_restarted", bool, True),
+        }
+
+
+@slotted_dataclass
 class Scope:
     """
     Scope description.
@@ -244,20 +261,20 @@ class Scope:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Scope:
-        return cls(
-            type_=str(json["type"]),
-            object_=runtime.RemoteObject.from_json(json["object"]),
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-            start_location=Location.from_json(json["startLocation"])
-            if json.get("startLocation", None) is not None
-            else None,
-            end_location=Location.from_json(json["endLocation"])
-            if json.get("endLocation", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "object": ("object_", runtime.RemoteObject.from_json, False),
+            "name": ("name", str, True),
+            "startLocation": ("start_location", Location.from_json, True),
+            "endLocation": ("end_location", Location.from_json, True),
+        }
+
+
+@slotted_dataclass
 class SearchMatch:
     """
     Search match for resource.
@@ -277,13 +294,17 @@ class SearchMatch:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SearchMatch:
-        return cls(
-            line_number=float(json["lineNumber"]),
-            line_content=str(json["lineContent"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "lineNumber": ("line_number", float, False),
+            "lineContent": ("line_content", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class BreakLocation:
     #: Script identifier as reported in the ``Debugger.scriptParsed``.
     script_id: runtime.ScriptId
@@ -308,17 +329,19 @@ class BreakLocation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BreakLocation:
-        return cls(
-            script_id=runtime.ScriptId.from_json(json["scriptId"]),
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"])
-            if json.get("columnNumber", None) is not None
-            else None,
-            type_=str(json["type"]) if json.get("type", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scriptId": ("script_id", runtime.ScriptId, False),
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, True),
+            "type": ("type_", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class WasmDisassemblyChunk:
     #: The next chunk of disassembled lines.
     lines: typing.List[str]
@@ -334,10 +357,18 @@ class WasmDisassemblyChunk:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WasmDisassemblyChunk:
-        return cls(
-            lines=[str(i) for i in json["lines"]],
-            bytecode_offsets=[int(i) for i in json["bytecodeOffsets"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "lines": ("lines", lambda v: [str(i) for i in v], False),
+            "bytecodeOffsets": (
+                "bytecode_offsets",
+                lambda v: [int(i) for i in v],
+                False,
+            ),
+        }
 
 
 class ScriptLanguage(enum.Enum):
@@ -356,7 +387,7 @@ class ScriptLanguage(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class DebugSymbols:
     """
     Debug symbols available for a wasm script.
@@ -377,12 +408,14 @@ class DebugSymbols:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DebugSymbols:
-        return cls(
-            type_=str(json["type"]),
-            external_url=str(json["externalURL"])
-            if json.get("externalURL", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "externalURL": ("external_url", str, True),
+        }
 
 
 def continue_to_location(
@@ -1233,7 +1266,7 @@ def step_over(
 
 
 @event_class("Debugger.breakpointResolved")
-@dataclass
+@slotted_dataclass
 class BreakpointResolved:
     """
     Fired when breakpoint is resolved to an actual script and location.
@@ -1246,14 +1279,18 @@ class BreakpointResolved:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BreakpointResolved:
-        return cls(
-            breakpoint_id=BreakpointId.from_json(json["breakpointId"]),
-            location=Location.from_json(json["location"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "breakpointId": ("breakpoint_id", BreakpointId, False),
+            "location": ("location", Location.from_json, False),
+        }
 
 
 @event_class("Debugger.paused")
-@dataclass
+@slotted_dataclass
 class Paused:
     """
     Fired when the virtual machine stopped on breakpoint or exception or any other stop criteria.
@@ -1276,31 +1313,39 @@ class Paused:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Paused:
-        return cls(
-            call_frames=[CallFrame.from_json(i) for i in json["callFrames"]],
-            reason=str(json["reason"]),
-            data=dict(json["data"]) if json.get("data", None) is not None else None,
-            hit_breakpoints=[str(i) for i in json["hitBreakpoints"]]
-            if json.get("hitBreakpoints", None) is not None
-            else None,
-            async_stack_trace=runtime.StackTrace.from_json(json["asyncStackTrace"])
-            if json.get("asyncStackTrace", None) is not None
-            else None,
-            async_stack_trace_id=runtime.StackTraceId.from_json(
-                json["asyncStackTraceId"]
-            )
-            if json.get("asyncStackTraceId", None) is not None
-            else None,
-            async_call_stack_trace_id=runtime.StackTraceId.from_json(
-                json["asyncCallStackTraceId"]
-            )
-            if json.get("asyncCallStackTraceId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "callFrames": (
+                "call_frames",
+                lambda v: [CallFrame.from_json(i) for i in v],
+                False,
+            ),
+            "reason": ("reason", str, False),
+            "data": ("data", dict, True),
+            "hitBreakpoints": ("hit_breakpoints", lambda v: [str(i) for i in v], True),
+            "asyncStackTrace": (
+                "async_stack_trace",
+                runtime.StackTrace.from_json,
+                True,
+            ),
+            "asyncStackTraceId": (
+                "async_stack_trace_id",
+                runtime.StackTraceId.from_json,
+                True,
+            ),
+            "asyncCallStackTraceId": (
+                "async_call_stack_trace_id",
+                runtime.StackTraceId.from_json,
+                True,
+            ),
+        }
 
 
 @event_class("Debugger.resumed")
-@dataclass
+@slotted_dataclass
 class Resumed:
     """
     Fired when the virtual machine resumed execution.
@@ -1308,11 +1353,15 @@ class Resumed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Resumed:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("Debugger.scriptFailedToParse")
-@dataclass
+@slotted_dataclass
 class ScriptFailedToParse:
     """
     Fired when virtual machine fails to parse the script.
@@ -1355,49 +1404,37 @@ class ScriptFailedToParse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptFailedToParse:
-        return cls(
-            script_id=runtime.ScriptId.from_json(json["scriptId"]),
-            url=str(json["url"]),
-            start_line=int(json["startLine"]),
-            start_column=int(json["startColumn"]),
-            end_line=int(json["endLine"]),
-            end_column=int(json["endColumn"]),
-            execution_context_id=runtime.ExecutionContextId.from_json(
-                json["executionContextId"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scriptId": ("script_id", runtime.ScriptId, False),
+            "url": ("url", str, False),
+            "startLine": ("start_line", int, False),
+            "startColumn": ("start_column", int, False),
+            "endLine": ("end_line", int, False),
+            "endColumn": ("end_column", int, False),
+            "executionContextId": (
+                "execution_context_id",
+                runtime.ExecutionContextId,
+                False,
             ),
-            hash_=str(json["hash"]),
-            execution_context_aux_data=dict(json["executionContextAuxData"])
-            if json.get("executionContextAuxData", None) is not None
-            else None,
-            source_map_url=str(json["sourceMapURL"])
-            if json.get("sourceMapURL", None) is not None
-            else None,
-            has_source_url=bool(json["hasSourceURL"])
-            if json.get("hasSourceURL", None) is not None
-            else None,
-            is_module=bool(json["isModule"])
-            if json.get("isModule", None) is not None
-            else None,
-            length=int(json["length"])
-            if json.get("length", None) is not None
-            else None,
-            stack_trace=runtime.StackTrace.from_json(json["stackTrace"])
-            if json.get("stackTrace", None) is not None
-            else None,
-            code_offset=int(json["codeOffset"])
-            if json.get("codeOffset", None) is not None
-            else None,
-            script_language=ScriptLanguage.from_json(json["scriptLanguage"])
-            if json.get("scriptLanguage", None) is not None
-            else None,
-            embedder_name=str(json["embedderName"])
-            if json.get("embedderName", None) is not None
-            else None,
-        )
+            "hash": ("hash_", str, False),
+            "executionContextAuxData": ("execution_context_aux_data", dict, True),
+            "sourceMapURL": ("source_map_url", str, True),
+            "hasSourceURL": ("has_source_url", bool, True),
+            "isModule": ("is_module", bool, True),
+            "length": ("length", int, True),
+            "stackTrace": ("stack_trace", runtime.StackTrace.from_json, True),
+            "codeOffset": ("code_offset", int, True),
+            "scriptLanguage": ("script_language", ScriptLanguage, True),
+            "embedderName": ("embedder_name", str, True),
+        }
 
 
 @event_class("Debugger.scriptParsed")
-@dataclass
+@slotted_dataclass
 class ScriptParsed:
     """
     Fired when virtual machine parses script. This event is also fired for all known and uncollected
@@ -1445,48 +1482,36 @@ class ScriptParsed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptParsed:
-        return cls(
-            script_id=runtime.ScriptId.from_json(json["scriptId"]),
-            url=str(json["url"]),
-            start_line=int(json["startLine"]),
-            start_column=int(json["startColumn"]),
-            end_line=int(json["endLine"]),
-            end_column=int(json["endColumn"]),
-            execution_context_id=runtime.ExecutionContextId.from_json(
-                json["executionContextId"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scriptId": ("script_id", runtime.ScriptId, False),
+            "url": ("url", str, False),
+            "startLine": ("start_line", int, False),
+            "startColumn": ("start_column", int, False),
+            "endLine": ("end_line", int, False),
+            "endColumn": ("end_column", int, False),
+            "executionContextId": (
+                "execution_context_id",
+                runtime.ExecutionContextId,
+                False,
+            ),
+            "hash": ("hash_", str, False),
+            "executionContextAuxData": ("execution_context_aux_data", dict, True),
+            "isLiveEdit": ("is_live_edit", bool, True),
+            "sourceMapURL": ("source_map_url", str, True),
+            "hasSourceURL": ("has_source_url", bool, True),
+            "isModule": ("is_module", bool, True),
+            "length": ("length", int, True),
+            "stackTrace": ("stack_trace", runtime.StackTrace.from_json, True),
+            "codeOffset": ("code_offset", int, True),
+            "scriptLanguage": ("script_language", ScriptLanguage, True),
+            "debugSymbols": (
+                "debug_symbols",
+                lambda v: [DebugSymbols.from_json(i) for i in v],
+                True,
             ),
-            hash_=str(json["hash"]),
-            execution_context_aux_data=dict(json["executionContextAuxData"])
-            if json.get("executionContextAuxData", None) is not None
-            else None,
-            is_live_edit=bool(json["isLiveEdit"])
-            if json.get("isLiveEdit", None) is not None
-            else None,
-            source_map_url=str(json["sourceMapURL"])
-            if json.get("sourceMapURL", None) is not None
-            else None,
-            has_source_url=bool(json["hasSourceURL"])
-            if json.get("hasSourceURL", None) is not None
-            else None,
-            is_module=bool(json["isModule"])
-            if json.get("isModule", None) is not None
-            else None,
-            length=int(json["length"])
-            if json.get("length", None) is not None
-            else None,
-            stack_trace=runtime.StackTrace.from_json(json["stackTrace"])
-            if json.get("stackTrace", None) is not None
-            else None,
-            code_offset=int(json["codeOffset"])
-            if json.get("codeOffset", None) is not None
-            else None,
-            script_language=ScriptLanguage.from_json(json["scriptLanguage"])
-            if json.get("scriptLanguage", None) is not None
-            else None,
-            debug_symbols=[DebugSymbols.from_json(i) for i in json["debugSymbols"]]
-            if json.get("debugSymbols", None) is not None
-            else None,
-            embedder_name=str(json["embedderName"])
-            if json.get("embedderName", None) is not None
-            else None,
-        )
+            "embedderName": ("embedder_name", str, True),
+        }
@@ -6,10 +6,14 @@
 # CDP domain: DeviceAccess (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class RequestId(str):
@@ -44,7 +48,7 @@ class DeviceId(str):
         return "DeviceId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class PromptDevice:
     """
     Device information displayed in a user prompt to select a device.
@@ -63,10 +67,14 @@ class PromptDevice:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PromptDevice:
-        return cls(
-            id_=DeviceId.from_json(json["id"]),
-            name=str(json["name"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", DeviceId, False),
+            "name": ("name", str, False),
+        }
 
 
 def enable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -124,7 +132,7 @@ def cancel_prompt(id_: RequestId) -> typing.Generator[T_JSON_DICT, T_JSON_DICT,
 
 
 @event_class("DeviceAccess.deviceRequestPrompted")
-@dataclass
+@slotted_dataclass
 class DeviceRequestPrompted:
     """
     A device request opened a user prompt to select a device. Respond with the
@@ -136,7 +144,15 @@ class DeviceRequestPrompted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DeviceRequestPrompted:
-        return cls(
-            id_=RequestId.from_json(json["id"]),
-            devices=[PromptDevice.from_json(i) for i in json["devices"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", RequestId, False),
+            "devices": (
+                "devices",
+                lambda v: [PromptDevice.from_json(i) for i in v],
+                False,
+            ),
+        }
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import page
 from . import runtime
@@ -49,7 +54,7 @@ class BackendNodeId(int):
         return "BackendNodeId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class BackendNode:
     """
     Backend node with a friendly name.
@@ -72,11 +77,15 @@ class BackendNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackendNode:
-        return cls(
-            node_type=int(json["nodeType"]),
-            node_name=str(json["nodeName"]),
-            backend_node_id=BackendNodeId.from_json(json["backendNodeId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeType": ("node_type", int, False),
+            "nodeName": ("node_name", str, False),
+            "backendNodeId": ("backend_node_id", BackendNodeId, False),
+        }
 
 
 class PseudoType(enum.Enum):
@@ -214,7 +223,7 @@ class ScrollOrientation(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class Node:
     """
     DOM interaction is implemented in terms of mirror objects that represent the actual DOM nodes.
@@ -383,91 +392,59 @@ class Node:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Node:
-        return cls(
-            node_id=NodeId.from_json(json["nodeId"]),
-            backend_node_id=BackendNodeId.from_json(json["backendNodeId"]),
-            node_type=int(json["nodeType"]),
-            node_name=str(json["nodeName"]),
-            local_name=str(json["localName"]),
-            node_value=str(json["nodeValue"]),
-            parent_id=NodeId.from_json(json["parentId"])
-            if json.get("parentId", None) is not None
-            else None,
-            child_node_count=int(json["childNodeCount"])
-            if json.get("childNodeCount", None) is not None
-            else None,
-            children=[Node.from_json(i) for i in json["children"]]
-            if json.get("children", None) is not None
-            else None,
-            attributes=[str(i) for i in json["attributes"]]
-            if json.get("attributes", None) is not None
-            else None,
-            document_url=str(json["documentURL"])
-            if json.get("documentURL", None) is not None
-            else None,
-            base_url=str(json["baseURL"])
-            if json.get("baseURL", None) is not None
-            else None,
-            public_id=str(json["publicId"])
-            if json.get("publicId", None) is not None
-            else None,
-            system_id=str(json["systemId"])
-            if json.get("systemId", None) is not None
-            else None,
-            internal_subset=str(json["internalSubset"])
-            if json.get("internalSubset", None) is not None
-            else None,
-            xml_version=str(json["xmlVersion"])
-            if json.get("xmlVersion", None) is not None
-            else None,
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-            value=str(json["value"]) if json.get("value", None) is not None else None,
-            pseudo_type=PseudoType.from_json(json["pseudoType"])
-            if json.get("pseudoType", None) is not None
-            else None,
-            pseudo_identifier=str(json["pseudoIdentifier"])
-            if json.get("pseudoIdentifier", None) is not None
-            else None,
-            shadow_root_type=ShadowRootType.from_json(json["shadowRootType"])
-            if json.get("shadowRootType", None) is not None
-            else None,
-            frame_id=page.FrameId.from_json(json["frameId"])
-            if json.get("frameId", None) is not None
-            else None,
-            content_document=Node.from_json(json["contentDocument"])
-            if json.get("contentDocument", None) is not None
-            else None,
-            shadow_roots=[Node.from_json(i) for i in json["shadowRoots"]]
-            if json.get("shadowRoots", None) is not None
-            else None,
-            template_content=Node.from_json(json["templateContent"])
-            if json.get("templateContent", None) is not None
-            else None,
-            pseudo_elements=[Node.from_json(i) for i in json["pseudoElements"]]
-            if json.get("pseudoElements", None) is not None
-            else None,
-            imported_document=Node.from_json(json["importedDocument"])
-            if json.get("importedDocument", None) is not None
-            else None,
-            distributed_nodes=[
-                BackendNode.from_json(i) for i in json["distributedNodes"]
-            ]
-            if json.get("distributedNodes", None) is not None
-            else None,
-            is_svg=bool(json["isSVG"]) if json.get("isSVG", None) is not None else None,
-            compatibility_mode=CompatibilityMode.from_json(json["compatibilityMode"])
-            if json.get("compatibilityMode", None) is not None
-            else None,
-            assigned_slot=BackendNode.from_json(json["assignedSlot"])
-            if json.get("assignedSlot", None) is not None
-            else None,
-            is_scrollable=bool(json["isScrollable"])
-            if json.get("isScrollable", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", NodeId, False),
+            "backendNodeId": ("backend_node_id", BackendNodeId, False),
+            "nodeType": ("node_type", int, False),
+            "nodeName": ("node_name", str, False),
+            "localName": ("local_name", str, False),
+            "nodeValue": ("node_value", str, False),
+            "parentId": ("parent_id", NodeId, True),
+            "childNodeCount": ("child_node_count", int, True),
+            "children": ("children", lambda v: [Node.from_json(i) for i in v], True),
+            "attributes": ("attributes", lambda v: [str(i) for i in v], True),
+            "documentURL": ("document_url", str, True),
+            "baseURL": ("base_url", str, True),
+            "publicId": ("public_id", str, True),
+            "systemId": ("system_id", str, True),
+            "internalSubset": ("internal_subset", str, True),
+            "xmlVersion": ("xml_version", str, True),
+            "name": ("name", str, True),
+            "value": ("value", str, True),
+            "pseudoType": ("pseudo_type", PseudoType, True),
+            "pseudoIdentifier": ("pseudo_identifier", str, True),
+            "shadowRootType": ("shadow_root_type", ShadowRootType, True),
+            "frameId": ("frame_id", page.FrameId, True),
+            "contentDocument": ("content_document", Node.from_json, True),
+            "shadowRoots": (
+                "shadow_roots",
+                lambda v: [Node.from_json(i) for i in v],
+                True,
+            ),
+            "templateContent": ("template_content", Node.from_json, True),
+            "pseudoElements": (
+                "pseudo_elements",
+                lambda v: [Node.from_json(i) for i in v],
+                True,
+            ),
+            "importedDocument": ("imported_document", Node.from_json, True),
+            "distributedNodes": (
+                "distributed_nodes",
+                lambda v: [BackendNode.from_json(i) for i in v],
+                True,
+            ),
+            "isSVG": ("is_svg", bool, True),
+            "compatibilityMode": ("compatibility_mode", CompatibilityMode, True),
+            "assignedSlot": ("assigned_slot", BackendNode.from_json, True),
+            "isScrollable": ("is_scrollable", bool, True),
+        }
+
+
+@slotted_dataclass
 class DetachedElementInfo:
     """
     A structure to hold the top-level node of a detached tree and an array of its retained descendants.
@@ -485,13 +462,21 @@ class DetachedElementInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DetachedElementInfo:
-        return cls(
-            tree_node=Node.from_json(json["treeNode"]),
-            retained_node_ids=[NodeId.from_json(i) for i in json["retainedNodeIds"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "treeNode": ("tree_node", Node.from_json, False),
+            "retainedNodeIds": (
+                "retained_node_ids",
+                lambda v: [NodeId(i) for i in v],
+                False,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class RGBA:
     """
     A structure holding an RGBA color.
@@ -520,12 +505,16 @@ class RGBA:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RGBA:
-        return cls(
-            r=int(json["r"]),
-            g=int(json["g"]),
-            b=int(json["b"]),
-            a=float(json["a"]) if json.get("a", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "r": ("r", int, False),
+            "g": ("g", int, False),
+            "b": ("b", int, False),
+            "a": ("a", float, True),
+        }
 
 
 class Quad(list):
@@ -544,7 +533,7 @@ class Quad(list):
         return "Quad({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class BoxModel:
     """
     Box model.
@@ -585,20 +574,22 @@ class BoxModel:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BoxModel:
-        return cls(
-            content=Quad.from_json(json["content"]),
-            padding=Quad.from_json(json["padding"]),
-            border=Quad.from_json(json["border"]),
-            margin=Quad.from_json(json["margin"]),
-            width=int(json["width"]),
-            height=int(json["height"]),
-            shape_outside=ShapeOutsideInfo.from_json(json["shapeOutside"])
-            if json.get("shapeOutside", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "content": ("content", Quad, False),
+            "padding": ("padding", Quad, False),
+            "border": ("border", Quad, False),
+            "margin": ("margin", Quad, False),
+            "width": ("width", int, False),
+            "height": ("height", int, False),
+            "shapeOutside": ("shape_outside", ShapeOutsideInfo.from_json, True),
+        }
+
+
+@slotted_dataclass
 class ShapeOutsideInfo:
     """
     CSS Shape Outside details.
@@ -622,14 +613,18 @@ class ShapeOutsideInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShapeOutsideInfo:
-        return cls(
-            bounds=Quad.from_json(json["bounds"]),
-            shape=[i for i in json["shape"]],
-            margin_shape=[i for i in json["marginShape"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "bounds": ("bounds", Quad, False),
+            "shape": ("shape", lambda v: [i for i in v], False),
+            "marginShape": ("margin_shape", lambda v: [i for i in v], False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Rect:
     """
     Rectangle.
@@ -657,15 +652,19 @@ class Rect:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Rect:
-        return cls(
-            x=float(json["x"]),
-            y=float(json["y"]),
-            width=float(json["width"]),
-            height=float(json["height"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "x": ("x", float, False),
+            "y": ("y", float, False),
+            "width": ("width", float, False),
+            "height": ("height", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CSSComputedStyleProperty:
     #: Computed style property name.
     name: str
@@ -681,10 +680,14 @@ class CSSComputedStyleProperty:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSComputedStyleProperty:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
 
 def collect_class_names_from_subtree(
@@ -1877,7 +1880,7 @@ def get_anchor_element(
 
 
 @event_class("DOM.attributeModified")
-@dataclass
+@slotted_dataclass
 class AttributeModified:
     """
     Fired when ``Element``'s attribute is modified.
@@ -1892,15 +1895,19 @@ class AttributeModified:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributeModified:
-        return cls(
-            node_id=NodeId.from_json(json["nodeId"]),
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", NodeId, False),
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
 
 @event_class("DOM.attributeRemoved")
-@dataclass
+@slotted_dataclass
 class AttributeRemoved:
     """
     Fired when ``Element``'s attribute is removed.
@@ -1913,11 +1920,18 @@ class AttributeRemoved:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributeRemoved:
-        return cls(node_id=NodeId.from_json(json["nodeId"]), name=str(json["name"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", NodeId, False),
+            "name": ("name", str, False),
+        }
 
 
 @event_class("DOM.characterDataModified")
-@dataclass
+@slotted_dataclass
 class CharacterDataModified:
     """
     Mirrors ``DOMCharacterDataModified`` event.
@@ -1930,14 +1944,18 @@ class CharacterDataModified:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CharacterDataModified:
-        return cls(
-            node_id=NodeId.from_json(json["nodeId"]),
-            character_data=str(json["characterData"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", NodeId, False),
+            "characterData": ("character_data", str, False),
+        }
 
 
 @event_class("DOM.childNodeCountUpdated")
-@dataclass
+@slotted_dataclass
 class ChildNodeCountUpdated:
     """
     Fired when ``Container``'s child node count has changed.
@@ -1950,14 +1968,18 @@ class ChildNodeCountUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeCountUpdated:
-        return cls(
-            node_id=NodeId.from_json(json["nodeId"]),
-            child_node_count=int(json["childNodeCount"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", NodeId, False),
+            "childNodeCount": ("child_node_count", int, False),
+        }
 
 
 @event_class("DOM.childNodeInserted")
-@dataclass
+@slotted_dataclass
 class ChildNodeInserted:
     """
     Mirrors ``DOMNodeInserted`` event.
@@ -1972,15 +1994,19 @@ class ChildNodeInserted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeInserted:
-        return cls(
-            parent_node_id=NodeId.from_json(json["parentNodeId"]),
-            previous_node_id=NodeId.from_json(json["previousNodeId"]),
-            node=Node.from_json(json["node"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "parentNodeId": ("parent_node_id", NodeId, False),
+            "previousNodeId": ("previous_node_id", NodeId, False),
+            "node": ("node", Node.from_json, False),
+        }
 
 
 @event_class("DOM.childNodeRemoved")
-@dataclass
+@slotted_dataclass
 class ChildNodeRemoved:
     """
     Mirrors ``DOMNodeRemoved`` event.
@@ -1993,14 +2019,18 @@ class ChildNodeRemoved:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeRemoved:
-        return cls(
-            parent_node_id=NodeId.from_json(json["parentNodeId"]),
-            node_id=NodeId.from_json(json["nodeId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "parentNodeId": ("parent_node_id", NodeId, False),
+            "nodeId": ("node_id", NodeId, False),
+        }
 
 
 @event_class("DOM.distributedNodesUpdated")
-@dataclass
+@slotted_dataclass
 class DistributedNodesUpdated:
     """
     **EXPERIMENTAL**
@@ -2015,16 +2045,22 @@ class DistributedNodesUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DistributedNodesUpdated:
-        return cls(
-            insertion_point_id=NodeId.from_json(json["insertionPointId"]),
-            distributed_nodes=[
-                BackendNode.from_json(i) for i in json["distributedNodes"]
-            ],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "insertionPointId": ("insertion_point_id", NodeId, False),
+            "distributedNodes": (
+                "distributed_nodes",
+                lambda v: [BackendNode.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 @event_class("DOM.documentUpdated")
-@dataclass
+@slotted_dataclass
 class DocumentUpdated:
     """
     Fired when ``Document`` has been totally updated. Node ids are no longer valid.
@@ -2032,11 +2068,15 @@ class DocumentUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DocumentUpdated:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("DOM.inlineStyleInvalidated")
-@dataclass
+@slotted_dataclass
 class InlineStyleInvalidated:
     """
     **EXPERIMENTAL**
@@ -2049,11 +2089,17 @@ class InlineStyleInvalidated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InlineStyleInvalidated:
-        return cls(node_ids=[NodeId.from_json(i) for i in json["nodeIds"]])
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeIds": ("node_ids", lambda v: [NodeId(i) for i in v], False),
+        }
 
 
 @event_class("DOM.pseudoElementAdded")
-@dataclass
+@slotted_dataclass
 class PseudoElementAdded:
     """
     **EXPERIMENTAL**
@@ -2068,14 +2114,18 @@ class PseudoElementAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementAdded:
-        return cls(
-            parent_id=NodeId.from_json(json["parentId"]),
-            pseudo_element=Node.from_json(json["pseudoElement"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "parentId": ("parent_id", NodeId, False),
+            "pseudoElement": ("pseudo_element", Node.from_json, False),
+        }
 
 
 @event_class("DOM.topLayerElementsUpdated")
-@dataclass
+@slotted_dataclass
 class TopLayerElementsUpdated:
     """
     **EXPERIMENTAL**
@@ -2085,11 +2135,15 @@ class TopLayerElementsUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TopLayerElementsUpdated:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("DOM.scrollableFlagUpdated")
-@dataclass
+@slotted_dataclass
 class ScrollableFlagUpdated:
     """
     **EXPERIMENTAL**
@@ -2104,14 +2158,18 @@ class ScrollableFlagUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScrollableFlagUpdated:
-        return cls(
-            node_id=NodeId.from_json(json["nodeId"]),
-            is_scrollable=bool(json["isScrollable"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", NodeId, False),
+            "isScrollable": ("is_scrollable", bool, False),
+        }
 
 
 @event_class("DOM.pseudoElementRemoved")
-@dataclass
+@slotted_dataclass
 class PseudoElementRemoved:
     """
     **EXPERIMENTAL**
@@ -2126,14 +2184,18 @@ class PseudoElementRemoved:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementRemoved:
-        return cls(
-            parent_id=NodeId.from_json(json["parentId"]),
-            pseudo_element_id=NodeId.from_json(json["pseudoElementId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "parentId": ("parent_id", NodeId, False),
+            "pseudoElementId": ("pseudo_element_id", NodeId, False),
+        }
 
 
 @event_class("DOM.setChildNodes")
-@dataclass
+@slotted_dataclass
 class SetChildNodes:
     """
     Fired when backend wants to provide client with the missing DOM structure. This happens upon
@@ -2147,14 +2209,18 @@ class SetChildNodes:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SetChildNodes:
-        return cls(
-            parent_id=NodeId.from_json(json["parentId"]),
-            nodes=[Node.from_json(i) for i in json["nodes"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "parentId": ("parent_id", NodeId, False),
+            "nodes": ("nodes", lambda v: [Node.from_json(i) for i in v], False),
+        }
 
 
 @event_class("DOM.shadowRootPopped")
-@dataclass
+@slotted_dataclass
 class ShadowRootPopped:
     """
     **EXPERIMENTAL**
@@ -2169,14 +2235,18 @@ class ShadowRootPopped:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShadowRootPopped:
-        return cls(
-            host_id=NodeId.from_json(json["hostId"]),
-            root_id=NodeId.from_json(json["rootId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "hostId": ("host_id", NodeId, False),
+            "rootId": ("root_id", NodeId, False),
+        }
 
 
 @event_class("DOM.shadowRootPushed")
-@dataclass
+@slotted_dataclass
 class ShadowRootPushed:
     """
     **EXPERIMENTAL**
@@ -2191,6 +2261,11 @@ class ShadowRootPushed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShadowRootPushed:
-        return cls(
-            host_id=NodeId.from_json(json["hostId"]), root=Node.from_json(json["root"])
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "hostId": ("host_id", NodeId, False),
+            "root": ("root", Node.from_json, False),
+        }
@@ -8,8 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import runtime
@@ -49,7 +53,7 @@ class CSPViolationType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class EventListener:
     """
     Object event listener.
@@ -104,24 +108,26 @@ class EventListener:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventListener:
-        return cls(
-            type_=str(json["type"]),
-            use_capture=bool(json["useCapture"]),
-            passive=bool(json["passive"]),
-            once=bool(json["once"]),
-            script_id=runtime.ScriptId.from_json(json["scriptId"]),
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"]),
-            handler=runtime.RemoteObject.from_json(json["handler"])
-            if json.get("handler", None) is not None
-            else None,
-            original_handler=runtime.RemoteObject.from_json(json["originalHandler"])
-            if json.get("originalHandler", None) is not None
-            else None,
-            backend_node_id=dom.BackendNodeId.from_json(json["backendNodeId"])
-            if json.get("backendNodeId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "useCapture": ("use_capture", bool, False),
+            "passive": ("passive", bool, False),
+            "once": ("once", bool, False),
+            "scriptId": ("script_id", runtime.ScriptId, False),
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, False),
+            "handler": ("handler", runtime.RemoteObject.from_json, True),
+            "originalHandler": (
+                "original_handler",
+                runtime.RemoteObject.from_json,
+                True,
+            ),
+            "backendNodeId": ("backend_node_id", dom.BackendNodeId, True),
+        }
 
 
 def get_event_listeners(
@@ -6,10 +6,13 @@
 # CDP domain: DOMSnapshot (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import dom_debugger
@@ -17,7 +20,7 @@ from . import page
 from deprecated.sphinx import deprecated  # type: ignore
 
 
-@dataclass
+@slotted_dataclass
 class DOMNode:
     """
     A Node in the DOM tree.
@@ -170,89 +173,59 @@ class DOMNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DOMNode:
-        return cls(
-            node_type=int(json["nodeType"]),
-            node_name=str(json["nodeName"]),
-            node_value=str(json["nodeValue"]),
-            backend_node_id=dom.BackendNodeId.from_json(json["backendNodeId"]),
-            text_value=str(json["textValue"])
-            if json.get("textValue", None) is not None
-            else None,
-            input_value=str(json["inputValue"])
-            if json.get("inputValue", None) is not None
-            else None,
-            input_checked=bool(json["inputChecked"])
-            if json.get("inputChecked", None) is not None
-            else None,
-            option_selected=bool(json["optionSelected"])
-            if json.get("optionSelected", None) is not None
-            else None,
-            child_node_indexes=[int(i) for i in json["childNodeIndexes"]]
-            if json.get("childNodeIndexes", None) is not None
-            else None,
-            attributes=[NameValue.from_json(i) for i in json["attributes"]]
-            if json.get("attributes", None) is not None
-            else None,
-            pseudo_element_indexes=[int(i) for i in json["pseudoElementIndexes"]]
-            if json.get("pseudoElementIndexes", None) is not None
-            else None,
-            layout_node_index=int(json["layoutNodeIndex"])
-            if json.get("layoutNodeIndex", None) is not None
-            else None,
-            document_url=str(json["documentURL"])
-            if json.get("documentURL", None) is not None
-            else None,
-            base_url=str(json["baseURL"])
-            if json.get("baseURL", None) is not None
-            else None,
-            content_language=str(json["contentLanguage"])
-            if json.get("contentLanguage", None) is not None
-            else None,
-            document_encoding=str(json["documentEncoding"])
-            if json.get("documentEncoding", None) is not None
-            else None,
-            public_id=str(json["publicId"])
-            if json.get("publicId", None) is not None
-            else None,
-            system_id=str(json["systemId"])
-            if json.get("systemId", None) is not None
-            else None,
-            frame_id=page.FrameId.from_json(json["frameId"])
-            if json.get("frameId", None) is not None
-            else None,
-            content_document_index=int(json["contentDocumentIndex"])
-            if json.get("contentDocumentIndex", None) is not None
-            else None,
-            pseudo_type=dom.PseudoType.from_json(json["pseudoType"])
-            if json.get("pseudoType", None) is not None
-            else None,
-            shadow_root_type=dom.ShadowRootType.from_json(json["shadowRootType"])
-            if json.get("shadowRootType", None) is not None
-            else None,
-            is_clickable=bool(json["isClickable"])
-            if json.get("isClickable", None) is not None
-            else None,
-            event_listeners=[
-                dom_debugger.EventListener.from_json(i) for i in json["eventListeners"]
-            ]
-            if json.get("eventListeners", None) is not None
-            else None,
-            current_source_url=str(json["currentSourceURL"])
-            if json.get("currentSourceURL", None) is not None
-            else None,
-            origin_url=str(json["originURL"])
-            if json.get("originURL", None) is not None
-            else None,
-            scroll_offset_x=float(json["scrollOffsetX"])
-            if json.get("scrollOffsetX", None) is not None
-            else None,
-            scroll_offset_y=float(json["scrollOffsetY"])
-            if json.get("scrollOffsetY", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeType": ("node_type", int, False),
+            "nodeName": ("node_name", str, False),
+            "nodeValue": ("node_value", str, False),
+            "backendNodeId": ("backend_node_id", dom.BackendNodeId, False),
+            "textValue": ("text_value", str, True),
+            "inputValue": ("input_value", str, True),
+            "inputChecked": ("input_checked", bool, True),
+            "optionSelected": ("option_selected", bool, True),
+            "childNodeIndexes": (
+                "child_node_indexes",
+                lambda v: [int(i) for i in v],
+                True,
+            ),
+            "attributes": (
+                "attributes",
+                lambda v: [NameValue.from_json(i) for i in v],
+                True,
+            ),
+            "pseudoElementIndexes": (
+                "pseudo_element_indexes",
+                lambda v: [int(i) for i in v],
+                True,
+            ),
+            "layoutNodeIndex": ("layout_node_index", int, True),
+            "documentURL": ("document_url", str, True),
+            "baseURL": ("base_url", str, True),
+            "contentLanguage": ("content_language", str, True),
+            "documentEncoding": ("document_encoding", str, True),
+            "publicId": ("public_id", str, True),
+            "systemId": ("system_id", str, True),
+            "frameId": ("frame_id", page.FrameId, True),
+            "contentDocumentIndex": ("content_document_index", int, True),
+            "pseudoType": ("pseudo_type", dom.PseudoType, True),
+            "shadowRootType": ("shadow_root_type", dom.ShadowRootType, True),
+            "isClickable": ("is_clickable", bool, True),
+            "eventListeners": (
+                "event_listeners",
+                lambda v: [dom_debugger.EventListener.from_json(i) for i in v],
+                True,
+            ),
+            "currentSourceURL": ("current_source_url", str, True),
+            "originURL": ("origin_url", str, True),
+            "scrollOffsetX": ("scroll_offset_x", float, True),
+            "scrollOffsetY": ("scroll_offset_y", float, True),
+        }
+
+
+@slotted_dataclass
 class InlineTextBox:
     """
     Details of post layout rendered text positions. The exact layout should not be regarded as
@@ -279,14 +252,18 @@ class InlineTextBox:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InlineTextBox:
-        return cls(
-            bounding_box=dom.Rect.from_json(json["boundingBox"]),
-            start_character_index=int(json["startCharacterIndex"]),
-            num_characters=int(json["numCharacters"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "boundingBox": ("bounding_box", dom.Rect.from_json, False),
+            "startCharacterIndex": ("start_character_index", int, False),
+            "numCharacters": ("num_characters", int, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class LayoutTreeNode:
     """
     Details of an element in the DOM tree with a LayoutObject.
@@ -333,30 +310,26 @@ class LayoutTreeNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutTreeNode:
-        return cls(
-            dom_node_index=int(json["domNodeIndex"]),
-            bounding_box=dom.Rect.from_json(json["boundingBox"]),
-            layout_text=str(json["layoutText"])
-            if json.get("layoutText", None) is not None
-            else None,
-            inline_text_nodes=[
-                InlineTextBox.from_json(i) for i in json["inlineTextNodes"]
-            ]
-            if json.get("inlineTextNodes", None) is not None
-            else None,
-            style_index=int(json["styleIndex"])
-            if json.get("styleIndex", None) is not None
-            else None,
-            paint_order=int(json["paintOrder"])
-            if json.get("paintOrder", None) is not None
-            else None,
-            is_stacking_context=bool(json["isStackingContext"])
-            if json.get("isStackingContext", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "domNodeIndex": ("dom_node_index", int, False),
+            "boundingBox": ("bounding_box", dom.Rect.from_json, False),
+            "layoutText": ("layout_text", str, True),
+            "inlineTextNodes": (
+                "inline_text_nodes",
+                lambda v: [InlineTextBox.from_json(i) for i in v],
+                True,
+            ),
+            "styleIndex": ("style_index", int, True),
+            "paintOrder": ("paint_order", int, True),
+            "isStackingContext": ("is_stacking_context", bool, True),
+        }
+
+
+@slotted_dataclass
 class ComputedStyle:
     """
     A subset of the full ComputedStyle as defined by the request whitelist.
@@ -372,12 +345,20 @@ class ComputedStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ComputedStyle:
-        return cls(
-            properties=[NameValue.from_json(i) for i in json["properties"]],
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "properties": (
+                "properties",
+                lambda v: [NameValue.from_json(i) for i in v],
+                False,
+            ),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class NameValue:
     """
     A name/value pair.
@@ -397,10 +378,14 @@ class NameValue:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NameValue:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
 
 class StringIndex(int):
@@ -435,7 +420,7 @@ class ArrayOfStrings(list):
         return "ArrayOfStrings({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class RareStringData:
     """
     Data that is only present on rare nodes.
@@ -453,13 +438,17 @@ class RareStringData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareStringData:
-        return cls(
-            index=[int(i) for i in json["index"]],
-            value=[StringIndex.from_json(i) for i in json["value"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "index": ("index", lambda v: [int(i) for i in v], False),
+            "value": ("value", lambda v: [StringIndex(i) for i in v], False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class RareBooleanData:
     index: typing.List[int]
 
@@ -470,12 +459,16 @@ class RareBooleanData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareBooleanData:
-        return cls(
-            index=[int(i) for i in json["index"]],
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "index": ("index", lambda v: [int(i) for i in v], False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class RareIntegerData:
     index: typing.List[int]
 
@@ -489,10 +482,14 @@ class RareIntegerData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareIntegerData:
-        return cls(
-            index=[int(i) for i in json["index"]],
-            value=[int(i) for i in json["value"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "index": ("index", lambda v: [int(i) for i in v], False),
+            "value": ("value", lambda v: [int(i) for i in v], False),
+        }
 
 
 class Rectangle(list):
@@ -507,7 +504,7 @@ class Rectangle(list):
         return "Rectangle({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class DocumentSnapshot:
     """
     Document snapshot.
@@ -583,34 +580,30 @@ class DocumentSnapshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DocumentSnapshot:
-        return cls(
-            document_url=StringIndex.from_json(json["documentURL"]),
-            title=StringIndex.from_json(json["title"]),
-            base_url=StringIndex.from_json(json["baseURL"]),
-            content_language=StringIndex.from_json(json["contentLanguage"]),
-            encoding_name=StringIndex.from_json(json["encodingName"]),
-            public_id=StringIndex.from_json(json["publicId"]),
-            system_id=StringIndex.from_json(json["systemId"]),
-            frame_id=StringIndex.from_json(json["frameId"]),
-            nodes=NodeTreeSnapshot.from_json(json["nodes"]),
-            layout=LayoutTreeSnapshot.from_json(json["layout"]),
-            text_boxes=TextBoxSnapshot.from_json(json["textBoxes"]),
-            scroll_offset_x=float(json["scrollOffsetX"])
-            if json.get("scrollOffsetX", None) is not None
-            else None,
-            scroll_offset_y=float(json["scrollOffsetY"])
-            if json.get("scrollOffsetY", None) is not None
-            else None,
-            content_width=float(json["contentWidth"])
-            if json.get("contentWidth", None) is not None
-            else None,
-            content_height=float(json["contentHeight"])
-            if json.get("contentHeight", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "documentURL": ("document_url", StringIndex, False),
+            "title": ("title", StringIndex, False),
+            "baseURL": ("base_url", StringIndex, False),
+            "contentLanguage": ("content_language", StringIndex, False),
+            "encodingName": ("encoding_name", StringIndex, False),
+            "publicId": ("public_id", StringIndex, False),
+            "systemId": ("system_id", StringIndex, False),
+            "frameId": ("frame_id", StringIndex, False),
+            "nodes": ("nodes", NodeTreeSnapshot.from_json, False),
+            "layout": ("layout", LayoutTreeSnapshot.from_json, False),
+            "textBoxes": ("text_boxes", TextBoxSnapshot.from_json, False),
+            "scrollOffsetX": ("scroll_offset_x", float, True),
+            "scrollOffsetY": ("scroll_offset_y", float, True),
+            "contentWidth": ("content_width", float, True),
+            "contentHeight": ("content_height", float, True),
+        }
+
+
+@slotted_dataclass
 class NodeTreeSnapshot:
     """
     Table containing nodes.
@@ -710,66 +703,44 @@ class NodeTreeSnapshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeTreeSnapshot:
-        return cls(
-            parent_index=[int(i) for i in json["parentIndex"]]
-            if json.get("parentIndex", None) is not None
-            else None,
-            node_type=[int(i) for i in json["nodeType"]]
-            if json.get("nodeType", None) is not None
-            else None,
-            shadow_root_type=RareStringData.from_json(json["shadowRootType"])
-            if json.get("shadowRootType", None) is not None
-            else None,
-            node_name=[StringIndex.from_json(i) for i in json["nodeName"]]
-            if json.get("nodeName", None) is not None
-            else None,
-            node_value=[StringIndex.from_json(i) for i in json["nodeValue"]]
-            if json.get("nodeValue", None) is not None
-            else None,
-            backend_node_id=[
-                dom.BackendNodeId.from_json(i) for i in json["backendNodeId"]
-            ]
-            if json.get("backendNodeId", None) is not None
-            else None,
-            attributes=[ArrayOfStrings.from_json(i) for i in json["attributes"]]
-            if json.get("attributes", None) is not None
-            else None,
-            text_value=RareStringData.from_json(json["textValue"])
-            if json.get("textValue", None) is not None
-            else None,
-            input_value=RareStringData.from_json(json["inputValue"])
-            if json.get("inputValue", None) is not None
-            else None,
-            input_checked=RareBooleanData.from_json(json["inputChecked"])
-            if json.get("inputChecked", None) is not None
-            else None,
-            option_selected=RareBooleanData.from_json(json["optionSelected"])
-            if json.get("optionSelected", None) is not None
-            else None,
-            content_document_index=RareIntegerData.from_json(
-                json["contentDocumentIndex"]
-            )
-            if json.get("contentDocumentIndex", None) is not None
-            else None,
-            pseudo_type=RareStringData.from_json(json["pseudoType"])
-            if json.get("pseudoType", None) is not None
-            else None,
-            pseudo_identifier=RareStringData.from_json(json["pseudoIdentifier"])
-            if json.get("pseudoIdentifier", None) is not None
-            else None,
-            is_clickable=RareBooleanData.from_json(json["isClickable"])
-            if json.get("isClickable", None) is not None
-            else None,
-            current_source_url=RareStringData.from_json(json["currentSourceURL"])
-            if json.get("currentSourceURL", None) is not None
-            else None,
-            origin_url=RareStringData.from_json(json["originURL"])
-            if json.get("originURL", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "parentIndex": ("parent_index", lambda v: [int(i) for i in v], True),
+            "nodeType": ("node_type", lambda v: [int(i) for i in v], True),
+            "shadowRootType": ("shadow_root_type", RareStringData.from_json, True),
+            "nodeName": ("node_name", lambda v: [StringIndex(i) for i in v], True),
+            "nodeValue": ("node_value", lambda v: [StringIndex(i) for i in v], True),
+            "backendNodeId": (
+                "backend_node_id",
+                lambda v: [dom.BackendNodeId(i) for i in v],
+                True,
+            ),
+            "attributes": (
+                "attributes",
+                lambda v: [ArrayOfStrings(i) for i in v],
+                True,
+            ),
+            "textValue": ("text_value", RareStringData.from_json, True),
+            "inputValue": ("input_value", RareStringData.from_json, True),
+            "inputChecked": ("input_checked", RareBooleanData.from_json, True),
+            "optionSelected": ("option_selected", RareBooleanData.from_json, True),
+            "contentDocumentIndex": (
+                "content_document_index",
+                RareIntegerData.from_json,
+                True,
+            ),
+            "pseudoType": ("pseudo_type", RareStringData.from_json, True),
+            "pseudoIdentifier": ("pseudo_identifier", RareStringData.from_json, True),
+            "isClickable": ("is_clickable", RareBooleanData.from_json, True),
+            "currentSourceURL": ("current_source_url", RareStringData.from_json, True),
+            "originURL": ("origin_url", RareStringData.from_json, True),
+        }
+
+
+@slotted_dataclass
 class LayoutTreeSnapshot:
     """
     Table of details of an element in the DOM tree with a LayoutObject.
@@ -835,36 +806,34 @@ class LayoutTreeSnapshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutTreeSnapshot:
-        return cls(
-            node_index=[int(i) for i in json["nodeIndex"]],
-            styles=[ArrayOfStrings.from_json(i) for i in json["styles"]],
-            bounds=[Rectangle.from_json(i) for i in json["bounds"]],
-            text=[StringIndex.from_json(i) for i in json["text"]],
-            stacking_contexts=RareBooleanData.from_json(json["stackingContexts"]),
-            paint_orders=[int(i) for i in json["paintOrders"]]
-            if json.get("paintOrders", None) is not None
-            else None,
-            offset_rects=[Rectangle.from_json(i) for i in json["offsetRects"]]
-            if json.get("offsetRects", None) is not None
-            else None,
-            scroll_rects=[Rectangle.from_json(i) for i in json["scrollRects"]]
-            if json.get("scrollRects", None) is not None
-            else None,
-            client_rects=[Rectangle.from_json(i) for i in json["clientRects"]]
-            if json.get("clientRects", None) is not None
-            else None,
-            blended_background_colors=[
-                StringIndex.from_json(i) for i in json["blendedBackgroundColors"]
-            ]
-            if json.get("blendedBackgroundColors", None) is not None
-            else None,
-            text_color_opacities=[float(i) for i in json["textColorOpacities"]]
-            if json.get("textColorOpacities", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeIndex": ("node_index", lambda v: [int(i) for i in v], False),
+            "styles": ("styles", lambda v: [ArrayOfStrings(i) for i in v], False),
+            "bounds": ("bounds", lambda v: [Rectangle(i) for i in v], False),
+            "text": ("text", lambda v: [StringIndex(i) for i in v], False),
+            "stackingContexts": ("stacking_contexts", RareBooleanData.from_json, False),
+            "paintOrders": ("paint_orders", lambda v: [int(i) for i in v], True),
+            "offsetRects": ("offset_rects", lambda v: [Rectangle(i) for i in v], True),
+            "scrollRects": ("scroll_rects", lambda v: [Rectangle(i) for i in v], True),
+            "clientRects": ("client_rects", lambda v: [Rectangle(i) for i in v], True),
+            "blendedBackgroundColors": (
+                "blended_background_colors",
+                lambda v: [StringIndex(i) for i in v],
+                True,
+            ),
+            "textColorOpacities": (
+                "text_color_opacities",
+                lambda v: [float(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class TextBoxSnapshot:
     """
     Table of details of the post layout rendered text positions. The exact layout should not be regarded as
@@ -895,12 +864,16 @@ class TextBoxSnapshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TextBoxSnapshot:
-        return cls(
-            layout_index=[int(i) for i in json["layoutIndex"]],
-            bounds=[Rectangle.from_json(i) for i in json["bounds"]],
-            start=[int(i) for i in json["start"]],
-            length=[int(i) for i in json["length"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "layoutIndex": ("layout_index", lambda v: [int(i) for i in v], False),
+            "bounds": ("bounds", lambda v: [Rectangle(i) for i in v], False),
+            "start": ("start", lambda v: [int(i) for i in v], False),
+            "length": ("length", lambda v: [int(i) for i in v], False),
+        }
 
 
 def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
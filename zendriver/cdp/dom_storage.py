@@ -6,10 +6,14 @@
 # CDP domain: DOMStorage (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class SerializedStorageKey(str):
@@ -24,7 +28,7 @@ class SerializedStorageKey(str):
         return "SerializedStorageKey({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class StorageId:
     """
     DOM Storage identifier.
@@ -50,15 +54,15 @@ class StorageId:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageId:
-        return cls(
-            is_local_storage=bool(json["isLocalStorage"]),
-            security_origin=str(json["securityOrigin"])
-            if json.get("securityOrigin", None) is not None
-            else None,
-            storage_key=SerializedStorageKey.from_json(json["storageKey"])
-            if json.get("storageKey", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "isLocalStorage": ("is_local_storage", bool, False),
+            "securityOrigin": ("security_origin", str, True),
+            "storageKey": ("storage_key", SerializedStorageKey, True),
+        }
 
 
 class Item(list):
@@ -164,7 +168,7 @@ def set_dom_storage_item(
 
 
 @event_class("DOMStorage.domStorageItemAdded")
-@dataclass
+@slotted_dataclass
 class DomStorageItemAdded:
     storage_id: StorageId
     key: str
@@ -172,28 +176,37 @@ class DomStorageItemAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemAdded:
-        return cls(
-            storage_id=StorageId.from_json(json["storageId"]),
-            key=str(json["key"]),
-            new_value=str(json["newValue"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "storageId": ("storage_id", StorageId.from_json, False),
+            "key": ("key", str, False),
+            "newValue": ("new_value", str, False),
+        }
 
 
 @event_class("DOMStorage.domStorageItemRemoved")
-@dataclass
+@slotted_dataclass
 class DomStorageItemRemoved:
     storage_id: StorageId
     key: str
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemRemoved:
-        return cls(
-            storage_id=StorageId.from_json(json["storageId"]), key=str(json["key"])
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "storageId": ("storage_id", StorageId.from_json, False),
+            "key": ("key", str, False),
+        }
 
 
 @event_class("DOMStorage.domStorageItemUpdated")
-@dataclass
+@slotted_dataclass
 class DomStorageItemUpdated:
     storage_id: StorageId
     key: str
@@ -202,19 +215,29 @@ class DomStorageItemUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemUpdated:
-        return cls(
-            storage_id=StorageId.from_json(json["storageId"]),
-            key=str(json["key"]),
-            old_value=str(json["oldValue"]),
-            new_value=str(json["newValue"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "storageId": ("storage_id", StorageId.from_json, False),
+            "key": ("key", str, False),
+            "oldValue": ("old_value", str, False),
+            "newValue": ("new_value", str, False),
+        }
 
 
 @event_class("DOMStorage.domStorageItemsCleared")
-@dataclass
+@slotted_dataclass
 class DomStorageItemsCleared:
     storage_id: StorageId
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemsCleared:
-        return cls(storage_id=StorageId.from_json(json["storageId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "storageId": ("storage_id", StorageId.from_json, False),
+        }
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import network
@@ -17,7 +22,7 @@ from . import page
 from deprecated.sphinx import deprecated  # type: ignore
 
 
-@dataclass
+@slotted_dataclass
 class ScreenOrientation:
     """
     Screen orientation.
@@ -37,13 +42,17 @@ class ScreenOrientation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenOrientation:
-        return cls(
-            type_=str(json["type"]),
-            angle=int(json["angle"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "angle": ("angle", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class DisplayFeature:
     #: Orientation of a display feature in relation to screen
     orientation: str
@@ -66,14 +75,18 @@ class DisplayFeature:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DisplayFeature:
-        return cls(
-            orientation=str(json["orientation"]),
-            offset=int(json["offset"]),
-            mask_length=int(json["maskLength"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "orientation": ("orientation", str, False),
+            "offset": ("offset", int, False),
+            "maskLength": ("mask_length", int, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class DevicePosture:
     #: Current posture of the device
     type_: str
@@ -85,12 +98,16 @@ class DevicePosture:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DevicePosture:
-        return cls(
-            type_=str(json["type"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class MediaFeature:
     name: str
 
@@ -104,10 +121,14 @@ class MediaFeature:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaFeature:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
 
 class VirtualTimePolicy(enum.Enum):
@@ -130,7 +151,7 @@ class VirtualTimePolicy(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class UserAgentBrandVersion:
     """
     Used to specify User Agent Client Hints to emulate. See https://wicg.github.io/ua-client-hints
@@ -148,13 +169,17 @@ class UserAgentBrandVersion:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> UserAgentBrandVersion:
-        return cls(
-            brand=str(json["brand"]),
-            version=str(json["version"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "brand": ("brand", str, False),
+            "version": ("version", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class UserAgentMetadata:
     """
     Used to specify User Agent Client Hints to emulate. See https://wicg.github.io/ua-client-hints
@@ -204,28 +229,30 @@ class UserAgentMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> UserAgentMetadata:
-        return cls(
-            platform=str(json["platform"]),
-            platform_version=str(json["platformVersion"]),
-            architecture=str(json["architecture"]),
-            model=str(json["model"]),
-            mobile=bool(json["mobile"]),
-            brands=[UserAgentBrandVersion.from_json(i) for i in json["brands"]]
-            if json.get("brands", None) is not None
-            else None,
-            full_version_list=[
-                UserAgentBrandVersion.from_json(i) for i in json["fullVersionList"]
-            ]
-            if json.get("fullVersionList", None) is not None
-            else None,
-            full_version=str(json["fullVersion"])
-            if json.get("fullVersion", None) is not None
-            else None,
-            bitness=str(json["bitness"])
-            if json.get("bitness", None) is not None
-            else None,
-            wow64=bool(json["wow64"]) if json.get("wow64", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "platform": ("platform", str, False),
+            "platformVersion": ("platform_version", str, False),
+            "architecture": ("architecture", str, False),
+            "model": ("model", str, False),
+            "mobile": ("mobile", bool, False),
+            "brands": (
+                "brands",
+                lambda v: [UserAgentBrandVersion.from_json(i) for i in v],
+                True,
+            ),
+            "fullVersionList": (
+                "full_version_list",
+                lambda v: [UserAgentBrandVersion.from_json(i) for i in v],
+                True,
+            ),
+            "fullVersion": ("full_version", str, True),
+            "bitness": ("bitness", str, True),
+            "wow64": ("wow64", bool, True),
+        }
 
 
 class SensorType(enum.Enum):
@@ -251,7 +278,7 @@ class SensorType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class SensorMetadata:
     available: typing.Optional[bool] = None
 
@@ -271,20 +298,18 @@ class SensorMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorMetadata:
-        return cls(
-            available=bool(json["available"])
-            if json.get("available", None) is not None
-            else None,
-            minimum_frequency=float(json["minimumFrequency"])
-            if json.get("minimumFrequency", None) is not None
-            else None,
-            maximum_frequency=float(json["maximumFrequency"])
-            if json.get("maximumFrequency", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "available": ("available", bool, True),
+            "minimumFrequency": ("minimum_frequency", float, True),
+            "maximumFrequency": ("maximum_frequency", float, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class SensorReadingSingle:
     value: float
 
@@ -295,12 +320,16 @@ class SensorReadingSingle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorReadingSingle:
-        return cls(
-            value=float(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "value": ("value", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SensorReadingXYZ:
     x: float
 
@@ -317,14 +346,18 @@ class SensorReadingXYZ:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorReadingXYZ:
-        return cls(
-            x=float(json["x"]),
-            y=float(json["y"]),
-            z=float(json["z"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "x": ("x", float, False),
+            "y": ("y", float, False),
+            "z": ("z", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SensorReadingQuaternion:
     x: float
 
@@ -344,15 +377,19 @@ class SensorReadingQuaternion:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorReadingQuaternion:
-        return cls(
-            x=float(json["x"]),
-            y=float(json["y"]),
-            z=float(json["z"]),
-            w=float(json["w"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "x": ("x", float, False),
+            "y": ("y", float, False),
+            "z": ("z", float, False),
+            "w": ("w", float, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class SensorReading:
     single: typing.Optional[SensorReadingSingle] = None
 
@@ -372,17 +409,15 @@ class SensorReading:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorReading:
-        return cls(
-            single=SensorReadingSingle.from_json(json["single"])
-            if json.get("single", None) is not None
-            else None,
-            xyz=SensorReadingXYZ.from_json(json["xyz"])
-            if json.get("xyz", None) is not None
-            else None,
-            quaternion=SensorReadingQuaternion.from_json(json["quaternion"])
-            if json.get("quaternion", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "single": ("single", SensorReadingSingle.from_json, True),
+            "xyz": ("xyz", SensorReadingXYZ.from_json, True),
+            "quaternion": ("quaternion", SensorReadingQuaternion.from_json, True),
+        }
 
 
 class PressureSource(enum.Enum):
@@ -410,7 +445,7 @@ class PressureState(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class PressureMetadata:
     available: typing.Optional[bool] = None
 
@@ -422,11 +457,13 @@ class PressureMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PressureMetadata:
-        return cls(
-            available=bool(json["available"])
-            if json.get("available", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "available": ("available", bool, True),
+        }
 
 
 class DisabledImageType(enum.Enum):
@@ -1214,7 +1251,7 @@ def set_automation_override(
 
 
 @event_class("Emulation.virtualTimeBudgetExpired")
-@dataclass
+@slotted_dataclass
 class VirtualTimeBudgetExpired:
     """
     **EXPERIMENTAL**
@@ -1224,4 +1261,8 @@ class VirtualTimeBudgetExpired:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VirtualTimeBudgetExpired:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class LoginState(enum.Enum):
@@ -80,7 +85,7 @@ class AccountUrlType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class Account:
     """
     Corresponds to IdentityRequestAccount
@@ -125,22 +130,22 @@ class Account:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Account:
-        return cls(
-            account_id=str(json["accountId"]),
-            email=str(json["email"]),
-            name=str(json["name"]),
-            given_name=str(json["givenName"]),
-            picture_url=str(json["pictureUrl"]),
-            idp_config_url=str(json["idpConfigUrl"]),
-            idp_login_url=str(json["idpLoginUrl"]),
-            login_state=LoginState.from_json(json["loginState"]),
-            terms_of_service_url=str(json["termsOfServiceUrl"])
-            if json.get("termsOfServiceUrl", None) is not None
-            else None,
-            privacy_policy_url=str(json["privacyPolicyUrl"])
-            if json.get("privacyPolicyUrl", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "accountId": ("account_id", str, False),
+            "email": ("email", str, False),
+            "name": ("name", str, False),
+            "givenName": ("given_name", str, False),
+            "pictureUrl": ("picture_url", str, False),
+            "idpConfigUrl": ("idp_config_url", str, False),
+            "idpLoginUrl": ("idp_login_url", str, False),
+            "loginState": ("login_state", LoginState, False),
+            "termsOfServiceUrl": ("terms_of_service_url", str, True),
+            "privacyPolicyUrl": ("privacy_policy_url", str, True),
+        }
 
 
 def enable(
@@ -249,7 +254,7 @@ def reset_cooldown() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
 
 
 @event_class("FedCm.dialogShown")
-@dataclass
+@slotted_dataclass
 class DialogShown:
     dialog_id: str
     dialog_type: DialogType
@@ -261,19 +266,25 @@ class DialogShown:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DialogShown:
-        return cls(
-            dialog_id=str(json["dialogId"]),
-            dialog_type=DialogType.from_json(json["dialogType"]),
-            accounts=[Account.from_json(i) for i in json["accounts"]],
-            title=str(json["title"]),
-            subtitle=str(json["subtitle"])
-            if json.get("subtitle", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "dialogId": ("dialog_id", str, False),
+            "dialogType": ("dialog_type", DialogType, False),
+            "accounts": (
+                "accounts",
+                lambda v: [Account.from_json(i) for i in v],
+                False,
+            ),
+            "title": ("title", str, False),
+            "subtitle": ("subtitle", str, True),
+        }
 
 
 @event_class("FedCm.dialogClosed")
-@dataclass
+@slotted_dataclass
 class DialogClosed:
     """
     Triggered when a dialog is closed, either by user action, JS abort,
@@ -284,4 +295,10 @@ class DialogClosed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DialogClosed:
-        return cls(dialog_id=str(json["dialogId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "dialogId": ("dialog_id", str, False),
+        }
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import io
 from . import network
@@ -52,7 +57,7 @@ class RequestStage(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class RequestPattern:
     #: Wildcards (``'*'`` -> zero or more, ``'?'`` -> exactly one) are allowed. Escape character is
     #: backslash. Omitting is equivalent to ``"*"``.
@@ -76,20 +81,18 @@ class RequestPattern:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPattern:
-        return cls(
-            url_pattern=str(json["urlPattern"])
-            if json.get("urlPattern", None) is not None
-            else None,
-            resource_type=network.ResourceType.from_json(json["resourceType"])
-            if json.get("resourceType", None) is not None
-            else None,
-            request_stage=RequestStage.from_json(json["requestStage"])
-            if json.get("requestStage", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "urlPattern": ("url_pattern", str, True),
+            "resourceType": ("resource_type", network.ResourceType, True),
+            "requestStage": ("request_stage", RequestStage, True),
+        }
+
+
+@slotted_dataclass
 class HeaderEntry:
     """
     Response HTTP header entry
@@ -107,13 +110,17 @@ class HeaderEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HeaderEntry:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AuthChallenge:
     """
     Authorization challenge for HTTP status code 401 or 407.
@@ -142,17 +149,19 @@ class AuthChallenge:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallenge:
-        return cls(
-            origin=str(json["origin"]),
-            scheme=str(json["scheme"]),
-            realm=str(json["realm"]),
-            source=str(json["source"])
-            if json.get("source", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "scheme": ("scheme", str, False),
+            "realm": ("realm", str, False),
+            "source": ("source", str, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AuthChallengeResponse:
     """
     Response to an AuthChallenge.
@@ -182,15 +191,15 @@ class AuthChallengeResponse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallengeResponse:
-        return cls(
-            response=str(json["response"]),
-            username=str(json["username"])
-            if json.get("username", None) is not None
-            else None,
-            password=str(json["password"])
-            if json.get("password", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "response": ("response", str, False),
+            "username": ("username", str, True),
+            "password": ("password", str, True),
+        }
 
 
 def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -434,7 +443,7 @@ def take_response_body_as_stream(
 
 
 @event_class("Fetch.requestPaused")
-@dataclass
+@slotted_dataclass
 class RequestPaused:
     """
     Issued when the domain is enabled and the request URL matches the
@@ -475,36 +484,30 @@ class RequestPaused:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPaused:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            request=network.Request.from_json(json["request"]),
-            frame_id=page.FrameId.from_json(json["frameId"]),
-            resource_type=network.ResourceType.from_json(json["resourceType"]),
-            response_error_reason=network.ErrorReason.from_json(
-                json["responseErrorReason"]
-            )
-            if json.get("responseErrorReason", None) is not None
-            else None,
-            response_status_code=int(json["responseStatusCode"])
-            if json.get("responseStatusCode", None) is not None
-            else None,
-            response_status_text=str(json["responseStatusText"])
-            if json.get("responseStatusText", None) is not None
-            else None,
-            response_headers=[HeaderEntry.from_json(i) for i in json["responseHeaders"]]
-            if json.get("responseHeaders", None) is not None
-            else None,
-            network_id=network.RequestId.from_json(json["networkId"])
-            if json.get("networkId", None) is not None
-            else None,
-            redirected_request_id=RequestId.from_json(json["redirectedRequestId"])
-            if json.get("redirectedRequestId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "request": ("request", network.Request.from_json, False),
+            "frameId": ("frame_id", page.FrameId, False),
+            "resourceType": ("resource_type", network.ResourceType, False),
+            "responseErrorReason": ("response_error_reason", network.ErrorReason, True),
+            "responseStatusCode": ("response_status_code", int, True),
+            "responseStatusText": ("response_status_text", str, True),
+            "responseHeaders": (
+                "response_headers",
+                lambda v: [HeaderEntry.from_json(i) for i in v],
+                True,
+            ),
+            "networkId": ("network_id", network.RequestId, True),
+            "redirectedRequestId": ("redirected_request_id", RequestId, True),
+        }
 
 
 @event_class("Fetch.authRequired")
-@dataclass
+@slotted_dataclass
 class AuthRequired:
     """
     Issued when the domain is enabled with handleAuthRequests set to true.
@@ -526,10 +529,14 @@ class AuthRequired:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthRequired:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            request=network.Request.from_json(json["request"]),
-            frame_id=page.FrameId.from_json(json["frameId"]),
-            resource_type=network.ResourceType.from_json(json["resourceType"]),
-            auth_challenge=AuthChallenge.from_json(json["authChallenge"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "request": ("request", network.Request.from_json, False),
+            "frameId": ("frame_id", page.FrameId, False),
+            "resourceType": ("resource_type", network.ResourceType, False),
+            "authChallenge": ("auth_challenge", AuthChallenge.from_json, False),
+        }
@@ -6,16 +6,19 @@
 # CDP domain: FileSystem (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import network
 from . import storage
 
 
-@dataclass
+@slotted_dataclass
 class File:
     name: str
 
@@ -37,15 +40,19 @@ class File:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> File:
-        return cls(
-            name=str(json["name"]),
-            last_modified=network.TimeSinceEpoch.from_json(json["lastModified"]),
-            size=float(json["size"]),
-            type_=str(json["type"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "lastModified": ("last_modified", network.TimeSinceEpoch, False),
+            "size": ("size", float, False),
+            "type": ("type_", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class Directory:
     name: str
 
@@ -63,14 +70,26 @@ class Directory:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Directory:
-        return cls(
-            name=str(json["name"]),
-            nested_directories=[str(i) for i in json["nestedDirectories"]],
-            nested_files=[File.from_json(i) for i in json["nestedFiles"]],
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "nestedDirectories": (
+                "nested_directories",
+                lambda v: [str(i) for i in v],
+                False,
+            ),
+            "nestedFiles": (
+                "nested_files",
+                lambda v: [File.from_json(i) for i in v],
+                False,
+            ),
+        }
+
+
+@slotted_dataclass
 class BucketFileSystemLocator:
     #: Storage key
     storage_key: storage.SerializedStorageKey
@@ -91,13 +110,15 @@ class BucketFileSystemLocator:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BucketFileSystemLocator:
-        return cls(
-            storage_key=storage.SerializedStorageKey.from_json(json["storageKey"]),
-            path_components=[str(i) for i in json["pathComponents"]],
-            bucket_name=str(json["bucketName"])
-            if json.get("bucketName", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "storageKey": ("storage_key", storage.SerializedStorageKey, False),
+            "pathComponents": ("path_components", lambda v: [str(i) for i in v], False),
+            "bucketName": ("bucket_name", str, True),
+        }
 
 
 def get_directory(
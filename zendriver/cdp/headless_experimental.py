@@ -6,16 +6,19 @@
 # CDP domain: HeadlessExperimental (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 from deprecated.sphinx import deprecated  # type: ignore
 
 
-@dataclass
+@slotted_dataclass
 class ScreenshotParams:
     """
     Encoding options for a screenshot.
@@ -42,17 +45,15 @@ class ScreenshotParams:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenshotParams:
-        return cls(
-            format_=str(json["format"])
-            if json.get("format", None) is not None
-            else None,
-            quality=int(json["quality"])
-            if json.get("quality", None) is not None
-            else None,
-            optimize_for_speed=bool(json["optimizeForSpeed"])
-            if json.get("optimizeForSpeed", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "format": ("format_", str, True),
+            "quality": ("quality", int, True),
+            "optimizeForSpeed": ("optimize_for_speed", bool, True),
+        }
 
 
 def begin_frame(
@@ -6,10 +6,14 @@
 # CDP domain: HeapProfiler (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import runtime
 
@@ -30,7 +34,7 @@ class HeapSnapshotObjectId(str):
         return "HeapSnapshotObjectId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class SamplingHeapProfileNode:
     """
     Sampling Heap Profile node. Holds callsite information, allocation statistics and child nodes.
@@ -58,15 +62,23 @@ class SamplingHeapProfileNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfileNode:
-        return cls(
-            call_frame=runtime.CallFrame.from_json(json["callFrame"]),
-            self_size=float(json["selfSize"]),
-            id_=int(json["id"]),
-            children=[SamplingHeapProfileNode.from_json(i) for i in json["children"]],
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "callFrame": ("call_frame", runtime.CallFrame.from_json, False),
+            "selfSize": ("self_size", float, False),
+            "id": ("id_", int, False),
+            "children": (
+                "children",
+                lambda v: [SamplingHeapProfileNode.from_json(i) for i in v],
+                False,
+            ),
+        }
+
+
+@slotted_dataclass
 class SamplingHeapProfileSample:
     """
     A single sample from a sampling profile.
@@ -91,14 +103,18 @@ class SamplingHeapProfileSample:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfileSample:
-        return cls(
-            size=float(json["size"]),
-            node_id=int(json["nodeId"]),
-            ordinal=float(json["ordinal"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "size": ("size", float, False),
+            "nodeId": ("node_id", int, False),
+            "ordinal": ("ordinal", float, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class SamplingHeapProfile:
     """
     Sampling profile.
@@ -116,10 +132,18 @@ class SamplingHeapProfile:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfile:
-        return cls(
-            head=SamplingHeapProfileNode.from_json(json["head"]),
-            samples=[SamplingHeapProfileSample.from_json(i) for i in json["samples"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "head": ("head", SamplingHeapProfileNode.from_json, False),
+            "samples": (
+                "samples",
+                lambda v: [SamplingHeapProfileSample.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 def add_inspected_heap_object(
@@ -327,17 +351,23 @@ def take_heap_snapshot(
 
 
 @event_class("HeapProfiler.addHeapSnapshotChunk")
-@dataclass
+@slotted_dataclass
 class AddHeapSnapshotChunk:
     chunk: str
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddHeapSnapshotChunk:
-        return cls(chunk=str(json["chunk"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "chunk": ("chunk", str, False),
+        }
 
 
 @event_class("HeapProfiler.heapStatsUpdate")
-@dataclass
+@slotted_dataclass
 class HeapStatsUpdate:
     """
     If heap objects tracking has been started then backend may send update for one or more fragments
@@ -350,11 +380,17 @@ class HeapStatsUpdate:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HeapStatsUpdate:
-        return cls(stats_update=[int(i) for i in json["statsUpdate"]])
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "statsUpdate": ("stats_update", lambda v: [int(i) for i in v], False),
+        }
 
 
 @event_class("HeapProfiler.lastSeenObjectId")
-@dataclass
+@slotted_dataclass
 class LastSeenObjectId:
     """
     If heap objects tracking has been started then backend regularly sends a current value for last
@@ -367,14 +403,18 @@ class LastSeenObjectId:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LastSeenObjectId:
-        return cls(
-            last_seen_object_id=int(json["lastSeenObjectId"]),
-            timestamp=float(json["timestamp"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "lastSeenObjectId": ("last_seen_object_id", int, False),
+            "timestamp": ("timestamp", float, False),
+        }
 
 
 @event_class("HeapProfiler.reportHeapSnapshotProgress")
-@dataclass
+@slotted_dataclass
 class ReportHeapSnapshotProgress:
     done: int
     total: int
@@ -382,18 +422,24 @@ class ReportHeapSnapshotProgress:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportHeapSnapshotProgress:
-        return cls(
-            done=int(json["done"]),
-            total=int(json["total"]),
-            finished=bool(json["finished"])
-            if json.get("finished", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "done": ("done", int, False),
+            "total": ("total", int, False),
+            "finished": ("finished", bool, True),
+        }
 
 
 @event_class("HeapProfiler.resetProfiles")
-@dataclass
+@slotted_dataclass
 class ResetProfiles:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResetProfiles:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
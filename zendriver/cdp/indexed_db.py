@@ -6,16 +6,19 @@
 # CDP domain: IndexedDB (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import runtime
 from . import storage
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseWithObjectStores:
     """
     Database with an array of object stores.
@@ -40,14 +43,22 @@ class DatabaseWithObjectStores:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DatabaseWithObjectStores:
-        return cls(
-            name=str(json["name"]),
-            version=float(json["version"]),
-            object_stores=[ObjectStore.from_json(i) for i in json["objectStores"]],
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "version": ("version", float, False),
+            "objectStores": (
+                "object_stores",
+                lambda v: [ObjectStore.from_json(i) for i in v],
+                False,
+            ),
+        }
+
+
+@slotted_dataclass
 class ObjectStore:
     """
     Object store.
@@ -75,15 +86,23 @@ class ObjectStore:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectStore:
-        return cls(
-            name=str(json["name"]),
-            key_path=KeyPath.from_json(json["keyPath"]),
-            auto_increment=bool(json["autoIncrement"]),
-            indexes=[ObjectStoreIndex.from_json(i) for i in json["indexes"]],
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "keyPath": ("key_path", KeyPath.from_json, False),
+            "autoIncrement": ("auto_increment", bool, False),
+            "indexes": (
+                "indexes",
+                lambda v: [ObjectStoreIndex.from_json(i) for i in v],
+                False,
+            ),
+        }
+
+
+@slotted_dataclass
 class ObjectStoreIndex:
     """
     Object store index.
@@ -111,15 +130,19 @@ class ObjectStoreIndex:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectStoreIndex:
-        return cls(
-            name=str(json["name"]),
-            key_path=KeyPath.from_json(json["keyPath"]),
-            unique=bool(json["unique"]),
-            multi_entry=bool(json["multiEntry"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "keyPath": ("key_path", KeyPath.from_json, False),
+            "unique": ("unique", bool, False),
+            "multiEntry": ("multi_entry", bool, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Key:
     """
     Key.
@@ -155,22 +178,20 @@ class Key:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Key:
-        return cls(
-            type_=str(json["type"]),
-            number=float(json["number"])
-            if json.get("number", None) is not None
-            else None,
-            string=str(json["string"])
-            if json.get("string", None) is not None
-            else None,
-            date=float(json["date"]) if json.get("date", None) is not None else None,
-            array=[Key.from_json(i) for i in json["array"]]
-            if json.get("array", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "number": ("number", float, True),
+            "string": ("string", str, True),
+            "date": ("date", float, True),
+            "array": ("array", lambda v: [Key.from_json(i) for i in v], True),
+        }
+
+
+@slotted_dataclass
 class KeyRange:
     """
     Key range.
@@ -200,19 +221,19 @@ class KeyRange:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyRange:
-        return cls(
-            lower_open=bool(json["lowerOpen"]),
-            upper_open=bool(json["upperOpen"]),
-            lower=Key.from_json(json["lower"])
-            if json.get("lower", None) is not None
-            else None,
-            upper=Key.from_json(json["upper"])
-            if json.get("upper", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "lowerOpen": ("lower_open", bool, False),
+            "upperOpen": ("upper_open", bool, False),
+            "lower": ("lower", Key.from_json, True),
+            "upper": ("upper", Key.from_json, True),
+        }
+
+
+@slotted_dataclass
 class DataEntry:
     """
     Data entry.
@@ -236,14 +257,18 @@ class DataEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataEntry:
-        return cls(
-            key=runtime.RemoteObject.from_json(json["key"]),
-            primary_key=runtime.RemoteObject.from_json(json["primaryKey"]),
-            value=runtime.RemoteObject.from_json(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", runtime.RemoteObject.from_json, False),
+            "primaryKey": ("primary_key", runtime.RemoteObject.from_json, False),
+            "value": ("value", runtime.RemoteObject.from_json, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class KeyPath:
     """
     Key path.
@@ -269,15 +294,15 @@ class KeyPath:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyPath:
-        return cls(
-            type_=str(json["type"]),
-            string=str(json["string"])
-            if json.get("string", None) is not None
-            else None,
-            array=[str(i) for i in json["array"]]
-            if json.get("array", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "string": ("string", str, True),
+            "array": ("array", lambda v: [str(i) for i in v], True),
+        }
 
 
 def clear_object_store(
@@ -8,11 +8,16 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
-@dataclass
+@slotted_dataclass
 class TouchPoint:
     #: X coordinate of the event relative to the main frame's viewport in CSS pixels.
     x: float
@@ -74,31 +79,23 @@ class TouchPoint:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TouchPoint:
-        return cls(
-            x=float(json["x"]),
-            y=float(json["y"]),
-            radius_x=float(json["radiusX"])
-            if json.get("radiusX", None) is not None
-            else None,
-            radius_y=float(json["radiusY"])
-            if json.get("radiusY", None) is not None
-            else None,
-            rotation_angle=float(json["rotationAngle"])
-            if json.get("rotationAngle", None) is not None
-            else None,
-            force=float(json["force"]) if json.get("force", None) is not None else None,
-            tangential_pressure=float(json["tangentialPressure"])
-            if json.get("tangentialPressure", None) is not None
-            else None,
-            tilt_x=float(json["tiltX"])
-            if json.get("tiltX", None) is not None
-            else None,
-            tilt_y=float(json["tiltY"])
-            if json.get("tiltY", None) is not None
-            else None,
-            twist=int(json["twist"]) if json.get("twist", None) is not None else None,
-            id_=float(json["id"]) if json.get("id", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "x": ("x", float, False),
+            "y": ("y", float, False),
+            "radiusX": ("radius_x", float, True),
+            "radiusY": ("radius_y", float, True),
+            "rotationAngle": ("rotation_angle", float, True),
+            "force": ("force", float, True),
+            "tangentialPressure": ("tangential_pressure", float, True),
+            "tiltX": ("tilt_x", float, True),
+            "tiltY": ("tilt_y", float, True),
+            "twist": ("twist", int, True),
+            "id": ("id_", float, True),
+        }
 
 
 class GestureSourceType(enum.Enum):
@@ -146,7 +143,7 @@ class TimeSinceEpoch(float):
         return "TimeSinceEpoch({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class DragDataItem:
     #: Mime type of the dragged data.
     mime_type: str
@@ -174,17 +171,19 @@ class DragDataItem:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DragDataItem:
-        return cls(
-            mime_type=str(json["mimeType"]),
-            data=str(json["data"]),
-            title=str(json["title"]) if json.get("title", None) is not None else None,
-            base_url=str(json["baseURL"])
-            if json.get("baseURL", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "mimeType": ("mime_type", str, False),
+            "data": ("data", str, False),
+            "title": ("title", str, True),
+            "baseURL": ("base_url", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class DragData:
     items: typing.List[DragDataItem]
 
@@ -204,13 +203,15 @@ class DragData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DragData:
-        return cls(
-            items=[DragDataItem.from_json(i) for i in json["items"]],
-            drag_operations_mask=int(json["dragOperationsMask"]),
-            files=[str(i) for i in json["files"]]
-            if json.get("files", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "items": ("items", lambda v: [DragDataItem.from_json(i) for i in v], False),
+            "dragOperationsMask": ("drag_operations_mask", int, False),
+            "files": ("files", lambda v: [str(i) for i in v], True),
+        }
 
 
 def dispatch_drag_event(
@@ -699,7 +700,7 @@ def synthesize_tap_gesture(
 
 
 @event_class("Input.dragIntercepted")
-@dataclass
+@slotted_dataclass
 class DragIntercepted:
     """
     **EXPERIMENTAL**
@@ -712,4 +713,10 @@ class DragIntercepted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DragIntercepted:
-        return cls(data=DragData.from_json(json["data"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "data": ("data", DragData.from_json, False),
+        }
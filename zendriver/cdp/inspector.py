@@ -6,10 +6,14 @@
 # CDP domain: Inspector (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -33,7 +37,7 @@ def enable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
 
 
 @event_class("Inspector.detached")
-@dataclass
+@slotted_dataclass
 class Detached:
     """
     Fired when remote debugging connection is about to be terminated. Contains detach reason.
@@ -44,11 +48,17 @@ class Detached:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Detached:
-        return cls(reason=str(json["reason"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "reason": ("reason", str, False),
+        }
 
 
 @event_class("Inspector.targetCrashed")
-@dataclass
+@slotted_dataclass
 class TargetCrashed:
     """
     Fired when debugging target has crashed
@@ -56,11 +66,15 @@ class TargetCrashed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCrashed:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("Inspector.targetReloadedAfterCrash")
-@dataclass
+@slotted_dataclass
 class TargetReloadedAfterCrash:
     """
     Fired when debugging target has reloaded after crash
@@ -68,4 +82,8 @@ class TargetReloadedAfterCrash:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetReloadedAfterCrash:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
@@ -6,10 +6,14 @@
 # CDP domain: LayerTree (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 
@@ -46,7 +50,7 @@ class SnapshotId(str):
         return "SnapshotId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class ScrollRect:
     """
     Rectangle where scrolling happens on the main thread.
@@ -66,13 +70,17 @@ class ScrollRect:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScrollRect:
-        return cls(
-            rect=dom.Rect.from_json(json["rect"]),
-            type_=str(json["type"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "rect": ("rect", dom.Rect.from_json, False),
+            "type": ("type_", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class StickyPositionConstraint:
     """
     Sticky position constraints.
@@ -106,23 +114,27 @@ class StickyPositionConstraint:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StickyPositionConstraint:
-        return cls(
-            sticky_box_rect=dom.Rect.from_json(json["stickyBoxRect"]),
-            containing_block_rect=dom.Rect.from_json(json["containingBlockRect"]),
-            nearest_layer_shifting_sticky_box=LayerId.from_json(
-                json["nearestLayerShiftingStickyBox"]
-            )
-            if json.get("nearestLayerShiftingStickyBox", None) is not None
-            else None,
-            nearest_layer_shifting_containing_block=LayerId.from_json(
-                json["nearestLayerShiftingContainingBlock"]
-            )
-            if json.get("nearestLayerShiftingContainingBlock", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "stickyBoxRect": ("sticky_box_rect", dom.Rect.from_json, False),
+            "containingBlockRect": ("containing_block_rect", dom.Rect.from_json, False),
+            "nearestLayerShiftingStickyBox": (
+                "nearest_layer_shifting_sticky_box",
+                LayerId,
+                True,
+            ),
+            "nearestLayerShiftingContainingBlock": (
+                "nearest_layer_shifting_containing_block",
+                LayerId,
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class PictureTile:
     """
     Serialized fragment of layer picture along with its offset within the layer.
@@ -146,14 +158,18 @@ class PictureTile:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PictureTile:
-        return cls(
-            x=float(json["x"]),
-            y=float(json["y"]),
-            picture=str(json["picture"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "x": ("x", float, False),
+            "y": ("y", float, False),
+            "picture": ("picture", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class Layer:
     """
     Information about a compositing layer.
@@ -239,44 +255,36 @@ class Layer:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Layer:
-        return cls(
-            layer_id=LayerId.from_json(json["layerId"]),
-            offset_x=float(json["offsetX"]),
-            offset_y=float(json["offsetY"]),
-            width=float(json["width"]),
-            height=float(json["height"]),
-            paint_count=int(json["paintCount"]),
-            draws_content=bool(json["drawsContent"]),
-            parent_layer_id=LayerId.from_json(json["parentLayerId"])
-            if json.get("parentLayerId", None) is not None
-            else None,
-            backend_node_id=dom.BackendNodeId.from_json(json["backendNodeId"])
-            if json.get("backendNodeId", None) is not None
-            else None,
-            transform=[float(i) for i in json["transform"]]
-            if json.get("transform", None) is not None
-            else None,
-            anchor_x=float(json["anchorX"])
-            if json.get("anchorX", None) is not None
-            else None,
-            anchor_y=float(json["anchorY"])
-            if json.get("anchorY", None) is not None
-            else None,
-            anchor_z=float(json["anchorZ"])
-            if json.get("anchorZ", None) is not None
-            else None,
-            invisible=bool(json["invisible"])
-            if json.get("invisible", None) is not None
-            else None,
-            scroll_rects=[ScrollRect.from_json(i) for i in json["scrollRects"]]
-            if json.get("scrollRects", None) is not None
-            else None,
-            sticky_position_constraint=StickyPositionConstraint.from_json(
-                json["stickyPositionConstraint"]
-            )
-            if json.get("stickyPositionConstraint", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "layerId": ("layer_id", LayerId, False),
+            "offsetX": ("offset_x", float, False),
+            "offsetY": ("offset_y", float, False),
+            "width": ("width", float, False),
+            "height": ("height", float, False),
+            "paintCount": ("paint_count", int, False),
+            "drawsContent": ("draws_content", bool, False),
+            "parentLayerId": ("parent_layer_id", LayerId, True),
+            "backendNodeId": ("backend_node_id", dom.BackendNodeId, True),
+            "transform": ("transform", lambda v: [float(i) for i in v], True),
+            "anchorX": ("anchor_x", float, True),
+            "anchorY": ("anchor_y", float, True),
+            "anchorZ": ("anchor_z", float, True),
+            "invisible": ("invisible", bool, True),
+            "scrollRects": (
+                "scroll_rects",
+                lambda v: [ScrollRect.from_json(i) for i in v],
+                True,
+            ),
+            "stickyPositionConstraint": (
+                "sticky_position_constraint",
+                StickyPositionConstraint.from_json,
+                True,
+            ),
+        }
 
 
 class PaintProfile(list):
@@ -477,7 +485,7 @@ def snapshot_command_log(
 
 
 @event_class("LayerTree.layerPainted")
-@dataclass
+@slotted_dataclass
 class LayerPainted:
     #: The id of the painted layer.
     layer_id: LayerId
@@ -486,22 +494,28 @@ class LayerPainted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayerPainted:
-        return cls(
-            layer_id=LayerId.from_json(json["layerId"]),
-            clip=dom.Rect.from_json(json["clip"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "layerId": ("layer_id", LayerId, False),
+            "clip": ("clip", dom.Rect.from_json, False),
+        }
 
 
 @event_class("LayerTree.layerTreeDidChange")
-@dataclass
+@slotted_dataclass
 class LayerTreeDidChange:
     #: Layer tree, absent if not in the compositing mode.
     layers: typing.Optional[typing.List[Layer]]
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayerTreeDidChange:
-        return cls(
-            layers=[Layer.from_json(i) for i in json["layers"]]
-            if json.get("layers", None) is not None
-            else None
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "layers": ("layers", lambda v: [Layer.from_json(i) for i in v], True),
+        }
@@ -6,16 +6,20 @@
 # CDP domain: Log
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import network
 from . import runtime
 
 
-@dataclass
+@slotted_dataclass
 class LogEntry:
     """
     Log entry.
@@ -77,34 +81,30 @@ class LogEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LogEntry:
-        return cls(
-            source=str(json["source"]),
-            level=str(json["level"]),
-            text=str(json["text"]),
-            timestamp=runtime.Timestamp.from_json(json["timestamp"]),
-            category=str(json["category"])
-            if json.get("category", None) is not None
-            else None,
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            line_number=int(json["lineNumber"])
-            if json.get("lineNumber", None) is not None
-            else None,
-            stack_trace=runtime.StackTrace.from_json(json["stackTrace"])
-            if json.get("stackTrace", None) is not None
-            else None,
-            network_request_id=network.RequestId.from_json(json["networkRequestId"])
-            if json.get("networkRequestId", None) is not None
-            else None,
-            worker_id=str(json["workerId"])
-            if json.get("workerId", None) is not None
-            else None,
-            args=[runtime.RemoteObject.from_json(i) for i in json["args"]]
-            if json.get("args", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "source": ("source", str, False),
+            "level": ("level", str, False),
+            "text": ("text", str, False),
+            "timestamp": ("timestamp", runtime.Timestamp, False),
+            "category": ("category", str, True),
+            "url": ("url", str, True),
+            "lineNumber": ("line_number", int, True),
+            "stackTrace": ("stack_trace", runtime.StackTrace.from_json, True),
+            "networkRequestId": ("network_request_id", network.RequestId, True),
+            "workerId": ("worker_id", str, True),
+            "args": (
+                "args",
+                lambda v: [runtime.RemoteObject.from_json(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class ViolationSetting:
     """
     Violation configuration setting.
@@ -124,10 +124,14 @@ class ViolationSetting:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ViolationSetting:
-        return cls(
-            name=str(json["name"]),
-            threshold=float(json["threshold"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "threshold": ("threshold", float, False),
+        }
 
 
 def clear() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -189,7 +193,7 @@ def stop_violations_report() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]
 
 
 @event_class("Log.entryAdded")
-@dataclass
+@slotted_dataclass
 class EntryAdded:
     """
     Issued when new message was logged.
@@ -200,4 +204,10 @@ class EntryAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EntryAdded:
-        return cls(entry=LogEntry.from_json(json["entry"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "entry": ("entry", LogEntry.from_json, False),
+        }
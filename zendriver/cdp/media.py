@@ -6,10 +6,14 @@
 # CDP domain: Media (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class PlayerId(str):
@@ -40,7 +44,7 @@ class Timestamp(float):
         return "Timestamp({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class PlayerMessage:
     """
     Have one type per entry in MediaLogRecord::Type
@@ -68,13 +72,17 @@ class PlayerMessage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerMessage:
-        return cls(
-            level=str(json["level"]),
-            message=str(json["message"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "level": ("level", str, False),
+            "message": ("message", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class PlayerProperty:
     """
     Corresponds to kMediaPropertyChange
@@ -92,13 +100,17 @@ class PlayerProperty:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerProperty:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class PlayerEvent:
     """
     Corresponds to kMediaEventTriggered
@@ -116,13 +128,17 @@ class PlayerEvent:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerEvent:
-        return cls(
-            timestamp=Timestamp.from_json(json["timestamp"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "timestamp": ("timestamp", Timestamp, False),
+            "value": ("value", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class PlayerErrorSourceLocation:
     """
     Represents logged source line numbers reported in an error.
@@ -141,13 +157,17 @@ class PlayerErrorSourceLocation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerErrorSourceLocation:
-        return cls(
-            file=str(json["file"]),
-            line=int(json["line"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "file": ("file", str, False),
+            "line": ("line", int, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class PlayerError:
     """
     Corresponds to kMediaError
@@ -180,13 +200,21 @@ class PlayerError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerError:
-        return cls(
-            error_type=str(json["errorType"]),
-            code=int(json["code"]),
-            stack=[PlayerErrorSourceLocation.from_json(i) for i in json["stack"]],
-            cause=[PlayerError.from_json(i) for i in json["cause"]],
-            data=dict(json["data"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "errorType": ("error_type", str, False),
+            "code": ("code", int, False),
+            "stack": (
+                "stack",
+                lambda v: [PlayerErrorSourceLocation.from_json(i) for i in v],
+                False,
+            ),
+            "cause": ("cause", lambda v: [PlayerError.from_json(i) for i in v], False),
+            "data": ("data", dict, False),
+        }
 
 
 def enable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -210,7 +238,7 @@ def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
 
 
 @event_class("Media.playerPropertiesChanged")
-@dataclass
+@slotted_dataclass
 class PlayerPropertiesChanged:
     """
     This can be called multiple times, and can be used to set / override /
@@ -222,14 +250,22 @@ class PlayerPropertiesChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerPropertiesChanged:
-        return cls(
-            player_id=PlayerId.from_json(json["playerId"]),
-            properties=[PlayerProperty.from_json(i) for i in json["properties"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "playerId": ("player_id", PlayerId, False),
+            "properties": (
+                "properties",
+                lambda v: [PlayerProperty.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 @event_class("Media.playerEventsAdded")
-@dataclass
+@slotted_dataclass
 class PlayerEventsAdded:
     """
     Send events as a list, allowing them to be batched on the browser for less
@@ -241,14 +277,22 @@ class PlayerEventsAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerEventsAdded:
-        return cls(
-            player_id=PlayerId.from_json(json["playerId"]),
-            events=[PlayerEvent.from_json(i) for i in json["events"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "playerId": ("player_id", PlayerId, False),
+            "events": (
+                "events",
+                lambda v: [PlayerEvent.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 @event_class("Media.playerMessagesLogged")
-@dataclass
+@slotted_dataclass
 class PlayerMessagesLogged:
     """
     Send a list of any messages that need to be delivered.
@@ -259,14 +303,22 @@ class PlayerMessagesLogged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerMessagesLogged:
-        return cls(
-            player_id=PlayerId.from_json(json["playerId"]),
-            messages=[PlayerMessage.from_json(i) for i in json["messages"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "playerId": ("player_id", PlayerId, False),
+            "messages": (
+                "messages",
+                lambda v: [PlayerMessage.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 @event_class("Media.playerErrorsRaised")
-@dataclass
+@slotted_dataclass
 class PlayerErrorsRaised:
     """
     Send a list of any errors that need to be delivered.
@@ -277,14 +329,22 @@ class PlayerErrorsRaised:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerErrorsRaised:
-        return cls(
-            player_id=PlayerId.from_json(json["playerId"]),
-            errors=[PlayerError.from_json(i) for i in json["errors"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "playerId": ("player_id", PlayerId, False),
+            "errors": (
+                "errors",
+                lambda v: [PlayerError.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 @event_class("Media.playersCreated")
-@dataclass
+@slotted_dataclass
 class PlayersCreated:
     """
     Called whenever a player is created, or when a new agent joins and receives
@@ -296,4 +356,10 @@ class PlayersCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayersCreated:
-        return cls(players=[PlayerId.from_json(i) for i in json["players"]])
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "players": ("players", lambda v: [PlayerId(i) for i in v], False),
+        }
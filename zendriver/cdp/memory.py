@@ -8,8 +8,12 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class PressureLevel(enum.Enum):
@@ -28,7 +32,7 @@ class PressureLevel(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class SamplingProfileNode:
     """
     Heap profile sample.
@@ -52,14 +56,18 @@ class SamplingProfileNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingProfileNode:
-        return cls(
-            size=float(json["size"]),
-            total=float(json["total"]),
-            stack=[str(i) for i in json["stack"]],
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "size": ("size", float, False),
+            "total": ("total", float, False),
+            "stack": ("stack", lambda v: [str(i) for i in v], False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class SamplingProfile:
     """
     Array of heap profile samples.
@@ -77,13 +85,21 @@ class SamplingProfile:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingProfile:
-        return cls(
-            samples=[SamplingProfileNode.from_json(i) for i in json["samples"]],
-            modules=[Module.from_json(i) for i in json["modules"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "samples": (
+                "samples",
+                lambda v: [SamplingProfileNode.from_json(i) for i in v],
+                False,
+            ),
+            "modules": ("modules", lambda v: [Module.from_json(i) for i in v], False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Module:
     """
     Executable module information
@@ -112,15 +128,19 @@ class Module:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Module:
-        return cls(
-            name=str(json["name"]),
-            uuid=str(json["uuid"]),
-            base_address=str(json["baseAddress"]),
-            size=float(json["size"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "uuid": ("uuid", str, False),
+            "baseAddress": ("base_address", str, False),
+            "size": ("size", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class DOMCounter:
     """
     DOM object counter data.
@@ -141,10 +161,14 @@ class DOMCounter:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DOMCounter:
-        return cls(
-            name=str(json["name"]),
-            count=int(json["count"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "count": ("count", int, False),
+        }
 
 
 def get_dom_counters() -> (
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import debugger
 from . import emulation
@@ -256,7 +261,7 @@ class CookieSourceScheme(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ResourceTiming:
     """
     Timing information for the request.
@@ -355,33 +360,37 @@ class ResourceTiming:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResourceTiming:
-        return cls(
-            request_time=float(json["requestTime"]),
-            proxy_start=float(json["proxyStart"]),
-            proxy_end=float(json["proxyEnd"]),
-            dns_start=float(json["dnsStart"]),
-            dns_end=float(json["dnsEnd"]),
-            connect_start=float(json["connectStart"]),
-            connect_end=float(json["connectEnd"]),
-            ssl_start=float(json["sslStart"]),
-            ssl_end=float(json["sslEnd"]),
-            worker_start=float(json["workerStart"]),
-            worker_ready=float(json["workerReady"]),
-            worker_fetch_start=float(json["workerFetchStart"]),
-            worker_respond_with_settled=float(json["workerRespondWithSettled"]),
-            send_start=float(json["sendStart"]),
-            send_end=float(json["sendEnd"]),
-            push_start=float(json["pushStart"]),
-            push_end=float(json["pushEnd"]),
-            receive_headers_start=float(json["receiveHeadersStart"]),
-            receive_headers_end=float(json["receiveHeadersEnd"]),
-            worker_router_evaluation_start=float(json["workerRouterEvaluationStart"])
-            if json.get("workerRouterEvaluationStart", None) is not None
-            else None,
-            worker_cache_lookup_start=float(json["workerCacheLookupStart"])
-            if json.get("workerCacheLookupStart", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestTime": ("request_time", float, False),
+            "proxyStart": ("proxy_start", float, False),
+            "proxyEnd": ("proxy_end", float, False),
+            "dnsStart": ("dns_start", float, False),
+            "dnsEnd": ("dns_end", float, False),
+            "connectStart": ("connect_start", float, False),
+            "connectEnd": ("connect_end", float, False),
+            "sslStart": ("ssl_start", float, False),
+            "sslEnd": ("ssl_end", float, False),
+            "workerStart": ("worker_start", float, False),
+            "workerReady": ("worker_ready", float, False),
+            "workerFetchStart": ("worker_fetch_start", float, False),
+            "workerRespondWithSettled": ("worker_respond_with_settled", float, False),
+            "sendStart": ("send_start", float, False),
+            "sendEnd": ("send_end", float, False),
+            "pushStart": ("push_start", float, False),
+            "pushEnd": ("push_end", float, False),
+            "receiveHeadersStart": ("receive_headers_start", float, False),
+            "receiveHeadersEnd": ("receive_headers_end", float, False),
+            "workerRouterEvaluationStart": (
+                "worker_router_evaluation_start",
+                float,
+                True,
+            ),
+            "workerCacheLookupStart": ("worker_cache_lookup_start", float, True),
+        }
 
 
 class ResourcePriority(enum.Enum):
@@ -403,7 +412,7 @@ class ResourcePriority(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class PostDataEntry:
     """
     Post data entry for HTTP request
@@ -419,12 +428,16 @@ class PostDataEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PostDataEntry:
-        return cls(
-            bytes_=str(json["bytes"]) if json.get("bytes", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "bytes": ("bytes_", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class Request:
     """
     HTTP request data.
@@ -499,44 +512,36 @@ class Request:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Request:
-        return cls(
-            url=str(json["url"]),
-            method=str(json["method"]),
-            headers=Headers.from_json(json["headers"]),
-            initial_priority=ResourcePriority.from_json(json["initialPriority"]),
-            referrer_policy=str(json["referrerPolicy"]),
-            url_fragment=str(json["urlFragment"])
-            if json.get("urlFragment", None) is not None
-            else None,
-            post_data=str(json["postData"])
-            if json.get("postData", None) is not None
-            else None,
-            has_post_data=bool(json["hasPostData"])
-            if json.get("hasPostData", None) is not None
-            else None,
-            post_data_entries=[
-                PostDataEntry.from_json(i) for i in json["postDataEntries"]
-            ]
-            if json.get("postDataEntries", None) is not None
-            else None,
-            mixed_content_type=security.MixedContentType.from_json(
-                json["mixedContentType"]
-            )
-            if json.get("mixedContentType", None) is not None
-            else None,
-            is_link_preload=bool(json["isLinkPreload"])
-            if json.get("isLinkPreload", None) is not None
-            else None,
-            trust_token_params=TrustTokenParams.from_json(json["trustTokenParams"])
-            if json.get("trustTokenParams", None) is not None
-            else None,
-            is_same_site=bool(json["isSameSite"])
-            if json.get("isSameSite", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "method": ("method", str, False),
+            "headers": ("headers", Headers, False),
+            "initialPriority": ("initial_priority", ResourcePriority, False),
+            "referrerPolicy": ("referrer_policy", str, False),
+            "urlFragment": ("url_fragment", str, True),
+            "postData": ("post_data", str, True),
+            "hasPostData": ("has_post_data", bool, True),
+            "postDataEntries": (
+                "post_data_entries",
+                lambda v: [PostDataEntry.from_json(i) for i in v],
+                True,
+            ),
+            "mixedContentType": ("mixed_content_type", security.MixedContentType, True),
+            "isLinkPreload": ("is_link_preload", bool, True),
+            "trustTokenParams": (
+                "trust_token_params",
+                TrustTokenParams.from_json,
+                True,
+            ),
+            "isSameSite": ("is_same_site", bool, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SignedCertificateTimestamp:
     """
     Details of a signed certificate timestamp (SCT).
@@ -581,19 +586,23 @@ class SignedCertificateTimestamp:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedCertificateTimestamp:
-        return cls(
-            status=str(json["status"]),
-            origin=str(json["origin"]),
-            log_description=str(json["logDescription"]),
-            log_id=str(json["logId"]),
-            timestamp=float(json["timestamp"]),
-            hash_algorithm=str(json["hashAlgorithm"]),
-            signature_algorithm=str(json["signatureAlgorithm"]),
-            signature_data=str(json["signatureData"]),
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "status": ("status", str, False),
+            "origin": ("origin", str, False),
+            "logDescription": ("log_description", str, False),
+            "logId": ("log_id", str, False),
+            "timestamp": ("timestamp", float, False),
+            "hashAlgorithm": ("hash_algorithm", str, False),
+            "signatureAlgorithm": ("signature_algorithm", str, False),
+            "signatureData": ("signature_data", str, False),
+        }
+
+
+@slotted_dataclass
 class SecurityDetails:
     """
     Security details about a request.
@@ -674,32 +683,35 @@ class SecurityDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityDetails:
-        return cls(
-            protocol=str(json["protocol"]),
-            key_exchange=str(json["keyExchange"]),
-            cipher=str(json["cipher"]),
-            certificate_id=security.CertificateId.from_json(json["certificateId"]),
-            subject_name=str(json["subjectName"]),
-            san_list=[str(i) for i in json["sanList"]],
-            issuer=str(json["issuer"]),
-            valid_from=TimeSinceEpoch.from_json(json["validFrom"]),
-            valid_to=TimeSinceEpoch.from_json(json["validTo"]),
-            signed_certificate_timestamp_list=[
-                SignedCertificateTimestamp.from_json(i)
-                for i in json["signedCertificateTimestampList"]
-            ],
-            certificate_transparency_compliance=CertificateTransparencyCompliance.from_json(
-                json["certificateTransparencyCompliance"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "protocol": ("protocol", str, False),
+            "keyExchange": ("key_exchange", str, False),
+            "cipher": ("cipher", str, False),
+            "certificateId": ("certificate_id", security.CertificateId, False),
+            "subjectName": ("subject_name", str, False),
+            "sanList": ("san_list", lambda v: [str(i) for i in v], False),
+            "issuer": ("issuer", str, False),
+            "validFrom": ("valid_from", TimeSinceEpoch, False),
+            "validTo": ("valid_to", TimeSinceEpoch, False),
+            "signedCertificateTimestampList": (
+                "signed_certificate_timestamp_list",
+                lambda v: [SignedCertificateTimestamp.from_json(i) for i in v],
+                False,
             ),
-            encrypted_client_hello=bool(json["encryptedClientHello"]),
-            key_exchange_group=str(json["keyExchangeGroup"])
-            if json.get("keyExchangeGroup", None) is not None
-            else None,
-            mac=str(json["mac"]) if json.get("mac", None) is not None else None,
-            server_signature_algorithm=int(json["serverSignatureAlgorithm"])
-            if json.get("serverSignatureAlgorithm", None) is not None
-            else None,
-        )
+            "certificateTransparencyCompliance": (
+                "certificate_transparency_compliance",
+                CertificateTransparencyCompliance,
+                False,
+            ),
+            "encryptedClientHello": ("encrypted_client_hello", bool, False),
+            "keyExchangeGroup": ("key_exchange_group", str, True),
+            "mac": ("mac", str, True),
+            "serverSignatureAlgorithm": ("server_signature_algorithm", int, True),
+        }
 
 
 class CertificateTransparencyCompliance(enum.Enum):
@@ -809,7 +821,7 @@ class CorsError(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class CorsErrorStatus:
     cors_error: CorsError
 
@@ -823,10 +835,14 @@ class CorsErrorStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CorsErrorStatus:
-        return cls(
-            cors_error=CorsError.from_json(json["corsError"]),
-            failed_parameter=str(json["failedParameter"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "corsError": ("cors_error", CorsError, False),
+            "failedParameter": ("failed_parameter", str, False),
+        }
 
 
 class ServiceWorkerResponseSource(enum.Enum):
@@ -847,7 +863,7 @@ class ServiceWorkerResponseSource(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class TrustTokenParams:
     """
     Determines what type of Trust Token operation is executed and
@@ -875,13 +891,15 @@ class TrustTokenParams:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TrustTokenParams:
-        return cls(
-            operation=TrustTokenOperationType.from_json(json["operation"]),
-            refresh_policy=str(json["refreshPolicy"]),
-            issuers=[str(i) for i in json["issuers"]]
-            if json.get("issuers", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "operation": ("operation", TrustTokenOperationType, False),
+            "refreshPolicy": ("refresh_policy", str, False),
+            "issuers": ("issuers", lambda v: [str(i) for i in v], True),
+        }
 
 
 class TrustTokenOperationType(enum.Enum):
@@ -937,7 +955,7 @@ class ServiceWorkerRouterSource(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ServiceWorkerRouterInfo:
     #: ID of the rule matched. If there is a matched rule, this field will
     #: be set, otherwiser no value will be set.
@@ -962,24 +980,22 @@ class ServiceWorkerRouterInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerRouterInfo:
-        return cls(
-            rule_id_matched=int(json["ruleIdMatched"])
-            if json.get("ruleIdMatched", None) is not None
-            else None,
-            matched_source_type=ServiceWorkerRouterSource.from_json(
-                json["matchedSourceType"]
-            )
-            if json.get("matchedSourceType", None) is not None
-            else None,
-            actual_source_type=ServiceWorkerRouterSource.from_json(
-                json["actualSourceType"]
-            )
-            if json.get("actualSourceType", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "ruleIdMatched": ("rule_id_matched", int, True),
+            "matchedSourceType": (
+                "matched_source_type",
+                ServiceWorkerRouterSource,
+                True,
+            ),
+            "actualSourceType": ("actual_source_type", ServiceWorkerRouterSource, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Response:
     """
     HTTP response data.
@@ -1121,78 +1137,54 @@ class Response:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Response:
-        return cls(
-            url=str(json["url"]),
-            status=int(json["status"]),
-            status_text=str(json["statusText"]),
-            headers=Headers.from_json(json["headers"]),
-            mime_type=str(json["mimeType"]),
-            charset=str(json["charset"]),
-            connection_reused=bool(json["connectionReused"]),
-            connection_id=float(json["connectionId"]),
-            encoded_data_length=float(json["encodedDataLength"]),
-            security_state=security.SecurityState.from_json(json["securityState"]),
-            headers_text=str(json["headersText"])
-            if json.get("headersText", None) is not None
-            else None,
-            request_headers=Headers.from_json(json["requestHeaders"])
-            if json.get("requestHeaders", None) is not None
-            else None,
-            request_headers_text=str(json["requestHeadersText"])
-            if json.get("requestHeadersText", None) is not None
-            else None,
-            remote_ip_address=str(json["remoteIPAddress"])
-            if json.get("remoteIPAddress", None) is not None
-            else None,
-            remote_port=int(json["remotePort"])
-            if json.get("remotePort", None) is not None
-            else None,
-            from_disk_cache=bool(json["fromDiskCache"])
-            if json.get("fromDiskCache", None) is not None
-            else None,
-            from_service_worker=bool(json["fromServiceWorker"])
-            if json.get("fromServiceWorker", None) is not None
-            else None,
-            from_prefetch_cache=bool(json["fromPrefetchCache"])
-            if json.get("fromPrefetchCache", None) is not None
-            else None,
-            from_early_hints=bool(json["fromEarlyHints"])
-            if json.get("fromEarlyHints", None) is not None
-            else None,
-            service_worker_router_info=ServiceWorkerRouterInfo.from_json(
-                json["serviceWorkerRouterInfo"]
-            )
-            if json.get("serviceWorkerRouterInfo", None) is not None
-            else None,
-            timing=ResourceTiming.from_json(json["timing"])
-            if json.get("timing", None) is not None
-            else None,
-            service_worker_response_source=ServiceWorkerResponseSource.from_json(
-                json["serviceWorkerResponseSource"]
-            )
-            if json.get("serviceWorkerResponseSource", None) is not None
-            else None,
-            response_time=TimeSinceEpoch.from_json(json["responseTime"])
-            if json.get("responseTime", None) is not None
-            else None,
-            cache_storage_cache_name=str(json["cacheStorageCacheName"])
-            if json.get("cacheStorageCacheName", None) is not None
-            else None,
-            protocol=str(json["protocol"])
-            if json.get("protocol", None) is not None
-            else None,
-            alternate_protocol_usage=AlternateProtocolUsage.from_json(
-                json["alternateProtocolUsage"]
-            )
-            if json.get("alternateProtocolUsage", None) is not None
-            else None,
-            security_details=SecurityDetails.from_json(json["securityDetails"])
-            if json.get("securityDetails", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "status": ("status", int, False),
+            "statusText": ("status_text", str, False),
+            "headers": ("headers", Headers, False),
+            "mimeType": ("mime_type", str, False),
+            "charset": ("charset", str, False),
+            "connectionReused": ("connection_reused", bool, False),
+            "connectionId": ("connection_id", float, False),
+            "encodedDataLength": ("encoded_data_length", float, False),
+            "securityState": ("security_state", security.SecurityState, False),
+            "headersText": ("headers_text", str, True),
+            "requestHeaders": ("request_headers", Headers, True),
+            "requestHeadersText": ("request_headers_text", str, True),
+            "remoteIPAddress": ("remote_ip_address", str, True),
+            "remotePort": ("remote_port", int, True),
+            "fromDiskCache": ("from_disk_cache", bool, True),
+            "fromServiceWorker": ("from_service_worker", bool, True),
+            "fromPrefetchCache": ("from_prefetch_cache", bool, True),
+            "fromEarlyHints": ("from_early_hints", bool, True),
+            "serviceWorkerRouterInfo": (
+                "service_worker_router_info",
+                ServiceWorkerRouterInfo.from_json,
+                True,
+            ),
+            "timing": ("timing", ResourceTiming.from_json, True),
+            "serviceWorkerResponseSource": (
+                "service_worker_response_source",
+                ServiceWorkerResponseSource,
+                True,
+            ),
+            "responseTime": ("response_time", TimeSinceEpoch, True),
+            "cacheStorageCacheName": ("cache_storage_cache_name", str, True),
+            "protocol": ("protocol", str, True),
+            "alternateProtocolUsage": (
+                "alternate_protocol_usage",
+                AlternateProtocolUsage,
+                True,
+            ),
+            "securityDetails": ("security_details", SecurityDetails.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class WebSocketRequest:
     """
     WebSocket request data.
@@ -1208,12 +1200,16 @@ class WebSocketRequest:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketRequest:
-        return cls(
-            headers=Headers.from_json(json["headers"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "headers": ("headers", Headers, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class WebSocketResponse:
     """
     WebSocket response data.
@@ -1252,23 +1248,21 @@ class WebSocketResponse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketResponse:
-        return cls(
-            status=int(json["status"]),
-            status_text=str(json["statusText"]),
-            headers=Headers.from_json(json["headers"]),
-            headers_text=str(json["headersText"])
-            if json.get("headersText", None) is not None
-            else None,
-            request_headers=Headers.from_json(json["requestHeaders"])
-            if json.get("requestHeaders", None) is not None
-            else None,
-            request_headers_text=str(json["requestHeadersText"])
-            if json.get("requestHeadersText", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "status": ("status", int, False),
+            "statusText": ("status_text", str, False),
+            "headers": ("headers", Headers, False),
+            "headersText": ("headers_text", str, True),
+            "requestHeaders": ("request_headers", Headers, True),
+            "requestHeadersText": ("request_headers_text", str, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class WebSocketFrame:
     """
     WebSocket message data. This represents an entire WebSocket message, not just a fragmented frame as the name suggests.
@@ -1294,14 +1288,18 @@ class WebSocketFrame:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrame:
-        return cls(
-            opcode=float(json["opcode"]),
-            mask=bool(json["mask"]),
-            payload_data=str(json["payloadData"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "opcode": ("opcode", float, False),
+            "mask": ("mask", bool, False),
+            "payloadData": ("payload_data", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CachedResource:
     """
     Information about the cached resource.
@@ -1330,17 +1328,19 @@ class CachedResource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CachedResource:
-        return cls(
-            url=str(json["url"]),
-            type_=ResourceType.from_json(json["type"]),
-            body_size=float(json["bodySize"]),
-            response=Response.from_json(json["response"])
-            if json.get("response", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "type": ("type_", ResourceType, False),
+            "bodySize": ("body_size", float, False),
+            "response": ("response", Response.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Initiator:
     """
     Information about the request initiator.
@@ -1384,25 +1384,21 @@ class Initiator:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Initiator:
-        return cls(
-            type_=str(json["type"]),
-            stack=runtime.StackTrace.from_json(json["stack"])
-            if json.get("stack", None) is not None
-            else None,
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            line_number=float(json["lineNumber"])
-            if json.get("lineNumber", None) is not None
-            else None,
-            column_number=float(json["columnNumber"])
-            if json.get("columnNumber", None) is not None
-            else None,
-            request_id=RequestId.from_json(json["requestId"])
-            if json.get("requestId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "stack": ("stack", runtime.StackTrace.from_json, True),
+            "url": ("url", str, True),
+            "lineNumber": ("line_number", float, True),
+            "columnNumber": ("column_number", float, True),
+            "requestId": ("request_id", RequestId, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CookiePartitionKey:
     """
     cookiePartitionKey object
@@ -1427,13 +1423,17 @@ class CookiePartitionKey:
         if isinstance(json, str):
             # Some chrome versions return partitionKey as string
             return cls(json, False)
-        return cls(
-            top_level_site=str(json["topLevelSite"]),
-            has_cross_site_ancestor=bool(json["hasCrossSiteAncestor"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "topLevelSite": ("top_level_site", str, False),
+            "hasCrossSiteAncestor": ("has_cross_site_ancestor", bool, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Cookie:
     """
     Cookie object
@@ -1515,32 +1515,28 @@ class Cookie:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Cookie:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-            domain=str(json["domain"]),
-            path=str(json["path"]),
-            size=int(json["size"]),
-            http_only=bool(json["httpOnly"]),
-            secure=bool(json["secure"]),
-            session=bool(json["session"]),
-            priority=CookiePriority.from_json(json["priority"]),
-            same_party=bool(json["sameParty"]),
-            source_scheme=CookieSourceScheme.from_json(json["sourceScheme"]),
-            source_port=int(json["sourcePort"]),
-            expires=float(json["expires"])
-            if json.get("expires", None) is not None
-            else None,
-            same_site=CookieSameSite.from_json(json["sameSite"])
-            if json.get("sameSite", None) is not None
-            else None,
-            partition_key=CookiePartitionKey.from_json(json["partitionKey"])
-            if json.get("partitionKey", None) is not None
-            else None,
-            partition_key_opaque=bool(json["partitionKeyOpaque"])
-            if json.get("partitionKeyOpaque", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+            "domain": ("domain", str, False),
+            "path": ("path", str, False),
+            "size": ("size", int, False),
+            "httpOnly": ("http_only", bool, False),
+            "secure": ("secure", bool, False),
+            "session": ("session", bool, False),
+            "priority": ("priority", CookiePriority, False),
+            "sameParty": ("same_party", bool, False),
+            "sourceScheme": ("source_scheme", CookieSourceScheme, False),
+            "sourcePort": ("source_port", int, False),
+            "expires": ("expires", float, True),
+            "sameSite": ("same_site", CookieSameSite, True),
+            "partitionKey": ("partition_key", CookiePartitionKey.from_json, True),
+            "partitionKeyOpaque": ("partition_key_opaque", bool, True),
+        }
 
 
 class SetCookieBlockedReason(enum.Enum):
@@ -1639,7 +1635,7 @@ class CookieExemptionReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class BlockedSetCookieWithReason:
     """
     A cookie which was not stored from a response with the corresponding reason.
@@ -1667,18 +1663,22 @@ class BlockedSetCookieWithReason:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BlockedSetCookieWithReason:
-        return cls(
-            blocked_reasons=[
-                SetCookieBlockedReason.from_json(i) for i in json["blockedReasons"]
-            ],
-            cookie_line=str(json["cookieLine"]),
-            cookie=Cookie.from_json(json["cookie"])
-            if json.get("cookie", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "blockedReasons": (
+                "blocked_reasons",
+                lambda v: [SetCookieBlockedReason(i) for i in v],
+                False,
+            ),
+            "cookieLine": ("cookie_line", str, False),
+            "cookie": ("cookie", Cookie.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ExemptedSetCookieWithReason:
     """
     A cookie should have been blocked by 3PCD but is exempted and stored from a response with the
@@ -1703,14 +1703,18 @@ class ExemptedSetCookieWithReason:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExemptedSetCookieWithReason:
-        return cls(
-            exemption_reason=CookieExemptionReason.from_json(json["exemptionReason"]),
-            cookie_line=str(json["cookieLine"]),
-            cookie=Cookie.from_json(json["cookie"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "exemptionReason": ("exemption_reason", CookieExemptionReason, False),
+            "cookieLine": ("cookie_line", str, False),
+            "cookie": ("cookie", Cookie.from_json, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AssociatedCookie:
     """
     A cookie associated with the request which may or may not be sent with it.
@@ -1737,18 +1741,22 @@ class AssociatedCookie:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AssociatedCookie:
-        return cls(
-            cookie=Cookie.from_json(json["cookie"]),
-            blocked_reasons=[
-                CookieBlockedReason.from_json(i) for i in json["blockedReasons"]
-            ],
-            exemption_reason=CookieExemptionReason.from_json(json["exemptionReason"])
-            if json.get("exemptionReason", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "cookie": ("cookie", Cookie.from_json, False),
+            "blockedReasons": (
+                "blocked_reasons",
+                lambda v: [CookieBlockedReason(i) for i in v],
+                False,
+            ),
+            "exemptionReason": ("exemption_reason", CookieExemptionReason, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class CookieParam:
     """
     Cookie parameter object
@@ -1831,45 +1839,29 @@ class CookieParam:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookieParam:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            domain=str(json["domain"])
-            if json.get("domain", None) is not None
-            else None,
-            path=str(json["path"]) if json.get("path", None) is not None else None,
-            secure=bool(json["secure"])
-            if json.get("secure", None) is not None
-            else None,
-            http_only=bool(json["httpOnly"])
-            if json.get("httpOnly", None) is not None
-            else None,
-            same_site=CookieSameSite.from_json(json["sameSite"])
-            if json.get("sameSite", None) is not None
-            else None,
-            expires=TimeSinceEpoch.from_json(json["expires"])
-            if json.get("expires", None) is not None
-            else None,
-            priority=CookiePriority.from_json(json["priority"])
-            if json.get("priority", None) is not None
-            else None,
-            same_party=bool(json["sameParty"])
-            if json.get("sameParty", None) is not None
-            else None,
-            source_scheme=CookieSourceScheme.from_json(json["sourceScheme"])
-            if json.get("sourceScheme", None) is not None
-            else None,
-            source_port=int(json["sourcePort"])
-            if json.get("sourcePort", None) is not None
-            else None,
-            partition_key=CookiePartitionKey.from_json(json["partitionKey"])
-            if json.get("partitionKey", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+            "url": ("url", str, True),
+            "domain": ("domain", str, True),
+            "path": ("path", str, True),
+            "secure": ("secure", bool, True),
+            "httpOnly": ("http_only", bool, True),
+            "sameSite": ("same_site", CookieSameSite, True),
+            "expires": ("expires", TimeSinceEpoch, True),
+            "priority": ("priority", CookiePriority, True),
+            "sameParty": ("same_party", bool, True),
+            "sourceScheme": ("source_scheme", CookieSourceScheme, True),
+            "sourcePort": ("source_port", int, True),
+            "partitionKey": ("partition_key", CookiePartitionKey.from_json, True),
+        }
+
+
+@slotted_dataclass
 class AuthChallenge:
     """
     Authorization challenge for HTTP status code 401 or 407.
@@ -1898,17 +1890,19 @@ class AuthChallenge:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallenge:
-        return cls(
-            origin=str(json["origin"]),
-            scheme=str(json["scheme"]),
-            realm=str(json["realm"]),
-            source=str(json["source"])
-            if json.get("source", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "scheme": ("scheme", str, False),
+            "realm": ("realm", str, False),
+            "source": ("source", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AuthChallengeResponse:
     """
     Response to an AuthChallenge.
@@ -1938,15 +1932,15 @@ class AuthChallengeResponse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallengeResponse:
-        return cls(
-            response=str(json["response"]),
-            username=str(json["username"])
-            if json.get("username", None) is not None
-            else None,
-            password=str(json["password"])
-            if json.get("password", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "response": ("response", str, False),
+            "username": ("username", str, True),
+            "password": ("password", str, True),
+        }
 
 
 class InterceptionStage(enum.Enum):
@@ -1966,7 +1960,7 @@ class InterceptionStage(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class RequestPattern:
     """
     Request pattern for interception.
@@ -1994,20 +1988,18 @@ class RequestPattern:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPattern:
-        return cls(
-            url_pattern=str(json["urlPattern"])
-            if json.get("urlPattern", None) is not None
-            else None,
-            resource_type=ResourceType.from_json(json["resourceType"])
-            if json.get("resourceType", None) is not None
-            else None,
-            interception_stage=InterceptionStage.from_json(json["interceptionStage"])
-            if json.get("interceptionStage", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "urlPattern": ("url_pattern", str, True),
+            "resourceType": ("resource_type", ResourceType, True),
+            "interceptionStage": ("interception_stage", InterceptionStage, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class SignedExchangeSignature:
     """
     Information about a signed exchange signature.
@@ -2059,26 +2051,24 @@ class SignedExchangeSignature:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeSignature:
-        return cls(
-            label=str(json["label"]),
-            signature=str(json["signature"]),
-            integrity=str(json["integrity"]),
-            validity_url=str(json["validityUrl"]),
-            date=int(json["date"]),
-            expires=int(json["expires"]),
-            cert_url=str(json["certUrl"])
-            if json.get("certUrl", None) is not None
-            else None,
-            cert_sha256=str(json["certSha256"])
-            if json.get("certSha256", None) is not None
-            else None,
-            certificates=[str(i) for i in json["certificates"]]
-            if json.get("certificates", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "label": ("label", str, False),
+            "signature": ("signature", str, False),
+            "integrity": ("integrity", str, False),
+            "validityUrl": ("validity_url", str, False),
+            "date": ("date", int, False),
+            "expires": ("expires", int, False),
+            "certUrl": ("cert_url", str, True),
+            "certSha256": ("cert_sha256", str, True),
+            "certificates": ("certificates", lambda v: [str(i) for i in v], True),
+        }
+
+
+@slotted_dataclass
 class SignedExchangeHeader:
     """
     Information about a signed exchange header.
@@ -2111,15 +2101,21 @@ class SignedExchangeHeader:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeHeader:
-        return cls(
-            request_url=str(json["requestUrl"]),
-            response_code=int(json["responseCode"]),
-            response_headers=Headers.from_json(json["responseHeaders"]),
-            signatures=[
-                SignedExchangeSignature.from_json(i) for i in json["signatures"]
-            ],
-            header_integrity=str(json["headerIntegrity"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestUrl": ("request_url", str, False),
+            "responseCode": ("response_code", int, False),
+            "responseHeaders": ("response_headers", Headers, False),
+            "signatures": (
+                "signatures",
+                lambda v: [SignedExchangeSignature.from_json(i) for i in v],
+                False,
+            ),
+            "headerIntegrity": ("header_integrity", str, False),
+        }
 
 
 class SignedExchangeErrorField(enum.Enum):
@@ -2142,7 +2138,7 @@ class SignedExchangeErrorField(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class SignedExchangeError:
     """
     Information about a signed exchange response.
@@ -2168,18 +2164,18 @@ class SignedExchangeError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeError:
-        return cls(
-            message=str(json["message"]),
-            signature_index=int(json["signatureIndex"])
-            if json.get("signatureIndex", None) is not None
-            else None,
-            error_field=SignedExchangeErrorField.from_json(json["errorField"])
-            if json.get("errorField", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "message": ("message", str, False),
+            "signatureIndex": ("signature_index", int, True),
+            "errorField": ("error_field", SignedExchangeErrorField, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class SignedExchangeInfo:
     """
     Information about a signed exchange response.
@@ -2210,18 +2206,20 @@ class SignedExchangeInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeInfo:
-        return cls(
-            outer_response=Response.from_json(json["outerResponse"]),
-            header=SignedExchangeHeader.from_json(json["header"])
-            if json.get("header", None) is not None
-            else None,
-            security_details=SecurityDetails.from_json(json["securityDetails"])
-            if json.get("securityDetails", None) is not None
-            else None,
-            errors=[SignedExchangeError.from_json(i) for i in json["errors"]]
-            if json.get("errors", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "outerResponse": ("outer_response", Response.from_json, False),
+            "header": ("header", SignedExchangeHeader.from_json, True),
+            "securityDetails": ("security_details", SecurityDetails.from_json, True),
+            "errors": (
+                "errors",
+                lambda v: [SignedExchangeError.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
 class ContentEncoding(enum.Enum):
@@ -2271,7 +2269,7 @@ class IPAddressSpace(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ConnectTiming:
     #: Timing's requestTime is a baseline in seconds, while the other numbers are ticks in
     #: milliseconds relatively to this requestTime. Matches ResourceTiming's requestTime for
@@ -2285,12 +2283,16 @@ class ConnectTiming:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConnectTiming:
-        return cls(
-            request_time=float(json["requestTime"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestTime": ("request_time", float, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class ClientSecurityState:
     initiator_is_secure_context: bool
 
@@ -2309,15 +2311,23 @@ class ClientSecurityState:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ClientSecurityState:
-        return cls(
-            initiator_is_secure_context=bool(json["initiatorIsSecureContext"]),
-            initiator_ip_address_space=IPAddressSpace.from_json(
-                json["initiatorIPAddressSpace"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "initiatorIsSecureContext": ("initiator_is_secure_context", bool, False),
+            "initiatorIPAddressSpace": (
+                "initiator_ip_address_space",
+                IPAddressSpace,
+                False,
             ),
-            private_network_request_policy=PrivateNetworkRequestPolicy.from_json(
-                json["privateNetworkRequestPolicy"]
+            "privateNetworkRequestPolicy": (
+                "private_network_request_policy",
+                PrivateNetworkRequestPolicy,
+                False,
             ),
-        )
+        }
 
 
 class CrossOriginOpenerPolicyValue(enum.Enum):
@@ -2337,7 +2347,7 @@ class CrossOriginOpenerPolicyValue(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class CrossOriginOpenerPolicyStatus:
     value: CrossOriginOpenerPolicyValue
 
@@ -2359,18 +2369,24 @@ class CrossOriginOpenerPolicyStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CrossOriginOpenerPolicyStatus:
-        return cls(
-            value=CrossOriginOpenerPolicyValue.from_json(json["value"]),
-            report_only_value=CrossOriginOpenerPolicyValue.from_json(
-                json["reportOnlyValue"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "value": ("value", CrossOriginOpenerPolicyValue, False),
+            "reportOnlyValue": (
+                "report_only_value",
+                CrossOriginOpenerPolicyValue,
+                False,
             ),
-            reporting_endpoint=str(json["reportingEndpoint"])
-            if json.get("reportingEndpoint", None) is not None
-            else None,
-            report_only_reporting_endpoint=str(json["reportOnlyReportingEndpoint"])
-            if json.get("reportOnlyReportingEndpoint", None) is not None
-            else None,
-        )
+            "reportingEndpoint": ("reporting_endpoint", str, True),
+            "reportOnlyReportingEndpoint": (
+                "report_only_reporting_endpoint",
+                str,
+                True,
+            ),
+        }
 
 
 class CrossOriginEmbedderPolicyValue(enum.Enum):
@@ -2386,7 +2402,7 @@ class CrossOriginEmbedderPolicyValue(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class CrossOriginEmbedderPolicyStatus:
     value: CrossOriginEmbedderPolicyValue
 
@@ -2408,18 +2424,24 @@ class CrossOriginEmbedderPolicyStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CrossOriginEmbedderPolicyStatus:
-        return cls(
-            value=CrossOriginEmbedderPolicyValue.from_json(json["value"]),
-            report_only_value=CrossOriginEmbedderPolicyValue.from_json(
-                json["reportOnlyValue"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "value": ("value", CrossOriginEmbedderPolicyValue, False),
+            "reportOnlyValue": (
+                "report_only_value",
+                CrossOriginEmbedderPolicyValue,
+                False,
             ),
-            reporting_endpoint=str(json["reportingEndpoint"])
-            if json.get("reportingEndpoint", None) is not None
-            else None,
-            report_only_reporting_endpoint=str(json["reportOnlyReportingEndpoint"])
-            if json.get("reportOnlyReportingEndpoint", None) is not None
-            else None,
-        )
+            "reportingEndpoint": ("reporting_endpoint", str, True),
+            "reportOnlyReportingEndpoint": (
+                "report_only_reporting_endpoint",
+                str,
+                True,
+            ),
+        }
 
 
 class ContentSecurityPolicySource(enum.Enum):
@@ -2434,7 +2456,7 @@ class ContentSecurityPolicySource(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ContentSecurityPolicyStatus:
     effective_directives: str
 
@@ -2451,14 +2473,18 @@ class ContentSecurityPolicyStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContentSecurityPolicyStatus:
-        return cls(
-            effective_directives=str(json["effectiveDirectives"]),
-            is_enforced=bool(json["isEnforced"]),
-            source=ContentSecurityPolicySource.from_json(json["source"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "effectiveDirectives": ("effective_directives", str, False),
+            "isEnforced": ("is_enforced", bool, False),
+            "source": ("source", ContentSecurityPolicySource, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class SecurityIsolationStatus:
     coop: typing.Optional[CrossOriginOpenerPolicyStatus] = None
 
@@ -2478,17 +2504,19 @@ class SecurityIsolationStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityIsolationStatus:
-        return cls(
-            coop=CrossOriginOpenerPolicyStatus.from_json(json["coop"])
-            if json.get("coop", None) is not None
-            else None,
-            coep=CrossOriginEmbedderPolicyStatus.from_json(json["coep"])
-            if json.get("coep", None) is not None
-            else None,
-            csp=[ContentSecurityPolicyStatus.from_json(i) for i in json["csp"]]
-            if json.get("csp", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "coop": ("coop", CrossOriginOpenerPolicyStatus.from_json, True),
+            "coep": ("coep", CrossOriginEmbedderPolicyStatus.from_json, True),
+            "csp": (
+                "csp",
+                lambda v: [ContentSecurityPolicyStatus.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
 class ReportStatus(enum.Enum):
@@ -2521,7 +2549,7 @@ class ReportId(str):
         return "ReportId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class ReportingApiReport:
     """
     An object representing a report generated by the Reporting API.
@@ -2566,20 +2594,24 @@ class ReportingApiReport:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiReport:
-        return cls(
-            id_=ReportId.from_json(json["id"]),
-            initiator_url=str(json["initiatorUrl"]),
-            destination=str(json["destination"]),
-            type_=str(json["type"]),
-            timestamp=TimeSinceEpoch.from_json(json["timestamp"]),
-            depth=int(json["depth"]),
-            completed_attempts=int(json["completedAttempts"]),
-            body=dict(json["body"]),
-            status=ReportStatus.from_json(json["status"]),
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", ReportId, False),
+            "initiatorUrl": ("initiator_url", str, False),
+            "destination": ("destination", str, False),
+            "type": ("type_", str, False),
+            "timestamp": ("timestamp", TimeSinceEpoch, False),
+            "depth": ("depth", int, False),
+            "completedAttempts": ("completed_attempts", int, False),
+            "body": ("body", dict, False),
+            "status": ("status", ReportStatus, False),
+        }
+
+
+@slotted_dataclass
 class ReportingApiEndpoint:
     #: The URL of the endpoint to which reports may be delivered.
     url: str
@@ -2595,13 +2627,17 @@ class ReportingApiEndpoint:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiEndpoint:
-        return cls(
-            url=str(json["url"]),
-            group_name=str(json["groupName"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "groupName": ("group_name", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class LoadNetworkResourcePageResult:
     """
     An object providing the result of a network resource load.
@@ -2639,27 +2675,21 @@ class LoadNetworkResourcePageResult:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadNetworkResourcePageResult:
-        return cls(
-            success=bool(json["success"]),
-            net_error=float(json["netError"])
-            if json.get("netError", None) is not None
-            else None,
-            net_error_name=str(json["netErrorName"])
-            if json.get("netErrorName", None) is not None
-            else None,
-            http_status_code=float(json["httpStatusCode"])
-            if json.get("httpStatusCode", None) is not None
-            else None,
-            stream=io.StreamHandle.from_json(json["stream"])
-            if json.get("stream", None) is not None
-            else None,
-            headers=Headers.from_json(json["headers"])
-            if json.get("headers", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "success": ("success", bool, False),
+            "netError": ("net_error", float, True),
+            "netErrorName": ("net_error_name", str, True),
+            "httpStatusCode": ("http_status_code", float, True),
+            "stream": ("stream", io.StreamHandle, True),
+            "headers": ("headers", Headers, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class LoadNetworkResourceOptions:
     """
     An options object that may be extended later to better support CORS,
@@ -2678,10 +2708,14 @@ class LoadNetworkResourceOptions:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadNetworkResourceOptions:
-        return cls(
-            disable_cache=bool(json["disableCache"]),
-            include_credentials=bool(json["includeCredentials"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "disableCache": ("disable_cache", bool, False),
+            "includeCredentials": ("include_credentials", bool, False),
+        }
 
 
 def set_accepted_encodings(
@@ -3477,7 +3511,7 @@ def load_network_resource(
 
 
 @event_class("Network.dataReceived")
-@dataclass
+@slotted_dataclass
 class DataReceived:
     """
     Fired when data chunk was received over the network.
@@ -3496,17 +3530,21 @@ class DataReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataReceived:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            data_length=int(json["dataLength"]),
-            encoded_data_length=int(json["encodedDataLength"]),
-            data=str(json["data"]) if json.get("data", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "dataLength": ("data_length", int, False),
+            "encodedDataLength": ("encoded_data_length", int, False),
+            "data": ("data", str, True),
+        }
 
 
 @event_class("Network.eventSourceMessageReceived")
-@dataclass
+@slotted_dataclass
 class EventSourceMessageReceived:
     """
     Fired when EventSource message is received.
@@ -3525,17 +3563,21 @@ class EventSourceMessageReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventSourceMessageReceived:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            event_name=str(json["eventName"]),
-            event_id=str(json["eventId"]),
-            data=str(json["data"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "eventName": ("event_name", str, False),
+            "eventId": ("event_id", str, False),
+            "data": ("data", str, False),
+        }
 
 
 @event_class("Network.loadingFailed")
-@dataclass
+@slotted_dataclass
 class LoadingFailed:
     """
     Fired when HTTP request has failed to load.
@@ -3558,25 +3600,23 @@ class LoadingFailed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadingFailed:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            type_=ResourceType.from_json(json["type"]),
-            error_text=str(json["errorText"]),
-            canceled=bool(json["canceled"])
-            if json.get("canceled", None) is not None
-            else None,
-            blocked_reason=BlockedReason.from_json(json["blockedReason"])
-            if json.get("blockedReason", None) is not None
-            else None,
-            cors_error_status=CorsErrorStatus.from_json(json["corsErrorStatus"])
-            if json.get("corsErrorStatus", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "type": ("type_", ResourceType, False),
+            "errorText": ("error_text", str, False),
+            "canceled": ("canceled", bool, True),
+            "blockedReason": ("blocked_reason", BlockedReason, True),
+            "corsErrorStatus": ("cors_error_status", CorsErrorStatus.from_json, True),
+        }
 
 
 @event_class("Network.loadingFinished")
-@dataclass
+@slotted_dataclass
 class LoadingFinished:
     """
     Fired when HTTP request has finished loading.
@@ -3591,16 +3631,20 @@ class LoadingFinished:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadingFinished:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            encoded_data_length=float(json["encodedDataLength"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "encodedDataLength": ("encoded_data_length", float, False),
+        }
 
 
 @deprecated(version="1.3")
 @event_class("Network.requestIntercepted")
-@dataclass
+@slotted_dataclass
 class RequestIntercepted:
     """
     **EXPERIMENTAL**
@@ -3644,38 +3688,28 @@ class RequestIntercepted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestIntercepted:
-        return cls(
-            interception_id=InterceptionId.from_json(json["interceptionId"]),
-            request=Request.from_json(json["request"]),
-            frame_id=page.FrameId.from_json(json["frameId"]),
-            resource_type=ResourceType.from_json(json["resourceType"]),
-            is_navigation_request=bool(json["isNavigationRequest"]),
-            is_download=bool(json["isDownload"])
-            if json.get("isDownload", None) is not None
-            else None,
-            redirect_url=str(json["redirectUrl"])
-            if json.get("redirectUrl", None) is not None
-            else None,
-            auth_challenge=AuthChallenge.from_json(json["authChallenge"])
-            if json.get("authChallenge", None) is not None
-            else None,
-            response_error_reason=ErrorReason.from_json(json["responseErrorReason"])
-            if json.get("responseErrorReason", None) is not None
-            else None,
-            response_status_code=int(json["responseStatusCode"])
-            if json.get("responseStatusCode", None) is not None
-            else None,
-            response_headers=Headers.from_json(json["responseHeaders"])
-            if json.get("responseHeaders", None) is not None
-            else None,
-            request_id=RequestId.from_json(json["requestId"])
-            if json.get("requestId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "interceptionId": ("interception_id", InterceptionId, False),
+            "request": ("request", Request.from_json, False),
+            "frameId": ("frame_id", page.FrameId, False),
+            "resourceType": ("resource_type", ResourceType, False),
+            "isNavigationRequest": ("is_navigation_request", bool, False),
+            "isDownload": ("is_download", bool, True),
+            "redirectUrl": ("redirect_url", str, True),
+            "authChallenge": ("auth_challenge", AuthChallenge.from_json, True),
+            "responseErrorReason": ("response_error_reason", ErrorReason, True),
+            "responseStatusCode": ("response_status_code", int, True),
+            "responseHeaders": ("response_headers", Headers, True),
+            "requestId": ("request_id", RequestId, True),
+        }
 
 
 @event_class("Network.requestServedFromCache")
-@dataclass
+@slotted_dataclass
 class RequestServedFromCache:
     """
     Fired if request ended up loading from cache.
@@ -3686,11 +3720,17 @@ class RequestServedFromCache:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestServedFromCache:
-        return cls(request_id=RequestId.from_json(json["requestId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+        }
 
 
 @event_class("Network.requestWillBeSent")
-@dataclass
+@slotted_dataclass
 class RequestWillBeSent:
     """
     Fired when page is about to send HTTP request.
@@ -3725,32 +3765,28 @@ class RequestWillBeSent:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSent:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            loader_id=LoaderId.from_json(json["loaderId"]),
-            document_url=str(json["documentURL"]),
-            request=Request.from_json(json["request"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            wall_time=TimeSinceEpoch.from_json(json["wallTime"]),
-            initiator=Initiator.from_json(json["initiator"]),
-            redirect_has_extra_info=bool(json["redirectHasExtraInfo"]),
-            redirect_response=Response.from_json(json["redirectResponse"])
-            if json.get("redirectResponse", None) is not None
-            else None,
-            type_=ResourceType.from_json(json["type"])
-            if json.get("type", None) is not None
-            else None,
-            frame_id=page.FrameId.from_json(json["frameId"])
-            if json.get("frameId", None) is not None
-            else None,
-            has_user_gesture=bool(json["hasUserGesture"])
-            if json.get("hasUserGesture", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "loaderId": ("loader_id", LoaderId, False),
+            "documentURL": ("document_url", str, False),
+            "request": ("request", Request.from_json, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "wallTime": ("wall_time", TimeSinceEpoch, False),
+            "initiator": ("initiator", Initiator.from_json, False),
+            "redirectHasExtraInfo": ("redirect_has_extra_info", bool, False),
+            "redirectResponse": ("redirect_response", Response.from_json, True),
+            "type": ("type_", ResourceType, True),
+            "frameId": ("frame_id", page.FrameId, True),
+            "hasUserGesture": ("has_user_gesture", bool, True),
+        }
 
 
 @event_class("Network.resourceChangedPriority")
-@dataclass
+@slotted_dataclass
 class ResourceChangedPriority:
     """
     **EXPERIMENTAL**
@@ -3767,15 +3803,19 @@ class ResourceChangedPriority:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResourceChangedPriority:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            new_priority=ResourcePriority.from_json(json["newPriority"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "newPriority": ("new_priority", ResourcePriority, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+        }
 
 
 @event_class("Network.signedExchangeReceived")
-@dataclass
+@slotted_dataclass
 class SignedExchangeReceived:
     """
     **EXPERIMENTAL**
@@ -3790,14 +3830,18 @@ class SignedExchangeReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeReceived:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            info=SignedExchangeInfo.from_json(json["info"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "info": ("info", SignedExchangeInfo.from_json, False),
+        }
 
 
 @event_class("Network.responseReceived")
-@dataclass
+@slotted_dataclass
 class ResponseReceived:
     """
     Fired when HTTP response is available.
@@ -3821,21 +3865,23 @@ class ResponseReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceived:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            loader_id=LoaderId.from_json(json["loaderId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            type_=ResourceType.from_json(json["type"]),
-            response=Response.from_json(json["response"]),
-            has_extra_info=bool(json["hasExtraInfo"]),
-            frame_id=page.FrameId.from_json(json["frameId"])
-            if json.get("frameId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "loaderId": ("loader_id", LoaderId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "type": ("type_", ResourceType, False),
+            "response": ("response", Response.from_json, False),
+            "hasExtraInfo": ("has_extra_info", bool, False),
+            "frameId": ("frame_id", page.FrameId, True),
+        }
 
 
 @event_class("Network.webSocketClosed")
-@dataclass
+@slotted_dataclass
 class WebSocketClosed:
     """
     Fired when WebSocket is closed.
@@ -3848,14 +3894,18 @@ class WebSocketClosed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketClosed:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+        }
 
 
 @event_class("Network.webSocketCreated")
-@dataclass
+@slotted_dataclass
 class WebSocketCreated:
     """
     Fired upon WebSocket creation.
@@ -3870,17 +3920,19 @@ class WebSocketCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketCreated:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            url=str(json["url"]),
-            initiator=Initiator.from_json(json["initiator"])
-            if json.get("initiator", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "url": ("url", str, False),
+            "initiator": ("initiator", Initiator.from_json, True),
+        }
 
 
 @event_class("Network.webSocketFrameError")
-@dataclass
+@slotted_dataclass
 class WebSocketFrameError:
     """
     Fired when WebSocket message error occurs.
@@ -3895,15 +3947,19 @@ class WebSocketFrameError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameError:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            error_message=str(json["errorMessage"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "errorMessage": ("error_message", str, False),
+        }
 
 
 @event_class("Network.webSocketFrameReceived")
-@dataclass
+@slotted_dataclass
 class WebSocketFrameReceived:
     """
     Fired when WebSocket message is received.
@@ -3918,15 +3974,19 @@ class WebSocketFrameReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameReceived:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            response=WebSocketFrame.from_json(json["response"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "response": ("response", WebSocketFrame.from_json, False),
+        }
 
 
 @event_class("Network.webSocketFrameSent")
-@dataclass
+@slotted_dataclass
 class WebSocketFrameSent:
     """
     Fired when WebSocket message is sent.
@@ -3941,15 +4001,19 @@ class WebSocketFrameSent:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameSent:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            response=WebSocketFrame.from_json(json["response"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "response": ("response", WebSocketFrame.from_json, False),
+        }
 
 
 @event_class("Network.webSocketHandshakeResponseReceived")
-@dataclass
+@slotted_dataclass
 class WebSocketHandshakeResponseReceived:
     """
     Fired when WebSocket handshake response becomes available.
@@ -3964,15 +4028,19 @@ class WebSocketHandshakeResponseReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketHandshakeResponseReceived:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            response=WebSocketResponse.from_json(json["response"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "response": ("response", WebSocketResponse.from_json, False),
+        }
 
 
 @event_class("Network.webSocketWillSendHandshakeRequest")
-@dataclass
+@slotted_dataclass
 class WebSocketWillSendHandshakeRequest:
     """
     Fired when WebSocket is about to initiate handshake.
@@ -3989,16 +4057,20 @@ class WebSocketWillSendHandshakeRequest:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketWillSendHandshakeRequest:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            wall_time=TimeSinceEpoch.from_json(json["wallTime"]),
-            request=WebSocketRequest.from_json(json["request"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "wallTime": ("wall_time", TimeSinceEpoch, False),
+            "request": ("request", WebSocketRequest.from_json, False),
+        }
 
 
 @event_class("Network.webTransportCreated")
-@dataclass
+@slotted_dataclass
 class WebTransportCreated:
     """
     Fired upon WebTransport creation.
@@ -4015,18 +4087,20 @@ class WebTransportCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebTransportCreated:
-        return cls(
-            transport_id=RequestId.from_json(json["transportId"]),
-            url=str(json["url"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-            initiator=Initiator.from_json(json["initiator"])
-            if json.get("initiator", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "transportId": ("transport_id", RequestId, False),
+            "url": ("url", str, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+            "initiator": ("initiator", Initiator.from_json, True),
+        }
 
 
 @event_class("Network.webTransportConnectionEstablished")
-@dataclass
+@slotted_dataclass
 class WebTransportConnectionEstablished:
     """
     Fired when WebTransport handshake is finished.
@@ -4039,14 +4113,18 @@ class WebTransportConnectionEstablished:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebTransportConnectionEstablished:
-        return cls(
-            transport_id=RequestId.from_json(json["transportId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "transportId": ("transport_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+        }
 
 
 @event_class("Network.webTransportClosed")
-@dataclass
+@slotted_dataclass
 class WebTransportClosed:
     """
     Fired when WebTransport is disposed.
@@ -4059,14 +4137,18 @@ class WebTransportClosed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebTransportClosed:
-        return cls(
-            transport_id=RequestId.from_json(json["transportId"]),
-            timestamp=MonotonicTime.from_json(json["timestamp"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "transportId": ("transport_id", RequestId, False),
+            "timestamp": ("timestamp", MonotonicTime, False),
+        }
 
 
 @event_class("Network.requestWillBeSentExtraInfo")
-@dataclass
+@slotted_dataclass
 class RequestWillBeSentExtraInfo:
     """
     **EXPERIMENTAL**
@@ -4093,28 +4175,34 @@ class RequestWillBeSentExtraInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSentExtraInfo:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            associated_cookies=[
-                AssociatedCookie.from_json(i) for i in json["associatedCookies"]
-            ],
-            headers=Headers.from_json(json["headers"]),
-            connect_timing=ConnectTiming.from_json(json["connectTiming"]),
-            client_security_state=ClientSecurityState.from_json(
-                json["clientSecurityState"]
-            )
-            if json.get("clientSecurityState", None) is not None
-            else None,
-            site_has_cookie_in_other_partition=bool(
-                json["siteHasCookieInOtherPartition"]
-            )
-            if json.get("siteHasCookieInOtherPartition", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "associatedCookies": (
+                "associated_cookies",
+                lambda v: [AssociatedCookie.from_json(i) for i in v],
+                False,
+            ),
+            "headers": ("headers", Headers, False),
+            "connectTiming": ("connect_timing", ConnectTiming.from_json, False),
+            "clientSecurityState": (
+                "client_security_state",
+                ClientSecurityState.from_json,
+                True,
+            ),
+            "siteHasCookieInOtherPartition": (
+                "site_has_cookie_in_other_partition",
+                bool,
+                True,
+            ),
+        }
 
 
 @event_class("Network.responseReceivedExtraInfo")
-@dataclass
+@slotted_dataclass
 class ResponseReceivedExtraInfo:
     """
     **EXPERIMENTAL**
@@ -4153,38 +4241,41 @@ class ResponseReceivedExtraInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceivedExtraInfo:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            blocked_cookies=[
-                BlockedSetCookieWithReason.from_json(i) for i in json["blockedCookies"]
-            ],
-            headers=Headers.from_json(json["headers"]),
-            resource_ip_address_space=IPAddressSpace.from_json(
-                json["resourceIPAddressSpace"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "blockedCookies": (
+                "blocked_cookies",
+                lambda v: [BlockedSetCookieWithReason.from_json(i) for i in v],
+                False,
             ),
-            status_code=int(json["statusCode"]),
-            headers_text=str(json["headersText"])
-            if json.get("headersText", None) is not None
-            else None,
-            cookie_partition_key=CookiePartitionKey.from_json(
-                json["cookiePartitionKey"]
-            )
-            if json.get("cookiePartitionKey", None) is not None
-            else None,
-            cookie_partition_key_opaque=bool(json["cookiePartitionKeyOpaque"])
-            if json.get("cookiePartitionKeyOpaque", None) is not None
-            else None,
-            exempted_cookies=[
-                ExemptedSetCookieWithReason.from_json(i)
-                for i in json["exemptedCookies"]
-            ]
-            if json.get("exemptedCookies", None) is not None
-            else None,
-        )
+            "headers": ("headers", Headers, False),
+            "resourceIPAddressSpace": (
+                "resource_ip_address_space",
+                IPAddressSpace,
+                False,
+            ),
+            "statusCode": ("status_code", int, False),
+            "headersText": ("headers_text", str, True),
+            "cookiePartitionKey": (
+                "cookie_partition_key",
+                CookiePartitionKey.from_json,
+                True,
+            ),
+            "cookiePartitionKeyOpaque": ("cookie_partition_key_opaque", bool, True),
+            "exemptedCookies": (
+                "exempted_cookies",
+                lambda v: [ExemptedSetCookieWithReason.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
 @event_class("Network.responseReceivedEarlyHints")
-@dataclass
+@slotted_dataclass
 class ResponseReceivedEarlyHints:
     """
     **EXPERIMENTAL**
@@ -4201,14 +4292,18 @@ class ResponseReceivedEarlyHints:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceivedEarlyHints:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            headers=Headers.from_json(json["headers"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "headers": ("headers", Headers, False),
+        }
 
 
 @event_class("Network.trustTokenOperationDone")
-@dataclass
+@slotted_dataclass
 class TrustTokenOperationDone:
     """
     **EXPERIMENTAL**
@@ -4235,24 +4330,22 @@ class TrustTokenOperationDone:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TrustTokenOperationDone:
-        return cls(
-            status=str(json["status"]),
-            type_=TrustTokenOperationType.from_json(json["type"]),
-            request_id=RequestId.from_json(json["requestId"]),
-            top_level_origin=str(json["topLevelOrigin"])
-            if json.get("topLevelOrigin", None) is not None
-            else None,
-            issuer_origin=str(json["issuerOrigin"])
-            if json.get("issuerOrigin", None) is not None
-            else None,
-            issued_token_count=int(json["issuedTokenCount"])
-            if json.get("issuedTokenCount", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "status": ("status", str, False),
+            "type": ("type_", TrustTokenOperationType, False),
+            "requestId": ("request_id", RequestId, False),
+            "topLevelOrigin": ("top_level_origin", str, True),
+            "issuerOrigin": ("issuer_origin", str, True),
+            "issuedTokenCount": ("issued_token_count", int, True),
+        }
 
 
 @event_class("Network.policyUpdated")
-@dataclass
+@slotted_dataclass
 class PolicyUpdated:
     """
     **EXPERIMENTAL**
@@ -4262,11 +4355,15 @@ class PolicyUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PolicyUpdated:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("Network.subresourceWebBundleMetadataReceived")
-@dataclass
+@slotted_dataclass
 class SubresourceWebBundleMetadataReceived:
     """
     **EXPERIMENTAL**
@@ -4282,14 +4379,18 @@ class SubresourceWebBundleMetadataReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleMetadataReceived:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            urls=[str(i) for i in json["urls"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "urls": ("urls", lambda v: [str(i) for i in v], False),
+        }
 
 
 @event_class("Network.subresourceWebBundleMetadataError")
-@dataclass
+@slotted_dataclass
 class SubresourceWebBundleMetadataError:
     """
     **EXPERIMENTAL**
@@ -4304,14 +4405,18 @@ class SubresourceWebBundleMetadataError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleMetadataError:
-        return cls(
-            request_id=RequestId.from_json(json["requestId"]),
-            error_message=str(json["errorMessage"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "requestId": ("request_id", RequestId, False),
+            "errorMessage": ("error_message", str, False),
+        }
 
 
 @event_class("Network.subresourceWebBundleInnerResponseParsed")
-@dataclass
+@slotted_dataclass
 class SubresourceWebBundleInnerResponseParsed:
     """
     **EXPERIMENTAL**
@@ -4331,17 +4436,19 @@ class SubresourceWebBundleInnerResponseParsed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleInnerResponseParsed:
-        return cls(
-            inner_request_id=RequestId.from_json(json["innerRequestId"]),
-            inner_request_url=str(json["innerRequestURL"]),
-            bundle_request_id=RequestId.from_json(json["bundleRequestId"])
-            if json.get("bundleRequestId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "innerRequestId": ("inner_request_id", RequestId, False),
+            "innerRequestURL": ("inner_request_url", str, False),
+            "bundleRequestId": ("bundle_request_id", RequestId, True),
+        }
 
 
 @event_class("Network.subresourceWebBundleInnerResponseError")
-@dataclass
+@slotted_dataclass
 class SubresourceWebBundleInnerResponseError:
     """
     **EXPERIMENTAL**
@@ -4362,18 +4469,20 @@ class SubresourceWebBundleInnerResponseError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleInnerResponseError:
-        return cls(
-            inner_request_id=RequestId.from_json(json["innerRequestId"]),
-            inner_request_url=str(json["innerRequestURL"]),
-            error_message=str(json["errorMessage"]),
-            bundle_request_id=RequestId.from_json(json["bundleRequestId"])
-            if json.get("bundleRequestId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "innerRequestId": ("inner_request_id", RequestId, False),
+            "innerRequestURL": ("inner_request_url", str, False),
+            "errorMessage": ("error_message", str, False),
+            "bundleRequestId": ("bundle_request_id", RequestId, True),
+        }
 
 
 @event_class("Network.reportingApiReportAdded")
-@dataclass
+@slotted_dataclass
 class ReportingApiReportAdded:
     """
     **EXPERIMENTAL**
@@ -4386,11 +4495,17 @@ class ReportingApiReportAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiReportAdded:
-        return cls(report=ReportingApiReport.from_json(json["report"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "report": ("report", ReportingApiReport.from_json, False),
+        }
 
 
 @event_class("Network.reportingApiReportUpdated")
-@dataclass
+@slotted_dataclass
 class ReportingApiReportUpdated:
     """
     **EXPERIMENTAL**
@@ -4402,11 +4517,17 @@ class ReportingApiReportUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiReportUpdated:
-        return cls(report=ReportingApiReport.from_json(json["report"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "report": ("report", ReportingApiReport.from_json, False),
+        }
 
 
 @event_class("Network.reportingApiEndpointsChangedForOrigin")
-@dataclass
+@slotted_dataclass
 class ReportingApiEndpointsChangedForOrigin:
     """
     **EXPERIMENTAL**
@@ -4420,7 +4541,15 @@ class ReportingApiEndpointsChangedForOrigin:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiEndpointsChangedForOrigin:
-        return cls(
-            origin=str(json["origin"]),
-            endpoints=[ReportingApiEndpoint.from_json(i) for i in json["endpoints"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "endpoints": (
+                "endpoints",
+                lambda v: [ReportingApiEndpoint.from_json(i) for i in v],
+                False,
+            ),
+        }
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import page
@@ -17,7 +22,7 @@ from . import runtime
 from deprecated.sphinx import deprecated  # type: ignore
 
 
-@dataclass
+@slotted_dataclass
 class SourceOrderConfig:
     """
     Configuration data for drawing the source order of an elements children.
@@ -37,13 +42,17 @@ class SourceOrderConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SourceOrderConfig:
-        return cls(
-            parent_outline_color=dom.RGBA.from_json(json["parentOutlineColor"]),
-            child_outline_color=dom.RGBA.from_json(json["childOutlineColor"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "parentOutlineColor": ("parent_outline_color", dom.RGBA.from_json, False),
+            "childOutlineColor": ("child_outline_color", dom.RGBA.from_json, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class GridHighlightConfig:
     """
     Configuration data for the highlighting of Grid elements.
@@ -155,71 +164,35 @@ class GridHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GridHighlightConfig:
-        return cls(
-            show_grid_extension_lines=bool(json["showGridExtensionLines"])
-            if json.get("showGridExtensionLines", None) is not None
-            else None,
-            show_positive_line_numbers=bool(json["showPositiveLineNumbers"])
-            if json.get("showPositiveLineNumbers", None) is not None
-            else None,
-            show_negative_line_numbers=bool(json["showNegativeLineNumbers"])
-            if json.get("showNegativeLineNumbers", None) is not None
-            else None,
-            show_area_names=bool(json["showAreaNames"])
-            if json.get("showAreaNames", None) is not None
-            else None,
-            show_line_names=bool(json["showLineNames"])
-            if json.get("showLineNames", None) is not None
-            else None,
-            show_track_sizes=bool(json["showTrackSizes"])
-            if json.get("showTrackSizes", None) is not None
-            else None,
-            grid_border_color=dom.RGBA.from_json(json["gridBorderColor"])
-            if json.get("gridBorderColor", None) is not None
-            else None,
-            cell_border_color=dom.RGBA.from_json(json["cellBorderColor"])
-            if json.get("cellBorderColor", None) is not None
-            else None,
-            row_line_color=dom.RGBA.from_json(json["rowLineColor"])
-            if json.get("rowLineColor", None) is not None
-            else None,
-            column_line_color=dom.RGBA.from_json(json["columnLineColor"])
-            if json.get("columnLineColor", None) is not None
-            else None,
-            grid_border_dash=bool(json["gridBorderDash"])
-            if json.get("gridBorderDash", None) is not None
-            else None,
-            cell_border_dash=bool(json["cellBorderDash"])
-            if json.get("cellBorderDash", None) is not None
-            else None,
-            row_line_dash=bool(json["rowLineDash"])
-            if json.get("rowLineDash", None) is not None
-            else None,
-            column_line_dash=bool(json["columnLineDash"])
-            if json.get("columnLineDash", None) is not None
-            else None,
-            row_gap_color=dom.RGBA.from_json(json["rowGapColor"])
-            if json.get("rowGapColor", None) is not None
-            else None,
-            row_hatch_color=dom.RGBA.from_json(json["rowHatchColor"])
-            if json.get("rowHatchColor", None) is not None
-            else None,
-            column_gap_color=dom.RGBA.from_json(json["columnGapColor"])
-            if json.get("columnGapColor", None) is not None
-            else None,
-            column_hatch_color=dom.RGBA.from_json(json["columnHatchColor"])
-            if json.get("columnHatchColor", None) is not None
-            else None,
-            area_border_color=dom.RGBA.from_json(json["areaBorderColor"])
-            if json.get("areaBorderColor", None) is not None
-            else None,
-            grid_background_color=dom.RGBA.from_json(json["gridBackgroundColor"])
-            if json.get("gridBackgroundColor", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "showGridExtensionLines": ("show_grid_extension_lines", bool, True),
+            "showPositiveLineNumbers": ("show_positive_line_numbers", bool, True),
+            "showNegativeLineNumbers": ("show_negative_line_numbers", bool, True),
+            "showAreaNames": ("show_area_names", bool, True),
+            "showLineNames": ("show_line_names", bool, True),
+            "showTrackSizes": ("show_track_sizes", bool, True),
+            "gridBorderColor": ("grid_border_color", dom.RGBA.from_json, True),
+            "cellBorderColor": ("cell_border_color", dom.RGBA.from_json, True),
+            "rowLineColor": ("row_line_color", dom.RGBA.from_json, True),
+            "columnLineColor": ("column_line_color", dom.RGBA.from_json, True),
+            "gridBorderDash": ("grid_border_dash", bool, True),
+            "cellBorderDash": ("cell_border_dash", bool, True),
+            "rowLineDash": ("row_line_dash", bool, True),
+            "columnLineDash": ("column_line_dash", bool, True),
+            "rowGapColor": ("row_gap_color", dom.RGBA.from_json, True),
+            "rowHatchColor": ("row_hatch_color", dom.RGBA.from_json, True),
+            "columnGapColor": ("column_gap_color", dom.RGBA.from_json, True),
+            "columnHatchColor": ("column_hatch_color", dom.RGBA.from_json, True),
+            "areaBorderColor": ("area_border_color", dom.RGBA.from_json, True),
+            "gridBackgroundColor": ("grid_background_color", dom.RGBA.from_json, True),
+        }
+
+
+@slotted_dataclass
 class FlexContainerHighlightConfig:
     """
     Configuration data for the highlighting of Flex container elements.
@@ -271,35 +244,31 @@ class FlexContainerHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FlexContainerHighlightConfig:
-        return cls(
-            container_border=LineStyle.from_json(json["containerBorder"])
-            if json.get("containerBorder", None) is not None
-            else None,
-            line_separator=LineStyle.from_json(json["lineSeparator"])
-            if json.get("lineSeparator", None) is not None
-            else None,
-            item_separator=LineStyle.from_json(json["itemSeparator"])
-            if json.get("itemSeparator", None) is not None
-            else None,
-            main_distributed_space=BoxStyle.from_json(json["mainDistributedSpace"])
-            if json.get("mainDistributedSpace", None) is not None
-            else None,
-            cross_distributed_space=BoxStyle.from_json(json["crossDistributedSpace"])
-            if json.get("crossDistributedSpace", None) is not None
-            else None,
-            row_gap_space=BoxStyle.from_json(json["rowGapSpace"])
-            if json.get("rowGapSpace", None) is not None
-            else None,
-            column_gap_space=BoxStyle.from_json(json["columnGapSpace"])
-            if json.get("columnGapSpace", None) is not None
-            else None,
-            cross_alignment=LineStyle.from_json(json["crossAlignment"])
-            if json.get("crossAlignment", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "containerBorder": ("container_border", LineStyle.from_json, True),
+            "lineSeparator": ("line_separator", LineStyle.from_json, True),
+            "itemSeparator": ("item_separator", LineStyle.from_json, True),
+            "mainDistributedSpace": (
+                "main_distributed_space",
+                BoxStyle.from_json,
+                True,
+            ),
+            "crossDistributedSpace": (
+                "cross_distributed_space",
+                BoxStyle.from_json,
+                True,
+            ),
+            "rowGapSpace": ("row_gap_space", BoxStyle.from_json, True),
+            "columnGapSpace": ("column_gap_space", BoxStyle.from_json, True),
+            "crossAlignment": ("cross_alignment", LineStyle.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FlexItemHighlightConfig:
     """
     Configuration data for the highlighting of Flex item elements.
@@ -326,20 +295,18 @@ class FlexItemHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FlexItemHighlightConfig:
-        return cls(
-            base_size_box=BoxStyle.from_json(json["baseSizeBox"])
-            if json.get("baseSizeBox", None) is not None
-            else None,
-            base_size_border=LineStyle.from_json(json["baseSizeBorder"])
-            if json.get("baseSizeBorder", None) is not None
-            else None,
-            flexibility_arrow=LineStyle.from_json(json["flexibilityArrow"])
-            if json.get("flexibilityArrow", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "baseSizeBox": ("base_size_box", BoxStyle.from_json, True),
+            "baseSizeBorder": ("base_size_border", LineStyle.from_json, True),
+            "flexibilityArrow": ("flexibility_arrow", LineStyle.from_json, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class LineStyle:
     """
     Style information for drawing a line.
@@ -361,17 +328,17 @@ class LineStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LineStyle:
-        return cls(
-            color=dom.RGBA.from_json(json["color"])
-            if json.get("color", None) is not None
-            else None,
-            pattern=str(json["pattern"])
-            if json.get("pattern", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "color": ("color", dom.RGBA.from_json, True),
+            "pattern": ("pattern", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class BoxStyle:
     """
     Style information for drawing a box.
@@ -393,14 +360,14 @@ class BoxStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BoxStyle:
-        return cls(
-            fill_color=dom.RGBA.from_json(json["fillColor"])
-            if json.get("fillColor", None) is not None
-            else None,
-            hatch_color=dom.RGBA.from_json(json["hatchColor"])
-            if json.get("hatchColor", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "fillColor": ("fill_color", dom.RGBA.from_json, True),
+            "hatchColor": ("hatch_color", dom.RGBA.from_json, True),
+        }
 
 
 class ContrastAlgorithm(enum.Enum):
@@ -416,7 +383,7 @@ class ContrastAlgorithm(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class HighlightConfig:
     """
     Configuration data for the highlighting of page elements.
@@ -531,73 +498,47 @@ class HighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HighlightConfig:
-        return cls(
-            show_info=bool(json["showInfo"])
-            if json.get("showInfo", None) is not None
-            else None,
-            show_styles=bool(json["showStyles"])
-            if json.get("showStyles", None) is not None
-            else None,
-            show_rulers=bool(json["showRulers"])
-            if json.get("showRulers", None) is not None
-            else None,
-            show_accessibility_info=bool(json["showAccessibilityInfo"])
-            if json.get("showAccessibilityInfo", None) is not None
-            else None,
-            show_extension_lines=bool(json["showExtensionLines"])
-            if json.get("showExtensionLines", None) is not None
-            else None,
-            content_color=dom.RGBA.from_json(json["contentColor"])
-            if json.get("contentColor", None) is not None
-            else None,
-            padding_color=dom.RGBA.from_json(json["paddingColor"])
-            if json.get("paddingColor", None) is not None
-            else None,
-            border_color=dom.RGBA.from_json(json["borderColor"])
-            if json.get("borderColor", None) is not None
-            else None,
-            margin_color=dom.RGBA.from_json(json["marginColor"])
-            if json.get("marginColor", None) is not None
-            else None,
-            event_target_color=dom.RGBA.from_json(json["eventTargetColor"])
-            if json.get("eventTargetColor", None) is not None
-            else None,
-            shape_color=dom.RGBA.from_json(json["shapeColor"])
-            if json.get("shapeColor", None) is not None
-            else None,
-            shape_margin_color=dom.RGBA.from_json(json["shapeMarginColor"])
-            if json.get("shapeMarginColor", None) is not None
-            else None,
-            css_grid_color=dom.RGBA.from_json(json["cssGridColor"])
-            if json.get("cssGridColor", None) is not None
-            else None,
-            color_format=ColorFormat.from_json(json["colorFormat"])
-            if json.get("colorFormat", None) is not None
-            else None,
-            grid_highlight_config=GridHighlightConfig.from_json(
-                json["gridHighlightConfig"]
-            )
-            if json.get("gridHighlightConfig", None) is not None
-            else None,
-            flex_container_highlight_config=FlexContainerHighlightConfig.from_json(
-                json["flexContainerHighlightConfig"]
-            )
-            if json.get("flexContainerHighlightConfig", None) is not None
-            else None,
-            flex_item_highlight_config=FlexItemHighlightConfig.from_json(
-                json["flexItemHighlightConfig"]
-            )
-            if json.get("flexItemHighlightConfig", None) is not None
-            else None,
-            contrast_algorithm=ContrastAlgorithm.from_json(json["contrastAlgorithm"])
-            if json.get("contrastAlgorithm", None) is not None
-            else None,
-            container_query_container_highlight_config=ContainerQueryContainerHighlightConfig.from_json(
-                json["containerQueryContainerHighlightConfig"]
-            )
-            if json.get("containerQueryContainerHighlightConfig", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "showInfo": ("show_info", bool, True),
+            "showStyles": ("show_styles", bool, True),
+            "showRulers": ("show_rulers", bool, True),
+            "showAccessibilityInfo": ("show_accessibility_info", bool, True),
+            "showExtensionLines": ("show_extension_lines", bool, True),
+            "contentColor": ("content_color", dom.RGBA.from_json, True),
+            "paddingColor": ("padding_color", dom.RGBA.from_json, True),
+            "borderColor": ("border_color", dom.RGBA.from_json, True),
+            "marginColor": ("margin_color", dom.RGBA.from_json, True),
+            "eventTargetColor": ("event_target_color", dom.RGBA.from_json, True),
+            "shapeColor": ("shape_color", dom.RGBA.from_json, True),
+            "shapeMarginColor": ("shape_margin_color", dom.RGBA.from_json, True),
+            "cssGridColor": ("css_grid_color", dom.RGBA.from_json, True),
+            "colorFormat": ("color_format", ColorFormat, True),
+            "gridHighlightConfig": (
+                "grid_highlight_config",
+                GridHighlightConfig.from_json,
+                True,
+            ),
+            "flexContainerHighlightConfig": (
+                "flex_container_highlight_config",
+                FlexContainerHighlightConfig.from_json,
+                True,
+            ),
+            "flexItemHighlightConfig": (
+                "flex_item_highlight_config",
+                FlexItemHighlightConfig.from_json,
+                True,
+            ),
+            "contrastAlgorithm": ("contrast_algorithm", ContrastAlgorithm, True),
+            "containerQueryContainerHighlightConfig": (
+                "container_query_container_highlight_config",
+                ContainerQueryContainerHighlightConfig.from_json,
+                True,
+            ),
+        }
 
 
 class ColorFormat(enum.Enum):
@@ -614,7 +555,7 @@ class ColorFormat(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class GridNodeHighlightConfig:
     """
     Configurations for Persistent Grid Highlight
@@ -634,15 +575,21 @@ class GridNodeHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GridNodeHighlightConfig:
-        return cls(
-            grid_highlight_config=GridHighlightConfig.from_json(
-                json["gridHighlightConfig"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "gridHighlightConfig": (
+                "grid_highlight_config",
+                GridHighlightConfig.from_json,
+                False,
             ),
-            node_id=dom.NodeId.from_json(json["nodeId"]),
-        )
+            "nodeId": ("node_id", dom.NodeId, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FlexNodeHighlightConfig:
     #: A descriptor for the highlight appearance of flex containers.
     flex_container_highlight_config: FlexContainerHighlightConfig
@@ -660,15 +607,21 @@ class FlexNodeHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FlexNodeHighlightConfig:
-        return cls(
-            flex_container_highlight_config=FlexContainerHighlightConfig.from_json(
-                json["flexContainerHighlightConfig"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "flexContainerHighlightConfig": (
+                "flex_container_highlight_config",
+                FlexContainerHighlightConfig.from_json,
+                False,
             ),
-            node_id=dom.NodeId.from_json(json["nodeId"]),
-        )
+            "nodeId": ("node_id", dom.NodeId, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ScrollSnapContainerHighlightConfig:
     #: The style of the snapport border (default: transparent)
     snapport_border: typing.Optional[LineStyle] = None
@@ -696,23 +649,19 @@ class ScrollSnapContainerHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScrollSnapContainerHighlightConfig:
-        return cls(
-            snapport_border=LineStyle.from_json(json["snapportBorder"])
-            if json.get("snapportBorder", None) is not None
-            else None,
-            snap_area_border=LineStyle.from_json(json["snapAreaBorder"])
-            if json.get("snapAreaBorder", None) is not None
-            else None,
-            scroll_margin_color=dom.RGBA.from_json(json["scrollMarginColor"])
-            if json.get("scrollMarginColor", None) is not None
-            else None,
-            scroll_padding_color=dom.RGBA.from_json(json["scrollPaddingColor"])
-            if json.get("scrollPaddingColor", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "snapportBorder": ("snapport_border", LineStyle.from_json, True),
+            "snapAreaBorder": ("snap_area_border", LineStyle.from_json, True),
+            "scrollMarginColor": ("scroll_margin_color", dom.RGBA.from_json, True),
+            "scrollPaddingColor": ("scroll_padding_color", dom.RGBA.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ScrollSnapHighlightConfig:
     #: A descriptor for the highlight appearance of scroll snap containers.
     scroll_snap_container_highlight_config: ScrollSnapContainerHighlightConfig
@@ -730,15 +679,21 @@ class ScrollSnapHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScrollSnapHighlightConfig:
-        return cls(
-            scroll_snap_container_highlight_config=ScrollSnapContainerHighlightConfig.from_json(
-                json["scrollSnapContainerHighlightConfig"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scrollSnapContainerHighlightConfig": (
+                "scroll_snap_container_highlight_config",
+                ScrollSnapContainerHighlightConfig.from_json,
+                False,
             ),
-            node_id=dom.NodeId.from_json(json["nodeId"]),
-        )
+            "nodeId": ("node_id", dom.NodeId, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class HingeConfig:
     """
     Configuration for dual screen hinge
@@ -764,18 +719,18 @@ class HingeConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HingeConfig:
-        return cls(
-            rect=dom.Rect.from_json(json["rect"]),
-            content_color=dom.RGBA.from_json(json["contentColor"])
-            if json.get("contentColor", None) is not None
-            else None,
-            outline_color=dom.RGBA.from_json(json["outlineColor"])
-            if json.get("outlineColor", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "rect": ("rect", dom.Rect.from_json, False),
+            "contentColor": ("content_color", dom.RGBA.from_json, True),
+            "outlineColor": ("outline_color", dom.RGBA.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class WindowControlsOverlayConfig:
     """
     Configuration for Window Controls Overlay
@@ -799,14 +754,18 @@ class WindowControlsOverlayConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WindowControlsOverlayConfig:
-        return cls(
-            show_css=bool(json["showCSS"]),
-            selected_platform=str(json["selectedPlatform"]),
-            theme_color=str(json["themeColor"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "showCSS": ("show_css", bool, False),
+            "selectedPlatform": ("selected_platform", str, False),
+            "themeColor": ("theme_color", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ContainerQueryHighlightConfig:
     #: A descriptor for the highlight appearance of container query containers.
     container_query_container_highlight_config: ContainerQueryContainerHighlightConfig
@@ -824,15 +783,21 @@ class ContainerQueryHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContainerQueryHighlightConfig:
-        return cls(
-            container_query_container_highlight_config=ContainerQueryContainerHighlightConfig.from_json(
-                json["containerQueryContainerHighlightConfig"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "containerQueryContainerHighlightConfig": (
+                "container_query_container_highlight_config",
+                ContainerQueryContainerHighlightConfig.from_json,
+                False,
             ),
-            node_id=dom.NodeId.from_json(json["nodeId"]),
-        )
+            "nodeId": ("node_id", dom.NodeId, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ContainerQueryContainerHighlightConfig:
     #: The style of the container border.
     container_border: typing.Optional[LineStyle] = None
@@ -850,17 +815,17 @@ class ContainerQueryContainerHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContainerQueryContainerHighlightConfig:
-        return cls(
-            container_border=LineStyle.from_json(json["containerBorder"])
-            if json.get("containerBorder", None) is not None
-            else None,
-            descendant_border=LineStyle.from_json(json["descendantBorder"])
-            if json.get("descendantBorder", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "containerBorder": ("container_border", LineStyle.from_json, True),
+            "descendantBorder": ("descendant_border", LineStyle.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class IsolatedElementHighlightConfig:
     #: A descriptor for the highlight appearance of an element in isolation mode.
     isolation_mode_highlight_config: IsolationModeHighlightConfig
@@ -878,15 +843,21 @@ class IsolatedElementHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IsolatedElementHighlightConfig:
-        return cls(
-            isolation_mode_highlight_config=IsolationModeHighlightConfig.from_json(
-                json["isolationModeHighlightConfig"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "isolationModeHighlightConfig": (
+                "isolation_mode_highlight_config",
+                IsolationModeHighlightConfig.from_json,
+                False,
             ),
-            node_id=dom.NodeId.from_json(json["nodeId"]),
-        )
+            "nodeId": ("node_id", dom.NodeId, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class IsolationModeHighlightConfig:
     #: The fill color of the resizers (default: transparent).
     resizer_color: typing.Optional[dom.RGBA] = None
@@ -909,17 +880,15 @@ class IsolationModeHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IsolationModeHighlightConfig:
-        return cls(
-            resizer_color=dom.RGBA.from_json(json["resizerColor"])
-            if json.get("resizerColor", None) is not None
-            else None,
-            resizer_handle_color=dom.RGBA.from_json(json["resizerHandleColor"])
-            if json.get("resizerHandleColor", None) is not None
-            else None,
-            mask_color=dom.RGBA.from_json(json["maskColor"])
-            if json.get("maskColor", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "resizerColor": ("resizer_color", dom.RGBA.from_json, True),
+            "resizerHandleColor": ("resizer_handle_color", dom.RGBA.from_json, True),
+            "maskColor": ("mask_color", dom.RGBA.from_json, True),
+        }
 
 
 class InspectMode(enum.Enum):
@@ -1514,7 +1483,7 @@ def set_show_window_controls_overlay(
 
 
 @event_class("Overlay.inspectNodeRequested")
-@dataclass
+@slotted_dataclass
 class InspectNodeRequested:
     """
     Fired when the node should be inspected. This happens after call to ``setInspectMode`` or when
@@ -1526,11 +1495,17 @@ class InspectNodeRequested:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectNodeRequested:
-        return cls(backend_node_id=dom.BackendNodeId.from_json(json["backendNodeId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "backendNodeId": ("backend_node_id", dom.BackendNodeId, False),
+        }
 
 
 @event_class("Overlay.nodeHighlightRequested")
-@dataclass
+@slotted_dataclass
 class NodeHighlightRequested:
     """
     Fired when the node should be highlighted. This happens after call to ``setInspectMode``.
@@ -1540,11 +1515,17 @@ class NodeHighlightRequested:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeHighlightRequested:
-        return cls(node_id=dom.NodeId.from_json(json["nodeId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", dom.NodeId, False),
+        }
 
 
 @event_class("Overlay.screenshotRequested")
-@dataclass
+@slotted_dataclass
 class ScreenshotRequested:
     """
     Fired when user asks to capture screenshot of some area on the page.
@@ -1555,11 +1536,17 @@ class ScreenshotRequested:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenshotRequested:
-        return cls(viewport=page.Viewport.from_json(json["viewport"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "viewport": ("viewport", page.Viewport.from_json, False),
+        }
 
 
 @event_class("Overlay.inspectModeCanceled")
-@dataclass
+@slotted_dataclass
 class InspectModeCanceled:
     """
     Fired when user cancels the inspect mode.
@@ -1567,4 +1554,8 @@ class InspectModeCanceled:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectModeCanceled:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import debugger
 from . import dom
@@ -66,7 +71,7 @@ class AdFrameExplanation(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class AdFrameStatus:
     """
     Indicates whether a frame has been identified as an ad and why.
@@ -85,15 +90,21 @@ class AdFrameStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AdFrameStatus:
-        return cls(
-            ad_frame_type=AdFrameType.from_json(json["adFrameType"]),
-            explanations=[AdFrameExplanation.from_json(i) for i in json["explanations"]]
-            if json.get("explanations", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "adFrameType": ("ad_frame_type", AdFrameType, False),
+            "explanations": (
+                "explanations",
+                lambda v: [AdFrameExplanation(i) for i in v],
+                True,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AdScriptId:
     """
     Identifies the bottom-most script which caused the frame to be labelled
@@ -115,10 +126,14 @@ class AdScriptId:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AdScriptId:
-        return cls(
-            script_id=runtime.ScriptId.from_json(json["scriptId"]),
-            debugger_id=runtime.UniqueDebuggerId.from_json(json["debuggerId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scriptId": ("script_id", runtime.ScriptId, False),
+            "debuggerId": ("debugger_id", runtime.UniqueDebuggerId, False),
+        }
 
 
 class SecureContextType(enum.Enum):
@@ -297,7 +312,7 @@ class PermissionsPolicyBlockReason(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class PermissionsPolicyBlockLocator:
     frame_id: FrameId
 
@@ -311,13 +326,17 @@ class PermissionsPolicyBlockLocator:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PermissionsPolicyBlockLocator:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]),
-            block_reason=PermissionsPolicyBlockReason.from_json(json["blockReason"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "blockReason": ("block_reason", PermissionsPolicyBlockReason, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class PermissionsPolicyFeatureState:
     feature: PermissionsPolicyFeature
 
@@ -335,13 +354,15 @@ class PermissionsPolicyFeatureState:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PermissionsPolicyFeatureState:
-        return cls(
-            feature=PermissionsPolicyFeature.from_json(json["feature"]),
-            allowed=bool(json["allowed"]),
-            locator=PermissionsPolicyBlockLocator.from_json(json["locator"])
-            if json.get("locator", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "feature": ("feature", PermissionsPolicyFeature, False),
+            "allowed": ("allowed", bool, False),
+            "locator": ("locator", PermissionsPolicyBlockLocator.from_json, True),
+        }
 
 
 class OriginTrialTokenStatus(enum.Enum):
@@ -401,7 +422,7 @@ class OriginTrialUsageRestriction(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class OriginTrialToken:
     origin: str
 
@@ -427,19 +448,25 @@ class OriginTrialToken:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> OriginTrialToken:
-        return cls(
-            origin=str(json["origin"]),
-            match_sub_domains=bool(json["matchSubDomains"]),
-            trial_name=str(json["trialName"]),
-            expiry_time=network.TimeSinceEpoch.from_json(json["expiryTime"]),
-            is_third_party=bool(json["isThirdParty"]),
-            usage_restriction=OriginTrialUsageRestriction.from_json(
-                json["usageRestriction"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "matchSubDomains": ("match_sub_domains", bool, False),
+            "trialName": ("trial_name", str, False),
+            "expiryTime": ("expiry_time", network.TimeSinceEpoch, False),
+            "isThirdParty": ("is_third_party", bool, False),
+            "usageRestriction": (
+                "usage_restriction",
+                OriginTrialUsageRestriction,
+                False,
             ),
-        )
+        }
 
 
-@dataclass
+@slotted_dataclass
 class OriginTrialTokenWithStatus:
     raw_token_text: str
 
@@ -459,16 +486,18 @@ class OriginTrialTokenWithStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> OriginTrialTokenWithStatus:
-        return cls(
-            raw_token_text=str(json["rawTokenText"]),
-            status=OriginTrialTokenStatus.from_json(json["status"]),
-            parsed_token=OriginTrialToken.from_json(json["parsedToken"])
-            if json.get("parsedToken", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "rawTokenText": ("raw_token_text", str, False),
+            "status": ("status", OriginTrialTokenStatus, False),
+            "parsedToken": ("parsed_token", OriginTrialToken.from_json, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class OriginTrial:
     trial_name: str
 
@@ -485,17 +514,22 @@ class OriginTrial:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> OriginTrial:
-        return cls(
-            trial_name=str(json["trialName"]),
-            status=OriginTrialStatus.from_json(json["status"]),
-            tokens_with_status=[
-                OriginTrialTokenWithStatus.from_json(i)
-                for i in json["tokensWithStatus"]
-            ],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "trialName": ("trial_name", str, False),
+            "status": ("status", OriginTrialStatus, False),
+            "tokensWithStatus": (
+                "tokens_with_status",
+                lambda v: [OriginTrialTokenWithStatus.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class Frame:
     """
     Information about the Frame on the page.
@@ -573,37 +607,37 @@ class Frame:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Frame:
-        return cls(
-            id_=FrameId.from_json(json["id"]),
-            loader_id=network.LoaderId.from_json(json["loaderId"]),
-            url=str(json["url"]),
-            domain_and_registry=str(json["domainAndRegistry"]),
-            security_origin=str(json["securityOrigin"]),
-            mime_type=str(json["mimeType"]),
-            secure_context_type=SecureContextType.from_json(json["secureContextType"]),
-            cross_origin_isolated_context_type=CrossOriginIsolatedContextType.from_json(
-                json["crossOriginIsolatedContextType"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", FrameId, False),
+            "loaderId": ("loader_id", network.LoaderId, False),
+            "url": ("url", str, False),
+            "domainAndRegistry": ("domain_and_registry", str, False),
+            "securityOrigin": ("security_origin", str, False),
+            "mimeType": ("mime_type", str, False),
+            "secureContextType": ("secure_context_type", SecureContextType, False),
+            "crossOriginIsolatedContextType": (
+                "cross_origin_isolated_context_type",
+                CrossOriginIsolatedContextType,
+                False,
             ),
-            gated_api_features=[
-                GatedAPIFeatures.from_json(i) for i in json["gatedAPIFeatures"]
-            ],
-            parent_id=FrameId.from_json(json["parentId"])
-            if json.get("parentId", None) is not None
-            else None,
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-            url_fragment=str(json["urlFragment"])
-            if json.get("urlFragment", None) is not None
-            else None,
-            unreachable_url=str(json["unreachableUrl"])
-            if json.get("unreachableUrl", None) is not None
-            else None,
-            ad_frame_status=AdFrameStatus.from_json(json["adFrameStatus"])
-            if json.get("adFrameStatus", None) is not None
-            else None,
-        )
+            "gatedAPIFeatures": (
+                "gated_api_features",
+                lambda v: [GatedAPIFeatures(i) for i in v],
+                False,
+            ),
+            "parentId": ("parent_id", FrameId, True),
+            "name": ("name", str, True),
+            "urlFragment": ("url_fragment", str, True),
+            "unreachableUrl": ("unreachable_url", str, True),
+            "adFrameStatus": ("ad_frame_status", AdFrameStatus.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FrameResource:
     """
     Information about the Resource on the page.
@@ -647,26 +681,22 @@ class FrameResource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameResource:
-        return cls(
-            url=str(json["url"]),
-            type_=network.ResourceType.from_json(json["type"]),
-            mime_type=str(json["mimeType"]),
-            last_modified=network.TimeSinceEpoch.from_json(json["lastModified"])
-            if json.get("lastModified", None) is not None
-            else None,
-            content_size=float(json["contentSize"])
-            if json.get("contentSize", None) is not None
-            else None,
-            failed=bool(json["failed"])
-            if json.get("failed", None) is not None
-            else None,
-            canceled=bool(json["canceled"])
-            if json.get("canceled", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "type": ("type_", network.ResourceType, False),
+            "mimeType": ("mime_type", str, False),
+            "lastModified": ("last_modified", network.TimeSinceEpoch, True),
+            "contentSize": ("content_size", float, True),
+            "failed": ("failed", bool, True),
+            "canceled": ("canceled", bool, True),
+        }
+
+
+@slotted_dataclass
 class FrameResourceTree:
     """
     Information about the Frame hierarchy along with their cached resources.
@@ -691,16 +721,26 @@ class FrameResourceTree:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameResourceTree:
-        return cls(
-            frame=Frame.from_json(json["frame"]),
-            resources=[FrameResource.from_json(i) for i in json["resources"]],
-            child_frames=[FrameResourceTree.from_json(i) for i in json["childFrames"]]
-            if json.get("childFrames", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frame": ("frame", Frame.from_json, False),
+            "resources": (
+                "resources",
+                lambda v: [FrameResource.from_json(i) for i in v],
+                False,
+            ),
+            "childFrames": (
+                "child_frames",
+                lambda v: [FrameResourceTree.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FrameTree:
     """
     Information about the Frame hierarchy.
@@ -721,12 +761,18 @@ class FrameTree:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameTree:
-        return cls(
-            frame=Frame.from_json(json["frame"]),
-            child_frames=[FrameTree.from_json(i) for i in json["childFrames"]]
-            if json.get("childFrames", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frame": ("frame", Frame.from_json, False),
+            "childFrames": (
+                "child_frames",
+                lambda v: [FrameTree.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
 class ScriptIdentifier(str):
@@ -772,7 +818,7 @@ class TransitionType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class NavigationEntry:
     """
     Navigation history entry.
@@ -804,16 +850,20 @@ class NavigationEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NavigationEntry:
-        return cls(
-            id_=int(json["id"]),
-            url=str(json["url"]),
-            user_typed_url=str(json["userTypedURL"]),
-            title=str(json["title"]),
-            transition_type=TransitionType.from_json(json["transitionType"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", int, False),
+            "url": ("url", str, False),
+            "userTypedURL": ("user_typed_url", str, False),
+            "title": ("title", str, False),
+            "transitionType": ("transition_type", TransitionType, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ScreencastFrameMetadata:
     """
     Screencast frame metadata.
@@ -854,17 +904,19 @@ class ScreencastFrameMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreencastFrameMetadata:
-        return cls(
-            offset_top=float(json["offsetTop"]),
-            page_scale_factor=float(json["pageScaleFactor"]),
-            device_width=float(json["deviceWidth"]),
-            device_height=float(json["deviceHeight"]),
-            scroll_offset_x=float(json["scrollOffsetX"]),
-            scroll_offset_y=float(json["scrollOffsetY"]),
-            timestamp=network.TimeSinceEpoch.from_json(json["timestamp"])
-            if json.get("timestamp", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "offsetTop": ("offset_top", float, False),
+            "pageScaleFactor": ("page_scale_factor", float, False),
+            "deviceWidth": ("device_width", float, False),
+            "deviceHeight": ("device_height", float, False),
+            "scrollOffsetX": ("scroll_offset_x", float, False),
+            "scrollOffsetY": ("scroll_offset_y", float, False),
+            "timestamp": ("timestamp", network.TimeSinceEpoch, True),
+        }
 
 
 class DialogType(enum.Enum):
@@ -885,7 +937,7 @@ class DialogType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class AppManifestError:
     """
     Error while paring app manifest.
@@ -913,15 +965,19 @@ class AppManifestError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AppManifestError:
-        return cls(
-            message=str(json["message"]),
-            critical=int(json["critical"]),
-            line=int(json["line"]),
-            column=int(json["column"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "message": ("message", str, False),
+            "critical": ("critical", int, False),
+            "line": ("line", int, False),
+            "column": ("column", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AppManifestParsedProperties:
     """
     Parsed app manifest properties.
@@ -937,12 +993,16 @@ class AppManifestParsedProperties:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AppManifestParsedProperties:
-        return cls(
-            scope=str(json["scope"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scope": ("scope", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class LayoutViewport:
     """
     Layout viewport position and dimensions.
@@ -970,15 +1030,19 @@ class LayoutViewport:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutViewport:
-        return cls(
-            page_x=int(json["pageX"]),
-            page_y=int(json["pageY"]),
-            client_width=int(json["clientWidth"]),
-            client_height=int(json["clientHeight"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "pageX": ("page_x", int, False),
+            "pageY": ("page_y", int, False),
+            "clientWidth": ("client_width", int, False),
+            "clientHeight": ("client_height", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class VisualViewport:
     """
     Visual viewport position, dimensions, and scale.
@@ -1023,19 +1087,23 @@ class VisualViewport:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VisualViewport:
-        return cls(
-            offset_x=float(json["offsetX"]),
-            offset_y=float(json["offsetY"]),
-            page_x=float(json["pageX"]),
-            page_y=float(json["pageY"]),
-            client_width=float(json["clientWidth"]),
-            client_height=float(json["clientHeight"]),
-            scale=float(json["scale"]),
-            zoom=float(json["zoom"]) if json.get("zoom", None) is not None else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "offsetX": ("offset_x", float, False),
+            "offsetY": ("offset_y", float, False),
+            "pageX": ("page_x", float, False),
+            "pageY": ("page_y", float, False),
+            "clientWidth": ("client_width", float, False),
+            "clientHeight": ("client_height", float, False),
+            "scale": ("scale", float, False),
+            "zoom": ("zoom", float, True),
+        }
+
+
+@slotted_dataclass
 class Viewport:
     """
     Viewport for capturing screenshot.
@@ -1067,16 +1135,20 @@ class Viewport:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Viewport:
-        return cls(
-            x=float(json["x"]),
-            y=float(json["y"]),
-            width=float(json["width"]),
-            height=float(json["height"]),
-            scale=float(json["scale"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "x": ("x", float, False),
+            "y": ("y", float, False),
+            "width": ("width", float, False),
+            "height": ("height", float, False),
+            "scale": ("scale", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FontFamilies:
     """
     Generic font families collection.
@@ -1123,26 +1195,22 @@ class FontFamilies:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontFamilies:
-        return cls(
-            standard=str(json["standard"])
-            if json.get("standard", None) is not None
-            else None,
-            fixed=str(json["fixed"]) if json.get("fixed", None) is not None else None,
-            serif=str(json["serif"]) if json.get("serif", None) is not None else None,
-            sans_serif=str(json["sansSerif"])
-            if json.get("sansSerif", None) is not None
-            else None,
-            cursive=str(json["cursive"])
-            if json.get("cursive", None) is not None
-            else None,
-            fantasy=str(json["fantasy"])
-            if json.get("fantasy", None) is not None
-            else None,
-            math=str(json["math"]) if json.get("math", None) is not None else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "standard": ("standard", str, True),
+            "fixed": ("fixed", str, True),
+            "serif": ("serif", str, True),
+            "sansSerif": ("sans_serif", str, True),
+            "cursive": ("cursive", str, True),
+            "fantasy": ("fantasy", str, True),
+            "math": ("math", str, True),
+        }
+
+
+@slotted_dataclass
 class ScriptFontFamilies:
     """
     Font families collection for a script.
@@ -1162,13 +1230,17 @@ class ScriptFontFamilies:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptFontFamilies:
-        return cls(
-            script=str(json["script"]),
-            font_families=FontFamilies.from_json(json["fontFamilies"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "script": ("script", str, False),
+            "fontFamilies": ("font_families", FontFamilies.from_json, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class FontSizes:
     """
     Default font sizes.
@@ -1190,12 +1262,14 @@ class FontSizes:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontSizes:
-        return cls(
-            standard=int(json["standard"])
-            if json.get("standard", None) is not None
-            else None,
-            fixed=int(json["fixed"]) if json.get("fixed", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "standard": ("standard", int, True),
+            "fixed": ("fixed", int, True),
+        }
 
 
 class ClientNavigationReason(enum.Enum):
@@ -1232,7 +1306,7 @@ class ClientNavigationDisposition(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class InstallabilityErrorArgument:
     #: Argument name (e.g. name:'minimum-icon-size-in-pixels').
     name: str
@@ -1248,13 +1322,17 @@ class InstallabilityErrorArgument:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InstallabilityErrorArgument:
-        return cls(
-            name=str(json["name"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class InstallabilityError:
     """
     The installability error
@@ -1274,12 +1352,18 @@ class InstallabilityError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InstallabilityError:
-        return cls(
-            error_id=str(json["errorId"]),
-            error_arguments=[
-                InstallabilityErrorArgument.from_json(i) for i in json["errorArguments"]
-            ],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "errorId": ("error_id", str, False),
+            "errorArguments": (
+                "error_arguments",
+                lambda v: [InstallabilityErrorArgument.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 class ReferrerPolicy(enum.Enum):
@@ -1304,7 +1388,7 @@ class ReferrerPolicy(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class CompilationCacheParams:
     """
     Per-script compilation cache parameters for ``Page.produceCompilationCache``
@@ -1326,13 +1410,17 @@ class CompilationCacheParams:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CompilationCacheParams:
-        return cls(
-            url=str(json["url"]),
-            eager=bool(json["eager"]) if json.get("eager", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "eager": ("eager", bool, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class FileFilter:
     name: typing.Optional[str] = None
 
@@ -1348,15 +1436,17 @@ class FileFilter:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileFilter:
-        return cls(
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-            accepts=[str(i) for i in json["accepts"]]
-            if json.get("accepts", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, True),
+            "accepts": ("accepts", lambda v: [str(i) for i in v], True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class FileHandler:
     action: str
 
@@ -1384,20 +1474,24 @@ class FileHandler:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileHandler:
-        return cls(
-            action=str(json["action"]),
-            name=str(json["name"]),
-            launch_type=str(json["launchType"]),
-            icons=[ImageResource.from_json(i) for i in json["icons"]]
-            if json.get("icons", None) is not None
-            else None,
-            accepts=[FileFilter.from_json(i) for i in json["accepts"]]
-            if json.get("accepts", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "action": ("action", str, False),
+            "name": ("name", str, False),
+            "launchType": ("launch_type", str, False),
+            "icons": ("icons", lambda v: [ImageResource.from_json(i) for i in v], True),
+            "accepts": (
+                "accepts",
+                lambda v: [FileFilter.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class ImageResource:
     """
     The image definition used in both icon and screenshot.
@@ -1422,14 +1516,18 @@ class ImageResource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ImageResource:
-        return cls(
-            url=str(json["url"]),
-            sizes=str(json["sizes"]) if json.get("sizes", None) is not None else None,
-            type_=str(json["type"]) if json.get("type", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "sizes": ("sizes", str, True),
+            "type": ("type_", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class LaunchHandler:
     client_mode: str
 
@@ -1440,12 +1538,16 @@ class LaunchHandler:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LaunchHandler:
-        return cls(
-            client_mode=str(json["clientMode"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "clientMode": ("client_mode", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class ProtocolHandler:
     protocol: str
 
@@ -1459,13 +1561,17 @@ class ProtocolHandler:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ProtocolHandler:
-        return cls(
-            protocol=str(json["protocol"]),
-            url=str(json["url"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "protocol": ("protocol", str, False),
+            "url": ("url", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class RelatedApplication:
     url: str
 
@@ -1480,13 +1586,17 @@ class RelatedApplication:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RelatedApplication:
-        return cls(
-            url=str(json["url"]),
-            id_=str(json["id"]) if json.get("id", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "id": ("id_", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class ScopeExtension:
     #: Instead of using tuple, this field always returns the serialized string
     #: for easy understanding and comparison.
@@ -1502,13 +1612,17 @@ class ScopeExtension:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScopeExtension:
-        return cls(
-            origin=str(json["origin"]),
-            has_origin_wildcard=bool(json["hasOriginWildcard"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "hasOriginWildcard": ("has_origin_wildcard", bool, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class Screenshot:
     image: ImageResource
 
@@ -1526,14 +1640,18 @@ class Screenshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Screenshot:
-        return cls(
-            image=ImageResource.from_json(json["image"]),
-            form_factor=str(json["formFactor"]),
-            label=str(json["label"]) if json.get("label", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "image": ("image", ImageResource.from_json, False),
+            "formFactor": ("form_factor", str, False),
+            "label": ("label", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class ShareTarget:
     action: str
 
@@ -1567,20 +1685,22 @@ class ShareTarget:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShareTarget:
-        return cls(
-            action=str(json["action"]),
-            method=str(json["method"]),
-            enctype=str(json["enctype"]),
-            title=str(json["title"]) if json.get("title", None) is not None else None,
-            text=str(json["text"]) if json.get("text", None) is not None else None,
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            files=[FileFilter.from_json(i) for i in json["files"]]
-            if json.get("files", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "action": ("action", str, False),
+            "method": ("method", str, False),
+            "enctype": ("enctype", str, False),
+            "title": ("title", str, True),
+            "text": ("text", str, True),
+            "url": ("url", str, True),
+            "files": ("files", lambda v: [FileFilter.from_json(i) for i in v], True),
+        }
+
+
+@slotted_dataclass
 class Shortcut:
     name: str
 
@@ -1594,13 +1714,17 @@ class Shortcut:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Shortcut:
-        return cls(
-            name=str(json["name"]),
-            url=str(json["url"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "url": ("url", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class WebAppManifest:
     background_color: typing.Optional[str] = None
 
@@ -1712,73 +1836,63 @@ class WebAppManifest:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebAppManifest:
-        return cls(
-            background_color=str(json["backgroundColor"])
-            if json.get("backgroundColor", None) is not None
-            else None,
-            description=str(json["description"])
-            if json.get("description", None) is not None
-            else None,
-            dir_=str(json["dir"]) if json.get("dir", None) is not None else None,
-            display=str(json["display"])
-            if json.get("display", None) is not None
-            else None,
-            display_overrides=[str(i) for i in json["displayOverrides"]]
-            if json.get("displayOverrides", None) is not None
-            else None,
-            file_handlers=[FileHandler.from_json(i) for i in json["fileHandlers"]]
-            if json.get("fileHandlers", None) is not None
-            else None,
-            icons=[ImageResource.from_json(i) for i in json["icons"]]
-            if json.get("icons", None) is not None
-            else None,
-            id_=str(json["id"]) if json.get("id", None) is not None else None,
-            lang=str(json["lang"]) if json.get("lang", None) is not None else None,
-            launch_handler=LaunchHandler.from_json(json["launchHandler"])
-            if json.get("launchHandler", None) is not None
-            else None,
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-            orientation=str(json["orientation"])
-            if json.get("orientation", None) is not None
-            else None,
-            prefer_related_applications=bool(json["preferRelatedApplications"])
-            if json.get("preferRelatedApplications", None) is not None
-            else None,
-            protocol_handlers=[
-                ProtocolHandler.from_json(i) for i in json["protocolHandlers"]
-            ]
-            if json.get("protocolHandlers", None) is not None
-            else None,
-            related_applications=[
-                RelatedApplication.from_json(i) for i in json["relatedApplications"]
-            ]
-            if json.get("relatedApplications", None) is not None
-            else None,
-            scope=str(json["scope"]) if json.get("scope", None) is not None else None,
-            scope_extensions=[
-                ScopeExtension.from_json(i) for i in json["scopeExtensions"]
-            ]
-            if json.get("scopeExtensions", None) is not None
-            else None,
-            screenshots=[Screenshot.from_json(i) for i in json["screenshots"]]
-            if json.get("screenshots", None) is not None
-            else None,
-            share_target=ShareTarget.from_json(json["shareTarget"])
-            if json.get("shareTarget", None) is not None
-            else None,
-            short_name=str(json["shortName"])
-            if json.get("shortName", None) is not None
-            else None,
-            shortcuts=[Shortcut.from_json(i) for i in json["shortcuts"]]
-            if json.get("shortcuts", None) is not None
-            else None,
-            start_url=str(json["startUrl"])
-            if json.get("startUrl", None) is not None
-            else None,
-            theme_color=str(json["themeColor"])
-            if json.get("themeColor", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "backgroundColor": ("background_color", str, True),
+            "description": ("description", str, True),
+            "dir": ("dir_", str, True),
+            "display": ("display", str, True),
+            "displayOverrides": (
+                "display_overrides",
+                lambda v: [str(i) for i in v],
+                True,
+            ),
+            "fileHandlers": (
+                "file_handlers",
+                lambda v: [FileHandler.from_json(i) for i in v],
+                True,
+            ),
+            "icons": ("icons", lambda v: [ImageResource.from_json(i) for i in v], True),
+            "id": ("id_", str, True),
+            "lang": ("lang", str, True),
+            "launchHandler": ("launch_handler", LaunchHandler.from_json, True),
+            "name": ("name", str, True),
+            "orientation": ("orientation", str, True),
+            "preferRelatedApplications": ("prefer_related_applications", bool, True),
+            "protocolHandlers": (
+                "protocol_handlers",
+                lambda v: [ProtocolHandler.from_json(i) for i in v],
+                True,
+            ),
+            "relatedApplications": (
+                "related_applications",
+                lambda v: [RelatedApplication.from_json(i) for i in v],
+                True,
+            ),
+            "scope": ("scope", str, True),
+            "scopeExtensions": (
+                "scope_extensions",
+                lambda v: [ScopeExtension.from_json(i) for i in v],
+                True,
+            ),
+            "screenshots": (
+                "screenshots",
+                lambda v: [Screenshot.from_json(i) for i in v],
+                True,
+            ),
+            "shareTarget": ("share_target", ShareTarget.from_json, True),
+            "shortName": ("short_name", str, True),
+            "shortcuts": (
+                "shortcuts",
+                lambda v: [Shortcut.from_json(i) for i in v],
+                True,
+            ),
+            "startUrl": ("start_url", str, True),
+            "themeColor": ("theme_color", str, True),
+        }
 
 
 class AutoResponseMode(enum.Enum):
@@ -2007,7 +2121,7 @@ class BackForwardCacheNotRestoredReasonType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class BackForwardCacheBlockingDetails:
     #: Line number in the script (0-based).
     line_number: int
@@ -2033,17 +2147,19 @@ class BackForwardCacheBlockingDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheBlockingDetails:
-        return cls(
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"]),
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            function=str(json["function"])
-            if json.get("function", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, False),
+            "url": ("url", str, True),
+            "function": ("function", str, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class BackForwardCacheNotRestoredExplanation:
     #: Type of the reason
     type_: BackForwardCacheNotRestoredReasonType
@@ -2070,21 +2186,23 @@ class BackForwardCacheNotRestoredExplanation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotRestoredExplanation:
-        return cls(
-            type_=BackForwardCacheNotRestoredReasonType.from_json(json["type"]),
-            reason=BackForwardCacheNotRestoredReason.from_json(json["reason"]),
-            context=str(json["context"])
-            if json.get("context", None) is not None
-            else None,
-            details=[
-                BackForwardCacheBlockingDetails.from_json(i) for i in json["details"]
-            ]
-            if json.get("details", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", BackForwardCacheNotRestoredReasonType, False),
+            "reason": ("reason", BackForwardCacheNotRestoredReason, False),
+            "context": ("context", str, True),
+            "details": (
+                "details",
+                lambda v: [BackForwardCacheBlockingDetails.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class BackForwardCacheNotRestoredExplanationTree:
     #: URL of each frame
     url: str
@@ -2104,17 +2222,27 @@ class BackForwardCacheNotRestoredExplanationTree:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotRestoredExplanationTree:
-        return cls(
-            url=str(json["url"]),
-            explanations=[
-                BackForwardCacheNotRestoredExplanation.from_json(i)
-                for i in json["explanations"]
-            ],
-            children=[
-                BackForwardCacheNotRestoredExplanationTree.from_json(i)
-                for i in json["children"]
-            ],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "explanations": (
+                "explanations",
+                lambda v: [
+                    BackForwardCacheNotRestoredExplanation.from_json(i) for i in v
+                ],
+                False,
+            ),
+            "children": (
+                "children",
+                lambda v: [
+                    BackForwardCacheNotRestoredExplanationTree.from_json(i) for i in v
+                ],
+                False,
+            ),
+        }
 
 
 @deprecated(version="1.3")
@@ -3536,17 +3664,23 @@ def set_prerendering_allowed(
 
 
 @event_class("Page.domContentEventFired")
-@dataclass
+@slotted_dataclass
 class DomContentEventFired:
     timestamp: network.MonotonicTime
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomContentEventFired:
-        return cls(timestamp=network.MonotonicTime.from_json(json["timestamp"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "timestamp": ("timestamp", network.MonotonicTime, False),
+        }
 
 
 @event_class("Page.fileChooserOpened")
-@dataclass
+@slotted_dataclass
 class FileChooserOpened:
     """
     Emitted only when ``page.interceptFileChooser`` is enabled.
@@ -3561,17 +3695,19 @@ class FileChooserOpened:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileChooserOpened:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]),
-            mode=str(json["mode"]),
-            backend_node_id=dom.BackendNodeId.from_json(json["backendNodeId"])
-            if json.get("backendNodeId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "mode": ("mode", str, False),
+            "backendNodeId": ("backend_node_id", dom.BackendNodeId, True),
+        }
 
 
 @event_class("Page.frameAttached")
-@dataclass
+@slotted_dataclass
 class FrameAttached:
     """
     Fired when frame has been attached to its parent.
@@ -3586,18 +3722,20 @@ class FrameAttached:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameAttached:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]),
-            parent_frame_id=FrameId.from_json(json["parentFrameId"]),
-            stack=runtime.StackTrace.from_json(json["stack"])
-            if json.get("stack", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "parentFrameId": ("parent_frame_id", FrameId, False),
+            "stack": ("stack", runtime.StackTrace.from_json, True),
+        }
 
 
 @deprecated(version="1.3")
 @event_class("Page.frameClearedScheduledNavigation")
-@dataclass
+@slotted_dataclass
 class FrameClearedScheduledNavigation:
     """
     Fired when frame no longer has a scheduled navigation.
@@ -3608,11 +3746,17 @@ class FrameClearedScheduledNavigation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameClearedScheduledNavigation:
-        return cls(frame_id=FrameId.from_json(json["frameId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+        }
 
 
 @event_class("Page.frameDetached")
-@dataclass
+@slotted_dataclass
 class FrameDetached:
     """
     Fired when frame has been detached from its parent.
@@ -3624,13 +3768,18 @@ class FrameDetached:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameDetached:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]), reason=str(json["reason"])
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "reason": ("reason", str, False),
+        }
 
 
 @event_class("Page.frameSubtreeWillBeDetached")
-@dataclass
+@slotted_dataclass
 class FrameSubtreeWillBeDetached:
     """
     **EXPERIMENTAL**
@@ -3644,11 +3793,17 @@ class FrameSubtreeWillBeDetached:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameSubtreeWillBeDetached:
-        return cls(frame_id=FrameId.from_json(json["frameId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+        }
 
 
 @event_class("Page.frameNavigated")
-@dataclass
+@slotted_dataclass
 class FrameNavigated:
     """
     Fired once navigation of the frame has completed. Frame is now associated with the new loader.
@@ -3660,14 +3815,18 @@ class FrameNavigated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameNavigated:
-        return cls(
-            frame=Frame.from_json(json["frame"]),
-            type_=NavigationType.from_json(json["type"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frame": ("frame", Frame.from_json, False),
+            "type": ("type_", NavigationType, False),
+        }
 
 
 @event_class("Page.documentOpened")
-@dataclass
+@slotted_dataclass
 class DocumentOpened:
     """
     **EXPERIMENTAL**
@@ -3680,11 +3839,17 @@ class DocumentOpened:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DocumentOpened:
-        return cls(frame=Frame.from_json(json["frame"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frame": ("frame", Frame.from_json, False),
+        }
 
 
 @event_class("Page.frameResized")
-@dataclass
+@slotted_dataclass
 class FrameResized:
     """
     **EXPERIMENTAL**
@@ -3694,11 +3859,15 @@ class FrameResized:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameResized:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("Page.frameRequestedNavigation")
-@dataclass
+@slotted_dataclass
 class FrameRequestedNavigation:
     """
     **EXPERIMENTAL**
@@ -3718,17 +3887,21 @@ class FrameRequestedNavigation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameRequestedNavigation:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]),
-            reason=ClientNavigationReason.from_json(json["reason"]),
-            url=str(json["url"]),
-            disposition=ClientNavigationDisposition.from_json(json["disposition"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "reason": ("reason", ClientNavigationReason, False),
+            "url": ("url", str, False),
+            "disposition": ("disposition", ClientNavigationDisposition, False),
+        }
 
 
 @deprecated(version="1.3")
 @event_class("Page.frameScheduledNavigation")
-@dataclass
+@slotted_dataclass
 class FrameScheduledNavigation:
     """
     Fired when frame schedules a potential navigation.
@@ -3746,16 +3919,20 @@ class FrameScheduledNavigation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameScheduledNavigation:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]),
-            delay=float(json["delay"]),
-            reason=ClientNavigationReason.from_json(json["reason"]),
-            url=str(json["url"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "delay": ("delay", float, False),
+            "reason": ("reason", ClientNavigationReason, False),
+            "url": ("url", str, False),
+        }
 
 
 @event_class("Page.frameStartedLoading")
-@dataclass
+@slotted_dataclass
 class FrameStartedLoading:
     """
     **EXPERIMENTAL**
@@ -3768,11 +3945,17 @@ class FrameStartedLoading:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameStartedLoading:
-        return cls(frame_id=FrameId.from_json(json["frameId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+        }
 
 
 @event_class("Page.frameStoppedLoading")
-@dataclass
+@slotted_dataclass
 class FrameStoppedLoading:
     """
     **EXPERIMENTAL**
@@ -3785,12 +3968,18 @@ class FrameStoppedLoading:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameStoppedLoading:
-        return cls(frame_id=FrameId.from_json(json["frameId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+        }
 
 
 @deprecated(version="1.3")
 @event_class("Page.downloadWillBegin")
-@dataclass
+@slotted_dataclass
 class DownloadWillBegin:
     """
     **EXPERIMENTAL**
@@ -3810,17 +3999,21 @@ class DownloadWillBegin:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadWillBegin:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]),
-            guid=str(json["guid"]),
-            url=str(json["url"]),
-            suggested_filename=str(json["suggestedFilename"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "guid": ("guid", str, False),
+            "url": ("url", str, False),
+            "suggestedFilename": ("suggested_filename", str, False),
+        }
 
 
 @deprecated(version="1.3")
 @event_class("Page.downloadProgress")
-@dataclass
+@slotted_dataclass
 class DownloadProgress:
     """
     **EXPERIMENTAL**
@@ -3840,16 +4033,20 @@ class DownloadProgress:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadProgress:
-        return cls(
-            guid=str(json["guid"]),
-            total_bytes=float(json["totalBytes"]),
-            received_bytes=float(json["receivedBytes"]),
-            state=str(json["state"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "guid": ("guid", str, False),
+            "totalBytes": ("total_bytes", float, False),
+            "receivedBytes": ("received_bytes", float, False),
+            "state": ("state", str, False),
+        }
 
 
 @event_class("Page.interstitialHidden")
-@dataclass
+@slotted_dataclass
 class InterstitialHidden:
     """
     Fired when interstitial page was hidden
@@ -3857,11 +4054,15 @@ class InterstitialHidden:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterstitialHidden:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("Page.interstitialShown")
-@dataclass
+@slotted_dataclass
 class InterstitialShown:
     """
     Fired when interstitial page was shown
@@ -3869,11 +4070,15 @@ class InterstitialShown:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterstitialShown:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("Page.javascriptDialogClosed")
-@dataclass
+@slotted_dataclass
 class JavascriptDialogClosed:
     """
     Fired when a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload) has been
@@ -3887,11 +4092,18 @@ class JavascriptDialogClosed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> JavascriptDialogClosed:
-        return cls(result=bool(json["result"]), user_input=str(json["userInput"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "result": ("result", bool, False),
+            "userInput": ("user_input", str, False),
+        }
 
 
 @event_class("Page.javascriptDialogOpening")
-@dataclass
+@slotted_dataclass
 class JavascriptDialogOpening:
     """
     Fired when a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload) is about to
@@ -3913,19 +4125,21 @@ class JavascriptDialogOpening:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> JavascriptDialogOpening:
-        return cls(
-            url=str(json["url"]),
-            message=str(json["message"]),
-            type_=DialogType.from_json(json["type"]),
-            has_browser_handler=bool(json["hasBrowserHandler"]),
-            default_prompt=str(json["defaultPrompt"])
-            if json.get("defaultPrompt", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "message": ("message", str, False),
+            "type": ("type_", DialogType, False),
+            "hasBrowserHandler": ("has_browser_handler", bool, False),
+            "defaultPrompt": ("default_prompt", str, True),
+        }
 
 
 @event_class("Page.lifecycleEvent")
-@dataclass
+@slotted_dataclass
 class LifecycleEvent:
     """
     Fired for lifecycle events (navigation, load, paint, etc) in the current
@@ -3941,16 +4155,20 @@ class LifecycleEvent:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LifecycleEvent:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]),
-            loader_id=network.LoaderId.from_json(json["loaderId"]),
-            name=str(json["name"]),
-            timestamp=network.MonotonicTime.from_json(json["timestamp"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "loaderId": ("loader_id", network.LoaderId, False),
+            "name": ("name", str, False),
+            "timestamp": ("timestamp", network.MonotonicTime, False),
+        }
 
 
 @event_class("Page.backForwardCacheNotUsed")
-@dataclass
+@slotted_dataclass
 class BackForwardCacheNotUsed:
     """
     **EXPERIMENTAL**
@@ -3974,33 +4192,46 @@ class BackForwardCacheNotUsed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotUsed:
-        return cls(
-            loader_id=network.LoaderId.from_json(json["loaderId"]),
-            frame_id=FrameId.from_json(json["frameId"]),
-            not_restored_explanations=[
-                BackForwardCacheNotRestoredExplanation.from_json(i)
-                for i in json["notRestoredExplanations"]
-            ],
-            not_restored_explanations_tree=BackForwardCacheNotRestoredExplanationTree.from_json(
-                json["notRestoredExplanationsTree"]
-            )
-            if json.get("notRestoredExplanationsTree", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "loaderId": ("loader_id", network.LoaderId, False),
+            "frameId": ("frame_id", FrameId, False),
+            "notRestoredExplanations": (
+                "not_restored_explanations",
+                lambda v: [
+                    BackForwardCacheNotRestoredExplanation.from_json(i) for i in v
+                ],
+                False,
+            ),
+            "notRestoredExplanationsTree": (
+                "not_restored_explanations_tree",
+                BackForwardCacheNotRestoredExplanationTree.from_json,
+                True,
+            ),
+        }
 
 
 @event_class("Page.loadEventFired")
-@dataclass
+@slotted_dataclass
 class LoadEventFired:
     timestamp: network.MonotonicTime
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadEventFired:
-        return cls(timestamp=network.MonotonicTime.from_json(json["timestamp"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "timestamp": ("timestamp", network.MonotonicTime, False),
+        }
 
 
 @event_class("Page.navigatedWithinDocument")
-@dataclass
+@slotted_dataclass
 class NavigatedWithinDocument:
     """
     **EXPERIMENTAL**
@@ -4017,15 +4248,19 @@ class NavigatedWithinDocument:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NavigatedWithinDocument:
-        return cls(
-            frame_id=FrameId.from_json(json["frameId"]),
-            url=str(json["url"]),
-            navigation_type=str(json["navigationType"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", FrameId, False),
+            "url": ("url", str, False),
+            "navigationType": ("navigation_type", str, False),
+        }
 
 
 @event_class("Page.screencastFrame")
-@dataclass
+@slotted_dataclass
 class ScreencastFrame:
     """
     **EXPERIMENTAL**
@@ -4042,15 +4277,19 @@ class ScreencastFrame:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreencastFrame:
-        return cls(
-            data=str(json["data"]),
-            metadata=ScreencastFrameMetadata.from_json(json["metadata"]),
-            session_id=int(json["sessionId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "data": ("data", str, False),
+            "metadata": ("metadata", ScreencastFrameMetadata.from_json, False),
+            "sessionId": ("session_id", int, False),
+        }
 
 
 @event_class("Page.screencastVisibilityChanged")
-@dataclass
+@slotted_dataclass
 class ScreencastVisibilityChanged:
     """
     **EXPERIMENTAL**
@@ -4063,11 +4302,17 @@ class ScreencastVisibilityChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreencastVisibilityChanged:
-        return cls(visible=bool(json["visible"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "visible": ("visible", bool, False),
+        }
 
 
 @event_class("Page.windowOpen")
-@dataclass
+@slotted_dataclass
 class WindowOpen:
     """
     Fired when a new window is going to be opened, via window.open(), link click, form submission,
@@ -4085,16 +4330,20 @@ class WindowOpen:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WindowOpen:
-        return cls(
-            url=str(json["url"]),
-            window_name=str(json["windowName"]),
-            window_features=[str(i) for i in json["windowFeatures"]],
-            user_gesture=bool(json["userGesture"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "windowName": ("window_name", str, False),
+            "windowFeatures": ("window_features", lambda v: [str(i) for i in v], False),
+            "userGesture": ("user_gesture", bool, False),
+        }
 
 
 @event_class("Page.compilationCacheProduced")
-@dataclass
+@slotted_dataclass
 class CompilationCacheProduced:
     """
     **EXPERIMENTAL**
@@ -4109,4 +4358,11 @@ class CompilationCacheProduced:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CompilationCacheProduced:
-        return cls(url=str(json["url"]), data=str(json["data"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "data": ("data", str, False),
+        }
@@ -6,16 +6,20 @@
 # CDP domain: Performance
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 from deprecated.sphinx import deprecated  # type: ignore
 
 
-@dataclass
+@slotted_dataclass
 class Metric:
     """
     Run-time execution metric.
@@ -35,10 +39,14 @@ class Metric:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Metric:
-        return cls(
-            name=str(json["name"]),
-            value=float(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", float, False),
+        }
 
 
 def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -107,7 +115,7 @@ def get_metrics() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, typing.List[Metr
 
 
 @event_class("Performance.metrics")
-@dataclass
+@slotted_dataclass
 class Metrics:
     """
     Current values of the metrics.
@@ -120,7 +128,11 @@ class Metrics:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Metrics:
-        return cls(
-            metrics=[Metric.from_json(i) for i in json["metrics"]],
-            title=str(json["title"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "metrics": ("metrics", lambda v: [Metric.from_json(i) for i in v], False),
+            "title": ("title", str, False),
+        }
@@ -6,17 +6,21 @@
 # CDP domain: PerformanceTimeline (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import network
 from . import page
 
 
-@dataclass
+@slotted_dataclass
 class LargestContentfulPaint:
     """
     See https://github.com/WICG/LargestContentfulPaint and largest_contentful_paint.idl
@@ -52,21 +56,21 @@ class LargestContentfulPaint:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LargestContentfulPaint:
-        return cls(
-            render_time=network.TimeSinceEpoch.from_json(json["renderTime"]),
-            load_time=network.TimeSinceEpoch.from_json(json["loadTime"]),
-            size=float(json["size"]),
-            element_id=str(json["elementId"])
-            if json.get("elementId", None) is not None
-            else None,
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            node_id=dom.BackendNodeId.from_json(json["nodeId"])
-            if json.get("nodeId", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "renderTime": ("render_time", network.TimeSinceEpoch, False),
+            "loadTime": ("load_time", network.TimeSinceEpoch, False),
+            "size": ("size", float, False),
+            "elementId": ("element_id", str, True),
+            "url": ("url", str, True),
+            "nodeId": ("node_id", dom.BackendNodeId, True),
+        }
+
+
+@slotted_dataclass
 class LayoutShiftAttribution:
     previous_rect: dom.Rect
 
@@ -84,16 +88,18 @@ class LayoutShiftAttribution:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutShiftAttribution:
-        return cls(
-            previous_rect=dom.Rect.from_json(json["previousRect"]),
-            current_rect=dom.Rect.from_json(json["currentRect"]),
-            node_id=dom.BackendNodeId.from_json(json["nodeId"])
-            if json.get("nodeId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "previousRect": ("previous_rect", dom.Rect.from_json, False),
+            "currentRect": ("current_rect", dom.Rect.from_json, False),
+            "nodeId": ("node_id", dom.BackendNodeId, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class LayoutShift:
     """
     See https://wicg.github.io/layout-instability/#sec-layout-shift and layout_shift.idl
@@ -118,15 +124,23 @@ class LayoutShift:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutShift:
-        return cls(
-            value=float(json["value"]),
-            had_recent_input=bool(json["hadRecentInput"]),
-            last_input_time=network.TimeSinceEpoch.from_json(json["lastInputTime"]),
-            sources=[LayoutShiftAttribution.from_json(i) for i in json["sources"]],
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "value": ("value", float, False),
+            "hadRecentInput": ("had_recent_input", bool, False),
+            "lastInputTime": ("last_input_time", network.TimeSinceEpoch, False),
+            "sources": (
+                "sources",
+                lambda v: [LayoutShiftAttribution.from_json(i) for i in v],
+                False,
+            ),
+        }
+
+
+@slotted_dataclass
 class TimelineEvent:
     #: Identifies the frame that this event is related to. Empty for non-frame targets.
     frame_id: page.FrameId
@@ -164,21 +178,19 @@ class TimelineEvent:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TimelineEvent:
-        return cls(
-            frame_id=page.FrameId.from_json(json["frameId"]),
-            type_=str(json["type"]),
-            name=str(json["name"]),
-            time=network.TimeSinceEpoch.from_json(json["time"]),
-            duration=float(json["duration"])
-            if json.get("duration", None) is not None
-            else None,
-            lcp_details=LargestContentfulPaint.from_json(json["lcpDetails"])
-            if json.get("lcpDetails", None) is not None
-            else None,
-            layout_shift_details=LayoutShift.from_json(json["layoutShiftDetails"])
-            if json.get("layoutShiftDetails", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "frameId": ("frame_id", page.FrameId, False),
+            "type": ("type_", str, False),
+            "name": ("name", str, False),
+            "time": ("time", network.TimeSinceEpoch, False),
+            "duration": ("duration", float, True),
+            "lcpDetails": ("lcp_details", LargestContentfulPaint.from_json, True),
+            "layoutShiftDetails": ("layout_shift_details", LayoutShift.from_json, True),
+        }
 
 
 def enable(
@@ -200,7 +212,7 @@ def enable(
 
 
 @event_class("PerformanceTimeline.timelineEventAdded")
-@dataclass
+@slotted_dataclass
 class TimelineEventAdded:
     """
     Sent when a performance timeline event is added. See reportPerformanceTimeline method.
@@ -210,4 +222,10 @@ class TimelineEventAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TimelineEventAdded:
-        return cls(event=TimelineEvent.from_json(json["event"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "event": ("event", TimelineEvent.from_json, False),
+        }
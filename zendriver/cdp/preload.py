@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import dom
 from . import network
@@ -32,7 +37,7 @@ class RuleSetId(str):
         return "RuleSetId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class RuleSet:
     """
     Corresponds to SpeculationRuleSet
@@ -94,24 +99,20 @@ class RuleSet:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleSet:
-        return cls(
-            id_=RuleSetId.from_json(json["id"]),
-            loader_id=network.LoaderId.from_json(json["loaderId"]),
-            source_text=str(json["sourceText"]),
-            backend_node_id=dom.BackendNodeId.from_json(json["backendNodeId"])
-            if json.get("backendNodeId", None) is not None
-            else None,
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            request_id=network.RequestId.from_json(json["requestId"])
-            if json.get("requestId", None) is not None
-            else None,
-            error_type=RuleSetErrorType.from_json(json["errorType"])
-            if json.get("errorType", None) is not None
-            else None,
-            error_message=str(json["errorMessage"])
-            if json.get("errorMessage", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", RuleSetId, False),
+            "loaderId": ("loader_id", network.LoaderId, False),
+            "sourceText": ("source_text", str, False),
+            "backendNodeId": ("backend_node_id", dom.BackendNodeId, True),
+            "url": ("url", str, True),
+            "requestId": ("request_id", network.RequestId, True),
+            "errorType": ("error_type", RuleSetErrorType, True),
+            "errorMessage": ("error_message", str, True),
+        }
 
 
 class RuleSetErrorType(enum.Enum):
@@ -161,7 +162,7 @@ class SpeculationTargetHint(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class PreloadingAttemptKey:
     """
     A key that identifies a preloading attempt.
@@ -191,17 +192,19 @@ class PreloadingAttemptKey:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptKey:
-        return cls(
-            loader_id=network.LoaderId.from_json(json["loaderId"]),
-            action=SpeculationAction.from_json(json["action"]),
-            url=str(json["url"]),
-            target_hint=SpeculationTargetHint.from_json(json["targetHint"])
-            if json.get("targetHint", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "loaderId": ("loader_id", network.LoaderId, False),
+            "action": ("action", SpeculationAction, False),
+            "url": ("url", str, False),
+            "targetHint": ("target_hint", SpeculationTargetHint, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class PreloadingAttemptSource:
     """
     Lists sources for a preloading attempt, specifically the ids of rule sets
@@ -226,11 +229,15 @@ class PreloadingAttemptSource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptSource:
-        return cls(
-            key=PreloadingAttemptKey.from_json(json["key"]),
-            rule_set_ids=[RuleSetId.from_json(i) for i in json["ruleSetIds"]],
-            node_ids=[dom.BackendNodeId.from_json(i) for i in json["nodeIds"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", PreloadingAttemptKey.from_json, False),
+            "ruleSetIds": ("rule_set_ids", lambda v: [RuleSetId(i) for i in v], False),
+            "nodeIds": ("node_ids", lambda v: [dom.BackendNodeId(i) for i in v], False),
+        }
 
 
 class PrerenderFinalStatus(enum.Enum):
@@ -424,7 +431,7 @@ class PrefetchStatus(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class PrerenderMismatchedHeaders:
     """
     Information of headers to be displayed when the header mismatch occurred.
@@ -447,15 +454,15 @@ class PrerenderMismatchedHeaders:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrerenderMismatchedHeaders:
-        return cls(
-            header_name=str(json["headerName"]),
-            initial_value=str(json["initialValue"])
-            if json.get("initialValue", None) is not None
-            else None,
-            activation_value=str(json["activationValue"])
-            if json.get("activationValue", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "headerName": ("header_name", str, False),
+            "initialValue": ("initial_value", str, True),
+            "activationValue": ("activation_value", str, True),
+        }
 
 
 def enable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -473,7 +480,7 @@ def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
 
 
 @event_class("Preload.ruleSetUpdated")
-@dataclass
+@slotted_dataclass
 class RuleSetUpdated:
     """
     Upsert. Currently, it is only emitted when a rule set added.
@@ -483,21 +490,33 @@ class RuleSetUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleSetUpdated:
-        return cls(rule_set=RuleSet.from_json(json["ruleSet"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "ruleSet": ("rule_set", RuleSet.from_json, False),
+        }
 
 
 @event_class("Preload.ruleSetRemoved")
-@dataclass
+@slotted_dataclass
 class RuleSetRemoved:
     id_: RuleSetId
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleSetRemoved:
-        return cls(id_=RuleSetId.from_json(json["id"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", RuleSetId, False),
+        }
 
 
 @event_class("Preload.preloadEnabledStateUpdated")
-@dataclass
+@slotted_dataclass
 class PreloadEnabledStateUpdated:
     """
     Fired when a preload enabled state is updated.
@@ -511,21 +530,29 @@ class PreloadEnabledStateUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreloadEnabledStateUpdated:
-        return cls(
-            disabled_by_preference=bool(json["disabledByPreference"]),
-            disabled_by_data_saver=bool(json["disabledByDataSaver"]),
-            disabled_by_battery_saver=bool(json["disabledByBatterySaver"]),
-            disabled_by_holdback_prefetch_speculation_rules=bool(
-                json["disabledByHoldbackPrefetchSpeculationRules"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "disabledByPreference": ("disabled_by_preference", bool, False),
+            "disabledByDataSaver": ("disabled_by_data_saver", bool, False),
+            "disabledByBatterySaver": ("disabled_by_battery_saver", bool, False),
+            "disabledByHoldbackPrefetchSpeculationRules": (
+                "disabled_by_holdback_prefetch_speculation_rules",
+                bool,
+                False,
             ),
-            disabled_by_holdback_prerender_speculation_rules=bool(
-                json["disabledByHoldbackPrerenderSpeculationRules"]
+            "disabledByHoldbackPrerenderSpeculationRules": (
+                "disabled_by_holdback_prerender_speculation_rules",
+                bool,
+                False,
             ),
-        )
+        }
 
 
 @event_class("Preload.prefetchStatusUpdated")
-@dataclass
+@slotted_dataclass
 class PrefetchStatusUpdated:
     """
     Fired when a prefetch attempt is updated.
@@ -541,18 +568,22 @@ class PrefetchStatusUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrefetchStatusUpdated:
-        return cls(
-            key=PreloadingAttemptKey.from_json(json["key"]),
-            initiating_frame_id=page.FrameId.from_json(json["initiatingFrameId"]),
-            prefetch_url=str(json["prefetchUrl"]),
-            status=PreloadingStatus.from_json(json["status"]),
-            prefetch_status=PrefetchStatus.from_json(json["prefetchStatus"]),
-            request_id=network.RequestId.from_json(json["requestId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", PreloadingAttemptKey.from_json, False),
+            "initiatingFrameId": ("initiating_frame_id", page.FrameId, False),
+            "prefetchUrl": ("prefetch_url", str, False),
+            "status": ("status", PreloadingStatus, False),
+            "prefetchStatus": ("prefetch_status", PrefetchStatus, False),
+            "requestId": ("request_id", network.RequestId, False),
+        }
 
 
 @event_class("Preload.prerenderStatusUpdated")
-@dataclass
+@slotted_dataclass
 class PrerenderStatusUpdated:
     """
     Fired when a prerender attempt is updated.
@@ -568,26 +599,25 @@ class PrerenderStatusUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrerenderStatusUpdated:
-        return cls(
-            key=PreloadingAttemptKey.from_json(json["key"]),
-            status=PreloadingStatus.from_json(json["status"]),
-            prerender_status=PrerenderFinalStatus.from_json(json["prerenderStatus"])
-            if json.get("prerenderStatus", None) is not None
-            else None,
-            disallowed_mojo_interface=str(json["disallowedMojoInterface"])
-            if json.get("disallowedMojoInterface", None) is not None
-            else None,
-            mismatched_headers=[
-                PrerenderMismatchedHeaders.from_json(i)
-                for i in json["mismatchedHeaders"]
-            ]
-            if json.get("mismatchedHeaders", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", PreloadingAttemptKey.from_json, False),
+            "status": ("status", PreloadingStatus, False),
+            "prerenderStatus": ("prerender_status", PrerenderFinalStatus, True),
+            "disallowedMojoInterface": ("disallowed_mojo_interface", str, True),
+            "mismatchedHeaders": (
+                "mismatched_headers",
+                lambda v: [PrerenderMismatchedHeaders.from_json(i) for i in v],
+                True,
+            ),
+        }
 
 
 @event_class("Preload.preloadingAttemptSourcesUpdated")
-@dataclass
+@slotted_dataclass
 class PreloadingAttemptSourcesUpdated:
     """
     Send a list of sources for all preloading attempts in a document.
@@ -598,10 +628,15 @@ class PreloadingAttemptSourcesUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptSourcesUpdated:
-        return cls(
-            loader_id=network.LoaderId.from_json(json["loaderId"]),
-            preloading_attempt_sources=[
-                PreloadingAttemptSource.from_json(i)
-                for i in json["preloadingAttemptSources"]
-            ],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "loaderId": ("loader_id", network.LoaderId, False),
+            "preloadingAttemptSources": (
+                "preloading_attempt_sources",
+                lambda v: [PreloadingAttemptSource.from_json(i) for i in v],
+                False,
+            ),
+        }
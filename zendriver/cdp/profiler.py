@@ -6,16 +6,20 @@
 # CDP domain: Profiler
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import debugger
 from . import runtime
 
 
-@dataclass
+@slotted_dataclass
 class ProfileNode:
     """
     Profile node. Holds callsite information, execution statistics and child nodes.
@@ -56,27 +60,25 @@ class ProfileNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ProfileNode:
-        return cls(
-            id_=int(json["id"]),
-            call_frame=runtime.CallFrame.from_json(json["callFrame"]),
-            hit_count=int(json["hitCount"])
-            if json.get("hitCount", None) is not None
-            else None,
-            children=[int(i) for i in json["children"]]
-            if json.get("children", None) is not None
-            else None,
-            deopt_reason=str(json["deoptReason"])
-            if json.get("deoptReason", None) is not None
-            else None,
-            position_ticks=[
-                PositionTickInfo.from_json(i) for i in json["positionTicks"]
-            ]
-            if json.get("positionTicks", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", int, False),
+            "callFrame": ("call_frame", runtime.CallFrame.from_json, False),
+            "hitCount": ("hit_count", int, True),
+            "children": ("children", lambda v: [int(i) for i in v], True),
+            "deoptReason": ("deopt_reason", str, True),
+            "positionTicks": (
+                "position_ticks",
+                lambda v: [PositionTickInfo.from_json(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class Profile:
     """
     Profile.
@@ -111,20 +113,20 @@ class Profile:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Profile:
-        return cls(
-            nodes=[ProfileNode.from_json(i) for i in json["nodes"]],
-            start_time=float(json["startTime"]),
-            end_time=float(json["endTime"]),
-            samples=[int(i) for i in json["samples"]]
-            if json.get("samples", None) is not None
-            else None,
-            time_deltas=[int(i) for i in json["timeDeltas"]]
-            if json.get("timeDeltas", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodes": ("nodes", lambda v: [ProfileNode.from_json(i) for i in v], False),
+            "startTime": ("start_time", float, False),
+            "endTime": ("end_time", float, False),
+            "samples": ("samples", lambda v: [int(i) for i in v], True),
+            "timeDeltas": ("time_deltas", lambda v: [int(i) for i in v], True),
+        }
+
+
+@slotted_dataclass
 class PositionTickInfo:
     """
     Specifies a number of samples attributed to a certain source position.
@@ -144,13 +146,17 @@ class PositionTickInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PositionTickInfo:
-        return cls(
-            line=int(json["line"]),
-            ticks=int(json["ticks"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "line": ("line", int, False),
+            "ticks": ("ticks", int, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class CoverageRange:
     """
     Coverage data for a source range.
@@ -174,14 +180,18 @@ class CoverageRange:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CoverageRange:
-        return cls(
-            start_offset=int(json["startOffset"]),
-            end_offset=int(json["endOffset"]),
-            count=int(json["count"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "startOffset": ("start_offset", int, False),
+            "endOffset": ("end_offset", int, False),
+            "count": ("count", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class FunctionCoverage:
     """
     Coverage data for a JavaScript function.
@@ -205,14 +215,22 @@ class FunctionCoverage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FunctionCoverage:
-        return cls(
-            function_name=str(json["functionName"]),
-            ranges=[CoverageRange.from_json(i) for i in json["ranges"]],
-            is_block_coverage=bool(json["isBlockCoverage"]),
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "functionName": ("function_name", str, False),
+            "ranges": (
+                "ranges",
+                lambda v: [CoverageRange.from_json(i) for i in v],
+                False,
+            ),
+            "isBlockCoverage": ("is_block_coverage", bool, False),
+        }
+
+
+@slotted_dataclass
 class ScriptCoverage:
     """
     Coverage data for a JavaScript script.
@@ -236,11 +254,19 @@ class ScriptCoverage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptCoverage:
-        return cls(
-            script_id=runtime.ScriptId.from_json(json["scriptId"]),
-            url=str(json["url"]),
-            functions=[FunctionCoverage.from_json(i) for i in json["functions"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scriptId": ("script_id", runtime.ScriptId, False),
+            "url": ("url", str, False),
+            "functions": (
+                "functions",
+                lambda v: [FunctionCoverage.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 def disable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -376,7 +402,7 @@ def take_precise_coverage() -> (
 
 
 @event_class("Profiler.consoleProfileFinished")
-@dataclass
+@slotted_dataclass
 class ConsoleProfileFinished:
     id_: str
     #: Location of console.profileEnd().
@@ -387,16 +413,20 @@ class ConsoleProfileFinished:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleProfileFinished:
-        return cls(
-            id_=str(json["id"]),
-            location=debugger.Location.from_json(json["location"]),
-            profile=Profile.from_json(json["profile"]),
-            title=str(json["title"]) if json.get("title", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", str, False),
+            "location": ("location", debugger.Location.from_json, False),
+            "profile": ("profile", Profile.from_json, False),
+            "title": ("title", str, True),
+        }
 
 
 @event_class("Profiler.consoleProfileStarted")
-@dataclass
+@slotted_dataclass
 class ConsoleProfileStarted:
     """
     Sent when new profile recording is started using console.profile() call.
@@ -410,15 +440,19 @@ class ConsoleProfileStarted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleProfileStarted:
-        return cls(
-            id_=str(json["id"]),
-            location=debugger.Location.from_json(json["location"]),
-            title=str(json["title"]) if json.get("title", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", str, False),
+            "location": ("location", debugger.Location.from_json, False),
+            "title": ("title", str, True),
+        }
 
 
 @event_class("Profiler.preciseCoverageDeltaUpdate")
-@dataclass
+@slotted_dataclass
 class PreciseCoverageDeltaUpdate:
     """
     **EXPERIMENTAL**
@@ -438,8 +472,16 @@ class PreciseCoverageDeltaUpdate:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreciseCoverageDeltaUpdate:
-        return cls(
-            timestamp=float(json["timestamp"]),
-            occasion=str(json["occasion"]),
-            result=[ScriptCoverage.from_json(i) for i in json["result"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "timestamp": ("timestamp", float, False),
+            "occasion": ("occasion", str, False),
+            "result": (
+                "result",
+                lambda v: [ScriptCoverage.from_json(i) for i in v],
+                False,
+            ),
+        }
@@ -8,13 +8,17 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import target
 
 
-@dataclass
+@slotted_dataclass
 class FileHandlerAccept:
     """
     The following types are the replica of
@@ -35,13 +39,17 @@ class FileHandlerAccept:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileHandlerAccept:
-        return cls(
-            media_type=str(json["mediaType"]),
-            file_extensions=[str(i) for i in json["fileExtensions"]],
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "mediaType": ("media_type", str, False),
+            "fileExtensions": ("file_extensions", lambda v: [str(i) for i in v], False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class FileHandler:
     action: str
 
@@ -58,11 +66,19 @@ class FileHandler:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileHandler:
-        return cls(
-            action=str(json["action"]),
-            accepts=[FileHandlerAccept.from_json(i) for i in json["accepts"]],
-            display_name=str(json["displayName"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "action": ("action", str, False),
+            "accepts": (
+                "accepts",
+                lambda v: [FileHandlerAccept.from_json(i) for i in v],
+                False,
+            ),
+            "displayName": ("display_name", str, False),
+        }
 
 
 class DisplayMode(enum.Enum):
@@ -6,10 +6,15 @@
 # CDP domain: Runtime
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    identity,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class ScriptId(str):
@@ -28,7 +33,7 @@ class ScriptId(str):
         return "ScriptId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class SerializationOptions:
     """
     Represents options for serialization. Overrides ``generatePreview`` and ``returnByValue``.
@@ -55,18 +60,18 @@ class SerializationOptions:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SerializationOptions:
-        return cls(
-            serialization=str(json["serialization"]),
-            max_depth=int(json["maxDepth"])
-            if json.get("maxDepth", None) is not None
-            else None,
-            additional_parameters=dict(json["additionalParameters"])
-            if json.get("additionalParameters", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "serialization": ("serialization", str, False),
+            "maxDepth": ("max_depth", int, True),
+            "additionalParameters": ("additional_parameters", dict, True),
+        }
+
+
+@slotted_dataclass
 class DeepSerializedValue:
     """
     Represents deep serialized value.
@@ -96,16 +101,16 @@ class DeepSerializedValue:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DeepSerializedValue:
-        return cls(
-            type_=str(json["type"]),
-            value=json["value"] if json.get("value", None) is not None else None,
-            object_id=str(json["objectId"])
-            if json.get("objectId", None) is not None
-            else None,
-            weak_local_object_reference=int(json["weakLocalObjectReference"])
-            if json.get("weakLocalObjectReference", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "value": ("value", identity, True),
+            "objectId": ("object_id", str, True),
+            "weakLocalObjectReference": ("weak_local_object_reference", int, True),
+        }
 
 
 class RemoteObjectId(str):
@@ -141,7 +146,7 @@ class UnserializableValue(str):
         return "UnserializableValue({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class RemoteObject:
     """
     Mirror object referencing original JavaScript object.
@@ -204,41 +209,29 @@ class RemoteObject:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RemoteObject:
-        return cls(
-            type_=str(json["type"]),
-            subtype=str(json["subtype"])
-            if json.get("subtype", None) is not None
-            else None,
-            class_name=str(json["className"])
-            if json.get("className", None) is not None
-            else None,
-            value=json["value"] if json.get("value", None) is not None else None,
-            unserializable_value=UnserializableValue.from_json(
-                json["unserializableValue"]
-            )
-            if json.get("unserializableValue", None) is not None
-            else None,
-            description=str(json["description"])
-            if json.get("description", None) is not None
-            else None,
-            deep_serialized_value=DeepSerializedValue.from_json(
-                json["deepSerializedValue"]
-            )
-            if json.get("deepSerializedValue", None) is not None
-            else None,
-            object_id=RemoteObjectId.from_json(json["objectId"])
-            if json.get("objectId", None) is not None
-            else None,
-            preview=ObjectPreview.from_json(json["preview"])
-            if json.get("preview", None) is not None
-            else None,
-            custom_preview=CustomPreview.from_json(json["customPreview"])
-            if json.get("customPreview", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "subtype": ("subtype", str, True),
+            "className": ("class_name", str, True),
+            "value": ("value", identity, True),
+            "unserializableValue": ("unserializable_value", UnserializableValue, True),
+            "description": ("description", str, True),
+            "deepSerializedValue": (
+                "deep_serialized_value",
+                DeepSerializedValue.from_json,
+                True,
+            ),
+            "objectId": ("object_id", RemoteObjectId, True),
+            "preview": ("preview", ObjectPreview.from_json, True),
+            "customPreview": ("custom_preview", CustomPreview.from_json, True),
+        }
+
+
+@slotted_dataclass
 class CustomPreview:
     #: The JSON-stringified result of formatter.header(object, config) call.
     #: It contains json ML array that represents RemoteObject.
@@ -258,15 +251,17 @@ class CustomPreview:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CustomPreview:
-        return cls(
-            header=str(json["header"]),
-            body_getter_id=RemoteObjectId.from_json(json["bodyGetterId"])
-            if json.get("bodyGetterId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "header": ("header", str, False),
+            "bodyGetterId": ("body_getter_id", RemoteObjectId, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class ObjectPreview:
     """
     Object containing abbreviated remote object value.
@@ -305,23 +300,29 @@ class ObjectPreview:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectPreview:
-        return cls(
-            type_=str(json["type"]),
-            overflow=bool(json["overflow"]),
-            properties=[PropertyPreview.from_json(i) for i in json["properties"]],
-            subtype=str(json["subtype"])
-            if json.get("subtype", None) is not None
-            else None,
-            description=str(json["description"])
-            if json.get("description", None) is not None
-            else None,
-            entries=[EntryPreview.from_json(i) for i in json["entries"]]
-            if json.get("entries", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "overflow": ("overflow", bool, False),
+            "properties": (
+                "properties",
+                lambda v: [PropertyPreview.from_json(i) for i in v],
+                False,
+            ),
+            "subtype": ("subtype", str, True),
+            "description": ("description", str, True),
+            "entries": (
+                "entries",
+                lambda v: [EntryPreview.from_json(i) for i in v],
+                True,
+            ),
+        }
+
+
+@slotted_dataclass
 class PropertyPreview:
     #: Property name.
     name: str
@@ -352,20 +353,20 @@ class PropertyPreview:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PropertyPreview:
-        return cls(
-            name=str(json["name"]),
-            type_=str(json["type"]),
-            value=str(json["value"]) if json.get("value", None) is not None else None,
-            value_preview=ObjectPreview.from_json(json["valuePreview"])
-            if json.get("valuePreview", None) is not None
-            else None,
-            subtype=str(json["subtype"])
-            if json.get("subtype", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "type": ("type_", str, False),
+            "value": ("value", str, True),
+            "valuePreview": ("value_preview", ObjectPreview.from_json, True),
+            "subtype": ("subtype", str, True),
+        }
+
+
+@slotted_dataclass
 class EntryPreview:
     #: Preview of the value.
     value: ObjectPreview
@@ -382,15 +383,17 @@ class EntryPreview:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EntryPreview:
-        return cls(
-            value=ObjectPreview.from_json(json["value"]),
-            key=ObjectPreview.from_json(json["key"])
-            if json.get("key", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "value": ("value", ObjectPreview.from_json, False),
+            "key": ("key", ObjectPreview.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class PropertyDescriptor:
     """
     Object property descriptor.
@@ -453,33 +456,25 @@ class PropertyDescriptor:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PropertyDescriptor:
-        return cls(
-            name=str(json["name"]),
-            configurable=bool(json["configurable"]),
-            enumerable=bool(json["enumerable"]),
-            value=RemoteObject.from_json(json["value"])
-            if json.get("value", None) is not None
-            else None,
-            writable=bool(json["writable"])
-            if json.get("writable", None) is not None
-            else None,
-            get=RemoteObject.from_json(json["get"])
-            if json.get("get", None) is not None
-            else None,
-            set_=RemoteObject.from_json(json["set"])
-            if json.get("set", None) is not None
-            else None,
-            was_thrown=bool(json["wasThrown"])
-            if json.get("wasThrown", None) is not None
-            else None,
-            is_own=bool(json["isOwn"]) if json.get("isOwn", None) is not None else None,
-            symbol=RemoteObject.from_json(json["symbol"])
-            if json.get("symbol", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "configurable": ("configurable", bool, False),
+            "enumerable": ("enumerable", bool, False),
+            "value": ("value", RemoteObject.from_json, True),
+            "writable": ("writable", bool, True),
+            "get": ("get", RemoteObject.from_json, True),
+            "set": ("set_", RemoteObject.from_json, True),
+            "wasThrown": ("was_thrown", bool, True),
+            "isOwn": ("is_own", bool, True),
+            "symbol": ("symbol", RemoteObject.from_json, True),
+        }
+
+
+@slotted_dataclass
 class InternalPropertyDescriptor:
     """
     Object internal property descriptor. This property isn't normally visible in JavaScript code.
@@ -500,15 +495,17 @@ class InternalPropertyDescriptor:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InternalPropertyDescriptor:
-        return cls(
-            name=str(json["name"]),
-            value=RemoteObject.from_json(json["value"])
-            if json.get("value", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", RemoteObject.from_json, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class PrivatePropertyDescriptor:
     """
     Object private field descriptor.
@@ -541,21 +538,19 @@ class PrivatePropertyDescriptor:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrivatePropertyDescriptor:
-        return cls(
-            name=str(json["name"]),
-            value=RemoteObject.from_json(json["value"])
-            if json.get("value", None) is not None
-            else None,
-            get=RemoteObject.from_json(json["get"])
-            if json.get("get", None) is not None
-            else None,
-            set_=RemoteObject.from_json(json["set"])
-            if json.get("set", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "value": ("value", RemoteObject.from_json, True),
+            "get": ("get", RemoteObject.from_json, True),
+            "set": ("set_", RemoteObject.from_json, True),
+        }
+
+
+@slotted_dataclass
 class CallArgument:
     """
     Represents function call argument. Either remote object id ``objectId``, primitive ``value``,
@@ -583,17 +578,15 @@ class CallArgument:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallArgument:
-        return cls(
-            value=json["value"] if json.get("value", None) is not None else None,
-            unserializable_value=UnserializableValue.from_json(
-                json["unserializableValue"]
-            )
-            if json.get("unserializableValue", None) is not None
-            else None,
-            object_id=RemoteObjectId.from_json(json["objectId"])
-            if json.get("objectId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "value": ("value", identity, True),
+            "unserializableValue": ("unserializable_value", UnserializableValue, True),
+            "objectId": ("object_id", RemoteObjectId, True),
+        }
 
 
 class ExecutionContextId(int):
@@ -612,7 +605,7 @@ class ExecutionContextId(int):
         return "ExecutionContextId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class ExecutionContextDescription:
     """
     Description of an isolated world.
@@ -648,18 +641,20 @@ class ExecutionContextDescription:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextDescription:
-        return cls(
-            id_=ExecutionContextId.from_json(json["id"]),
-            origin=str(json["origin"]),
-            name=str(json["name"]),
-            unique_id=str(json["uniqueId"]),
-            aux_data=dict(json["auxData"])
-            if json.get("auxData", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", ExecutionContextId, False),
+            "origin": ("origin", str, False),
+            "name": ("name", str, False),
+            "uniqueId": ("unique_id", str, False),
+            "auxData": ("aux_data", dict, True),
+        }
+
+
+@slotted_dataclass
 class ExceptionDetails:
     """
     Detailed information about exception (or error) that was thrown during script compilation or
@@ -720,30 +715,22 @@ class ExceptionDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionDetails:
-        return cls(
-            exception_id=int(json["exceptionId"]),
-            text=str(json["text"]),
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"]),
-            script_id=ScriptId.from_json(json["scriptId"])
-            if json.get("scriptId", None) is not None
-            else None,
-            url=str(json["url"]) if json.get("url", None) is not None else None,
-            stack_trace=StackTrace.from_json(json["stackTrace"])
-            if json.get("stackTrace", None) is not None
-            else None,
-            exception=RemoteObject.from_json(json["exception"])
-            if json.get("exception", None) is not None
-            else None,
-            execution_context_id=ExecutionContextId.from_json(
-                json["executionContextId"]
-            )
-            if json.get("executionContextId", None) is not None
-            else None,
-            exception_meta_data=dict(json["exceptionMetaData"])
-            if json.get("exceptionMetaData", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "exceptionId": ("exception_id", int, False),
+            "text": ("text", str, False),
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, False),
+            "scriptId": ("script_id", ScriptId, True),
+            "url": ("url", str, True),
+            "stackTrace": ("stack_trace", StackTrace.from_json, True),
+            "exception": ("exception", RemoteObject.from_json, True),
+            "executionContextId": ("execution_context_id", ExecutionContextId, True),
+            "exceptionMetaData": ("exception_meta_data", dict, True),
+        }
 
 
 class Timestamp(float):
@@ -778,7 +765,7 @@ class TimeDelta(float):
         return "TimeDelta({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class CallFrame:
     """
     Stack entry for runtime errors and assertions.
@@ -810,16 +797,20 @@ class CallFrame:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallFrame:
-        return cls(
-            function_name=str(json["functionName"]),
-            script_id=ScriptId.from_json(json["scriptId"]),
-            url=str(json["url"]),
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "functionName": ("function_name", str, False),
+            "scriptId": ("script_id", ScriptId, False),
+            "url": ("url", str, False),
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class StackTrace:
     """
     Call frames for assertions or error messages.
@@ -851,18 +842,20 @@ class StackTrace:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StackTrace:
-        return cls(
-            call_frames=[CallFrame.from_json(i) for i in json["callFrames"]],
-            description=str(json["description"])
-            if json.get("description", None) is not None
-            else None,
-            parent=StackTrace.from_json(json["parent"])
-            if json.get("parent", None) is not None
-            else None,
-            parent_id=StackTraceId.from_json(json["parentId"])
-            if json.get("parentId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "callFrames": (
+                "call_frames",
+                lambda v: [CallFrame.from_json(i) for i in v],
+                False,
+            ),
+            "description": ("description", str, True),
+            "parent": ("parent", StackTrace.from_json, True),
+            "parentId": ("parent_id", StackTraceId.from_json, True),
+        }
 
 
 class UniqueDebuggerId(str):
@@ -881,7 +874,7 @@ class UniqueDebuggerId(str):
         return "UniqueDebuggerId({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class StackTraceId:
     """
     If ``debuggerId`` is set stack trace comes from another debugger and can be resolved there. This
@@ -901,12 +894,14 @@ class StackTraceId:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StackTraceId:
-        return cls(
-            id_=str(json["id"]),
-            debugger_id=UniqueDebuggerId.from_json(json["debuggerId"])
-            if json.get("debuggerId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "id": ("id_", str, False),
+            "debuggerId": ("debugger_id", UniqueDebuggerId, True),
+        }
 
 
 def await_promise(
@@ -1578,7 +1573,7 @@ def get_exception_details(
 
 
 @event_class("Runtime.bindingCalled")
-@dataclass
+@slotted_dataclass
 class BindingCalled:
     """
     **EXPERIMENTAL**
@@ -1593,17 +1588,19 @@ class BindingCalled:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BindingCalled:
-        return cls(
-            name=str(json["name"]),
-            payload=str(json["payload"]),
-            execution_context_id=ExecutionContextId.from_json(
-                json["executionContextId"]
-            ),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "payload": ("payload", str, False),
+            "executionContextId": ("execution_context_id", ExecutionContextId, False),
+        }
 
 
 @event_class("Runtime.consoleAPICalled")
-@dataclass
+@slotted_dataclass
 class ConsoleAPICalled:
     """
     Issued when console API was called.
@@ -1628,24 +1625,22 @@ class ConsoleAPICalled:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleAPICalled:
-        return cls(
-            type_=str(json["type"]),
-            args=[RemoteObject.from_json(i) for i in json["args"]],
-            execution_context_id=ExecutionContextId.from_json(
-                json["executionContextId"]
-            ),
-            timestamp=Timestamp.from_json(json["timestamp"]),
-            stack_trace=StackTrace.from_json(json["stackTrace"])
-            if json.get("stackTrace", None) is not None
-            else None,
-            context=str(json["context"])
-            if json.get("context", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "args": ("args", lambda v: [RemoteObject.from_json(i) for i in v], False),
+            "executionContextId": ("execution_context_id", ExecutionContextId, False),
+            "timestamp": ("timestamp", Timestamp, False),
+            "stackTrace": ("stack_trace", StackTrace.from_json, True),
+            "context": ("context", str, True),
+        }
 
 
 @event_class("Runtime.exceptionRevoked")
-@dataclass
+@slotted_dataclass
 class ExceptionRevoked:
     """
     Issued when unhandled exception was revoked.
@@ -1658,11 +1653,18 @@ class ExceptionRevoked:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionRevoked:
-        return cls(reason=str(json["reason"]), exception_id=int(json["exceptionId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "reason": ("reason", str, False),
+            "exceptionId": ("exception_id", int, False),
+        }
 
 
 @event_class("Runtime.exceptionThrown")
-@dataclass
+@slotted_dataclass
 class ExceptionThrown:
     """
     Issued when exception was thrown and unhandled.
@@ -1674,14 +1676,22 @@ class ExceptionThrown:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionThrown:
-        return cls(
-            timestamp=Timestamp.from_json(json["timestamp"]),
-            exception_details=ExceptionDetails.from_json(json["exceptionDetails"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "timestamp": ("timestamp", Timestamp, False),
+            "exceptionDetails": (
+                "exception_details",
+                ExceptionDetails.from_json,
+                False,
+            ),
+        }
 
 
 @event_class("Runtime.executionContextCreated")
-@dataclass
+@slotted_dataclass
 class ExecutionContextCreated:
     """
     Issued when new execution context is created.
@@ -1692,11 +1702,17 @@ class ExecutionContextCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextCreated:
-        return cls(context=ExecutionContextDescription.from_json(json["context"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "context": ("context", ExecutionContextDescription.from_json, False),
+        }
 
 
 @event_class("Runtime.executionContextDestroyed")
-@dataclass
+@slotted_dataclass
 class ExecutionContextDestroyed:
     """
     Issued when execution context is destroyed.
@@ -1709,16 +1725,18 @@ class ExecutionContextDestroyed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextDestroyed:
-        return cls(
-            execution_context_id=ExecutionContextId.from_json(
-                json["executionContextId"]
-            ),
-            execution_context_unique_id=str(json["executionContextUniqueId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "executionContextId": ("execution_context_id", ExecutionContextId, False),
+            "executionContextUniqueId": ("execution_context_unique_id", str, False),
+        }
 
 
 @event_class("Runtime.executionContextsCleared")
-@dataclass
+@slotted_dataclass
 class ExecutionContextsCleared:
     """
     Issued when all executionContexts were cleared in browser
@@ -1726,11 +1744,15 @@ class ExecutionContextsCleared:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextsCleared:
-        return cls()
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {}
 
 
 @event_class("Runtime.inspectRequested")
-@dataclass
+@slotted_dataclass
 class InspectRequested:
     """
     Issued when object should be inspected (for example, as a result of inspect() command line API
@@ -1744,12 +1766,12 @@ class InspectRequested:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectRequested:
-        return cls(
-            object_=RemoteObject.from_json(json["object"]),
-            hints=dict(json["hints"]),
-            execution_context_id=ExecutionContextId.from_json(
-                json["executionContextId"]
-            )
-            if json.get("executionContextId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "object": ("object_", RemoteObject.from_json, False),
+            "hints": ("hints", dict, False),
+            "executionContextId": ("execution_context_id", ExecutionContextId, True),
+        }
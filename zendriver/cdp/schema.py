@@ -6,13 +6,16 @@
 # CDP domain: Schema
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
-@dataclass
+@slotted_dataclass
 class Domain:
     """
     Description of the protocol domain.
@@ -32,10 +35,14 @@ class Domain:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Domain:
-        return cls(
-            name=str(json["name"]),
-            version=str(json["version"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "name": ("name", str, False),
+            "version": ("version", str, False),
+        }
 
 
 def get_domains() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, typing.List[Domain]]:
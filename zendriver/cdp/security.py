@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import network
 from deprecated.sphinx import deprecated  # type: ignore
@@ -69,7 +74,7 @@ class SecurityState(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class CertificateSecurityState:
     """
     Details about the security state of the page certificate.
@@ -156,30 +161,38 @@ class CertificateSecurityState:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CertificateSecurityState:
-        return cls(
-            protocol=str(json["protocol"]),
-            key_exchange=str(json["keyExchange"]),
-            cipher=str(json["cipher"]),
-            certificate=[str(i) for i in json["certificate"]],
-            subject_name=str(json["subjectName"]),
-            issuer=str(json["issuer"]),
-            valid_from=network.TimeSinceEpoch.from_json(json["validFrom"]),
-            valid_to=network.TimeSinceEpoch.from_json(json["validTo"]),
-            certificate_has_weak_signature=bool(json["certificateHasWeakSignature"]),
-            certificate_has_sha1_signature=bool(json["certificateHasSha1Signature"]),
-            modern_ssl=bool(json["modernSSL"]),
-            obsolete_ssl_protocol=bool(json["obsoleteSslProtocol"]),
-            obsolete_ssl_key_exchange=bool(json["obsoleteSslKeyExchange"]),
-            obsolete_ssl_cipher=bool(json["obsoleteSslCipher"]),
-            obsolete_ssl_signature=bool(json["obsoleteSslSignature"]),
-            key_exchange_group=str(json["keyExchangeGroup"])
-            if json.get("keyExchangeGroup", None) is not None
-            else None,
-            mac=str(json["mac"]) if json.get("mac", None) is not None else None,
-            certificate_network_error=str(json["certificateNetworkError"])
-            if json.get("certificateNetworkError", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "protocol": ("protocol", str, False),
+            "keyExchange": ("key_exchange", str, False),
+            "cipher": ("cipher", str, False),
+            "certificate": ("certificate", lambda v: [str(i) for i in v], False),
+            "subjectName": ("subject_name", str, False),
+            "issuer": ("issuer", str, False),
+            "validFrom": ("valid_from", network.TimeSinceEpoch, False),
+            "validTo": ("valid_to", network.TimeSinceEpoch, False),
+            "certificateHasWeakSignature": (
+                "certificate_has_weak_signature",
+                bool,
+                False,
+            ),
+            "certificateHasSha1Signature": (
+                "certificate_has_sha1_signature",
+                bool,
+                False,
+            ),
+            "modernSSL": ("modern_ssl", bool, False),
+            "obsoleteSslProtocol": ("obsolete_ssl_protocol", bool, False),
+            "obsoleteSslKeyExchange": ("obsolete_ssl_key_exchange", bool, False),
+            "obsoleteSslCipher": ("obsolete_ssl_cipher", bool, False),
+            "obsoleteSslSignature": ("obsolete_ssl_signature", bool, False),
+            "keyExchangeGroup": ("key_exchange_group", str, True),
+            "mac": ("mac", str, True),
+            "certificateNetworkError": ("certificate_network_error", str, True),
+        }
 
 
 class SafetyTipStatus(enum.Enum):
@@ -194,7 +207,7 @@ class SafetyTipStatus(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class SafetyTipInfo:
     #: Describes whether the page triggers any safety tips or reputation warnings. Default is unknown.
     safety_tip_status: SafetyTipStatus
@@ -211,15 +224,17 @@ class SafetyTipInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SafetyTipInfo:
-        return cls(
-            safety_tip_status=SafetyTipStatus.from_json(json["safetyTipStatus"]),
-            safe_url=str(json["safeUrl"])
-            if json.get("safeUrl", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "safetyTipStatus": ("safety_tip_status", SafetyTipStatus, False),
+            "safeUrl": ("safe_url", str, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class VisibleSecurityState:
     """
     Security state information about the page.
@@ -249,21 +264,27 @@ class VisibleSecurityState:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VisibleSecurityState:
-        return cls(
-            security_state=SecurityState.from_json(json["securityState"]),
-            security_state_issue_ids=[str(i) for i in json["securityStateIssueIds"]],
-            certificate_security_state=CertificateSecurityState.from_json(
-                json["certificateSecurityState"]
-            )
-            if json.get("certificateSecurityState", None) is not None
-            else None,
-            safety_tip_info=SafetyTipInfo.from_json(json["safetyTipInfo"])
-            if json.get("safetyTipInfo", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "securityState": ("security_state", SecurityState, False),
+            "securityStateIssueIds": (
+                "security_state_issue_ids",
+                lambda v: [str(i) for i in v],
+                False,
+            ),
+            "certificateSecurityState": (
+                "certificate_security_state",
+                CertificateSecurityState.from_json,
+                True,
+            ),
+            "safetyTipInfo": ("safety_tip_info", SafetyTipInfo.from_json, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SecurityStateExplanation:
     """
     An explanation of an factor contributing to the security state.
@@ -304,20 +325,22 @@ class SecurityStateExplanation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityStateExplanation:
-        return cls(
-            security_state=SecurityState.from_json(json["securityState"]),
-            title=str(json["title"]),
-            summary=str(json["summary"]),
-            description=str(json["description"]),
-            mixed_content_type=MixedContentType.from_json(json["mixedContentType"]),
-            certificate=[str(i) for i in json["certificate"]],
-            recommendations=[str(i) for i in json["recommendations"]]
-            if json.get("recommendations", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "securityState": ("security_state", SecurityState, False),
+            "title": ("title", str, False),
+            "summary": ("summary", str, False),
+            "description": ("description", str, False),
+            "mixedContentType": ("mixed_content_type", MixedContentType, False),
+            "certificate": ("certificate", lambda v: [str(i) for i in v], False),
+            "recommendations": ("recommendations", lambda v: [str(i) for i in v], True),
+        }
+
+
+@slotted_dataclass
 class InsecureContentStatus:
     """
     Information about insecure content on the page.
@@ -359,21 +382,31 @@ class InsecureContentStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InsecureContentStatus:
-        return cls(
-            ran_mixed_content=bool(json["ranMixedContent"]),
-            displayed_mixed_content=bool(json["displayedMixedContent"]),
-            contained_mixed_form=bool(json["containedMixedForm"]),
-            ran_content_with_cert_errors=bool(json["ranContentWithCertErrors"]),
-            displayed_content_with_cert_errors=bool(
-                json["displayedContentWithCertErrors"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "ranMixedContent": ("ran_mixed_content", bool, False),
+            "displayedMixedContent": ("displayed_mixed_content", bool, False),
+            "containedMixedForm": ("contained_mixed_form", bool, False),
+            "ranContentWithCertErrors": ("ran_content_with_cert_errors", bool, False),
+            "displayedContentWithCertErrors": (
+                "displayed_content_with_cert_errors",
+                bool,
+                False,
             ),
-            ran_insecure_content_style=SecurityState.from_json(
-                json["ranInsecureContentStyle"]
+            "ranInsecureContentStyle": (
+                "ran_insecure_content_style",
+                SecurityState,
+                False,
             ),
-            displayed_insecure_content_style=SecurityState.from_json(
-                json["displayedInsecureContentStyle"]
+            "displayedInsecureContentStyle": (
+                "displayed_insecure_content_style",
+                SecurityState,
+                False,
             ),
-        )
+        }
 
 
 class CertificateErrorAction(enum.Enum):
@@ -475,7 +508,7 @@ def set_override_certificate_errors(
 
 @deprecated(version="1.3")
 @event_class("Security.certificateError")
-@dataclass
+@slotted_dataclass
 class CertificateError:
     """
     There is a certificate error. If overriding certificate errors is enabled, then it should be
@@ -493,15 +526,19 @@ class CertificateError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CertificateError:
-        return cls(
-            event_id=int(json["eventId"]),
-            error_type=str(json["errorType"]),
-            request_url=str(json["requestURL"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "eventId": ("event_id", int, False),
+            "errorType": ("error_type", str, False),
+            "requestURL": ("request_url", str, False),
+        }
 
 
 @event_class("Security.visibleSecurityStateChanged")
-@dataclass
+@slotted_dataclass
 class VisibleSecurityStateChanged:
     """
     **EXPERIMENTAL**
@@ -514,16 +551,22 @@ class VisibleSecurityStateChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VisibleSecurityStateChanged:
-        return cls(
-            visible_security_state=VisibleSecurityState.from_json(
-                json["visibleSecurityState"]
-            )
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "visibleSecurityState": (
+                "visible_security_state",
+                VisibleSecurityState.from_json,
+                False,
+            ),
+        }
 
 
 @deprecated(version="1.3")
 @event_class("Security.securityStateChanged")
-@dataclass
+@slotted_dataclass
 class SecurityStateChanged:
     """
     The security state of the page changed. No longer being sent.
@@ -543,16 +586,22 @@ class SecurityStateChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityStateChanged:
-        return cls(
-            security_state=SecurityState.from_json(json["securityState"]),
-            scheme_is_cryptographic=bool(json["schemeIsCryptographic"]),
-            explanations=[
-                SecurityStateExplanation.from_json(i) for i in json["explanations"]
-            ],
-            insecure_content_status=InsecureContentStatus.from_json(
-                json["insecureContentStatus"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "securityState": ("security_state", SecurityState, False),
+            "schemeIsCryptographic": ("scheme_is_cryptographic", bool, False),
+            "explanations": (
+                "explanations",
+                lambda v: [SecurityStateExplanation.from_json(i) for i in v],
+                False,
             ),
-            summary=str(json["summary"])
-            if json.get("summary", None) is not None
-            else None,
-        )
+            "insecureContentStatus": (
+                "insecure_content_status",
+                InsecureContentStatus.from_json,
+                False,
+            ),
+            "summary": ("summary", str, True),
+        }
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import target
 
@@ -26,7 +31,7 @@ class RegistrationID(str):
         return "RegistrationID({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class ServiceWorkerRegistration:
     """
     ServiceWorker registration.
@@ -47,11 +52,15 @@ class ServiceWorkerRegistration:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerRegistration:
-        return cls(
-            registration_id=RegistrationID.from_json(json["registrationId"]),
-            scope_url=str(json["scopeURL"]),
-            is_deleted=bool(json["isDeleted"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "registrationId": ("registration_id", RegistrationID, False),
+            "scopeURL": ("scope_url", str, False),
+            "isDeleted": ("is_deleted", bool, False),
+        }
 
 
 class ServiceWorkerVersionRunningStatus(enum.Enum):
@@ -84,7 +93,7 @@ class ServiceWorkerVersionStatus(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ServiceWorkerVersion:
     """
     ServiceWorker version.
@@ -134,35 +143,33 @@ class ServiceWorkerVersion:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerVersion:
-        return cls(
-            version_id=str(json["versionId"]),
-            registration_id=RegistrationID.from_json(json["registrationId"]),
-            script_url=str(json["scriptURL"]),
-            running_status=ServiceWorkerVersionRunningStatus.from_json(
-                json["runningStatus"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "versionId": ("version_id", str, False),
+            "registrationId": ("registration_id", RegistrationID, False),
+            "scriptURL": ("script_url", str, False),
+            "runningStatus": (
+                "running_status",
+                ServiceWorkerVersionRunningStatus,
+                False,
+            ),
+            "status": ("status", ServiceWorkerVersionStatus, False),
+            "scriptLastModified": ("script_last_modified", float, True),
+            "scriptResponseTime": ("script_response_time", float, True),
+            "controlledClients": (
+                "controlled_clients",
+                lambda v: [target.TargetID(i) for i in v],
+                True,
             ),
-            status=ServiceWorkerVersionStatus.from_json(json["status"]),
-            script_last_modified=float(json["scriptLastModified"])
-            if json.get("scriptLastModified", None) is not None
-            else None,
-            script_response_time=float(json["scriptResponseTime"])
-            if json.get("scriptResponseTime", None) is not None
-            else None,
-            controlled_clients=[
-                target.TargetID.from_json(i) for i in json["controlledClients"]
-            ]
-            if json.get("controlledClients", None) is not None
-            else None,
-            target_id=target.TargetID.from_json(json["targetId"])
-            if json.get("targetId", None) is not None
-            else None,
-            router_rules=str(json["routerRules"])
-            if json.get("routerRules", None) is not None
-            else None,
-        )
-
-
-@dataclass
+            "targetId": ("target_id", target.TargetID, True),
+            "routerRules": ("router_rules", str, True),
+        }
+
+
+@slotted_dataclass
 class ServiceWorkerErrorMessage:
     """
     ServiceWorker error message.
@@ -192,14 +199,18 @@ class ServiceWorkerErrorMessage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerErrorMessage:
-        return cls(
-            error_message=str(json["errorMessage"]),
-            registration_id=RegistrationID.from_json(json["registrationId"]),
-            version_id=str(json["versionId"]),
-            source_url=str(json["sourceURL"]),
-            line_number=int(json["lineNumber"]),
-            column_number=int(json["columnNumber"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "errorMessage": ("error_message", str, False),
+            "registrationId": ("registration_id", RegistrationID, False),
+            "versionId": ("version_id", str, False),
+            "sourceURL": ("source_url", str, False),
+            "lineNumber": ("line_number", int, False),
+            "columnNumber": ("column_number", int, False),
+        }
 
 
 def deliver_push_message(
@@ -378,38 +389,60 @@ def update_registration(
 
 
 @event_class("ServiceWorker.workerErrorReported")
-@dataclass
+@slotted_dataclass
 class WorkerErrorReported:
     error_message: ServiceWorkerErrorMessage
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerErrorReported:
-        return cls(
-            error_message=ServiceWorkerErrorMessage.from_json(json["errorMessage"])
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "errorMessage": (
+                "error_message",
+                ServiceWorkerErrorMessage.from_json,
+                False,
+            ),
+        }
 
 
 @event_class("ServiceWorker.workerRegistrationUpdated")
-@dataclass
+@slotted_dataclass
 class WorkerRegistrationUpdated:
     registrations: typing.List[ServiceWorkerRegistration]
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerRegistrationUpdated:
-        return cls(
-            registrations=[
-                ServiceWorkerRegistration.from_json(i) for i in json["registrations"]
-            ]
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "registrations": (
+                "registrations",
+                lambda v: [ServiceWorkerRegistration.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
 @event_class("ServiceWorker.workerVersionUpdated")
-@dataclass
+@slotted_dataclass
 class WorkerVersionUpdated:
     versions: typing.List[ServiceWorkerVersion]
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerVersionUpdated:
-        return cls(
-            versions=[ServiceWorkerVersion.from_json(i) for i in json["versions"]]
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "versions": (
+                "versions",
+                lambda v: [ServiceWorkerVersion.from_json(i) for i in v],
+                False,
+            ),
+        }
@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import browser
 from . import network
@@ -56,7 +61,7 @@ class StorageType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class UsageForType:
     """
     Usage for a storage type.
@@ -76,13 +81,17 @@ class UsageForType:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> UsageForType:
-        return cls(
-            storage_type=StorageType.from_json(json["storageType"]),
-            usage=float(json["usage"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "storageType": ("storage_type", StorageType, False),
+            "usage": ("usage", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class TrustTokens:
     """
     Pair of issuer origin and number of available (signed, but not used) Trust
@@ -101,10 +110,14 @@ class TrustTokens:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TrustTokens:
-        return cls(
-            issuer_origin=str(json["issuerOrigin"]),
-            count=float(json["count"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "issuerOrigin": ("issuer_origin", str, False),
+            "count": ("count", float, False),
+        }
 
 
 class InterestGroupAuctionId(str):
@@ -218,7 +231,7 @@ class SharedStorageAccessType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class SharedStorageEntry:
     """
     Struct for a single key-value pair in an origin's shared storage.
@@ -236,13 +249,17 @@ class SharedStorageEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageEntry:
-        return cls(
-            key=str(json["key"]),
-            value=str(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", str, False),
+            "value": ("value", str, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class SharedStorageMetadata:
     """
     Details for an origin's shared storage.
@@ -271,15 +288,19 @@ class SharedStorageMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageMetadata:
-        return cls(
-            creation_time=network.TimeSinceEpoch.from_json(json["creationTime"]),
-            length=int(json["length"]),
-            remaining_budget=float(json["remainingBudget"]),
-            bytes_used=int(json["bytesUsed"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "creationTime": ("creation_time", network.TimeSinceEpoch, False),
+            "length": ("length", int, False),
+            "remainingBudget": ("remaining_budget", float, False),
+            "bytesUsed": ("bytes_used", int, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SharedStorageReportingMetadata:
     """
     Pair of reporting metadata details for a candidate URL for ``selectURL()``.
@@ -297,13 +318,17 @@ class SharedStorageReportingMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageReportingMetadata:
-        return cls(
-            event_type=str(json["eventType"]),
-            reporting_url=str(json["reportingUrl"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "eventType": ("event_type", str, False),
+            "reportingUrl": ("reporting_url", str, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SharedStorageUrlWithMetadata:
     """
     Bundles a candidate URL with its reporting metadata.
@@ -323,16 +348,21 @@ class SharedStorageUrlWithMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageUrlWithMetadata:
-        return cls(
-            url=str(json["url"]),
-            reporting_metadata=[
-                SharedStorageReportingMetadata.from_json(i)
-                for i in json["reportingMetadata"]
-            ],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "url": ("url", str, False),
+            "reportingMetadata": (
+                "reporting_metadata",
+                lambda v: [SharedStorageReportingMetadata.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class SharedStorageAccessParams:
     """
     Bundles the parameters for shared storage access events whose
@@ -407,28 +437,23 @@ class SharedStorageAccessParams:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageAccessParams:
-        return cls(
-            script_source_url=str(json["scriptSourceUrl"])
-            if json.get("scriptSourceUrl", None) is not None
-            else None,
-            operation_name=str(json["operationName"])
-            if json.get("operationName", None) is not None
-            else None,
-            serialized_data=str(json["serializedData"])
-            if json.get("serializedData", None) is not None
-            else None,
-            urls_with_metadata=[
-                SharedStorageUrlWithMetadata.from_json(i)
-                for i in json["urlsWithMetadata"]
-            ]
-            if json.get("urlsWithMetadata", None) is not None
-            else None,
-            key=str(json["key"]) if json.get("key", None) is not None else None,
-            value=str(json["value"]) if json.get("value", None) is not None else None,
-            ignore_if_present=bool(json["ignoreIfPresent"])
-            if json.get("ignoreIfPresent", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "scriptSourceUrl": ("script_source_url", str, True),
+            "operationName": ("operation_name", str, True),
+            "serializedData": ("serialized_data", str, True),
+            "urlsWithMetadata": (
+                "urls_with_metadata",
+                lambda v: [SharedStorageUrlWithMetadata.from_json(i) for i in v],
+                True,
+            ),
+            "key": ("key", str, True),
+            "value": ("value", str, True),
+            "ignoreIfPresent": ("ignore_if_present", bool, True),
+        }
 
 
 class StorageBucketsDurability(enum.Enum):
@@ -443,7 +468,7 @@ class StorageBucketsDurability(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class StorageBucket:
     storage_key: SerializedStorageKey
 
@@ -459,13 +484,17 @@ class StorageBucket:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageBucket:
-        return cls(
-            storage_key=SerializedStorageKey.from_json(json["storageKey"]),
-            name=str(json["name"]) if json.get("name", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "storageKey": ("storage_key", SerializedStorageKey, False),
+            "name": ("name", str, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class StorageBucketInfo:
     bucket: StorageBucket
 
@@ -492,14 +521,18 @@ class StorageBucketInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageBucketInfo:
-        return cls(
-            bucket=StorageBucket.from_json(json["bucket"]),
-            id_=str(json["id"]),
-            expiration=network.TimeSinceEpoch.from_json(json["expiration"]),
-            quota=float(json["quota"]),
-            persistent=bool(json["persistent"]),
-            durability=StorageBucketsDurability.from_json(json["durability"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "bucket": ("bucket", StorageBucket.from_json, False),
+            "id": ("id_", str, False),
+            "expiration": ("expiration", network.TimeSinceEpoch, False),
+            "quota": ("quota", float, False),
+            "persistent": ("persistent", bool, False),
+            "durability": ("durability", StorageBucketsDurability, False),
+        }
 
 
 class AttributionReportingSourceType(enum.Enum):
@@ -550,7 +583,7 @@ class SignedInt64AsBase10(str):
         return "SignedInt64AsBase10({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingFilterDataEntry:
     key: str
 
@@ -564,13 +597,17 @@ class AttributionReportingFilterDataEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterDataEntry:
-        return cls(
-            key=str(json["key"]),
-            values=[str(i) for i in json["values"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", str, False),
+            "values": ("values", lambda v: [str(i) for i in v], False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingFilterConfig:
     filter_values: typing.List[AttributionReportingFilterDataEntry]
 
@@ -586,18 +623,21 @@ class AttributionReportingFilterConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterConfig:
-        return cls(
-            filter_values=[
-                AttributionReportingFilterDataEntry.from_json(i)
-                for i in json["filterValues"]
-            ],
-            lookback_window=int(json["lookbackWindow"])
-            if json.get("lookbackWindow", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "filterValues": (
+                "filter_values",
+                lambda v: [AttributionReportingFilterDataEntry.from_json(i) for i in v],
+                False,
+            ),
+            "lookbackWindow": ("lookback_window", int, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingFilterPair:
     filters: typing.List[AttributionReportingFilterConfig]
 
@@ -611,18 +651,25 @@ class AttributionReportingFilterPair:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterPair:
-        return cls(
-            filters=[
-                AttributionReportingFilterConfig.from_json(i) for i in json["filters"]
-            ],
-            not_filters=[
-                AttributionReportingFilterConfig.from_json(i)
-                for i in json["notFilters"]
-            ],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "filters": (
+                "filters",
+                lambda v: [AttributionReportingFilterConfig.from_json(i) for i in v],
+                False,
+            ),
+            "notFilters": (
+                "not_filters",
+                lambda v: [AttributionReportingFilterConfig.from_json(i) for i in v],
+                False,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingAggregationKeysEntry:
     key: str
 
@@ -636,13 +683,17 @@ class AttributionReportingAggregationKeysEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregationKeysEntry:
-        return cls(
-            key=str(json["key"]),
-            value=UnsignedInt128AsBase16.from_json(json["value"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", str, False),
+            "value": ("value", UnsignedInt128AsBase16, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingEventReportWindows:
     #: duration in seconds
     start: int
@@ -658,13 +709,17 @@ class AttributionReportingEventReportWindows:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingEventReportWindows:
-        return cls(
-            start=int(json["start"]),
-            ends=[int(i) for i in json["ends"]],
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "start": ("start", int, False),
+            "ends": ("ends", lambda v: [int(i) for i in v], False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AttributionReportingTriggerSpec:
     #: number instead of integer because not all uint32 can be represented by
     #: int
@@ -680,12 +735,18 @@ class AttributionReportingTriggerSpec:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerSpec:
-        return cls(
-            trigger_data=[float(i) for i in json["triggerData"]],
-            event_report_windows=AttributionReportingEventReportWindows.from_json(
-                json["eventReportWindows"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "triggerData": ("trigger_data", lambda v: [float(i) for i in v], False),
+            "eventReportWindows": (
+                "event_report_windows",
+                AttributionReportingEventReportWindows.from_json,
+                False,
             ),
-        )
+        }
 
 
 class AttributionReportingTriggerDataMatching(enum.Enum):
@@ -700,7 +761,7 @@ class AttributionReportingTriggerDataMatching(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingAggregatableDebugReportingData:
     key_piece: UnsignedInt128AsBase16
 
@@ -721,14 +782,18 @@ class AttributionReportingAggregatableDebugReportingData:
     def from_json(
         cls, json: T_JSON_DICT
     ) -> AttributionReportingAggregatableDebugReportingData:
-        return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json["keyPiece"]),
-            value=float(json["value"]),
-            types=[str(i) for i in json["types"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "keyPiece": ("key_piece", UnsignedInt128AsBase16, False),
+            "value": ("value", float, False),
+            "types": ("types", lambda v: [str(i) for i in v], False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingAggregatableDebugReportingConfig:
     key_piece: UnsignedInt128AsBase16
 
@@ -754,22 +819,30 @@ class AttributionReportingAggregatableDebugReportingConfig:
     def from_json(
         cls, json: T_JSON_DICT
     ) -> AttributionReportingAggregatableDebugReportingConfig:
-        return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json["keyPiece"]),
-            debug_data=[
-                AttributionReportingAggregatableDebugReportingData.from_json(i)
-                for i in json["debugData"]
-            ],
-            budget=float(json["budget"])
-            if json.get("budget", None) is not None
-            else None,
-            aggregation_coordinator_origin=str(json["aggregationCoordinatorOrigin"])
-            if json.get("aggregationCoordinatorOrigin", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "keyPiece": ("key_piece", UnsignedInt128AsBase16, False),
+            "debugData": (
+                "debug_data",
+                lambda v: [
+                    AttributionReportingAggregatableDebugReportingData.from_json(i)
+                    for i in v
+                ],
+                False,
+            ),
+            "budget": ("budget", float, True),
+            "aggregationCoordinatorOrigin": (
+                "aggregation_coordinator_origin",
+                str,
+                True,
+            ),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionScopesData:
     values: typing.List[str]
 
@@ -788,14 +861,18 @@ class AttributionScopesData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionScopesData:
-        return cls(
-            values=[str(i) for i in json["values"]],
-            limit=float(json["limit"]),
-            max_event_states=float(json["maxEventStates"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "values": ("values", lambda v: [str(i) for i in v], False),
+            "limit": ("limit", float, False),
+            "maxEventStates": ("max_event_states", float, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingSourceRegistration:
     time: network.TimeSinceEpoch
 
@@ -865,45 +942,60 @@ class AttributionReportingSourceRegistration:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingSourceRegistration:
-        return cls(
-            time=network.TimeSinceEpoch.from_json(json["time"]),
-            expiry=int(json["expiry"]),
-            trigger_specs=[
-                AttributionReportingTriggerSpec.from_json(i)
-                for i in json["triggerSpecs"]
-            ],
-            aggregatable_report_window=int(json["aggregatableReportWindow"]),
-            type_=AttributionReportingSourceType.from_json(json["type"]),
-            source_origin=str(json["sourceOrigin"]),
-            reporting_origin=str(json["reportingOrigin"]),
-            destination_sites=[str(i) for i in json["destinationSites"]],
-            event_id=UnsignedInt64AsBase10.from_json(json["eventId"]),
-            priority=SignedInt64AsBase10.from_json(json["priority"]),
-            filter_data=[
-                AttributionReportingFilterDataEntry.from_json(i)
-                for i in json["filterData"]
-            ],
-            aggregation_keys=[
-                AttributionReportingAggregationKeysEntry.from_json(i)
-                for i in json["aggregationKeys"]
-            ],
-            trigger_data_matching=AttributionReportingTriggerDataMatching.from_json(
-                json["triggerDataMatching"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "time": ("time", network.TimeSinceEpoch, False),
+            "expiry": ("expiry", int, False),
+            "triggerSpecs": (
+                "trigger_specs",
+                lambda v: [AttributionReportingTriggerSpec.from_json(i) for i in v],
+                False,
             ),
-            destination_limit_priority=SignedInt64AsBase10.from_json(
-                json["destinationLimitPriority"]
+            "aggregatableReportWindow": ("aggregatable_report_window", int, False),
+            "type": ("type_", AttributionReportingSourceType, False),
+            "sourceOrigin": ("source_origin", str, False),
+            "reportingOrigin": ("reporting_origin", str, False),
+            "destinationSites": (
+                "destination_sites",
+                lambda v: [str(i) for i in v],
+                False,
             ),
-            aggregatable_debug_reporting_config=AttributionReportingAggregatableDebugReportingConfig.from_json(
-                json["aggregatableDebugReportingConfig"]
+            "eventId": ("event_id", UnsignedInt64AsBase10, False),
+            "priority": ("priority", SignedInt64AsBase10, False),
+            "filterData": (
+                "filter_data",
+                lambda v: [AttributionReportingFilterDataEntry.from_json(i) for i in v],
+                False,
             ),
-            max_event_level_reports=int(json["maxEventLevelReports"]),
-            debug_key=UnsignedInt64AsBase10.from_json(json["debugKey"])
-            if json.get("debugKey", None) is not None
-            else None,
-            scopes_data=AttributionScopesData.from_json(json["scopesData"])
-            if json.get("scopesData", None) is not None
-            else None,
-        )
+            "aggregationKeys": (
+                "aggregation_keys",
+                lambda v: [
+                    AttributionReportingAggregationKeysEntry.from_json(i) for i in v
+                ],
+                False,
+            ),
+            "triggerDataMatching": (
+                "trigger_data_matching",
+                AttributionReportingTriggerDataMatching,
+                False,
+            ),
+            "destinationLimitPriority": (
+                "destination_limit_priority",
+                SignedInt64AsBase10,
+                False,
+            ),
+            "aggregatableDebugReportingConfig": (
+                "aggregatable_debug_reporting_config",
+                AttributionReportingAggregatableDebugReportingConfig.from_json,
+                False,
+            ),
+            "maxEventLevelReports": ("max_event_level_reports", int, False),
+            "debugKey": ("debug_key", UnsignedInt64AsBase10, True),
+            "scopesData": ("scopes_data", AttributionScopesData.from_json, True),
+        }
 
 
 class AttributionReportingSourceRegistrationResult(enum.Enum):
@@ -946,7 +1038,7 @@ class AttributionReportingSourceRegistrationTimeConfig(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingAggregatableValueDictEntry:
     key: str
 
@@ -967,14 +1059,18 @@ class AttributionReportingAggregatableValueDictEntry:
     def from_json(
         cls, json: T_JSON_DICT
     ) -> AttributionReportingAggregatableValueDictEntry:
-        return cls(
-            key=str(json["key"]),
-            value=float(json["value"]),
-            filtering_id=UnsignedInt64AsBase10.from_json(json["filteringId"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "key": ("key", str, False),
+            "value": ("value", float, False),
+            "filteringId": ("filtering_id", UnsignedInt64AsBase10, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AttributionReportingAggregatableValueEntry:
     values: typing.List[AttributionReportingAggregatableValueDictEntry]
 
@@ -988,16 +1084,24 @@ class AttributionReportingAggregatableValueEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableValueEntry:
-        return cls(
-            values=[
-                AttributionReportingAggregatableValueDictEntry.from_json(i)
-                for i in json["values"]
-            ],
-            filters=AttributionReportingFilterPair.from_json(json["filters"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "values": (
+                "values",
+                lambda v: [
+                    AttributionReportingAggregatableValueDictEntry.from_json(i)
+                    for i in v
+                ],
+                False,
+            ),
+            "filters": ("filters", AttributionReportingFilterPair.from_json, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingEventTriggerData:
     data: UnsignedInt64AsBase10
 
@@ -1018,17 +1122,19 @@ class AttributionReportingEventTriggerData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingEventTriggerData:
-        return cls(
-            data=UnsignedInt64AsBase10.from_json(json["data"]),
-            priority=SignedInt64AsBase10.from_json(json["priority"]),
-            filters=AttributionReportingFilterPair.from_json(json["filters"]),
-            dedup_key=UnsignedInt64AsBase10.from_json(json["dedupKey"])
-            if json.get("dedupKey", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "data": ("data", UnsignedInt64AsBase10, False),
+            "priority": ("priority", SignedInt64AsBase10, False),
+            "filters": ("filters", AttributionReportingFilterPair.from_json, False),
+            "dedupKey": ("dedup_key", UnsignedInt64AsBase10, True),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingAggregatableTriggerData:
     key_piece: UnsignedInt128AsBase16
 
@@ -1047,14 +1153,18 @@ class AttributionReportingAggregatableTriggerData:
     def from_json(
         cls, json: T_JSON_DICT
     ) -> AttributionReportingAggregatableTriggerData:
-        return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json["keyPiece"]),
-            source_keys=[str(i) for i in json["sourceKeys"]],
-            filters=AttributionReportingFilterPair.from_json(json["filters"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "keyPiece": ("key_piece", UnsignedInt128AsBase16, False),
+            "sourceKeys": ("source_keys", lambda v: [str(i) for i in v], False),
+            "filters": ("filters", AttributionReportingFilterPair.from_json, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AttributionReportingAggregatableDedupKey:
     filters: AttributionReportingFilterPair
 
@@ -1069,15 +1179,17 @@ class AttributionReportingAggregatableDedupKey:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableDedupKey:
-        return cls(
-            filters=AttributionReportingFilterPair.from_json(json["filters"]),
-            dedup_key=UnsignedInt64AsBase10.from_json(json["dedupKey"])
-            if json.get("dedupKey", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "filters": ("filters", AttributionReportingFilterPair.from_json, False),
+            "dedupKey": ("dedup_key", UnsignedInt64AsBase10, True),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class AttributionReportingTriggerRegistration:
     filters: AttributionReportingFilterPair
 
@@ -1139,45 +1251,65 @@ class AttributionReportingTriggerRegistration:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerRegistration:
-        return cls(
-            filters=AttributionReportingFilterPair.from_json(json["filters"]),
-            aggregatable_dedup_keys=[
-                AttributionReportingAggregatableDedupKey.from_json(i)
-                for i in json["aggregatableDedupKeys"]
-            ],
-            event_trigger_data=[
-                AttributionReportingEventTriggerData.from_json(i)
-                for i in json["eventTriggerData"]
-            ],
-            aggregatable_trigger_data=[
-                AttributionReportingAggregatableTriggerData.from_json(i)
-                for i in json["aggregatableTriggerData"]
-            ],
-            aggregatable_values=[
-                AttributionReportingAggregatableValueEntry.from_json(i)
-                for i in json["aggregatableValues"]
-            ],
-            aggregatable_filtering_id_max_bytes=int(
-                json["aggregatableFilteringIdMaxBytes"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "filters": ("filters", AttributionReportingFilterPair.from_json, False),
+            "aggregatableDedupKeys": (
+                "aggregatable_dedup_keys",
+                lambda v: [
+                    AttributionReportingAggregatableDedupKey.from_json(i) for i in v
+                ],
+                False,
             ),
-            debug_reporting=bool(json["debugReporting"]),
-            source_registration_time_config=AttributionReportingSourceRegistrationTimeConfig.from_json(
-                json["sourceRegistrationTimeConfig"]
+            "eventTriggerData": (
+                "event_trigger_data",
+                lambda v: [
+                    AttributionReportingEventTriggerData.from_json(i) for i in v
+                ],
+                False,
             ),
-            aggregatable_debug_reporting_config=AttributionReportingAggregatableDebugReportingConfig.from_json(
-                json["aggregatableDebugReportingConfig"]
+            "aggregatableTriggerData": (
+                "aggregatable_trigger_data",
+                lambda v: [
+                    AttributionReportingAggregatableTriggerData.from_json(i) for i in v
+                ],
+                False,
             ),
-            scopes=[str(i) for i in json["scopes"]],
-            debug_key=UnsignedInt64AsBase10.from_json(json["debugKey"])
-            if json.get("debugKey", None) is not None
-            else None,
-            aggregation_coordinator_origin=str(json["aggregationCoordinatorOrigin"])
-            if json.get("aggregationCoordinatorOrigin", None) is not None
-            else None,
-            trigger_context_id=str(json["triggerContextId"])
-            if json.get("triggerContextId", None) is not None
-            else None,
-        )
+            "aggregatableValues": (
+                "aggregatable_values",
+                lambda v: [
+                    AttributionReportingAggregatableValueEntry.from_json(i) for i in v
+                ],
+                False,
+            ),
+            "aggregatableFilteringIdMaxBytes": (
+                "aggregatable_filtering_id_max_bytes",
+                int,
+                False,
+            ),
+            "debugReporting": ("debug_reporting", bool, False),
+            "sourceRegistrationTimeConfig": (
+                "source_registration_time_config",
+                AttributionReportingSourceRegistrationTimeConfig,
+                False,
+            ),
+            "aggregatableDebugReportingConfig": (
+                "aggregatable_debug_reporting_config",
+                AttributionReportingAggregatableDebugReportingConfig.from_json,
+                False,
+            ),
+            "scopes": ("scopes", lambda v: [str(i) for i in v], False),
+            "debugKey": ("debug_key", UnsignedInt64AsBase10, True),
+            "aggregationCoordinatorOrigin": (
+                "aggregation_coordinator_origin",
+                str,
+                True,
+            ),
+            "triggerContextId": ("trigger_context_id", str, True),
+        }
 
 
 class AttributionReportingEventLevelResult(enum.Enum):
@@ -1234,7 +1366,7 @@ class AttributionReportingAggregatableResult(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class RelatedWebsiteSet:
     """
     A single Related Website Set object.
@@ -1258,11 +1390,19 @@ class RelatedWebsiteSet:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RelatedWebsiteSet:
-        return cls(
-            primary_sites=[str(i) for i in json["primarySites"]],
-            associated_sites=[str(i) for i in json["associatedSites"]],
-            service_sites=[str(i) for i in json["serviceSites"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "primarySites": ("primary_sites", lambda v: [str(i) for i in v], False),
+            "associatedSites": (
+                "associated_sites",
+                lambda v: [str(i) for i in v],
+                False,
+            ),
+            "serviceSites": ("service_sites", lambda v: [str(i) for i in v], False),
+        }
 
 
 def get_storage_key_for_frame(
@@ -1955,7 +2095,7 @@ def get_related_website_sets() -> (
 
 
 @event_class("Storage.cacheStorageContentUpdated")
-@dataclass
+@slotted_dataclass
 class CacheStorageContentUpdated:
     """
     A cache's contents have been modified.
@@ -1972,16 +2112,20 @@ class CacheStorageContentUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CacheStorageContentUpdated:
-        return cls(
-            origin=str(json["origin"]),
-            storage_key=str(json["storageKey"]),
-            bucket_id=str(json["bucketId"]),
-            cache_name=str(json["cacheName"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "storageKey": ("storage_key", str, False),
+            "bucketId": ("bucket_id", str, False),
+            "cacheName": ("cache_name", str, False),
+        }
 
 
 @event_class("Storage.cacheStorageListUpdated")
-@dataclass
+@slotted_dataclass
 class CacheStorageListUpdated:
     """
     A cache has been added/deleted.
@@ -1996,15 +2140,19 @@ class CacheStorageListUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CacheStorageListUpdated:
-        return cls(
-            origin=str(json["origin"]),
-            storage_key=str(json["storageKey"]),
-            bucket_id=str(json["bucketId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "storageKey": ("storage_key", str, False),
+            "bucketId": ("bucket_id", str, False),
+        }
 
 
 @event_class("Storage.indexedDBContentUpdated")
-@dataclass
+@slotted_dataclass
 class IndexedDBContentUpdated:
     """
     The origin's IndexedDB object store has been modified.
@@ -2023,17 +2171,21 @@ class IndexedDBContentUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IndexedDBContentUpdated:
-        return cls(
-            origin=str(json["origin"]),
-            storage_key=str(json["storageKey"]),
-            bucket_id=str(json["bucketId"]),
-            database_name=str(json["databaseName"]),
-            object_store_name=str(json["objectStoreName"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "storageKey": ("storage_key", str, False),
+            "bucketId": ("bucket_id", str, False),
+            "databaseName": ("database_name", str, False),
+            "objectStoreName": ("object_store_name", str, False),
+        }
 
 
 @event_class("Storage.indexedDBListUpdated")
-@dataclass
+@slotted_dataclass
 class IndexedDBListUpdated:
     """
     The origin's IndexedDB database list has been modified.
@@ -2048,15 +2200,19 @@ class IndexedDBListUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IndexedDBListUpdated:
-        return cls(
-            origin=str(json["origin"]),
-            storage_key=str(json["storageKey"]),
-            bucket_id=str(json["bucketId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "origin": ("origin", str, False),
+            "storageKey": ("storage_key", str, False),
+            "bucketId": ("bucket_id", str, False),
+        }
 
 
 @event_class("Storage.interestGroupAccessed")
-@dataclass
+@slotted_dataclass
 class InterestGroupAccessed:
     """
     One of the interest groups was accessed. Note that these events are global
@@ -2078,26 +2234,24 @@ class InterestGroupAccessed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterestGroupAccessed:
-        return cls(
-            access_time=network.TimeSinceEpoch.from_json(json["accessTime"]),
-            type_=InterestGroupAccessType.from_json(json["type"]),
-            owner_origin=str(json["ownerOrigin"]),
-            name=str(json["name"]),
-            component_seller_origin=str(json["componentSellerOrigin"])
-            if json.get("componentSellerOrigin", None) is not None
-            else None,
-            bid=float(json["bid"]) if json.get("bid", None) is not None else None,
-            bid_currency=str(json["bidCurrency"])
-            if json.get("bidCurrency", None) is not None
-            else None,
-            unique_auction_id=InterestGroupAuctionId.from_json(json["uniqueAuctionId"])
-            if json.get("uniqueAuctionId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "accessTime": ("access_time", network.TimeSinceEpoch, False),
+            "type": ("type_", InterestGroupAccessType, False),
+            "ownerOrigin": ("owner_origin", str, False),
+            "name": ("name", str, False),
+            "componentSellerOrigin": ("component_seller_origin", str, True),
+            "bid": ("bid", float, True),
+            "bidCurrency": ("bid_currency", str, True),
+            "uniqueAuctionId": ("unique_auction_id", InterestGroupAuctionId, True),
+        }
 
 
 @event_class("Storage.interestGroupAuctionEventOccurred")
-@dataclass
+@slotted_dataclass
 class InterestGroupAuctionEventOccurred:
     """
     An auction involving interest groups is taking place. These events are
@@ -2114,21 +2268,21 @@ class InterestGroupAuctionEventOccurred:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterestGroupAuctionEventOccurred:
-        return cls(
-            event_time=network.TimeSinceEpoch.from_json(json["eventTime"]),
-            type_=InterestGroupAuctionEventType.from_json(json["type"]),
-            unique_auction_id=InterestGroupAuctionId.from_json(json["uniqueAuctionId"]),
-            parent_auction_id=InterestGroupAuctionId.from_json(json["parentAuctionId"])
-            if json.get("parentAuctionId", None) is not None
-            else None,
-            auction_config=dict(json["auctionConfig"])
-            if json.get("auctionConfig", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "eventTime": ("event_time", network.TimeSinceEpoch, False),
+            "type": ("type_", InterestGroupAuctionEventType, False),
+            "uniqueAuctionId": ("unique_auction_id", InterestGroupAuctionId, False),
+            "parentAuctionId": ("parent_auction_id", InterestGroupAuctionId, True),
+            "auctionConfig": ("auction_config", dict, True),
+        }
 
 
 @event_class("Storage.interestGroupAuctionNetworkRequestCreated")
-@dataclass
+@slotted_dataclass
 class InterestGroupAuctionNetworkRequestCreated:
     """
     Specifies which auctions a particular network fetch may be related to, and
@@ -2146,15 +2300,23 @@ class InterestGroupAuctionNetworkRequestCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterestGroupAuctionNetworkRequestCreated:
-        return cls(
-            type_=InterestGroupAuctionFetchType.from_json(json["type"]),
-            request_id=network.RequestId.from_json(json["requestId"]),
-            auctions=[InterestGroupAuctionId.from_json(i) for i in json["auctions"]],
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", InterestGroupAuctionFetchType, False),
+            "requestId": ("request_id", network.RequestId, False),
+            "auctions": (
+                "auctions",
+                lambda v: [InterestGroupAuctionId(i) for i in v],
+                False,
+            ),
+        }
 
 
 @event_class("Storage.sharedStorageAccessed")
-@dataclass
+@slotted_dataclass
 class SharedStorageAccessed:
     """
     Shared storage was accessed by the associated page.
@@ -2175,37 +2337,53 @@ class SharedStorageAccessed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageAccessed:
-        return cls(
-            access_time=network.TimeSinceEpoch.from_json(json["accessTime"]),
-            type_=SharedStorageAccessType.from_json(json["type"]),
-            main_frame_id=page.FrameId.from_json(json["mainFrameId"]),
-            owner_origin=str(json["ownerOrigin"]),
-            params=SharedStorageAccessParams.from_json(json["params"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "accessTime": ("access_time", network.TimeSinceEpoch, False),
+            "type": ("type_", SharedStorageAccessType, False),
+            "mainFrameId": ("main_frame_id", page.FrameId, False),
+            "ownerOrigin": ("owner_origin", str, False),
+            "params": ("params", SharedStorageAccessParams.from_json, False),
+        }
 
 
 @event_class("Storage.storageBucketCreatedOrUpdated")
-@dataclass
+@slotted_dataclass
 class StorageBucketCreatedOrUpdated:
     bucket_info: StorageBucketInfo
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageBucketCreatedOrUpdated:
-        return cls(bucket_info=StorageBucketInfo.from_json(json["bucketInfo"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "bucketInfo": ("bucket_info", StorageBucketInfo.from_json, False),
+        }
 
 
 @event_class("Storage.storageBucketDeleted")
-@dataclass
+@slotted_dataclass
 class StorageBucketDeleted:
     bucket_id: str
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageBucketDeleted:
-        return cls(bucket_id=str(json["bucketId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "bucketId": ("bucket_id", str, False),
+        }
 
 
 @event_class("Storage.attributionReportingSourceRegistered")
-@dataclass
+@slotted_dataclass
 class AttributionReportingSourceRegistered:
     """
     **EXPERIMENTAL**
@@ -2218,18 +2396,22 @@ class AttributionReportingSourceRegistered:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingSourceRegistered:
-        return cls(
-            registration=AttributionReportingSourceRegistration.from_json(
-                json["registration"]
-            ),
-            result=AttributionReportingSourceRegistrationResult.from_json(
-                json["result"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "registration": (
+                "registration",
+                AttributionReportingSourceRegistration.from_json,
+                False,
             ),
-        )
+            "result": ("result", AttributionReportingSourceRegistrationResult, False),
+        }
 
 
 @event_class("Storage.attributionReportingTriggerRegistered")
-@dataclass
+@slotted_dataclass
 class AttributionReportingTriggerRegistered:
     """
     **EXPERIMENTAL**
@@ -2243,14 +2425,20 @@ class AttributionReportingTriggerRegistered:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerRegistered:
-        return cls(
-            registration=AttributionReportingTriggerRegistration.from_json(
-                json["registration"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "registration": (
+                "registration",
+                AttributionReportingTriggerRegistration.from_json,
+                False,
             ),
-            event_level=AttributionReportingEventLevelResult.from_json(
-                json["eventLevel"]
+            "eventLevel": ("event_level", AttributionReportingEventLevelResult, False),
+            "aggregatable": (
+                "aggregatable",
+                AttributionReportingAggregatableResult,
+                False,
             ),
-            aggregatable=AttributionReportingAggregatableResult.from_json(
-                json["aggregatable"]
-            ),
-        )
+        }
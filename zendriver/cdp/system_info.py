@@ -8,11 +8,15 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
-@dataclass
+@slotted_dataclass
 class GPUDevice:
     """
     Describes a single graphics processor (GPU).
@@ -58,23 +62,23 @@ class GPUDevice:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GPUDevice:
-        return cls(
-            vendor_id=float(json["vendorId"]),
-            device_id=float(json["deviceId"]),
-            vendor_string=str(json["vendorString"]),
-            device_string=str(json["deviceString"]),
-            driver_vendor=str(json["driverVendor"]),
-            driver_version=str(json["driverVersion"]),
-            sub_sys_id=float(json["subSysId"])
-            if json.get("subSysId", None) is not None
-            else None,
-            revision=float(json["revision"])
-            if json.get("revision", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "vendorId": ("vendor_id", float, False),
+            "deviceId": ("device_id", float, False),
+            "vendorString": ("vendor_string", str, False),
+            "deviceString": ("device_string", str, False),
+            "driverVendor": ("driver_vendor", str, False),
+            "driverVersion": ("driver_version", str, False),
+            "subSysId": ("sub_sys_id", float, True),
+            "revision": ("revision", float, True),
+        }
+
+
+@slotted_dataclass
 class Size:
     """
     Describes the width and height dimensions of an entity.
@@ -94,13 +98,17 @@ class Size:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Size:
-        return cls(
-            width=int(json["width"]),
-            height=int(json["height"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "width": ("width", int, False),
+            "height": ("height", int, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class VideoDecodeAcceleratorCapability:
     """
     Describes a supported video decoding profile with its associated minimum and
@@ -125,14 +133,18 @@ class VideoDecodeAcceleratorCapability:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VideoDecodeAcceleratorCapability:
-        return cls(
-            profile=str(json["profile"]),
-            max_resolution=Size.from_json(json["maxResolution"]),
-            min_resolution=Size.from_json(json["minResolution"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "profile": ("profile", str, False),
+            "maxResolution": ("max_resolution", Size.from_json, False),
+            "minResolution": ("min_resolution", Size.from_json, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class VideoEncodeAcceleratorCapability:
     """
     Describes a supported video encoding profile with its associated maximum
@@ -162,12 +174,16 @@ class VideoEncodeAcceleratorCapability:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VideoEncodeAcceleratorCapability:
-        return cls(
-            profile=str(json["profile"]),
-            max_resolution=Size.from_json(json["maxResolution"]),
-            max_framerate_numerator=int(json["maxFramerateNumerator"]),
-            max_framerate_denominator=int(json["maxFramerateDenominator"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "profile": ("profile", str, False),
+            "maxResolution": ("max_resolution", Size.from_json, False),
+            "maxFramerateNumerator": ("max_framerate_numerator", int, False),
+            "maxFramerateDenominator": ("max_framerate_denominator", int, False),
+        }
 
 
 class SubsamplingFormat(enum.Enum):
@@ -204,7 +220,7 @@ class ImageType(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ImageDecodeAcceleratorCapability:
     """
     Describes a supported image decoding profile with its associated minimum and
@@ -233,15 +249,23 @@ class ImageDecodeAcceleratorCapability:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ImageDecodeAcceleratorCapability:
-        return cls(
-            image_type=ImageType.from_json(json["imageType"]),
-            max_dimensions=Size.from_json(json["maxDimensions"]),
-            min_dimensions=Size.from_json(json["minDimensions"]),
-            subsamplings=[SubsamplingFormat.from_json(i) for i in json["subsamplings"]],
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "imageType": ("image_type", ImageType, False),
+            "maxDimensions": ("max_dimensions", Size.from_json, False),
+            "minDimensions": ("min_dimensions", Size.from_json, False),
+            "subsamplings": (
+                "subsamplings",
+                lambda v: [SubsamplingFormat(i) for i in v],
+                False,
+            ),
+        }
+
+
+@slotted_dataclass
 class GPUInfo:
     """
     Provides information about the GPU(s) on the system.
@@ -283,31 +307,42 @@ class GPUInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GPUInfo:
-        return cls(
-            devices=[GPUDevice.from_json(i) for i in json["devices"]],
-            driver_bug_workarounds=[str(i) for i in json["driverBugWorkarounds"]],
-            video_decoding=[
-                VideoDecodeAcceleratorCapability.from_json(i)
-                for i in json["videoDecoding"]
-            ],
-            video_encoding=[
-                VideoEncodeAcceleratorCapability.from_json(i)
-                for i in json["videoEncoding"]
-            ],
-            image_decoding=[
-                ImageDecodeAcceleratorCapability.from_json(i)
-                for i in json["imageDecoding"]
-            ],
-            aux_attributes=dict(json["auxAttributes"])
-            if json.get("auxAttributes", None) is not None
-            else None,
-            feature_status=dict(json["featureStatus"])
-            if json.get("featureStatus", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "devices": (
+                "devices",
+                lambda v: [GPUDevice.from_json(i) for i in v],
+                False,
+            ),
+            "driverBugWorkarounds": (
+                "driver_bug_workarounds",
+                lambda v: [str(i) for i in v],
+                False,
+            ),
+            "videoDecoding": (
+                "video_decoding",
+                lambda v: [VideoDecodeAcceleratorCapability.from_json(i) for i in v],
+                False,
+            ),
+            "videoEncoding": (
+                "video_encoding",
+                lambda v: [VideoEncodeAcceleratorCapability.from_json(i) for i in v],
+                False,
+            ),
+            "imageDecoding": (
+                "image_decoding",
+                lambda v: [ImageDecodeAcceleratorCapability.from_json(i) for i in v],
+                False,
+            ),
+            "auxAttributes": ("aux_attributes", dict, True),
+            "featureStatus": ("feature_status", dict, True),
+        }
+
+
+@slotted_dataclass
 class ProcessInfo:
     """
     Represents process info.
@@ -332,11 +367,15 @@ class ProcessInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ProcessInfo:
-        return cls(
-            type_=str(json["type"]),
-            id_=int(json["id"]),
-            cpu_time=float(json["cpuTime"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "type": ("type_", str, False),
+            "id": ("id_", int, False),
+            "cpuTime": ("cpu_time", float, False),
+        }
 
 
 def get_info() -> (
@@ -6,10 +6,14 @@
 # CDP domain: Target
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import browser
 from . import page
@@ -44,7 +48,7 @@ class SessionID(str):
         return "SessionID({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class TargetInfo:
     target_id: TargetID
 
@@ -93,31 +97,25 @@ class TargetInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetInfo:
-        return cls(
-            target_id=TargetID.from_json(json["targetId"]),
-            type_=str(json["type"]),
-            title=str(json["title"]),
-            url=str(json["url"]),
-            attached=bool(json["attached"]),
-            can_access_opener=bool(json["canAccessOpener"]),
-            opener_id=TargetID.from_json(json["openerId"])
-            if json.get("openerId", None) is not None
-            else None,
-            opener_frame_id=page.FrameId.from_json(json["openerFrameId"])
-            if json.get("openerFrameId", None) is not None
-            else None,
-            browser_context_id=browser.BrowserContextID.from_json(
-                json["browserContextId"]
-            )
-            if json.get("browserContextId", None) is not None
-            else None,
-            subtype=str(json["subtype"])
-            if json.get("subtype", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "targetId": ("target_id", TargetID, False),
+            "type": ("type_", str, False),
+            "title": ("title", str, False),
+            "url": ("url", str, False),
+            "attached": ("attached", bool, False),
+            "canAccessOpener": ("can_access_opener", bool, False),
+            "openerId": ("opener_id", TargetID, True),
+            "openerFrameId": ("opener_frame_id", page.FrameId, True),
+            "browserContextId": ("browser_context_id", browser.BrowserContextID, True),
+            "subtype": ("subtype", str, True),
+        }
+
+
+@slotted_dataclass
 class FilterEntry:
     """
     A filter used by target query/discovery/auto-attach operations.
@@ -139,12 +137,14 @@ class FilterEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FilterEntry:
-        return cls(
-            exclude=bool(json["exclude"])
-            if json.get("exclude", None) is not None
-            else None,
-            type_=str(json["type"]) if json.get("type", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "exclude": ("exclude", bool, True),
+            "type": ("type_", str, True),
+        }
 
 
 class TargetFilter(list):
@@ -168,7 +168,7 @@ class TargetFilter(list):
         return "TargetFilter({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class RemoteLocation:
     host: str
 
@@ -182,10 +182,14 @@ class RemoteLocation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RemoteLocation:
-        return cls(
-            host=str(json["host"]),
-            port=int(json["port"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "host": ("host", str, False),
+            "port": ("port", int, False),
+        }
 
 
 def activate_target(
@@ -603,7 +607,7 @@ def set_remote_locations(
 
 
 @event_class("Target.attachedToTarget")
-@dataclass
+@slotted_dataclass
 class AttachedToTarget:
     """
     **EXPERIMENTAL**
@@ -618,15 +622,19 @@ class AttachedToTarget:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttachedToTarget:
-        return cls(
-            session_id=SessionID.from_json(json["sessionId"]),
-            target_info=TargetInfo.from_json(json["targetInfo"]),
-            waiting_for_debugger=bool(json["waitingForDebugger"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sessionId": ("session_id", SessionID, False),
+            "targetInfo": ("target_info", TargetInfo.from_json, False),
+            "waitingForDebugger": ("waiting_for_debugger", bool, False),
+        }
 
 
 @event_class("Target.detachedFromTarget")
-@dataclass
+@slotted_dataclass
 class DetachedFromTarget:
     """
     **EXPERIMENTAL**
@@ -642,16 +650,18 @@ class DetachedFromTarget:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DetachedFromTarget:
-        return cls(
-            session_id=SessionID.from_json(json["sessionId"]),
-            target_id=TargetID.from_json(json["targetId"])
-            if json.get("targetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sessionId": ("session_id", SessionID, False),
+            "targetId": ("target_id", TargetID, True),
+        }
 
 
 @event_class("Target.receivedMessageFromTarget")
-@dataclass
+@slotted_dataclass
 class ReceivedMessageFromTarget:
     """
     Notifies about a new protocol message received from the session (as reported in
@@ -666,17 +676,19 @@ class ReceivedMessageFromTarget:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReceivedMessageFromTarget:
-        return cls(
-            session_id=SessionID.from_json(json["sessionId"]),
-            message=str(json["message"]),
-            target_id=TargetID.from_json(json["targetId"])
-            if json.get("targetId", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "sessionId": ("session_id", SessionID, False),
+            "message": ("message", str, False),
+            "targetId": ("target_id", TargetID, True),
+        }
 
 
 @event_class("Target.targetCreated")
-@dataclass
+@slotted_dataclass
 class TargetCreated:
     """
     Issued when a possible inspection target is created.
@@ -686,11 +698,17 @@ class TargetCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCreated:
-        return cls(target_info=TargetInfo.from_json(json["targetInfo"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "targetInfo": ("target_info", TargetInfo.from_json, False),
+        }
 
 
 @event_class("Target.targetDestroyed")
-@dataclass
+@slotted_dataclass
 class TargetDestroyed:
     """
     Issued when a target is destroyed.
@@ -700,11 +718,17 @@ class TargetDestroyed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetDestroyed:
-        return cls(target_id=TargetID.from_json(json["targetId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "targetId": ("target_id", TargetID, False),
+        }
 
 
 @event_class("Target.targetCrashed")
-@dataclass
+@slotted_dataclass
 class TargetCrashed:
     """
     Issued when a target has crashed.
@@ -718,15 +742,19 @@ class TargetCrashed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCrashed:
-        return cls(
-            target_id=TargetID.from_json(json["targetId"]),
-            status=str(json["status"]),
-            error_code=int(json["errorCode"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "targetId": ("target_id", TargetID, False),
+            "status": ("status", str, False),
+            "errorCode": ("error_code", int, False),
+        }
 
 
 @event_class("Target.targetInfoChanged")
-@dataclass
+@slotted_dataclass
 class TargetInfoChanged:
     """
     Issued when some information about a target has changed. This only happens between
@@ -737,4 +765,10 @@ class TargetInfoChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetInfoChanged:
-        return cls(target_info=TargetInfo.from_json(json["targetInfo"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "targetInfo": ("target_info", TargetInfo.from_json, False),
+        }
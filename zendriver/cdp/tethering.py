@@ -6,10 +6,14 @@
 # CDP domain: Tethering (experimental)
 
 from __future__ import annotations
-import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 def bind(port: int) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -43,7 +47,7 @@ def unbind(port: int) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
 
 
 @event_class("Tethering.accepted")
-@dataclass
+@slotted_dataclass
 class Accepted:
     """
     Informs that port was successfully bound and got a specified connection id.
@@ -56,4 +60,11 @@ class Accepted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Accepted:
-        return cls(port=int(json["port"]), connection_id=str(json["connectionId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "port": ("port", int, False),
+            "connectionId": ("connection_id", str, False),
+        }
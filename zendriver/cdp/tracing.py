@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 from . import io
 
@@ -30,7 +35,7 @@ class MemoryDumpConfig(dict):
         return "MemoryDumpConfig({})".format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class TraceConfig:
     #: Controls how the trace buffer stores data.
     record_mode: typing.Optional[str] = None
@@ -84,35 +89,33 @@ class TraceConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TraceConfig:
-        return cls(
-            record_mode=str(json["recordMode"])
-            if json.get("recordMode", None) is not None
-            else None,
-            trace_buffer_size_in_kb=float(json["traceBufferSizeInKb"])
-            if json.get("traceBufferSizeInKb", None) is not None
-            else None,
-            enable_sampling=bool(json["enableSampling"])
-            if json.get("enableSampling", None) is not None
-            else None,
-            enable_systrace=bool(json["enableSystrace"])
-            if json.get("enableSystrace", None) is not None
-            else None,
-            enable_argument_filter=bool(json["enableArgumentFilter"])
-            if json.get("enableArgumentFilter", None) is not None
-            else None,
-            included_categories=[str(i) for i in json["includedCategories"]]
-            if json.get("includedCategories", None) is not None
-            else None,
-            excluded_categories=[str(i) for i in json["excludedCategories"]]
-            if json.get("excludedCategories", None) is not None
-            else None,
-            synthetic_delays=[str(i) for i in json["syntheticDelays"]]
-            if json.get("syntheticDelays", None) is not None
-            else None,
-            memory_dump_config=MemoryDumpConfig.from_json(json["memoryDumpConfig"])
-            if json.get("memoryDumpConfig", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "recordMode": ("record_mode", str, True),
+            "traceBufferSizeInKb": ("trace_buffer_size_in_kb", float, True),
+            "enableSampling": ("enable_sampling", bool, True),
+            "enableSystrace": ("enable_systrace", bool, True),
+            "enableArgumentFilter": ("enable_argument_filter", bool, True),
+            "includedCategories": (
+                "included_categories",
+                lambda v: [str(i) for i in v],
+                True,
+            ),
+            "excludedCategories": (
+                "excluded_categories",
+                lambda v: [str(i) for i in v],
+                True,
+            ),
+            "syntheticDelays": (
+                "synthetic_delays",
+                lambda v: [str(i) for i in v],
+                True,
+            ),
+            "memoryDumpConfig": ("memory_dump_config", MemoryDumpConfig, True),
+        }
 
 
 class StreamFormat(enum.Enum):
@@ -312,7 +315,7 @@ def start(
 
 
 @event_class("Tracing.bufferUsage")
-@dataclass
+@slotted_dataclass
 class BufferUsage:
     """
     **EXPERIMENTAL**
@@ -331,19 +334,19 @@ class BufferUsage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BufferUsage:
-        return cls(
-            percent_full=float(json["percentFull"])
-            if json.get("percentFull", None) is not None
-            else None,
-            event_count=float(json["eventCount"])
-            if json.get("eventCount", None) is not None
-            else None,
-            value=float(json["value"]) if json.get("value", None) is not None else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "percentFull": ("percent_full", float, True),
+            "eventCount": ("event_count", float, True),
+            "value": ("value", float, True),
+        }
 
 
 @event_class("Tracing.dataCollected")
-@dataclass
+@slotted_dataclass
 class DataCollected:
     """
     **EXPERIMENTAL**
@@ -356,11 +359,17 @@ class DataCollected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataCollected:
-        return cls(value=[dict(i) for i in json["value"]])
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "value": ("value", lambda v: [dict(i) for i in v], False),
+        }
 
 
 @event_class("Tracing.tracingComplete")
-@dataclass
+@slotted_dataclass
 class TracingComplete:
     """
     Signals that tracing is stopped and there is no trace buffers pending flush, all data were
@@ -379,15 +388,13 @@ class TracingComplete:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TracingComplete:
-        return cls(
-            data_loss_occurred=bool(json["dataLossOccurred"]),
-            stream=io.StreamHandle.from_json(json["stream"])
-            if json.get("stream", None) is not None
-            else None,
-            trace_format=StreamFormat.from_json(json["traceFormat"])
-            if json.get("traceFormat", None) is not None
-            else None,
-            stream_compression=StreamCompression.from_json(json["streamCompression"])
-            if json.get("streamCompression", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "dataLossOccurred": ("data_loss_occurred", bool, False),
+            "stream": ("stream", io.StreamHandle, True),
+            "traceFormat": ("trace_format", StreamFormat, True),
+            "streamCompression": ("stream_compression", StreamCompression, True),
+        }
@@ -1,7 +1,74 @@
+import dataclasses
+import importlib
+import types
 import typing
 
 T_JSON_DICT = typing.Dict[str, typing.Any]
+# JSON key => (attribute name, decoder, optional) of the members of a class
+T_MEMBERS = typing.Dict[
+    str, typing.Tuple[str, typing.Callable[[typing.Any], typing.Any], bool]
+]
 _event_parsers = dict()
+# class => (its member map, the keyword arguments of its absent optional members)
+_members: typing.Dict[type, typing.Tuple[T_MEMBERS, T_JSON_DICT]] = dict()
+
+# CDP domain => the module of this package implementing it
+DOMAIN_MODULES = {
+    "Accessibility": "accessibility",
+    "Animation": "animation",
+    "Audits": "audits",
+    "Autofill": "autofill",
+    "BackgroundService": "background_service",
+    "BluetoothEmulation": "bluetooth_emulation",
+    "Browser": "browser",
+    "CSS": "css",
+    "CacheStorage": "cache_storage",
+    "Cast": "cast",
+    "Console": "console",
+    "DOM": "dom",
+    "DOMDebugger": "dom_debugger",
+    "DOMSnapshot": "dom_snapshot",
+    "DOMStorage": "dom_storage",
+    "Database": "database",
+    "Debugger": "debugger",
+    "DeviceAccess": "device_access",
+    "DeviceOrientation": "device_orientation",
+    "Emulation": "emulation",
+    "EventBreakpoints": "event_breakpoints",
+    "Extensions": "extensions",
+    "FedCm": "fed_cm",
+    "Fetch": "fetch",
+    "FileSystem": "file_system",
+    "HeadlessExperimental": "headless_experimental",
+    "HeapProfiler": "heap_profiler",
+    "IO": "io",
+    "IndexedDB": "indexed_db",
+    "Input": "input_",
+    "Inspector": "inspector",
+    "LayerTree": "layer_tree",
+    "Log": "log",
+    "Media": "media",
+    "Memory": "memory",
+    "Network": "network",
+    "Overlay": "overlay",
+    "PWA": "pwa",
+    "Page": "page",
+    "Performance": "performance",
+    "PerformanceTimeline": "performance_timeline",
+    "Preload": "preload",
+    "Profiler": "profiler",
+    "Runtime": "runtime",
+    "Schema": "schema",
+    "Security": "security",
+    "ServiceWorker": "service_worker",
+    "Storage": "storage",
+    "SystemInfo": "system_info",
+    "Target": "target",
+    "Tethering": "tethering",
+    "Tracing": "tracing",
+    "WebAudio": "web_audio",
+    "WebAuthn": "web_authn",
+}
 
 
 def event_class(method):
@@ -14,6 +81,86 @@ def event_class(method):
     return decorate
 
 
+def identity(value: typing.Any) -> typing.Any:
+    """The decoder of members which can have any JSON value."""
+    return value
+
+
+def decode_members(cls: typing.Any, json: T_JSON_DICT) -> T_JSON_DICT:
+    """
+    Decode the members of a JSON object into the keyword arguments of a class,
+    using the member map of the class. Optional members which are absent or null
+    are None.
+    """
+    cached = _members.get(cls)
+    if cached is None:
+        members = cls._members()
+        absent = {name: None for name, _, optional in members.values() if optional}
+        cached = _members[cls] = (members, absent)
+    members, kwargs = cached
+    kwargs = kwargs.copy()
+    for key, value in json.items():
+        member = members.get(key)
+        if member is None:
+            continue
+        name, decode, optional = member
+        if value is None and optional:
+            continue
+        kwargs[name] = decode(value)
+    return kwargs
+
+
+def _getstate(self):
+    return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _setstate(self, state):
+    # also restores instances pickled before the types had __slots__
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+if typing.TYPE_CHECKING:
+    from dataclasses import dataclass as slotted_dataclass
+else:
+
+    def slotted_dataclass(cls):
+        """
+        A decorator that turns a class into a dataclass with __slots__ instead of a
+        __dict__ per instance, like dataclass(slots=True) in Python 3.10+.
+        """
+        cls = dataclasses.dataclass(cls)
+        names = tuple(field.name for field in dataclasses.fields(cls))
+        namespace = {
+            key: value
+            for key, value in cls.__dict__.items()
+            if key not in names and key not in ("__dict__", "__weakref__")
+        }
+        namespace["__slots__"] = names
+        namespace["__getstate__"] = _getstate
+        namespace["__setstate__"] = _setstate
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def import_domain(domain: str) -> typing.Optional[types.ModuleType]:
+    """Import the module of a CDP domain (eg. "DOMStorage"), or None if unknown."""
+    module = DOMAIN_MODULES.get(domain)
+    if module is None:
+        return None
+    return importlib.import_module("." + module, __package__)
+
+
+def get_event_class(method: str) -> typing.Optional[typing.Type[typing.Any]]:
+    """Return the event class of a method, importing its domain when needed."""
+    cls = _event_parsers.get(method)
+    if cls is None and import_domain(method.split(".", 1)[0]) is not None:
+        cls = _event_parsers.get(method)
+    return cls
+
+
 def parse_json_event(json: T_JSON_DICT) -> typing.Any:
     """Parse a JSON dictionary into a CDP event."""
-    return _event_parsers[json["method"]].from_json(json["params"])
+    cls = get_event_class(json["method"])
+    if cls is None:
+        raise KeyError(json["method"])
+    return cls.from_json(json["params"])
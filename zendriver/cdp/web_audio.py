@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class GraphObjectId(str):
@@ -143,7 +148,7 @@ class AutomationRate(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class ContextRealtimeData:
     """
     Fields in AudioContext that change in real-time.
@@ -173,15 +178,19 @@ class ContextRealtimeData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextRealtimeData:
-        return cls(
-            current_time=float(json["currentTime"]),
-            render_capacity=float(json["renderCapacity"]),
-            callback_interval_mean=float(json["callbackIntervalMean"]),
-            callback_interval_variance=float(json["callbackIntervalVariance"]),
-        )
+        return cls(**decode_members(cls, json))
 
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "currentTime": ("current_time", float, False),
+            "renderCapacity": ("render_capacity", float, False),
+            "callbackIntervalMean": ("callback_interval_mean", float, False),
+            "callbackIntervalVariance": ("callback_interval_variance", float, False),
+        }
 
-@dataclass
+
+@slotted_dataclass
 class BaseAudioContext:
     """
     Protocol object for BaseAudioContext
@@ -218,20 +227,22 @@ class BaseAudioContext:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BaseAudioContext:
-        return cls(
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            context_type=ContextType.from_json(json["contextType"]),
-            context_state=ContextState.from_json(json["contextState"]),
-            callback_buffer_size=float(json["callbackBufferSize"]),
-            max_output_channel_count=float(json["maxOutputChannelCount"]),
-            sample_rate=float(json["sampleRate"]),
-            realtime_data=ContextRealtimeData.from_json(json["realtimeData"])
-            if json.get("realtimeData", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+            "contextType": ("context_type", ContextType, False),
+            "contextState": ("context_state", ContextState, False),
+            "callbackBufferSize": ("callback_buffer_size", float, False),
+            "maxOutputChannelCount": ("max_output_channel_count", float, False),
+            "sampleRate": ("sample_rate", float, False),
+            "realtimeData": ("realtime_data", ContextRealtimeData.from_json, True),
+        }
+
+
+@slotted_dataclass
 class AudioListener:
     """
     Protocol object for AudioListener
@@ -249,13 +260,17 @@ class AudioListener:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioListener:
-        return cls(
-            listener_id=GraphObjectId.from_json(json["listenerId"]),
-            context_id=GraphObjectId.from_json(json["contextId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "listenerId": ("listener_id", GraphObjectId, False),
+            "contextId": ("context_id", GraphObjectId, False),
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AudioNode:
     """
     Protocol object for AudioNode
@@ -291,21 +306,27 @@ class AudioNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioNode:
-        return cls(
-            node_id=GraphObjectId.from_json(json["nodeId"]),
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            node_type=NodeType.from_json(json["nodeType"]),
-            number_of_inputs=float(json["numberOfInputs"]),
-            number_of_outputs=float(json["numberOfOutputs"]),
-            channel_count=float(json["channelCount"]),
-            channel_count_mode=ChannelCountMode.from_json(json["channelCountMode"]),
-            channel_interpretation=ChannelInterpretation.from_json(
-                json["channelInterpretation"]
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "nodeId": ("node_id", GraphObjectId, False),
+            "contextId": ("context_id", GraphObjectId, False),
+            "nodeType": ("node_type", NodeType, False),
+            "numberOfInputs": ("number_of_inputs", float, False),
+            "numberOfOutputs": ("number_of_outputs", float, False),
+            "channelCount": ("channel_count", float, False),
+            "channelCountMode": ("channel_count_mode", ChannelCountMode, False),
+            "channelInterpretation": (
+                "channel_interpretation",
+                ChannelInterpretation,
+                False,
             ),
-        )
+        }
 
 
-@dataclass
+@slotted_dataclass
 class AudioParam:
     """
     Protocol object for AudioParam
@@ -341,16 +362,20 @@ class AudioParam:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioParam:
-        return cls(
-            param_id=GraphObjectId.from_json(json["paramId"]),
-            node_id=GraphObjectId.from_json(json["nodeId"]),
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            param_type=ParamType.from_json(json["paramType"]),
-            rate=AutomationRate.from_json(json["rate"]),
-            default_value=float(json["defaultValue"]),
-            min_value=float(json["minValue"]),
-            max_value=float(json["maxValue"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "paramId": ("param_id", GraphObjectId, False),
+            "nodeId": ("node_id", GraphObjectId, False),
+            "contextId": ("context_id", GraphObjectId, False),
+            "paramType": ("param_type", ParamType, False),
+            "rate": ("rate", AutomationRate, False),
+            "defaultValue": ("default_value", float, False),
+            "minValue": ("min_value", float, False),
+            "maxValue": ("max_value", float, False),
+        }
 
 
 def enable() -> typing.Generator[T_JSON_DICT, T_JSON_DICT, None]:
@@ -393,7 +418,7 @@ def get_realtime_data(
 
 
 @event_class("WebAudio.contextCreated")
-@dataclass
+@slotted_dataclass
 class ContextCreated:
     """
     Notifies that a new BaseAudioContext has been created.
@@ -403,11 +428,17 @@ class ContextCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextCreated:
-        return cls(context=BaseAudioContext.from_json(json["context"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "context": ("context", BaseAudioContext.from_json, False),
+        }
 
 
 @event_class("WebAudio.contextWillBeDestroyed")
-@dataclass
+@slotted_dataclass
 class ContextWillBeDestroyed:
     """
     Notifies that an existing BaseAudioContext will be destroyed.
@@ -417,11 +448,17 @@ class ContextWillBeDestroyed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextWillBeDestroyed:
-        return cls(context_id=GraphObjectId.from_json(json["contextId"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+        }
 
 
 @event_class("WebAudio.contextChanged")
-@dataclass
+@slotted_dataclass
 class ContextChanged:
     """
     Notifies that existing BaseAudioContext has changed some properties (id stays the same)..
@@ -431,11 +468,17 @@ class ContextChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextChanged:
-        return cls(context=BaseAudioContext.from_json(json["context"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "context": ("context", BaseAudioContext.from_json, False),
+        }
 
 
 @event_class("WebAudio.audioListenerCreated")
-@dataclass
+@slotted_dataclass
 class AudioListenerCreated:
     """
     Notifies that the construction of an AudioListener has finished.
@@ -445,11 +488,17 @@ class AudioListenerCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioListenerCreated:
-        return cls(listener=AudioListener.from_json(json["listener"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "listener": ("listener", AudioListener.from_json, False),
+        }
 
 
 @event_class("WebAudio.audioListenerWillBeDestroyed")
-@dataclass
+@slotted_dataclass
 class AudioListenerWillBeDestroyed:
     """
     Notifies that a new AudioListener has been created.
@@ -460,14 +509,18 @@ class AudioListenerWillBeDestroyed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioListenerWillBeDestroyed:
-        return cls(
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            listener_id=GraphObjectId.from_json(json["listenerId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+            "listenerId": ("listener_id", GraphObjectId, False),
+        }
 
 
 @event_class("WebAudio.audioNodeCreated")
-@dataclass
+@slotted_dataclass
 class AudioNodeCreated:
     """
     Notifies that a new AudioNode has been created.
@@ -477,11 +530,17 @@ class AudioNodeCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioNodeCreated:
-        return cls(node=AudioNode.from_json(json["node"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "node": ("node", AudioNode.from_json, False),
+        }
 
 
 @event_class("WebAudio.audioNodeWillBeDestroyed")
-@dataclass
+@slotted_dataclass
 class AudioNodeWillBeDestroyed:
     """
     Notifies that an existing AudioNode has been destroyed.
@@ -492,14 +551,18 @@ class AudioNodeWillBeDestroyed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioNodeWillBeDestroyed:
-        return cls(
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            node_id=GraphObjectId.from_json(json["nodeId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+            "nodeId": ("node_id", GraphObjectId, False),
+        }
 
 
 @event_class("WebAudio.audioParamCreated")
-@dataclass
+@slotted_dataclass
 class AudioParamCreated:
     """
     Notifies that a new AudioParam has been created.
@@ -509,11 +572,17 @@ class AudioParamCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioParamCreated:
-        return cls(param=AudioParam.from_json(json["param"]))
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "param": ("param", AudioParam.from_json, False),
+        }
 
 
 @event_class("WebAudio.audioParamWillBeDestroyed")
-@dataclass
+@slotted_dataclass
 class AudioParamWillBeDestroyed:
     """
     Notifies that an existing AudioParam has been destroyed.
@@ -525,15 +594,19 @@ class AudioParamWillBeDestroyed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioParamWillBeDestroyed:
-        return cls(
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            node_id=GraphObjectId.from_json(json["nodeId"]),
-            param_id=GraphObjectId.from_json(json["paramId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+            "nodeId": ("node_id", GraphObjectId, False),
+            "paramId": ("param_id", GraphObjectId, False),
+        }
 
 
 @event_class("WebAudio.nodesConnected")
-@dataclass
+@slotted_dataclass
 class NodesConnected:
     """
     Notifies that two AudioNodes are connected.
@@ -547,21 +620,21 @@ class NodesConnected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodesConnected:
-        return cls(
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            source_id=GraphObjectId.from_json(json["sourceId"]),
-            destination_id=GraphObjectId.from_json(json["destinationId"]),
-            source_output_index=float(json["sourceOutputIndex"])
-            if json.get("sourceOutputIndex", None) is not None
-            else None,
-            destination_input_index=float(json["destinationInputIndex"])
-            if json.get("destinationInputIndex", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+            "sourceId": ("source_id", GraphObjectId, False),
+            "destinationId": ("destination_id", GraphObjectId, False),
+            "sourceOutputIndex": ("source_output_index", float, True),
+            "destinationInputIndex": ("destination_input_index", float, True),
+        }
 
 
 @event_class("WebAudio.nodesDisconnected")
-@dataclass
+@slotted_dataclass
 class NodesDisconnected:
     """
     Notifies that AudioNodes are disconnected. The destination can be null, and it means all the outgoing connections from the source are disconnected.
@@ -575,21 +648,21 @@ class NodesDisconnected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodesDisconnected:
-        return cls(
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            source_id=GraphObjectId.from_json(json["sourceId"]),
-            destination_id=GraphObjectId.from_json(json["destinationId"]),
-            source_output_index=float(json["sourceOutputIndex"])
-            if json.get("sourceOutputIndex", None) is not None
-            else None,
-            destination_input_index=float(json["destinationInputIndex"])
-            if json.get("destinationInputIndex", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+            "sourceId": ("source_id", GraphObjectId, False),
+            "destinationId": ("destination_id", GraphObjectId, False),
+            "sourceOutputIndex": ("source_output_index", float, True),
+            "destinationInputIndex": ("destination_input_index", float, True),
+        }
 
 
 @event_class("WebAudio.nodeParamConnected")
-@dataclass
+@slotted_dataclass
 class NodeParamConnected:
     """
     Notifies that an AudioNode is connected to an AudioParam.
@@ -602,18 +675,20 @@ class NodeParamConnected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeParamConnected:
-        return cls(
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            source_id=GraphObjectId.from_json(json["sourceId"]),
-            destination_id=GraphObjectId.from_json(json["destinationId"]),
-            source_output_index=float(json["sourceOutputIndex"])
-            if json.get("sourceOutputIndex", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+            "sourceId": ("source_id", GraphObjectId, False),
+            "destinationId": ("destination_id", GraphObjectId, False),
+            "sourceOutputIndex": ("source_output_index", float, True),
+        }
 
 
 @event_class("WebAudio.nodeParamDisconnected")
-@dataclass
+@slotted_dataclass
 class NodeParamDisconnected:
     """
     Notifies that an AudioNode is disconnected to an AudioParam.
@@ -626,11 +701,13 @@ class NodeParamDisconnected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeParamDisconnected:
-        return cls(
-            context_id=GraphObjectId.from_json(json["contextId"]),
-            source_id=GraphObjectId.from_json(json["sourceId"]),
-            destination_id=GraphObjectId.from_json(json["destinationId"]),
-            source_output_index=float(json["sourceOutputIndex"])
-            if json.get("sourceOutputIndex", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "contextId": ("context_id", GraphObjectId, False),
+            "sourceId": ("source_id", GraphObjectId, False),
+            "destinationId": ("destination_id", GraphObjectId, False),
+            "sourceOutputIndex": ("source_output_index", float, True),
+        }
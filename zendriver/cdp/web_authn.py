@@ -8,8 +8,13 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import (
+    event_class,
+    slotted_dataclass,
+    decode_members,
+    T_JSON_DICT,
+    T_MEMBERS,
+)
 
 
 class AuthenticatorId(str):
@@ -63,7 +68,7 @@ class AuthenticatorTransport(enum.Enum):
         return cls(json)
 
 
-@dataclass
+@slotted_dataclass
 class VirtualAuthenticatorOptions:
     protocol: AuthenticatorProtocol
 
@@ -146,46 +151,32 @@ class VirtualAuthenticatorOptions:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VirtualAuthenticatorOptions:
-        return cls(
-            protocol=AuthenticatorProtocol.from_json(json["protocol"]),
-            transport=AuthenticatorTransport.from_json(json["transport"]),
-            ctap2_version=Ctap2Version.from_json(json["ctap2Version"])
-            if json.get("ctap2Version", None) is not None
-            else None,
-            has_resident_key=bool(json["hasResidentKey"])
-            if json.get("hasResidentKey", None) is not None
-            else None,
-            has_user_verification=bool(json["hasUserVerification"])
-            if json.get("hasUserVerification", None) is not None
-            else None,
-            has_large_blob=bool(json["hasLargeBlob"])
-            if json.get("hasLargeBlob", None) is not None
-            else None,
-            has_cred_blob=bool(json["hasCredBlob"])
-            if json.get("hasCredBlob", None) is not None
-            else None,
-            has_min_pin_length=bool(json["hasMinPinLength"])
-            if json.get("hasMinPinLength", None) is not None
-            else None,
-            has_prf=bool(json["hasPrf"])
-            if json.get("hasPrf", None) is not None
-            else None,
-            automatic_presence_simulation=bool(json["automaticPresenceSimulation"])
-            if json.get("automaticPresenceSimulation", None) is not None
-            else None,
-            is_user_verified=bool(json["isUserVerified"])
-            if json.get("isUserVerified", None) is not None
-            else None,
-            default_backup_eligibility=bool(json["defaultBackupEligibility"])
-            if json.get("defaultBackupEligibility", None) is not None
-            else None,
-            default_backup_state=bool(json["defaultBackupState"])
-            if json.get("defaultBackupState", None) is not None
-            else None,
-        )
-
-
-@dataclass
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "protocol": ("protocol", AuthenticatorProtocol, False),
+            "transport": ("transport", AuthenticatorTransport, False),
+            "ctap2Version": ("ctap2_version", Ctap2Version, True),
+            "hasResidentKey": ("has_resident_key", bool, True),
+            "hasUserVerification": ("has_user_verification", bool, True),
+            "hasLargeBlob": ("has_large_blob", bool, True),
+            "hasCredBlob": ("has_cred_blob", bool, True),
+            "hasMinPinLength": ("has_min_pin_length", bool, True),
+            "hasPrf": ("has_prf", bool, True),
+            "automaticPresenceSimulation": (
+                "automatic_presence_simulation",
+                bool,
+                True,
+            ),
+            "isUserVerified": ("is_user_verified", bool, True),
+            "defaultBackupEligibility": ("default_backup_eligibility", bool, True),
+            "defaultBackupState": ("default_backup_state", bool, True),
+        }
+
+
+@slotted_dataclass
 class Credential:
     credential_id: str
 
@@ -254,31 +245,23 @@ class Credential:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Credential:
-        return cls(
-            credential_id=str(json["credentialId"]),
-            is_resident_credential=bool(json["isResidentCredential"]),
-            private_key=str(json["privateKey"]),
-            sign_count=int(json["signCount"]),
-            rp_id=str(json["rpId"]) if json.get("rpId", None) is not None else None,
-            user_handle=str(json["userHandle"])
-            if json.get("userHandle", None) is not None
-            else None,
-            large_blob=str(json["largeBlob"])
-            if json.get("largeBlob", None) is not None
-            else None,
-            backup_eligibility=bool(json["backupEligibility"])
-            if json.get("backupEligibility", None) is not None
-            else None,
-            backup_state=bool(json["backupState"])
-            if json.get("backupState", None) is not None
-            else None,
-            user_name=str(json["userName"])
-            if json.get("userName", None) is not None
-            else None,
-            user_display_name=str(json["userDisplayName"])
-            if json.get("userDisplayName", None) is not None
-            else None,
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "credentialId": ("credential_id", str, False),
+            "isResidentCredential": ("is_resident_credential", bool, False),
+            "privateKey": ("private_key", str, False),
+            "signCount": ("sign_count", int, False),
+            "rpId": ("rp_id", str, True),
+            "userHandle": ("user_handle", str, True),
+            "largeBlob": ("large_blob", str, True),
+            "backupEligibility": ("backup_eligibility", bool, True),
+            "backupState": ("backup_state", bool, True),
+            "userName": ("user_name", str, True),
+            "userDisplayName": ("user_display_name", str, True),
+        }
 
 
 def enable(
@@ -541,7 +524,7 @@ def set_credential_properties(
 
 
 @event_class("WebAuthn.credentialAdded")
-@dataclass
+@slotted_dataclass
 class CredentialAdded:
     """
     Triggered when a credential is added to an authenticator.
@@ -552,14 +535,18 @@ class CredentialAdded:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CredentialAdded:
-        return cls(
-            authenticator_id=AuthenticatorId.from_json(json["authenticatorId"]),
-            credential=Credential.from_json(json["credential"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "authenticatorId": ("authenticator_id", AuthenticatorId, False),
+            "credential": ("credential", Credential.from_json, False),
+        }
 
 
 @event_class("WebAuthn.credentialDeleted")
-@dataclass
+@slotted_dataclass
 class CredentialDeleted:
     """
     Triggered when a credential is deleted, e.g. through
@@ -571,14 +558,18 @@ class CredentialDeleted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CredentialDeleted:
-        return cls(
-            authenticator_id=AuthenticatorId.from_json(json["authenticatorId"]),
-            credential_id=str(json["credentialId"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "authenticatorId": ("authenticator_id", AuthenticatorId, False),
+            "credentialId": ("credential_id", str, False),
+        }
 
 
 @event_class("WebAuthn.credentialUpdated")
-@dataclass
+@slotted_dataclass
 class CredentialUpdated:
     """
     Triggered when a credential is updated, e.g. through
@@ -590,14 +581,18 @@ class CredentialUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CredentialUpdated:
-        return cls(
-            authenticator_id=AuthenticatorId.from_json(json["authenticatorId"]),
-            credential=Credential.from_json(json["credential"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "authenticatorId": ("authenticator_id", AuthenticatorId, False),
+            "credential": ("credential", Credential.from_json, False),
+        }
 
 
 @event_class("WebAuthn.credentialAsserted")
-@dataclass
+@slotted_dataclass
 class CredentialAsserted:
     """
     Triggered when a credential is used in a webauthn assertion.
@@ -608,7 +603,11 @@ class CredentialAsserted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CredentialAsserted:
-        return cls(
-            authenticator_id=AuthenticatorId.from_json(json["authenticatorId"]),
-            credential=Credential.from_json(json["credential"]),
-        )
+        return cls(**decode_members(cls, json))
+
+    @staticmethod
+    def _members() -> T_MEMBERS:
+        return {
+            "authenticatorId": ("authenticator_id", AuthenticatorId, False),
+            "credential": ("credential", Credential.from_json, False),
+        }
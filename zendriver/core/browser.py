@@ -12,7 +12,7 @@ import urllib.parse
 import urllib.request
 import warnings
 from collections import defaultdict
-from typing import List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import asyncio_atexit
 
@@ -20,7 +20,9 @@ from .. import cdp
 from . import tab, util
 from ._contradict import ContraDict
 from .config import Config, PathLike, is_posix
-from .connection import Connection
+from .connection import MAX_SIZE, Connection, ProtocolException
+from .pipe import PipeFds, PipeTransport
+from .recorder import Recorder
 
 logger = logging.getLogger(__name__)
 
@@ -126,13 +128,29 @@ class Browser:
         self._process_pid = None
         self._keep_user_data_dir = None
         self._is_updating = asyncio.Event()
+        # futures of Browser.get(new_tab=True), resolved with the tab of the new target
+        self._target_waiters: Dict[cdp.target.TargetID, asyncio.Future[tab.Tab]] = {}
         self.connection: Connection = None
+        self.recorder: Optional[Recorder] = None
+        record = getattr(config, "record", None)
+        if record:
+            self.recorder = Recorder(record)
         logger.debug("Session object initialized: %s" % vars(self))
 
     @property
     def websocket_url(self):
         return self.info.webSocketDebuggerUrl
 
+    @property
+    def _session_parent(self) -> Union[Connection, None]:
+        """
+        the connection new targets are multiplexed over when flattened sessions
+        are enabled, otherwise None (each target gets its own websocket)
+        """
+        if self.config.flatten_sessions:
+            return self.connection
+        return None
+
     @property
     def main_tab(self) -> tab.Tab:
         """returns the target which was launched with the browser"""
@@ -205,7 +223,7 @@ class Browser:
                 current_tab.target = target_info
 
         elif isinstance(event, cdp.target.TargetCreated):
-            target_info: cdp.target.TargetInfo = event.target_info
+            target_info = event.target_info
             from .tab import Tab
 
             new_target = Tab(
@@ -216,9 +234,13 @@ class Browser:
                 ),
                 target=target_info,
                 browser=self,
+                _parent=self._session_parent,
             )
 
             self.targets.append(new_target)
+            waiter = self._target_waiters.pop(target_info.target_id, None)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(new_target)
 
             logger.debug("target #%d created => %s", len(self.targets), new_target)
 
@@ -246,6 +268,7 @@ class Browser:
         :param new_window:  open new window
         :return: Page
         """
+        connection: tab.Tab
         if new_tab or new_window:
             # creat new target using the browser session
             target_id = await self.connection.send(
@@ -253,20 +276,32 @@ class Browser:
                     url, new_window=new_window, enable_begin_frame_control=True
                 )
             )
-            # get the connection matching the new target_id from our inventory
-            connection: tab.Tab = next(
-                filter(
-                    lambda item: item.type_ == "page" and item.target_id == target_id,
-                    self.targets,
+            # get the connection matching the new target_id from our inventory.
+            # it is added by the TargetCreated handler, which runs on its own task
+            # and may not have processed the event yet.
+            for item in self.targets:
+                if item.type_ == "page" and item.target_id == target_id:
+                    connection = item
+                    break
+            else:
+                waiter = self._target_waiters.setdefault(
+                    target_id, asyncio.get_running_loop().create_future()
                 )
-            )
+                try:
+                    connection = await asyncio.wait_for(
+                        waiter, self.connection.command_timeout
+                    )
+                except asyncio.TimeoutError:
+                    raise RuntimeError(
+                        "the new target %s was not announced by the browser" % target_id
+                    ) from None
+                finally:
+                    self._target_waiters.pop(target_id, None)
             connection.browser = self
 
         else:
             # first tab from browser.tabs
-            connection: tab.Tab = next(
-                filter(lambda item: item.type_ == "page", self.targets)
-            )
+            connection = next(filter(lambda item: item.type_ == "page", self.targets))
             # use the tab to navigate to new url
             frame_id, loader_id, *_ = await connection.send(cdp.page.navigate(url))
             # update the frame_id on the tab
@@ -295,7 +330,10 @@ class Browser:
 
         # self.config.update(kwargs)
         connect_existing = False
-        if self.config.host is not None and self.config.port is not None:
+        if self.config.pipe:
+            # the protocol is spoken over the pipes of the process we launch
+            pass
+        elif self.config.host is not None and self.config.port is not None:
             connect_existing = True
         else:
             self.config.host = "127.0.0.1"
@@ -334,33 +372,48 @@ class Browser:
         logger.info(
             "starting\n\texecutable :%s\n\narguments:\n%s", exe, "\n\t".join(params)
         )
+        pipe_fds = None
         if not connect_existing:
-            self._process: asyncio.subprocess.Process = (
-                await asyncio.create_subprocess_exec(
-                    # self.config.browser_executable_path,
-                    # *cmdparams,
-                    exe,
-                    *params,
-                    stdin=asyncio.subprocess.PIPE,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    close_fds=is_posix,
+            if self.config.pipe:
+                # the pipes are moved to fd 3 and 4 of the browser process, which
+                # makes them inheritable, so they must not be closed by close_fds.
+                # all our other descriptors are not inheritable.
+                pipe_fds = PipeTransport.create_pipes()
+            try:
+                self._process: asyncio.subprocess.Process = (
+                    await asyncio.create_subprocess_exec(
+                        # self.config.browser_executable_path,
+                        # *cmdparams,
+                        exe,
+                        *params,
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        close_fds=is_posix and pipe_fds is None,
+                        preexec_fn=pipe_fds.preexec_fn if pipe_fds else None,
+                    )
                 )
-            )
+            except Exception:
+                if pipe_fds:
+                    pipe_fds.close()
+                raise
             self._process_pid = self._process.pid
 
-        self._http = HTTPApi((self.config.host, self.config.port))
         util.get_registered_instances().add(self)
-        await asyncio.sleep(0.25)
-        for _ in range(5):
-            try:
-                self.info = ContraDict(await self._http.get("version"), silent=True)
-            except (Exception,):
-                if _ == 4:
-                    logger.debug("could not start", exc_info=True)
-                await self.sleep(0.5)
-            else:
-                break
+        if pipe_fds:
+            await self._connect_pipe(pipe_fds)
+        else:
+            self._http = HTTPApi((self.config.host, self.config.port))
+            await asyncio.sleep(0.25)
+            for _ in range(5):
+                try:
+                    self.info = ContraDict(await self._http.get("version"), silent=True)
+                except (Exception,):
+                    if _ == 4:
+                        logger.debug("could not start", exc_info=True)
+                    await self.sleep(0.5)
+                else:
+                    break
 
         if not self.info:
             stderr = None
@@ -382,7 +435,8 @@ class Browser:
                 )
             )
 
-        self.connection = Connection(self.info.webSocketDebuggerUrl, _owner=self)
+        if not pipe_fds:
+            self.connection = Connection(self.info.webSocketDebuggerUrl, _owner=self)
 
         if self.config.autodiscover_targets:
             logger.info("enabling autodiscover targets")
@@ -417,6 +471,38 @@ class Browser:
         # self.connection.handlers[cdp.inspector.Detached] = [self.stop]
         # return self
 
+    async def _connect_pipe(self, pipe_fds: PipeFds):
+        """
+        connects to the browser over the devtools pipes, and fills :py:attr:`info`
+        using Browser.getVersion, since there is no http endpoint to ask.
+        """
+        transport = await PipeTransport.open(pipe_fds, limit=MAX_SIZE)
+        self.connection = Connection(
+            "pipe://%d" % self._process_pid, _owner=self, _transport=transport
+        )
+        try:
+            (
+                protocol_version,
+                product,
+                revision,
+                user_agent,
+                js_version,
+            ) = await self.connection.send(cdp.browser.get_version())
+        except ProtocolException:
+            logger.debug("could not start", exc_info=True)
+            return
+        self.info = ContraDict(
+            {
+                "Browser": product,
+                "Protocol-Version": protocol_version,
+                "User-Agent": user_agent,
+                "V8-Version": js_version,
+                "WebKit-Version": revision,
+                "webSocketDebuggerUrl": self.connection.websocket_url,
+            },
+            silent=True,
+        )
+
     async def grant_all_permissions(self):
         """
         grant permissions for:
@@ -521,7 +607,8 @@ class Browser:
             for existing_tab in self.targets:
                 existing_target = existing_tab.target
                 if existing_target.target_id == t.target_id:
-                    existing_tab.target.__dict__.update(t.__dict__)
+                    for name, value in util.fields_dict(t).items():
+                        setattr(existing_target, name, value)
                     break
             else:
                 self.targets.append(
@@ -533,6 +620,7 @@ class Browser:
                         ),
                         target=t,
                         _owner=self,
+                        _parent=self._session_parent,
                     )
                 )
 
@@ -587,6 +675,8 @@ class Browser:
         await self._process.wait()
         self._process = None
         self._process_pid = None
+        if self.recorder:
+            self.recorder.close()
 
     async def _cleanup_temporary_profile(self) -> None:
         if not self.config or self.config.uses_custom_data_dir:
@@ -717,7 +807,7 @@ class CookieJar:
         cookies = await self.get_all(requests_cookie_format=False)
         included_cookies = []
         for cookie in cookies:
-            for match in pattern.finditer(str(cookie.__dict__)):
+            for match in pattern.finditer(str(util.fields_dict(cookie))):
                 logger.debug(
                     "saved cookie for matching pattern '%s' => (%s: %s)",
                     pattern.pattern,
@@ -753,7 +843,7 @@ class CookieJar:
         cookies = pickle.load(save_path.open("r+b"))
         included_cookies = []
         for cookie in cookies:
-            for match in pattern.finditer(str(cookie.__dict__)):
+            for match in pattern.finditer(str(util.fields_dict(cookie))):
                 included_cookies.append(cookie)
                 logger.debug(
                     "loaded cookie for matching pattern '%s' => (%s: %s)",
@@ -804,7 +894,7 @@ class HTTPApi:
         if not url:
             url = self.api + endpoint
         request = urllib.request.Request(url)
-        request.method = method
+        request.method = method.upper()
         request.data = None
         if data:
             request.data = json.dumps(data).encode("utf-8")
@@ -0,0 +1,103 @@
+"""
+json codecs for the protocol layer.
+
+the fastest installed json library is used: orjson, then msgspec, falling back to the
+json module of the standard library. none of them are required.
+
+orjson and msgspec reject strings with lone surrogates (eg. ``"\\ud800"``), which the
+browser sends for the strings of pages: the listener of a connection decodes the frames
+they fail on with the json module.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class Codec:
+    """
+    encodes protocol messages to bytes and decodes received frames (str or bytes).
+    """
+
+    name: str = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class OrjsonCodec(Codec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.dumps = orjson.dumps  # type: ignore[method-assign,assignment]
+        self.loads = orjson.loads  # type: ignore[method-assign,assignment]
+
+
+def _msgspec_enc_hook(obj: Any) -> Any:
+    """
+    encodes the subclasses of builtin types (the ids and headers of :py:mod:`zendriver.cdp`,
+    eg. NodeId) as their base type, which msgspec doesn't do by itself
+    """
+    for base in (str, int, float, dict, list):
+        if isinstance(obj, base):
+            return base(obj)
+    raise TypeError("Encoding objects of type %s is unsupported" % type(obj).__name__)
+
+
+class MsgspecCodec(Codec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self.dumps = msgspec.json.Encoder(enc_hook=_msgspec_enc_hook).encode  # type: ignore[method-assign,assignment]
+        self.loads = msgspec.json.Decoder().decode  # type: ignore[method-assign,assignment]
+
+
+CODECS: Dict[str, Callable[[], Codec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": Codec,
+}
+
+_default: Optional[Codec] = None
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """
+    returns the codec with the given name ("orjson", "msgspec" or "json").
+    when no name is given, returns the fastest codec which is installed.
+
+    :param name: name of the codec
+    :type name: str
+    :return:
+    :rtype: Codec
+    """
+    global _default
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(
+                "unknown codec %r, choose one of %s" % (name, ", ".join(CODECS))
+            )
+        return CODECS[name]()
+    if _default is None:
+        for factory in CODECS.values():
+            try:
+                _default = factory()
+                break
+            except ImportError:
+                continue
+        logger.debug("using %s for the protocol messages", _default)
+    return _default  # type: ignore[return-value]
@@ -4,9 +4,12 @@ import pathlib
 import secrets
 import sys
 import tempfile
-from typing import Union, List, Optional
+from typing import TYPE_CHECKING, Union, List, Optional
 import zipfile
 
+if TYPE_CHECKING:
+    from .connection import ReconnectPolicy
+
 __all__ = [
     "Config",
     "find_chrome_executable",
@@ -39,6 +42,12 @@ class Config:
         host: str = AUTO,
         port: int = AUTO,
         expert: bool = AUTO,
+        flatten_sessions: bool = False,
+        command_timeout: Optional[float] = 180,
+        reconnect_policy: Optional["ReconnectPolicy"] = None,
+        pipe: bool = False,
+        metrics: bool = False,
+        record: Optional[PathLike] = None,
         **kwargs: dict,
     ):
         """
@@ -62,6 +71,22 @@ class Config:
         :param expert: when set to True, enabled "expert" mode.
                This conveys, the inclusion of parameters: --disable-web-security ----disable-site-isolation-trials,
                as well as some scripts and patching useful for debugging (for example, ensuring shadow-root is always in "open" mode)
+        :param flatten_sessions: when set to True, all tabs share the single websocket of the browser connection.
+               tabs attach to their target using flattened sessions (Target.attachToTarget(flatten=True))
+               instead of opening a websocket per tab, which saves sockets, tasks and connect latency
+               when working with many tabs.
+        :param command_timeout: default number of seconds to wait for the response to a command,
+               after which it fails with a CommandTimeoutException. None to wait forever.
+               can be overridden per command using the `timeout` parameter of send().
+        :param reconnect_policy: when given, connections reconnect after their websocket drops unexpectedly,
+               and restore their enabled domains and session state. see :py:class:`ReconnectPolicy`.
+        :param pipe: when set to True, the browser is launched with --remote-debugging-pipe and the protocol
+               is spoken over its pipes instead of a websocket. no debugging port is opened, which avoids port
+               races and speeds up starting many browsers. implies flatten_sessions. only available on posix.
+        :param metrics: when set to True, connections collect protocol metrics (command latency per method,
+               bytes and messages, events and handler time), see :py:class:`zendriver.core.metrics.Metrics`.
+        :param record: file to record the protocol messages of all connections to, as json lines.
+               a .gz or .zst suffix compresses it. see :py:mod:`zendriver.core.recorder` to replay it.
 
         :param kwargs:
 
@@ -71,6 +96,12 @@ class Config:
         :type browser_args: list[str]
         :type sandbox: bool
         :type lang: str
+        :type flatten_sessions: bool
+        :type command_timeout: float
+        :type reconnect_policy: ReconnectPolicy
+        :type pipe: bool
+        :type metrics: bool
+        :type record: PathLike
         :type kwargs: dict
         """
 
@@ -94,6 +125,15 @@ class Config:
         self.host = host
         self.port = port
         self.expert = expert
+        if pipe and not is_posix:
+            raise ValueError("pipe=True is only supported on posix systems")
+        self.pipe = pipe
+        self.metrics = metrics
+        self.record = record
+        # targets can't be connected to separately, they share the pipe
+        self.flatten_sessions = flatten_sessions or pipe
+        self.command_timeout = command_timeout
+        self.reconnect_policy = reconnect_policy
         self._extensions = []
         # when using posix-ish operating system and running as root
         # you must use no_sandbox = True, which in case is corrected here
@@ -190,6 +230,9 @@ class Config:
             args.append("--headless=new")
         if not self.sandbox:
             args.append("--no-sandbox")
+        if self.pipe:
+            args.append("--remote-debugging-pipe")
+            return args
         if self.host:
             args.append("--remote-debugging-host=%s" % self.host)
         if self.port:
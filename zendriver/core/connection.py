@@ -2,27 +2,41 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import enum
+import functools
 import inspect
 import itertools
 import json
 import logging
+import math
 import sys
+import time
 import types
-from asyncio import iscoroutine, iscoroutinefunction
 from typing import (
     TYPE_CHECKING,
     Any,
     Awaitable,
     Callable,
+    Deque,
+    Dict,
     Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
     TypeVar,
     Union,
 )
 
 import websockets
+import websockets.exceptions
 
 from .. import cdp
 from . import util
+from .codec import Codec, get_codec
+from .metrics import Metrics, handler_name
+from .pipe import PipeClosedError, PipeTransport
+from .recorder import RECEIVED, SENT, Recorder
 
 if TYPE_CHECKING:
     from zendriver.core.browser import Browser
@@ -33,11 +47,97 @@ T = TypeVar("T")
 GLOBAL_DELAY = 0.005
 MAX_SIZE: int = 2**28
 PING_TIMEOUT: int = 900  # 15 minutes
+COMMAND_TIMEOUT: Optional[float] = 180
+HANDLER_QUEUE_SIZE: int = 1000
+# raised by the websocket or the pipe transport when it is closed
+TRANSPORT_CLOSED_ERRORS = (websockets.exceptions.ConnectionClosed, PipeClosedError)
 
 TargetType = Union[cdp.target.TargetInfo, cdp.target.TargetID]
 
 logger = logging.getLogger("uc.connection")
 
+# commands which set up state of the devtools session, which is lost when the
+# websocket is closed. when a reconnect policy is used, these are recorded when
+# they succeed, and replayed after reconnecting.
+# method => (state, True when the command sets the state or False when it clears it,
+#            param which tells apart multiple states of the same kind)
+# besides these, any <Domain>.enable and <Domain>.disable command is recorded.
+SESSION_STATE_COMMANDS: Dict[str, Tuple[str, bool, Optional[str]]] = {
+    "Browser.setDownloadBehavior": ("Browser.downloadBehavior", True, None),
+    "Emulation.setDeviceMetricsOverride": ("Emulation.deviceMetrics", True, None),
+    "Emulation.clearDeviceMetricsOverride": ("Emulation.deviceMetrics", False, None),
+    "Emulation.setEmulatedMedia": ("Emulation.emulatedMedia", True, None),
+    "Emulation.setGeolocationOverride": ("Emulation.geolocation", True, None),
+    "Emulation.clearGeolocationOverride": ("Emulation.geolocation", False, None),
+    "Emulation.setLocaleOverride": ("Emulation.locale", True, None),
+    "Emulation.setScriptExecutionDisabled": ("Emulation.scriptExecution", True, None),
+    "Emulation.setTimezoneOverride": ("Emulation.timezone", True, None),
+    "Emulation.setTouchEmulationEnabled": ("Emulation.touchEmulation", True, None),
+    "Emulation.setUserAgentOverride": ("Emulation.userAgent", True, None),
+    "Network.setBlockedURLs": ("Network.blockedURLs", True, None),
+    "Network.setBypassServiceWorker": ("Network.bypassServiceWorker", True, None),
+    "Network.setCacheDisabled": ("Network.cacheDisabled", True, None),
+    "Network.setExtraHTTPHeaders": ("Network.extraHTTPHeaders", True, None),
+    "Network.setUserAgentOverride": ("Network.userAgent", True, None),
+    "Page.addScriptToEvaluateOnNewDocument": ("Page.script", True, "identifier"),
+    "Page.removeScriptToEvaluateOnNewDocument": ("Page.script", False, "identifier"),
+    "Page.setBypassCSP": ("Page.bypassCSP", True, None),
+    "Page.setInterceptFileChooserDialog": ("Page.fileChooser", True, None),
+    "Page.setLifecycleEventsEnabled": ("Page.lifecycleEvents", True, None),
+    "Runtime.addBinding": ("Runtime.binding", True, "name"),
+    "Runtime.removeBinding": ("Runtime.binding", False, "name"),
+    "Target.setAutoAttach": ("Target.autoAttach", True, None),
+    "Target.setDiscoverTargets": ("Target.discoverTargets", True, None),
+}
+
+
+def _command(method: str, params: Optional[dict] = None) -> Generator[dict, dict, dict]:
+    """a command like the ones generated in the cdp package, returning the raw result"""
+    result = yield {"method": method, "params": params or {}}
+    return result
+
+
+def _session_state(method: str, params: dict) -> Optional[Tuple[Any, bool]]:
+    """
+    returns the key of the session state changed by the command and whether the command
+    sets or clears it, or None when the command doesn't change session state.
+    """
+    rule = SESSION_STATE_COMMANDS.get(method)
+    if rule is None:
+        domain, _, command = method.partition(".")
+        if command == "enable":
+            return domain, True
+        if command == "disable":
+            return domain, False
+        return None
+    state, is_set, param = rule
+    if param is None:
+        return state, is_set
+    # the identifier of an added script is only known from the response
+    return (state, params.get(param)), is_set
+
+
+# event class => event method, the reverse of cdp.util._event_parsers
+_event_methods: Dict[type, str] = {}
+
+
+def _event_method(event_type: type) -> Optional[str]:
+    """returns the protocol method name (eg. "Network.requestWillBeSent") of an event class"""
+    if len(_event_methods) != len(cdp.util._event_parsers):
+        _event_methods.clear()
+        _event_methods.update(
+            (cls, method) for method, cls in cdp.util._event_parsers.items()
+        )
+    return _event_methods.get(event_type)
+
+
+def _event_domain(method: str) -> Optional[types.ModuleType]:
+    """returns the cdp module of the domain of an event method, if any"""
+    event_type = cdp.util._event_parsers.get(method)
+    if event_type is not None:
+        return util.cdp_get_module(event_type.__module__)
+    return cdp.util.import_domain(method.split(".", 1)[0])
+
 
 class ProtocolException(Exception):
     def __init__(self, *args, **kwargs):  # real signature unknown
@@ -70,10 +170,101 @@ class ProtocolException(Exception):
         return f"{self.message} [code: {self.code}]" if self.code else f"{self.message}"
 
 
+class CommandTimeoutException(ProtocolException, asyncio.TimeoutError):
+    """raised when the browser didn't respond to a command in time"""
+
+    pass
+
+
+class ConnectionClosedException(ProtocolException):
+    """raised for commands which can't complete, because the connection is closed"""
+
+    pass
+
+
 class SettingClassVarNotAllowedException(PermissionError):
     pass
 
 
+class ReconnectPolicy:
+    """
+    tells a connection to reconnect when its websocket drops unexpectedly, instead of
+    failing all pending commands.
+
+    after reconnecting, the connection enables the domains it needs for its event
+    handlers again, and replays the commands which set up state of the devtools
+    session, like Fetch.enable, Page.addScriptToEvaluateOnNewDocument and
+    overrides (see :py:data:`SESSION_STATE_COMMANDS`). flattened sessions re-attach
+    to their targets and do the same.
+
+    .. code-block::
+
+        browser = await zendriver.start(reconnect_policy=ReconnectPolicy(max_attempts=10))
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff: float = 0.25,
+        max_backoff: float = 5.0,
+        factor: float = 2.0,
+        retry_in_flight: bool = False,
+    ):
+        """
+        :param max_attempts: number of times to try to reconnect before giving up
+        :param backoff: seconds to wait before the first attempt
+        :param max_backoff: maximum seconds to wait between attempts
+        :param factor: the wait time is multiplied by this after each attempt
+        :param retry_in_flight: when True, the commands which didn't get a response
+            before the websocket dropped are sent again after reconnecting.
+            when False, they fail with a ConnectionClosedException.
+            only enable this when resending commands is safe for your use.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.factor = factor
+        self.retry_in_flight = retry_in_flight
+
+    def delays(self) -> Iterator[float]:
+        """the seconds to wait before each attempt"""
+        delay = self.backoff
+        for _ in range(self.max_attempts):
+            yield delay
+            delay = min(delay * self.factor, self.max_backoff)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} max_attempts={self.max_attempts} "
+            f"backoff={self.backoff} retry_in_flight={self.retry_in_flight}>"
+        )
+
+
+class BackpressurePolicy(str, enum.Enum):
+    """
+    what happens to a new event when the queue of an event handler is full.
+    """
+
+    #: wait until the handler has room in its queue. this pauses reading from the
+    #: websocket while no command awaits its response. while one does, (eg. one sent by
+    #: the handler itself) up to maxsize more events are queued instead, so the responses
+    #: keep flowing. beyond that the oldest queued events are discarded, like with
+    #: DROP_OLDEST, and counted as dropped.
+    BLOCK = "block"
+    #: discard the new event
+    DROP_NEWEST = "drop-newest"
+    #: discard the oldest event in the queue
+    DROP_OLDEST = "drop-oldest"
+    #: keep only the newest queued event of each event type. a new event replaces
+    #: the queued event of the same type, instead of being added to the queue.
+    COALESCE = "coalesce"
+    #: no queue: the listener calls the handler itself, before it reads the next
+    #: message, so the handler has seen every event which arrived before the response
+    #: to a command. for quick regular functions, which must not block. an awaitable
+    #: returned by the handler is run in a task of its own.
+    INLINE = "inline"
+
+
 class Transaction(asyncio.Future):
     __cdp_obj__: Generator = None
 
@@ -81,6 +272,11 @@ class Transaction(asyncio.Future):
     params: dict = None
 
     id: int = None
+    session_id: Optional[str] = None
+    #: loop time after which the transaction fails with a CommandTimeoutException
+    deadline: Optional[float] = None
+    #: perf_counter() when the command was written, only set when collecting metrics
+    sent_at: Optional[float] = None
 
     def __init__(self, cdp_obj: Generator):
         """
@@ -88,16 +284,24 @@ class Transaction(asyncio.Future):
         """
         super().__init__()
         self.__cdp_obj__ = cdp_obj
-        self.connection = None
+        self.connection: Connection = None  # type: ignore[assignment]
 
         self.method, *params = next(self.__cdp_obj__).values()
         if params:
             params = params.pop()
         self.params = params
 
+    @property
+    def payload(self) -> dict:
+        """the protocol message of this transaction, to be encoded by the codec"""
+        payload = {"method": self.method, "params": self.params, "id": self.id}
+        if self.session_id:
+            payload["sessionId"] = self.session_id
+        return payload
+
     @property
     def message(self):
-        return json.dumps({"method": self.method, "params": self.params, "id": self.id})
+        return json.dumps(self.payload)
 
     @property
     def has_exception(self):
@@ -116,7 +320,9 @@ class Transaction(asyncio.Future):
         :param response:
         :return:
         """
-
+        if self.done():
+            # eg. cancelled by the caller while the command was in flight
+            return
         if "error" in response:
             # set exception and bail out
             return self.set_exception(ProtocolException(response["error"]))
@@ -126,7 +332,16 @@ class Transaction(asyncio.Future):
         except StopIteration as e:
             # exception value holds the parsed response
             return self.set_result(e.value)
-        raise ProtocolException("could not parse the cdp response:\n%s" % response)
+        except Exception as e:
+            logger.debug("could not parse the cdp response", exc_info=True)
+            return self.set_exception(
+                ProtocolException(
+                    "could not parse the cdp response (%r):\n%s" % (e, response)
+                )
+            )
+        self.set_exception(
+            ProtocolException("could not parse the cdp response:\n%s" % response)
+        )
 
     def __repr__(self):
         success = False if (self.done() and self.has_exception) else True
@@ -143,29 +358,45 @@ class Transaction(asyncio.Future):
         return fmt
 
 
-class EventTransaction(Transaction):
-    event = None
-    value = None
+class HandlerRegistry(collections.defaultdict):
+    """
+    mapping of event type => list of handlers, which keeps a version number that
+    is bumped whenever an event type is added or removed. this allows the connection
+    to only reconcile the enabled domains when the set of event types changes.
+    """
 
-    def __init__(self, event_object):
-        try:
-            super().__init__(None)
-        except Exception:
-            pass
-        self.set_result(event_object)
-        self.event = self.value = self.result()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
 
-    def __repr__(self):
-        status = "finished"
-        success = False if self.exception() else True
-        event_object = self.result()
-        fmt = (
-            f"{self.__class__.__name__}\n\t"
-            f"event: {event_object.__class__.__module__}.{event_object.__class__.__name__}\n\t"
-            f"status: {status}\n\t"
-            f"success: {success}>"
-        )
-        return fmt
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
 
 
 class CantTouchThis(type):
@@ -189,7 +420,7 @@ class CantTouchThis(type):
 
 class Connection(metaclass=CantTouchThis):
     attached: bool = None
-    websocket: websockets.WebSocketClientProtocol
+    websocket: Optional[Union[websockets.WebSocketClientProtocol, PipeTransport]]
     _target: cdp.target.TargetInfo
 
     def __init__(
@@ -197,20 +428,68 @@ class Connection(metaclass=CantTouchThis):
         websocket_url: str,
         target: cdp.target.TargetInfo = None,
         _owner: Browser = None,
+        _parent: Optional[Connection] = None,
+        _transport: Optional[PipeTransport] = None,
         **kwargs,
     ):
         super().__init__()
+        # when a transport is given, it is used instead of connecting a websocket
+        # to websocket_url. it can't be reopened once it is closed.
+        self._transport = _transport
+        # when a parent is given, this connection is a lightweight view on a
+        # flattened session (Target.attachToTarget(flatten=True)) which shares
+        # the websocket, listener and id counter of the parent connection.
+        self._parent = _parent
+        self.session_id: Optional[cdp.target.SessionID] = None
+        self.sessions: Dict[cdp.target.SessionID, Connection] = {}
+        self._attach_lock: Optional[asyncio.Lock] = None
         self._target = target
         self._cdp_id_generator = itertools.count(0)
         self._owner = _owner
         self.websocket_url: str = websocket_url
         self.websocket = None
         self.mapper = {}
-        self.handlers = collections.defaultdict(list)
+        self.handlers = HandlerRegistry(list)
         self.recv_task = None
         self.enabled_domains = []
+        # version of self.handlers for which the domains were last enabled
+        self._handlers_version: Optional[int] = None
+        self._handler_policies: Dict[Callable, tuple] = {}
+        self._handler_workers: Dict[Callable, HandlerWorker] = {}
+        self._handler_workers_version: Optional[int] = None
+        # event method => [event type, typed handlers, raw handlers]
+        self._subscriptions: Dict[str, list] = {}
+        self._subscriptions_version: Optional[int] = None
         self._last_result = []
         self.listener: Listener = None
+        #: json codec used to encode commands and decode received messages
+        self.codec: Codec = get_codec()
+        #: default number of seconds to wait for the response to a command, None to wait forever
+        self.command_timeout: Optional[float] = COMMAND_TIMEOUT
+        if _owner is not None and getattr(_owner, "config", None):
+            self.command_timeout = getattr(
+                _owner.config, "command_timeout", COMMAND_TIMEOUT
+            )
+        self._reaper: Optional[asyncio.TimerHandle] = None
+        #: when set, the connection reconnects when its websocket drops
+        self.reconnect_policy: Optional[ReconnectPolicy] = None
+        if _owner is not None and getattr(_owner, "config", None):
+            self.reconnect_policy = getattr(_owner.config, "reconnect_policy", None)
+        self._reconnect_task: Optional[asyncio.Task] = None
+        # state => (method, params) of the recorded session state commands
+        self._session_state: Dict[Any, Tuple[str, dict]] = {}
+        # script identifiers given to the user => the current identifiers, which
+        # change when the scripts are added again after reconnecting
+        self._script_ids: Dict[str, str] = {}
+        #: protocol metrics, collected when set. flattened sessions use the
+        #: metrics of their parent.
+        self.metrics: Optional[Metrics] = None
+        if _parent is not None:
+            self.metrics = _parent.metrics
+        elif _owner is not None and getattr(_owner.config, "metrics", False):
+            self.metrics = Metrics(self)
+        #: when set, the messages of this connection are written to the recording
+        self.recorder: Optional[Recorder] = getattr(_owner, "recorder", None)
         self.__dict__.update(**kwargs)
 
     @property
@@ -228,14 +507,31 @@ class Connection(metaclass=CantTouchThis):
 
     @property
     def closed(self):
+        if self._parent is not None:
+            return not self.session_id or self._parent.closed
         if not self.websocket:
             return True
-        return (not self.websocket)
+        return not self.websocket
+
+    @property
+    def is_session(self) -> bool:
+        """
+        True when this connection is a flattened session multiplexed over the
+        websocket of its parent connection, instead of having its own websocket.
+        """
+        return self._parent is not None
+
+    @property
+    def _root(self) -> Connection:
+        """the connection which owns the websocket this connection talks over"""
+        return self._parent if self._parent is not None else self
 
     def add_handler(
         self,
-        event_type_or_domain: Union[type, types.ModuleType],
+        event_type_or_domain: Union[type, types.ModuleType, str],
         handler: Union[Callable, Awaitable],
+        policy: Union[BackpressurePolicy, str] = BackpressurePolicy.BLOCK,
+        maxsize: int = HANDLER_QUEUE_SIZE,
     ):
         """
         add a handler for given event
@@ -253,35 +549,185 @@ class Connection(metaclass=CantTouchThis):
 
         the next time you make network traffic you will see your console print like crazy.
 
-        :param event_type_or_domain:
-        :type event_type_or_domain:
+        if event_type_or_domain is a protocol method name instead, the handler receives the raw
+        message (a dict with "method" and "params") instead of a parsed event object. this skips
+        parsing the event altogether, and works for events zendriver doesn't know about as well:
+
+        .. code-block::
+
+            page.add_handler("Network.requestWillBeSent", lambda message: print(message["params"]["request"]["url"]))
+
+        events are only parsed when a handler for the event type is registered, and
+        once for all handlers of that type.
+
+        each handler runs in its own task, fed by a queue of at most `maxsize` events, so a slow
+        handler doesn't hold up the responses to commands or the other handlers.
+        the `policy` decides what happens when a new event arrives while that queue is full.
+        for handlers which only care about the latest state, use drop-oldest or coalesce.
+        quick handlers which must have seen every event before the response to the next
+        command can run inline, in the listener itself:
+
+        .. code-block::
+
+            page.add_handler(cdp.network.RequestWillBeSent, slow_handler, policy="drop-oldest", maxsize=100)
+
+        :param event_type_or_domain: event type, cdp domain module or method name
+        :type event_type_or_domain: Union[type, types.ModuleType, str]
         :param handler:
         :type handler:
+        :param policy: what to do with new events when the queue of the handler is full
+        :type policy: BackpressurePolicy
+        :param maxsize: maximum number of queued events for this handler
+        :type maxsize: int
 
         :return:
         :rtype:
         """
+        policy = BackpressurePolicy(policy)
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._handler_policies[handler] = (policy, maxsize)
+        worker = self._handler_workers.get(handler)
+        if worker:
+            worker.configure(policy, maxsize)
         if isinstance(event_type_or_domain, types.ModuleType):
+            event_types = set(cdp.util._event_parsers.values())
             for name, obj in inspect.getmembers_static(event_type_or_domain):
-                if name.isupper():
-                    continue
-                if not name[0].isupper():
-                    continue
-                if type(obj) is type:
-                    continue
-                if inspect.isbuiltin(obj):
-                    continue
-                self.handlers[obj].append(handler)
+                if isinstance(obj, type) and obj in event_types:
+                    self.handlers[obj].append(handler)
             return
         self.handlers[event_type_or_domain].append(handler)
 
+    def remove_handlers(
+        self,
+        event_type: Optional[Union[type, str]] = None,
+        handler: Optional[Union[Callable, Awaitable]] = None,
+    ):
+        """
+        remove handlers for given event
+
+        when no event type is given, all handlers are removed.
+        when no handler is given, all handlers for the event type are removed.
+
+        :param event_type:
+        :type event_type:
+        :param handler:
+        :type handler:
+        """
+        if event_type is None:
+            if handler is not None:
+                raise ValueError("an event_type is required when handler is given")
+            self.handlers.clear()
+        elif handler is None:
+            self.handlers.pop(event_type, None)
+        else:
+            callbacks = self.handlers.get(event_type)
+            if callbacks and handler in callbacks:
+                callbacks.remove(handler)
+                if not callbacks:
+                    self.handlers.pop(event_type)
+        self._prune_handler_workers()
+
+    def handler_stats(self) -> Dict[Callable, Dict[str, Any]]:
+        """
+        returns the dispatch counters for each event handler which received events:
+        the policy, number of queued, processed and dropped events, and the number
+        of events for which the handler raised an exception.
+
+        :return:
+        :rtype: Dict[Callable, Dict[str, Any]]
+        """
+        return {
+            handler: worker.stats for handler, worker in self._handler_workers.items()
+        }
+
+    def _get_subscriptions(self) -> Dict[str, list]:
+        """
+        returns the subscription table, which maps the method name of an event to
+        [event type, typed handlers, raw handlers]. rebuilt when the handlers change.
+        """
+        if self.handlers.version == self._subscriptions_version:
+            return self._subscriptions
+        subscriptions: Dict[str, list] = {}
+        for key, callbacks in self.handlers.items():
+            if isinstance(key, str):
+                method = key
+            else:
+                method = _event_method(key)
+                if method is None:
+                    continue
+            subscription = subscriptions.setdefault(
+                method, [cdp.util._event_parsers.get(method), (), ()]
+            )
+            # the handler lists themselves are stored, so appending to
+            # them doesn't require a rebuild
+            subscription[1 if key is subscription[0] else 2] = callbacks
+        self._subscriptions = subscriptions
+        self._subscriptions_version = self.handlers.version
+        return subscriptions
+
+    def _get_handler_worker(self, handler: Callable) -> HandlerWorker:
+        """returns the worker for the given handler, starting it when needed"""
+        if self.handlers.version != self._handler_workers_version:
+            self._prune_handler_workers()
+        worker = self._handler_workers.get(handler)
+        if worker is None:
+            policy, maxsize = self._handler_policies.get(
+                handler, (BackpressurePolicy.BLOCK, HANDLER_QUEUE_SIZE)
+            )
+            worker = self._handler_workers[handler] = HandlerWorker(
+                self, handler, policy, maxsize
+            )
+        return worker
+
+    def _prune_handler_workers(self):
+        """stops the workers (and forgets the policies) of handlers which were removed"""
+        version = self.handlers.version
+        current = set()
+        for callbacks in self.handlers.values():
+            current.update(callbacks)
+        for handler in list(self._handler_workers):
+            if handler not in current:
+                self._handler_workers.pop(handler).stop()
+        for handler in list(self._handler_policies):
+            if handler not in current:
+                del self._handler_policies[handler]
+        self._handler_workers_version = version
+
+    def _stop_handler_workers(self):
+        for worker in self._handler_workers.values():
+            worker.stop()
+        self._handler_workers.clear()
+
     async def aopen(self, **kw):
         """
         opens the websocket connection. should not be called manually by users
         :param kw:
         :return:
         """
+        if self._parent is not None:
+            root = self._root
+            if root._reconnect_task:
+                # sessions are attached again once the websocket is back
+                await asyncio.shield(root._reconnect_task)
+            await self._attach()
+            return
+        if self.websocket and self.listener and self.listener.running:
+            return
+        if self._reconnect_task:
+            # the websocket dropped, and we are reconnecting
+            await asyncio.shield(self._reconnect_task)
+            if self.websocket and self.listener and self.listener.running:
+                return
+        if self.websocket and self.websocket.closed:
+            self.websocket = None
 
+        if not self.websocket and self._transport is not None:
+            if self._transport.closed:
+                raise ConnectionClosedException(
+                    "connection to %s is closed" % self.websocket_url
+                )
+            self.websocket = self._transport
         if not self.websocket:
             try:
                 self.websocket = await websockets.connect(
@@ -299,22 +745,106 @@ class Connection(metaclass=CantTouchThis):
             self.listener = Listener(self)
             logger.debug("\n✅  opened websocket connection to %s", self.websocket_url)
 
+        await self._prepare_connection()
+        await self._replay_session_state()
         # when a websocket connection is closed (either by error or on purpose)
         # and reconnected, the registered event listeners (if any), should be
         # registered again, so the browser sends those events
         await self._register_handlers()
 
+    async def _attach(self):
+        """
+        attaches to the target using a flattened session on the parent's websocket.
+        should not be called manually by users
+        """
+        if self.session_id:
+            return
+        if self._attach_lock is None:
+            self._attach_lock = asyncio.Lock()
+        async with self._attach_lock:
+            if self.session_id:
+                return
+            parent = self._parent
+            if parent is None:
+                return
+            session_id = await parent.send(
+                cdp.target.attach_to_target(self.target.target_id, flatten=True),
+                _is_update=True,
+            )
+            if not session_id:
+                return
+            self.session_id = session_id
+            parent.sessions[session_id] = self
+            logger.debug(
+                "\n✅  attached session %s to target %s",
+                session_id,
+                self.target.target_id,
+            )
+        await self._prepare_connection()
+        await self._replay_session_state()
+        # handlers added before attaching need their domains enabled
+        await self._register_handlers()
+
+    def _detached(self):
+        """
+        called when the session of this connection is gone (detached, or the
+        parent websocket was closed).
+        """
+        if self._parent is not None and self.session_id:
+            self._parent.sessions.pop(self.session_id, None)
+            if self._root.listener:
+                self._root.listener.forget(self.session_id)
+        self.session_id = None
+        self.enabled_domains.clear()
+        self._handlers_version = None
+        self._stop_handler_workers()
+        if self._parent is not None:
+            # commands sent over this session won't be answered anymore
+            mapper = self._parent.mapper
+            exc = ConnectionClosedException("session detached from target")
+            for tx_id, tx in list(mapper.items()):
+                if tx.connection is self:
+                    del mapper[tx_id]
+                    if not tx.done():
+                        tx.set_exception(exc)
+
     async def aclose(self):
         """
         closes the websocket connection. should not be called manually by users.
         """
+        if self._parent is not None:
+            session_id = self.session_id
+            if not session_id:
+                return
+            self._detached()
+            if not self._parent.closed:
+                try:
+                    await self._parent.send(
+                        cdp.target.detach_from_target(session_id=session_id),
+                        _is_update=True,
+                    )
+                except Exception:  # noqa
+                    logger.debug("could not detach session %s", session_id)
+            logger.debug("\n❌ detached session %s", session_id)
+            return
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        for session in list(self.sessions.values()):
+            session._detached()
+        self.sessions.clear()
+        self._stop_handler_workers()
         if self.websocket:
             if self.listener and self.listener.running:
                 self.listener.cancel()
                 self.enabled_domains.clear()
+                self._handlers_version = None
             await self.websocket.close()
             self.websocket = None
             logger.debug("\n❌ closed websocket connection to %s", self.websocket_url)
+        self._fail_transactions(
+            ConnectionClosedException("connection to %s closed" % self.websocket_url)
+        )
 
     async def sleep(self, t: Union[int, float] = 0.25):
         await self.update_target()
@@ -334,7 +864,13 @@ class Connection(metaclass=CantTouchThis):
         :return:
         :rtype:
         """
-        asyncio.ensure_future(self.send(cdp_obj))
+        task = asyncio.ensure_future(self.send(cdp_obj))
+        task.add_done_callback(self._log_feed_cdp_result)
+
+    @staticmethod
+    def _log_feed_cdp_result(task: asyncio.Future):
+        if not task.cancelled() and task.exception():
+            logger.warning("feed_cdp command failed: %s", task.exception())
 
     async def wait(self, t: Union[int, float] = None):
         """
@@ -349,13 +885,17 @@ class Connection(metaclass=CantTouchThis):
         await self.update_target()
         loop = asyncio.get_running_loop()
         start_time = loop.time()
+        listener = self._root.listener
         try:
+            # only the messages of this session count, not those of the other
+            # flattened sessions sharing the websocket
+            idle = listener.idle_state(self.session_id).idle
             if isinstance(t, (int, float)):
-                await asyncio.wait_for(self.listener.idle.wait(), timeout=t)
+                await asyncio.wait_for(idle.wait(), timeout=t)
                 while (loop.time() - start_time) < t:
                     await asyncio.sleep(0.1)
             else:
-                await self.listener.idle.wait()
+                await idle.wait()
         except asyncio.TimeoutError:
             if isinstance(t, (int, float)):
                 # explicit time is given, which is now passed
@@ -398,7 +938,10 @@ class Connection(metaclass=CantTouchThis):
         self.target = target_info
 
     async def send(
-        self, cdp_obj: Generator[dict[str, Any], dict[str, Any], Any], _is_update=False
+        self,
+        cdp_obj: Generator[dict[str, Any], dict[str, Any], Any],
+        _is_update=False,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         send a protocol command. the commands are made using any of the cdp.<domain>.<method>()'s
@@ -409,11 +952,107 @@ class Connection(metaclass=CantTouchThis):
         :param _is_update: internal flag
             prevents infinite loop by skipping the registeration of handlers
             when multiple calls to connection.send() are made
+        :param timeout: seconds to wait for the response, defaults to :py:attr:`command_timeout`.
+            use math.inf to wait forever.
+        :raises ProtocolException: when the browser returns an error for the command
+        :raises CommandTimeoutException: when the browser doesn't respond in time
+        :raises ConnectionClosedException: when the connection is closed before the response
         :return:
         """
         await self.aopen()
-        if not self.websocket:
-            return
+        root = self._root
+        if not root.websocket:
+            raise ConnectionClosedException(
+                "connection to %s is closed" % self.websocket_url
+            )
+        if not _is_update and self.handlers.version != self._handlers_version:
+            await self._register_handlers()
+        tx = self._create_transaction(cdp_obj, timeout, _record=not _is_update)
+        await self._write(tx)
+        try:
+            return await tx
+        except ProtocolException as e:
+            e.message = (e.message or "") + f"\ncommand:{tx.method}\nparams:{tx.params}"
+            raise e
+
+    async def send_many(
+        self,
+        *cdp_objs: Generator[dict[str, Any], dict[str, Any], Any],
+        return_exceptions: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        send multiple protocol commands at once. all commands are written to the
+        websocket back-to-back, before awaiting any of the responses (pipelining),
+        so sending N commands costs roughly one round trip instead of N.
+
+        the browser executes the commands in the order they are given, and the results
+        are returned in that same order.
+
+        .. code-block::
+
+            results = await tab.send_many(
+                cdp.input_.dispatch_key_event("char", text="a"),
+                cdp.input_.dispatch_key_event("char", text="b"),
+            )
+
+        :param cdp_objs: the generator objects created by cdp methods
+        :param return_exceptions: when True (default), a command which fails does not
+            raise, but its exception is returned in place of its result.
+            when False, the first exception (in command order) is raised after all
+            commands have completed.
+        :param timeout: seconds to wait for each response, defaults to :py:attr:`command_timeout`
+        :return: list of results, in the same order as the commands
+        """
+        if not cdp_objs:
+            return []
+        await self.aopen()
+        root = self._root
+        if not root.websocket:
+            raise ConnectionClosedException(
+                "connection to %s is closed" % self.websocket_url
+            )
+        if self.handlers.version != self._handlers_version:
+            await self._register_handlers()
+        txs = [self._create_transaction(cdp_obj, timeout) for cdp_obj in cdp_objs]
+        try:
+            await self._write(*txs)
+        except ConnectionClosedException:
+            # the transactions have failed with this exception, which is
+            # returned or raised below like any other error
+            pass
+
+        results = await asyncio.gather(*txs, return_exceptions=True)
+        for tx, result in zip(txs, results):
+            if isinstance(result, ProtocolException):
+                result.message = (
+                    result.message or ""
+                ) + f"\ncommand:{tx.method}\nparams:{tx.params}"
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return results
+
+    def pipeline(self) -> Pipeline:
+        """
+        returns a :py:class:`Pipeline` which collects commands and sends them all at once
+        using :py:meth:`send_many` when the context exits.
+
+        .. code-block::
+
+            async with tab.pipeline() as pipe:
+                for key, value in items.items():
+                    pipe.send(cdp.dom_storage.set_dom_storage_item(storage_id, key, value))
+            print(pipe.results)
+
+        :return:
+        :rtype: Pipeline
+        """
+        return Pipeline(self)
+
+    async def _prepare_connection(self):
+        """runs the one-time preparations needed after the connection is opened"""
         if self._owner:
             browser = self._owner
             if browser.config:
@@ -421,23 +1060,308 @@ class Connection(metaclass=CantTouchThis):
                     await self._prepare_expert()
                 if browser.config.headless:
                     await self._prepare_headless()
-        if not self.listener or not self.listener.running:
-            self.listener = Listener(self)
+
+    def _create_transaction(
+        self,
+        cdp_obj: Generator[dict[str, Any], dict[str, Any], Any],
+        timeout: Optional[float] = None,
+        _record: bool = True,
+    ) -> Transaction:
+        """creates a transaction for the given command and registers it for its response"""
+        root = self._root
+        tx = Transaction(cdp_obj)
+        tx.connection = self
+        if _record and root.reconnect_policy is not None:
+            # remember commands which set up the session, to replay them on reconnect
+            state = _session_state(tx.method, tx.params or {})
+            if state is not None:
+                key, is_set = state
+                tx.add_done_callback(
+                    functools.partial(
+                        self._record_state, key, is_set, tx.method, tx.params
+                    )
+                )
+                if not is_set and isinstance(key, tuple) and key[1] in self._script_ids:
+                    # the script was added again after a reconnect, under a new identifier
+                    tx.params = dict(tx.params, identifier=self._script_ids[key[1]])
+        tx.id = next(root._cdp_id_generator)
+        tx.session_id = self.session_id
+        if timeout is None:
+            timeout = self.command_timeout
+        if timeout is not None and timeout != math.inf:
+            tx.deadline = asyncio.get_running_loop().time() + timeout
+            if root._reaper is None or tx.deadline < root._reaper.when():
+                root._schedule_reaper(tx.deadline)
+        root.mapper[tx.id] = tx
+        if root.listener:
+            # a command awaiting its response means we are not idle
+            root.listener.activity(self.session_id)
+        return tx
+
+    async def _write(self, *txs: Transaction):
+        """
+        encodes the transactions and writes them to the websocket.
+        a transaction which can't be encoded fails with the exception of the codec, the
+        others are sent. when writing fails, the connection is closed and
+        ConnectionClosedException is raised.
+        """
+        root = self._root
+        dumps = root.codec.dumps
+        if root.websocket is None:
+            raise ConnectionClosedException(
+                "connection to %s is closed" % root.websocket_url
+            )
+        send = root.websocket.send
+        metrics = root.metrics
+        recorder = root.recorder
+        # the devtools websocket server only handles text frames, so the encoded
+        # bytes are sent as str. the pipe transport takes the bytes as they are.
+        text = root._transport is None
         try:
-            tx = Transaction(cdp_obj)
-            tx.connection = self
-            tx.id = next(self._cdp_id_generator)
-            self.mapper.update({tx.id: tx})
-            if not _is_update:
-                await self._register_handlers()
-            await self.websocket.send(tx.message)
+            for tx in txs:
+                try:
+                    data = dumps(tx.payload)
+                except Exception as e:
+                    root.mapper.pop(tx.id, None)
+                    if not tx.done():
+                        tx.set_exception(e)
+                    continue
+                if metrics is not None:
+                    metrics.record_sent(len(data))
+                    tx.sent_at = time.perf_counter()
+                if recorder is not None:
+                    recorder.record(root.websocket_url, SENT, data)
+                await send(data.decode() if text else data)
+        except TRANSPORT_CLOSED_ERRORS as e:
+            policy = root.reconnect_policy
+            if policy is not None and policy.retry_in_flight:
+                task = root._reconnect_task
+                if task is None:
+                    # the listener notices the drop as well, and the reconnect
+                    # sends these transactions again
+                    return
+                # the reconnect already took the in-flight transactions,
+                # so wait for it and send these ourselves
+                for tx in txs:
+                    root.mapper.pop(tx.id, None)
+                await asyncio.shield(task)
+                if root.websocket is not None:
+                    for tx in txs:
+                        tx.session_id = tx.connection.session_id
+                        root.mapper[tx.id] = tx
+                    await self._write(*txs)
+                    return
+            exc = ConnectionClosedException(
+                "connection to %s closed: %s" % (root.websocket_url, e)
+            )
+            for tx in txs:
+                root.mapper.pop(tx.id, None)
+                if not tx.done():
+                    tx.set_exception(exc)
+            if policy is None:
+                await root.aclose()
+            raise exc from e
+
+    def _record_state(
+        self, key: Any, is_set: bool, method: str, params: dict, tx: Transaction
+    ):
+        """records a succeeded session state command, see :py:data:`SESSION_STATE_COMMANDS`"""
+        if tx.cancelled() or tx.exception() is not None:
+            return
+        if isinstance(key, tuple) and key[1] is None:
+            result = tx.result()
+            identifier = result["identifier"] if isinstance(result, dict) else result
+            key = (key[0], str(identifier))
+        # re-inserted, so the state is replayed in the order it was last changed
+        self._session_state.pop(key, None)
+        if is_set:
+            self._session_state[key] = (method, params)
+        elif isinstance(key, tuple):
+            self._script_ids.pop(key[1], None)
+
+    async def _replay_session_state(self):
+        """
+        sends the recorded session state commands again, after (re)connecting.
+        these are pipelined, and errors are logged, since the state may not apply
+        to the target anymore.
+        """
+        if not self._session_state:
+            return
+        items = list(self._session_state.items())
+        txs = [
+            self._create_transaction(_command(method, params), _record=False)
+            for _, (method, params) in items
+        ]
+        try:
+            await self._write(*txs)
+        except ConnectionClosedException:
+            return
+        results = await asyncio.gather(*txs, return_exceptions=True)
+        for (key, (method, _)), result in zip(items, results):
+            if isinstance(result, BaseException):
+                logger.debug("could not restore %s: %s", method, result)
+            elif isinstance(key, tuple) and "identifier" in result:
+                self._script_ids[key[1]] = result["identifier"]
+        logger.debug("restored %d session state commands", len(items))
+
+    async def _reconnect(self, in_flight: List[Transaction]):
+        """
+        reconnects the websocket after it dropped, according to the
+        :py:attr:`reconnect_policy`, and restores the sessions on it.
+
+        :param in_flight: transactions to send again after reconnecting
+        """
+        policy = self.reconnect_policy
+        if policy is None:
+            return
+        for attempt, delay in enumerate(policy.delays(), 1):
+            await asyncio.sleep(delay)
             try:
-                return await tx
+                self.websocket = await websockets.connect(
+                    self.websocket_url,
+                    ping_timeout=PING_TIMEOUT,
+                    max_size=MAX_SIZE,
+                )
+                break
+            except (Exception,) as e:
+                logger.debug(
+                    "reconnect attempt %d to %s failed: %s",
+                    attempt,
+                    self.websocket_url,
+                    e,
+                )
+        else:
+            logger.warning(
+                "could not reconnect to %s after %d attempts",
+                self.websocket_url,
+                policy.max_attempts,
+            )
+            self._reconnect_task = None
+            exc = ConnectionClosedException(
+                "connection to %s closed, reconnecting failed" % self.websocket_url
+            )
+            for tx in in_flight:
+                if not tx.done():
+                    tx.set_exception(exc)
+            for session in list(self.sessions.values()):
+                session._detached()
+            self.sessions.clear()
+            self._fail_transactions(exc)
+            self.websocket = None
+            return
+        logger.debug("\n✅  reconnected to %s", self.websocket_url)
+        self.listener = Listener(self)
+        self.enabled_domains.clear()
+        self._handlers_version = None
+        # from here on, the pending commands of aopen() can go
+        self._reconnect_task = None
+        await self._replay_session_state()
+        await self._register_handlers()
+
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        for session in sessions:
+            # the handler workers keep running, only the session is new
+            session.session_id = None
+            session.enabled_domains.clear()
+            session._handlers_version = None
+            try:
+                await session._attach()
             except ProtocolException as e:
-                e.message += f"\ncommand:{tx.method}\nparams:{tx.params}"
-                raise e
-        except Exception:
-            await self.aclose()
+                logger.debug("could not re-attach to %s: %s", session.target, e)
+                session._detached()
+
+        txs = []
+        for tx in sorted(in_flight, key=lambda tx: tx.id):
+            if tx.done():
+                continue
+            if tx.connection is not self and tx.connection.session_id is None:
+                tx.set_exception(ConnectionClosedException("session lost on reconnect"))
+                continue
+            tx.session_id = tx.connection.session_id
+            self.mapper[tx.id] = tx
+            txs.append(tx)
+            if tx.deadline is not None and (
+                self._reaper is None or tx.deadline < self._reaper.when()
+            ):
+                self._schedule_reaper(tx.deadline)
+        if txs:
+            logger.debug("sending %d in-flight commands again", len(txs))
+            try:
+                await self._write(*txs)
+            except ConnectionClosedException:
+                pass
+
+    def _connection_lost(self):
+        """
+        called by the listener when the websocket dropped. fails the pending
+        transactions, or reconnects when there is a :py:attr:`reconnect_policy`.
+        """
+        exc = ConnectionClosedException("connection to %s closed" % self.websocket_url)
+        policy = self.reconnect_policy
+        if policy is None or self.websocket is None or self._transport is not None:
+            # a pipe can't be reconnected, the browser is gone
+            self._fail_transactions(exc)
+            return
+        in_flight = []
+        if policy.retry_in_flight:
+            if self._reaper:
+                self._reaper.cancel()
+                self._reaper = None
+            in_flight = list(self.mapper.values())
+            self.mapper = {}
+        else:
+            self._fail_transactions(exc)
+        if self._reconnect_task is None:
+            logger.debug("connection to %s dropped, reconnecting", self.websocket_url)
+            self._reconnect_task = asyncio.ensure_future(self._reconnect(in_flight))
+
+    def _schedule_reaper(self, when: float):
+        if self._reaper:
+            self._reaper.cancel()
+        self._reaper = asyncio.get_running_loop().call_at(when, self._reap_transactions)
+
+    def _reap_transactions(self):
+        """
+        fails and evicts the transactions which passed their deadline, so a target
+        which never answers doesn't leave commands waiting forever.
+        a single timer is used, which runs at the earliest deadline of the pending
+        transactions, so the scan only happens when something may have expired.
+        """
+        self._reaper = None
+        now = asyncio.get_running_loop().time()
+        next_deadline = None
+        for tx_id, tx in list(self.mapper.items()):
+            if tx.deadline is None:
+                continue
+            if tx.deadline > now and not tx.done():
+                if next_deadline is None or tx.deadline < next_deadline:
+                    next_deadline = tx.deadline
+                continue
+            self.mapper.pop(tx_id, None)
+            if not tx.done():
+                if self.metrics is not None:
+                    self.metrics.record_failure(tx.method)
+                logger.debug("command %s (id %d) timed out", tx.method, tx_id)
+                tx.set_exception(
+                    CommandTimeoutException(
+                        "no response to %s within the timeout" % tx.method
+                    )
+                )
+        if next_deadline is not None:
+            self._schedule_reaper(next_deadline)
+
+    def _fail_transactions(self, exc: Exception):
+        """fails all pending transactions with the given exception"""
+        if self._reaper:
+            self._reaper.cancel()
+            self._reaper = None
+        mapper, self.mapper = self.mapper, {}
+        for tx in mapper.values():
+            if not tx.done():
+                if self.metrics is not None:
+                    self.metrics.record_failure(tx.method)
+                tx.set_exception(exc)
 
     #
     async def _register_handlers(self):
@@ -445,7 +1369,17 @@ class Connection(metaclass=CantTouchThis):
         ensure that for current (event) handlers, the corresponding
         domain is enabled in the protocol.
 
+        this only does work when the handlers changed since the last
+        time it ran, so it is cheap to call.
         """
+        if self.handlers.version == self._handlers_version:
+            return
+        for event_type in [k for k, v in self.handlers.items() if not v]:
+            self.handlers.pop(event_type)
+        # read after pruning, which bumps the version, but before awaiting anything:
+        # handlers added while the domains are enabled make it run again
+        version = self.handlers.version
+        failed = False
         # save a copy of current enabled domains in a variable
         # domains will be removed from this variable
         # if it is still needed according to the set handlers
@@ -454,11 +1388,13 @@ class Connection(metaclass=CantTouchThis):
         enabled_domains = self.enabled_domains.copy()
         for event_type in self.handlers.copy():
             domain_mod = None
-            if len(self.handlers[event_type]) == 0:
-                self.handlers.pop(event_type)
+            if not self.handlers.get(event_type):
+                # removed while a domain was being enabled
                 continue
             if isinstance(event_type, type):
                 domain_mod = util.cdp_get_module(event_type.__module__)
+            elif isinstance(event_type, str):
+                domain_mod = _event_domain(event_type)
             if domain_mod in self.enabled_domains:
                 # at this point, the domain is being used by a handler
                 # so remove that domain from temp variable 'enabled_domains' if present
@@ -469,6 +1405,9 @@ class Connection(metaclass=CantTouchThis):
                 if domain_mod in (cdp.target, cdp.storage):
                     # by default enabled
                     continue
+                if not hasattr(domain_mod, "enable"):
+                    # domain sends its events without being enabled
+                    continue
                 try:
                     # we add this before sending the request, because it will
                     # loop indefinite
@@ -479,6 +1418,7 @@ class Connection(metaclass=CantTouchThis):
 
                 except:  # noqa - as broad as possible, we don't want an error before the "actual" request is sent
                     logger.debug("", exc_info=True)
+                    failed = True
                     try:
                         self.enabled_domains.remove(domain_mod)
                     except:  # noqa
@@ -491,6 +1431,9 @@ class Connection(metaclass=CantTouchThis):
             # temp variable when we registered it or saw handlers for it.
             # items still present at this point are unused and need removal
             self.enabled_domains.remove(ed)
+        if not failed:
+            # a failed domain is retried on the next send
+            self._handlers_version = version
 
     async def _prepare_headless(self):
         if getattr(self, "_prep_headless_done", None):
@@ -504,8 +1447,9 @@ class Connection(metaclass=CantTouchThis):
                 allow_unsafe_eval_blocked_by_csp=True,
             )
         )
-        if response and response.value:
-            ua = response.value
+        # evaluate returns (remote object, exception details)
+        if response and response[0].value:
+            ua = response[0].value
             await self._send_oneshot(
                 cdp.network.set_user_agent_override(
                     user_agent=ua.replace("Headless", ""),
@@ -532,11 +1476,8 @@ class Connection(metaclass=CantTouchThis):
         setattr(self, "_prep_expert_done", True)
 
     async def _send_oneshot(self, cdp_obj):
-        tx = Transaction(cdp_obj)
-        tx.connection = self
-        tx.id = -2
-        self.mapper.update({tx.id: tx})
-        await self.websocket.send(tx.message)
+        tx = self._create_transaction(cdp_obj)
+        await self._write(tx)
         try:
             # in try except since if browser connection sends this it reises an exception
             return await tx
@@ -544,6 +1485,309 @@ class Connection(metaclass=CantTouchThis):
             pass
 
 
+class Pipeline:
+    """
+    collects commands which are sent at once using :py:meth:`Connection.send_many`.
+    create one using :py:meth:`Connection.pipeline`.
+    """
+
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.results: List[Any] = []
+        self._cdp_objs: List[Generator[dict[str, Any], dict[str, Any], Any]] = []
+
+    def send(self, cdp_obj: Generator[dict[str, Any], dict[str, Any], Any]) -> int:
+        """
+        queue a command. it is sent when the pipeline is flushed.
+
+        :param cdp_obj: the generator object created by a cdp method
+        :return: the index of the command's result in :py:attr:`results`
+        """
+        self._cdp_objs.append(cdp_obj)
+        return len(self.results) + len(self._cdp_objs) - 1
+
+    async def flush(self, return_exceptions: bool = True) -> List[Any]:
+        """
+        send all queued commands and wait for their results.
+
+        :return: the results of the commands which were flushed
+        """
+        cdp_objs, self._cdp_objs = self._cdp_objs, []
+        results = await self.connection.send_many(
+            *cdp_objs, return_exceptions=return_exceptions
+        )
+        self.results.extend(results)
+        return results
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.flush()
+
+
+class HandlerWorker:
+    """
+    runs an event handler in its own task, fed by a bounded queue of events.
+    created by the connection when the handler receives its first event.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        handler: Callable,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        maxsize: int = HANDLER_QUEUE_SIZE,
+    ):
+        self.connection = connection
+        self.handler = handler
+        self.policy = BackpressurePolicy(policy)
+        self.maxsize = maxsize
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self._queue: Deque[Any] = collections.deque()
+        # used by the coalesce policy: event type => newest event
+        self._latest: Dict[type, Any] = {}
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._stopped = False
+        self.task: asyncio.Task = asyncio.create_task(self._run())
+
+    @property
+    def pending(self) -> int:
+        """number of queued events"""
+        return (
+            len(self._latest)
+            if self.policy is BackpressurePolicy.COALESCE
+            else len(self._queue)
+        )
+
+    @property
+    def idle(self) -> bool:
+        """
+        True when no events are queued. a handler which is running doesn't count, as
+        it could be waiting for the connection to become idle itself.
+        """
+        return not self._queue and not self._latest
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy.value,
+            "pending": self.pending,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+    def configure(self, policy: BackpressurePolicy, maxsize: int):
+        """changes the policy and size of the queue, keeping the queued events"""
+        events = list(self._latest.values()) + list(self._queue)
+        self._latest.clear()
+        self._queue.clear()
+        self.policy = BackpressurePolicy(policy)
+        self.maxsize = maxsize
+        self._not_full.set()
+        for event in events:
+            self.put(event)
+
+    def put(self, event: Any, force: bool = False) -> bool:
+        """
+        queues an event according to the policy.
+
+        :param force: queue the event even when the queue is full and the policy is to
+            block, up to twice the maximum size, beyond which the oldest event is discarded
+        :return: False when the queue is full and the policy is to block, in which case
+            the event is not queued.
+        """
+        if self._stopped:
+            return True
+        if self.policy is BackpressurePolicy.INLINE:
+            self._handle_inline(event)
+            return True
+        if self.policy is BackpressurePolicy.COALESCE:
+            # raw messages are coalesced per method
+            event_type = event["method"] if type(event) is dict else type(event)
+            if event_type in self._latest:
+                # replaces the queued event, but keeps its place in line
+                self._latest[event_type] = event
+                self.dropped += 1
+                return True
+            if len(self._latest) >= self.maxsize:
+                del self._latest[next(iter(self._latest))]
+                self.dropped += 1
+            self._latest[event_type] = event
+        elif len(self._queue) >= self.maxsize:
+            if self.policy is BackpressurePolicy.BLOCK:
+                if force:
+                    if len(self._queue) >= 2 * self.maxsize:
+                        if not self.dropped:
+                            logger.warning(
+                                "the queue of %s overflowed while commands were "
+                                "pending, discarding its oldest events",
+                                handler_name(self.handler),
+                            )
+                        self._queue.popleft()
+                        self.dropped += 1
+                    self._queue.append(event)
+                    self._not_empty.set()
+                    return True
+                self._not_full.clear()
+                return False
+            self.dropped += 1
+            if self.policy is BackpressurePolicy.DROP_NEWEST:
+                return True
+            self._queue.popleft()
+            self._queue.append(event)
+        else:
+            self._queue.append(event)
+        self._not_empty.set()
+        return True
+
+    async def wait_not_full(self):
+        """waits until the queue has room for another event, or until woken"""
+        await self._not_full.wait()
+
+    def wake(self):
+        """ends wait_not_full, eg. because a command awaits its response"""
+        self._not_full.set()
+
+    def stop(self):
+        """stops the worker. queued events are discarded."""
+        self._stopped = True
+        self._queue.clear()
+        self._latest.clear()
+        self._not_full.set()
+        if self.task is not asyncio.current_task():
+            self.task.cancel()
+
+    def _get(self) -> Any:
+        if self._latest:
+            return self._latest.pop(next(iter(self._latest)))
+        return self._queue.popleft()
+
+    async def _run(self):
+        connection = self.connection
+        handler = self.handler
+        while not self._stopped:
+            if not self._queue and not self._latest:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+            event = self._get()
+            self._not_full.set()
+            metrics = connection._root.metrics
+            if metrics is not None:
+                started = time.perf_counter()
+            try:
+                result = self._call(event)
+                if inspect.isawaitable(result):
+                    await result
+                self.processed += 1
+                if metrics is not None:
+                    metrics.record_handler(
+                        handler_name(handler), time.perf_counter() - started
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._failed(event, e)
+
+    def _handle_inline(self, event: Any):
+        metrics = self.connection._root.metrics
+        if metrics is not None:
+            started = time.perf_counter()
+        try:
+            result = self._call(event)
+            if inspect.isawaitable(result):
+                # the listener doesn't wait for it
+                asyncio.ensure_future(result)
+            self.processed += 1
+            if metrics is not None:
+                metrics.record_handler(
+                    handler_name(self.handler), time.perf_counter() - started
+                )
+        except Exception as e:
+            self._failed(event, e)
+
+    def _call(self, event: Any) -> Any:
+        try:
+            return self.handler(event, self.connection)
+        except TypeError:
+            return self.handler(event)
+
+    def _failed(self, event: Any, e: Exception):
+        self.errors += 1
+        logger.warning(
+            "exception in callback %s for event %s => %s",
+            self.handler,
+            event.__class__.__name__,
+            e,
+            exc_info=True,
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.handler} {self.stats}>"
+
+
+class IdleState:
+    """
+    the idle state of one session of a listener: of the connection of the websocket, or of
+    a flattened session over it. the session is idle when none of its messages were received
+    for `time_before_considered_idle` seconds, none of its commands are awaiting a response
+    and its event handlers have processed all events, so a busy tab doesn't keep the other
+    tabs sharing the websocket from being idle.
+    """
+
+    def __init__(self, listener: Listener, session_id: Optional[str]):
+        self.listener = listener
+        self.session_id = session_id
+        self.idle = asyncio.Event()
+        # idle is tracked by a single timer, which is only rescheduled when it fires,
+        # instead of a timeout per received message
+        self._last_activity = listener._loop.time()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def touch(self):
+        """marks the session as busy"""
+        self._last_activity = self.listener._loop.time()
+        if self.idle.is_set():
+            self.idle.clear()
+        if self._timer is None and self.listener.running:
+            self.schedule()
+
+    def schedule(self):
+        self._timer = self.listener._loop.call_at(
+            self._last_activity + self.listener._time_before_considered_idle,
+            self._check,
+        )
+
+    def cancel(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _check(self):
+        """timer callback"""
+        self._timer = None
+        listener = self.listener
+        if not listener.running:
+            return
+        now = listener._loop.time()
+        if now - self._last_activity < listener._time_before_considered_idle:
+            # messages came in since the timer was scheduled
+            self.schedule()
+            return
+        if listener._busy(self.session_id):
+            self._last_activity = now
+            self.schedule()
+            return
+        self.idle.set()
+
+
 class Listener:
     def __init__(self, connection: Connection):
         self.connection = connection
@@ -565,11 +1809,37 @@ class Listener:
 
         is_interactive = getattr(sys, "ps1", sys.flags.interactive)
         self._time_before_considered_idle = 0.10 if not is_interactive else 0.75
-        self.idle = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        # the idle state of the connection of the websocket (None), and of each of the
+        # flattened sessions over it, by session id
+        self._idle_states: Dict[Optional[str], IdleState] = {}
+        # the worker whose full queue pauses reading, see _dispatch
+        self._blocked_by: Optional[HandlerWorker] = None
         self.run()
 
     def run(self):
         self.task = asyncio.create_task(self.listener_loop())
+        self.idle_state(None)
+
+    @property
+    def idle(self) -> asyncio.Event:
+        """set when the connection of the websocket is idle, see :py:class:`IdleState`"""
+        return self.idle_state(None).idle
+
+    def idle_state(self, session_id: Optional[str]) -> IdleState:
+        """the idle state of the messages of a session, None for the websocket itself"""
+        state = self._idle_states.get(session_id)
+        if state is None:
+            state = self._idle_states[session_id] = IdleState(self, session_id)
+            if self.running:
+                state.schedule()
+        return state
+
+    def forget(self, session_id: Optional[str]):
+        """forgets the idle state of a session which is gone"""
+        state = self._idle_states.pop(session_id, None)
+        if state is not None:
+            state.cancel()
 
     @property
     def time_before_considered_idle(self):
@@ -582,6 +1852,35 @@ class Listener:
     def cancel(self):
         if self.task and not self.task.cancelled():
             self.task.cancel()
+        for state in self._idle_states.values():
+            state.cancel()
+
+    def activity(self, session_id: Optional[str] = None):
+        """marks a session as busy, eg. because a command is sent over it"""
+        self.idle_state(session_id).touch()
+        if self._blocked_by is not None:
+            # a command awaits its response, so reading must go on
+            self._blocked_by.wake()
+
+    def _busy(self, session_id: Optional[str] = None) -> bool:
+        """
+        True when commands of a session are awaiting a response, or events of the session
+        are waiting for a handler. the commands and handlers of the other sessions over
+        the websocket don't count.
+        """
+        connection = self.connection
+        for tx in connection.mapper.values():
+            if tx.session_id == session_id and not tx.done():
+                return True
+        if session_id is not None:
+            session = connection.sessions.get(cdp.target.SessionID(session_id))
+            if session is None:
+                return False
+            connection = session
+        for worker in connection._handler_workers.values():
+            if not worker.idle:
+                return True
+        return False
 
     @property
     def running(self):
@@ -592,17 +1891,15 @@ class Listener:
         return True
 
     async def listener_loop(self):
+        idle_states = self._idle_states
         while True:
+            websocket = self.connection.websocket
+            if websocket is None:
+                # the connection was closed while the previous message was handled
+                break
             try:
-                msg = await asyncio.wait_for(
-                    self.connection.websocket.recv(), self.time_before_considered_idle
-                )
-            except asyncio.TimeoutError:
-                self.idle.set()
-                # breathe
-                # await asyncio.sleep(self.time_before_considered_idle / 10)
-                continue
-            except (websockets.exceptions.ConnectionClosedError,) as e:
+                msg = await websocket.recv()
+            except TRANSPORT_CLOSED_ERRORS as e:
                 logger.debug(
                     "connection listener exception while reading websocket:\n%s", e
                 )
@@ -619,10 +1916,38 @@ class Listener:
                 # break this loop
                 break
 
-            # since we are at this point, we are not "idle" anymore.
-            self.idle.clear()
-
-            message = json.loads(msg)
+            message: Dict[str, Any]
+            try:
+                message = self.connection.codec.loads(msg)
+            except ValueError:
+                # orjson and msgspec reject lone surrogates (eg. "\ud800"), which
+                # the browser sends for the strings of pages. the json module accepts them.
+                try:
+                    message = json.loads(msg)
+                except ValueError:
+                    logger.warning("could not decode a message: %.200r", msg)
+                    continue
+            if not isinstance(message, dict):
+                logger.warning("received a message which is not an object: %.200r", msg)
+                continue
+            # since we are at this point, the session of the message is not "idle" anymore.
+            session_id = message.get("sessionId")
+            idle_state = idle_states.get(session_id)
+            if idle_state is None:
+                idle_state = self.idle_state(session_id)
+            idle_state.touch()
+            metrics = self.connection.metrics
+            if metrics is not None:
+                # the websocket gives text frames as str, count their utf-8 bytes
+                # (isascii() is a flag check, so ascii frames aren't encoded)
+                if isinstance(msg, str) and not msg.isascii():
+                    metrics.record_received(len(msg.encode()))
+                else:
+                    metrics.record_received(len(msg))
+            if self.connection.recorder is not None:
+                self.connection.recorder.record(
+                    self.connection.websocket_url, RECEIVED, msg
+                )
             if "id" in message:
                 # response to our command
                 if message["id"] in self.connection.mapper:
@@ -632,23 +1957,45 @@ class Listener:
                     # pop to prevent memory leaks
                     tx = self.connection.mapper.pop(message["id"])
                     logger.debug("got answer for %s (message_id:%d)", tx, message["id"])
+                    if metrics is not None and tx.sent_at is not None:
+                        metrics.record_response(
+                            tx.method,
+                            time.perf_counter() - tx.sent_at,
+                            "error" in message,
+                        )
 
                     # complete the transaction, which is a Future object
                     # and thus will return to anyone awaiting it.
                     tx(**message)
-                else:
-                    if message["id"] == -2:
-                        tx = self.connection.mapper.get(-2)
-                        if tx:
-                            tx(**message)
-                        continue
             else:
                 # probably an event
+                connection = self.connection
+                method = message.get("method", "")
+                if metrics is not None:
+                    metrics.record_event(method)
+                if session_id is not None:
+                    # event belonging to a flattened session, dispatch it
+                    # on the connection representing that session
+                    connection = self.connection.sessions.get(session_id)
+                    if connection is None:
+                        continue
+                elif method == "Target.detachedFromTarget":
+                    detached = self.connection.sessions.get(
+                        message["params"]["sessionId"]
+                    )
+                    if detached is not None:
+                        detached._detached()
+                # events are only parsed when there is someone to receive them
+                subscription = connection._get_subscriptions().get(method)
+                if subscription is None:
+                    continue
+                event_type, typed_callbacks, raw_callbacks = subscription
+                if raw_callbacks:
+                    await self._dispatch(connection, raw_callbacks, message)
+                if not typed_callbacks:
+                    continue
                 try:
-                    event = cdp.util.parse_json_event(message)
-                    event_tx = EventTransaction(event)
-                    event_tx.id = next(self.connection._cdp_id_generator)
-                    self.connection.mapper[event_tx.id] = event_tx
+                    event = event_type.from_json(message["params"])
                 except Exception as e:
                     logger.info(
                         "%s: %s  during parsing of json from event : %s"
@@ -656,43 +2003,31 @@ class Listener:
                         exc_info=True,
                     )
                     continue
-                except KeyError as e:
-                    logger.info("some lousy KeyError %s" % e, exc_info=True)
-                    continue
-                try:
-                    if type(event) in self.connection.handlers:
-                        callbacks = self.connection.handlers[type(event)]
-                    else:
-                        continue
-                    if not len(callbacks):
-                        continue
-                    for callback in callbacks:
-                        try:
-                            if iscoroutinefunction(callback) or iscoroutine(callback):
-                                try:
-                                    await callback(event, self.connection)
-                                except TypeError:
-                                    await callback(event)
-                            else:
-                                try:
-                                    callback(event, self.connection)
-                                except TypeError:
-                                    callback(event)
-                        except Exception as e:
-                            logger.warning(
-                                "exception in callback %s for event %s => %s",
-                                callback,
-                                event.__class__.__name__,
-                                e,
-                                exc_info=True,
-                            )
-                            raise
-                except asyncio.CancelledError:
-                    break
-                except Exception:
-                    raise
+                await self._dispatch(connection, typed_callbacks, event)
                 continue
 
+        # the websocket is gone, so no responses will arrive anymore
+        self.connection._connection_lost()
+
+    async def _dispatch(self, connection: Connection, callbacks: List, event: Any):
+        # handlers run on their own worker task, so the listener
+        # can continue reading responses while they are busy.
+        for callback in tuple(callbacks):
+            worker = connection._get_handler_worker(callback)
+            while not worker.put(event):
+                # queue is full and the policy is to block. reading is only paused
+                # while no command awaits its response, or the response would never
+                # arrive (eg. when the handler itself sends a command). the overflow
+                # is bounded by put(force=True).
+                if self.connection.mapper:
+                    worker.put(event, force=True)
+                    break
+                self._blocked_by = worker
+                try:
+                    await worker.wait_not_full()
+                finally:
+                    self._blocked_by = None
+
     def __repr__(self):
         s_idle = "[idle]" if self.idle.is_set() else "[busy]"
         s_cache_length = f"[cache size: {len(self.history)}]"
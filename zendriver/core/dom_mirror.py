@@ -0,0 +1,245 @@
+"""
+a local copy of the document of a tab, fetched once with ``DOM.getDocument(-1, True)`` and
+kept current by applying the DOM events, so the query helpers of the tab don't fetch the
+whole document again for every call.
+
+the mirror is opt-in per tab:
+
+.. code-block::
+
+    await tab.enable_dom_mirror()
+    links = await tab.select_all("a")  # no DOM.getDocument
+    ...
+    await tab.disable_dom_mirror()
+
+while the mirror is enabled, don't send ``DOM.getDocument`` or ``DOM.disable`` yourself:
+the browser assigns new node ids on every ``DOM.getDocument``, and stops sending the events
+the mirror needs after ``DOM.disable``. use :py:meth:`DOMMirror.get_document` instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, List, Optional, Set
+
+from .. import cdp
+from .connection import BackpressurePolicy
+from .node_index import NodeIndex
+
+if TYPE_CHECKING:
+    from .tab import Tab
+
+logger = logging.getLogger(__name__)
+
+#: the events which change the document
+EVENTS = (
+    cdp.dom.DocumentUpdated,
+    cdp.dom.SetChildNodes,
+    cdp.dom.ChildNodeInserted,
+    cdp.dom.ChildNodeRemoved,
+    cdp.dom.ChildNodeCountUpdated,
+    cdp.dom.AttributeModified,
+    cdp.dom.AttributeRemoved,
+    cdp.dom.CharacterDataModified,
+    cdp.dom.ShadowRootPushed,
+    cdp.dom.ShadowRootPopped,
+)
+
+
+class DOMMirror:
+    """
+    the document of a tab and its :py:class:`~zendriver.core.node_index.NodeIndex`,
+    updated by the DOM events of the tab.
+
+    all events go to a single handler, which the listener runs inline (see
+    :py:attr:`~zendriver.core.connection.BackpressurePolicy.INLINE`), so they are applied
+    in the order they arrived, and before the response to any later command is
+    received: a query which follows a command sees the changes the command made.
+    the document is fetched again when it is needed after ``DOM.documentUpdated``
+    (eg. a navigation) or after the connection reconnected. events which arrive while
+    the document is being fetched are applied to the new document once it is there;
+    events about nodes of an earlier document refer to node ids it doesn't have, and
+    are ignored.
+    """
+
+    def __init__(self, tab: Tab):
+        self.tab = tab
+        #: the mirrored document, None until it is fetched or after it was replaced
+        self.document: Optional[cdp.dom.Node] = None
+        #: the index of the mirrored document
+        self.index: Optional[NodeIndex] = None
+        self._handler = self._on_event
+        self._lock = asyncio.Lock()
+        # events which arrived while the document was fetched
+        self._buffer: Optional[List[Any]] = None
+        # identifies the protocol session the node ids of the document belong to
+        self._session: Any = None
+        self._requests: Set[asyncio.Future] = set()
+
+    async def start(self):
+        """starts receiving the DOM events and fetches the document"""
+        for event_type in EVENTS:
+            self.tab.add_handler(
+                event_type, self._handler, policy=BackpressurePolicy.INLINE
+            )
+        await self.get_document()
+
+    async def stop(self):
+        """stops receiving the DOM events and forgets the document"""
+        for event_type in EVENTS:
+            self.tab.remove_handlers(event_type, self._handler)
+        for request in self._requests:
+            request.cancel()
+        self._requests.clear()
+        self.document = None
+        self.index = None
+
+    async def get_document(self) -> cdp.dom.Node:
+        """returns the current document, fetching it when needed"""
+        async with self._lock:
+            if self.document is None or self._session != self._current_session():
+                return await self._fetch()
+            return self.document
+
+    def node(self, node_id: Optional[cdp.dom.NodeId]) -> Optional[cdp.dom.Node]:
+        """returns the node of the mirrored document with the node id, or None"""
+        if self.document is None or self.index is None:
+            return None
+        if node_id == self.document.node_id:
+            return self.document
+        return self.index.node(node_id)
+
+    def _current_session(self) -> Any:
+        # a reconnect replaces the listener, attaching to a target changes the session
+        return self.tab._root.listener, self.tab.session_id
+
+    async def _fetch(self) -> cdp.dom.Node:
+        self._buffer = []
+        try:
+            document = await self.tab.send(cdp.dom.get_document(-1, True))
+            self.document = document
+            self.index = NodeIndex(document)
+            self._session = self._current_session()
+            for event in self._buffer:
+                self._apply(event)
+        finally:
+            self._buffer = None
+        return document
+
+    def _on_event(self, event: Any):
+        if self._buffer is not None:
+            self._buffer.append(event)
+        else:
+            self._apply(event)
+
+    def _apply(self, event: Any):
+        if self.document is None or self.index is None:
+            return
+        index = self.index
+        if isinstance(event, cdp.dom.DocumentUpdated):
+            # fetched again when it is needed
+            self.document = None
+            self.index = None
+        elif isinstance(event, cdp.dom.SetChildNodes):
+            parent = self.node(event.parent_id)
+            if parent is None:
+                return
+            for child in parent.children or ():
+                index.remove(child)
+            parent.children = event.nodes
+            parent.child_node_count = len(event.nodes)
+            for child in event.nodes:
+                index.add(child, parent)
+                self._request_children(child)
+        elif isinstance(event, cdp.dom.ChildNodeInserted):
+            parent = self.node(event.parent_node_id)
+            if parent is None:
+                return
+            children = parent.children if parent.children is not None else []
+            position = 0
+            if event.previous_node_id:
+                for i, child in enumerate(children):
+                    if child.node_id == event.previous_node_id:
+                        position = i + 1
+                        break
+            children.insert(position, event.node)
+            parent.children = children
+            parent.child_node_count = len(children)
+            if event.node.parent_id is None:
+                event.node.parent_id = parent.node_id
+            index.add(event.node, parent)
+            self._request_children(event.node)
+        elif isinstance(event, cdp.dom.ChildNodeRemoved):
+            parent = self.node(event.parent_node_id)
+            node = index.node(event.node_id)
+            if parent is None or node is None:
+                return
+            if parent.children:
+                parent.children = [c for c in parent.children if c is not node]
+                parent.child_node_count = len(parent.children)
+            index.remove(node)
+        elif isinstance(event, cdp.dom.ChildNodeCountUpdated):
+            node = self.node(event.node_id)
+            if node is None:
+                return
+            node.child_node_count = event.child_node_count
+            self._request_children(node)
+        elif isinstance(event, cdp.dom.AttributeModified):
+            node = self.node(event.node_id)
+            if node is None:
+                return
+            attributes = node.attributes if node.attributes is not None else []
+            for i in range(0, len(attributes), 2):
+                if attributes[i] == event.name:
+                    attributes[i + 1] = event.value
+                    break
+            else:
+                attributes.extend((event.name, event.value))
+            node.attributes = attributes
+        elif isinstance(event, cdp.dom.AttributeRemoved):
+            node = self.node(event.node_id)
+            if node is None or not node.attributes:
+                return
+            attributes = node.attributes
+            for i in range(0, len(attributes), 2):
+                if attributes[i] == event.name:
+                    del attributes[i : i + 2]
+                    break
+        elif isinstance(event, cdp.dom.CharacterDataModified):
+            node = self.node(event.node_id)
+            if node is not None:
+                node.node_value = event.character_data
+        elif isinstance(event, cdp.dom.ShadowRootPushed):
+            host = self.node(event.host_id)
+            if host is None:
+                return
+            host.shadow_roots = (host.shadow_roots or []) + [event.root]
+            index.add(event.root, host)
+        elif isinstance(event, cdp.dom.ShadowRootPopped):
+            host = self.node(event.host_id)
+            root = index.node(event.root_id)
+            if host is None or root is None:
+                return
+            if host.shadow_roots:
+                host.shadow_roots = [r for r in host.shadow_roots if r is not root]
+            index.remove(root)
+
+    def _request_children(self, node: cdp.dom.Node):
+        """
+        the browser sends inserted nodes without their children,
+        ask for them when the node has any; they arrive as DOM.setChildNodes
+        """
+        if node.children is not None or not node.child_node_count:
+            return
+        request = asyncio.ensure_future(
+            self.tab.send(cdp.dom.request_child_nodes(node.node_id, -1, True))
+        )
+        self._requests.add(request)
+        request.add_done_callback(self._request_done)
+
+    def _request_done(self, request: asyncio.Future):
+        self._requests.discard(request)
+        if not request.cancelled() and request.exception() is not None:
+            # eg. the node was removed in the meantime
+            logger.debug("could not request child nodes: %s", request.exception())
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import pathlib
-import secrets
 import typing
 
 from . import util
 from ._contradict import ContraDict
 from .config import PathLike
+from .node_index import NodeIndex
 from .. import cdp
 
 logger = logging.getLogger(__name__)
@@ -18,7 +17,13 @@ if typing.TYPE_CHECKING:
     from .tab import Tab
 
 
-def create(node: cdp.dom.Node, tab: Tab, tree: typing.Optional[cdp.dom.Node] = None):
+def create(
+    node: cdp.dom.Node,
+    tab: Tab,
+    tree: typing.Optional[cdp.dom.Node] = None,
+    index: typing.Optional[NodeIndex] = None,
+    parent: typing.Optional[Element] = None,
+):
     """
     factory for Elements
     this is used with Tab.query_selector(_all), since we already have the tree,
@@ -31,15 +36,27 @@ def create(node: cdp.dom.Node, tab: Tab, tree: typing.Optional[cdp.dom.Node] = N
     :param tree: [Optional] the full node tree to which <node> belongs, enhances performance.
                 when not provided, you need to call `await elem.update()` before using .children / .parent
     :type tree:
+    :param index: [Optional] the index of <tree>, shared by the elements created from the same tree.
+                when not provided, it is built when first needed.
+    :type index: NodeIndex
+    :param parent: [Optional] the parent element, for elements created without <tree>.
+    :type parent: Element
     """
 
-    elem = Element(node, tab, tree)
+    elem = Element(node, tab, tree, index, parent)
 
     return elem
 
 
 class Element:
-    def __init__(self, node: cdp.dom.Node, tab: Tab, tree: cdp.dom.Node = None):
+    def __init__(
+        self,
+        node: cdp.dom.Node,
+        tab: Tab,
+        tree: cdp.dom.Node = None,
+        index: typing.Optional[NodeIndex] = None,
+        parent: typing.Optional[Element] = None,
+    ):
         """
         Represents an (HTML) DOM Element
 
@@ -56,8 +73,9 @@ class Element:
         # else:
         self._node = node
         self._tree = tree
-        self._parent = None
-        self._remote_object = None
+        self._index = index
+        self._parent = parent
+        self._remote_object: typing.Optional[cdp.runtime.RemoteObject] = None
         self._attrs = ContraDict(silent=True)
         self._make_attrs()
 
@@ -241,9 +259,7 @@ class Element:
     async def remove_from_dom(self):
         """removes the element from dom"""
         await self.update()  # ensure we have latest node_id
-        node = util.filter_recurse(
-            self._tree, lambda node: node.backend_node_id == self.backend_node_id
-        )
+        node = self._node_index().backend_node(self.backend_node_id)
         if node:
             await self.tab.send(cdp.dom.remove_node(node.node_id))
         # self._tree = util.remove_from_tree(self.tree, self.node)
@@ -277,16 +293,16 @@ class Element:
             # self._children.clear()
             self._parent = None
         else:
-            doc = await self._tab.send(cdp.dom.get_document(-1, True))
+            doc = await self._tab._get_document()
             self._parent = None
         # if self.node_name != "IFRAME":
-        updated_node = util.filter_recurse(
-            doc, lambda n: n.backend_node_id == self._node.backend_node_id
-        )
+        index = self._tab._node_index(doc)
+        updated_node = index.backend_node(self._node.backend_node_id)
         if updated_node:
             logger.debug("node seems changed, and has now been updated.")
             self._node = updated_node
         self._tree = doc
+        self._index = index
 
         self._remote_object = await self._tab.send(
             cdp.dom.resolve_node(backend_node_id=self._node.backend_node_id)
@@ -294,13 +310,13 @@ class Element:
         self.attrs.clear()
         self._make_attrs()
         if self.node_name != "IFRAME":
-            parent_node = util.filter_recurse(
-                doc, lambda n: n.node_id == self.node.parent_id
-            )
+            parent_node = index.node(self.node.parent_id)
             if not parent_node:
                 # could happen if node is for example <html>
                 return self
-            self._parent = create(parent_node, tab=self._tab, tree=self._tree)
+            self._parent = create(
+                parent_node, tab=self._tab, tree=self._tree, index=index
+            )
         return self
 
     @property
@@ -315,6 +331,13 @@ class Element:
     @tree.setter
     def tree(self, tree: cdp.dom.Node):
         self._tree = tree
+        self._index = None
+
+    def _node_index(self) -> NodeIndex:
+        """the index of the tree, built on first use unless shared by the creator"""
+        if self._index is None:
+            self._index = self._tab._node_index(self._tree)
+        return self._index
 
     @property
     def attrs(self):
@@ -333,13 +356,15 @@ class Element:
         :rtype:
         """
         if not self.tree:
+            # the document at the top of the ancestors of Tab.find_elements_by_text
+            if self._parent is not None or self.node_type == 9:
+                return self._parent
             raise RuntimeError("could not get parent since the element has no tree set")
-        parent_node = util.filter_recurse(
-            self.tree, lambda n: n.node_id == self.parent_id
-        )
+        index = self._node_index()
+        parent_node = index.node(self.parent_id)
         if not parent_node:
             return None
-        parent_element = create(parent_node, tab=self._tab, tree=self.tree)
+        parent_element = create(parent_node, tab=self._tab, tree=self.tree, index=index)
         return parent_element
 
     @property
@@ -368,22 +393,22 @@ class Element:
         elif not self.node.child_node_count:
             return []
         if self.node.children:
+            index = self._node_index() if self.tree is not None else None
             for child in self.node.children:
-                child_elem = create(child, self._tab, self.tree)
+                child_elem = create(child, self._tab, self.tree, index)
                 if child_elem:
                     _children.append(child_elem)
         return _children
 
     @property
-    def remote_object(self) -> cdp.runtime.RemoteObject:
+    def remote_object(self) -> typing.Optional[cdp.runtime.RemoteObject]:
         return self._remote_object
 
     @property
-    def object_id(self) -> cdp.runtime.RemoteObjectId:
-        try:
-            return self.remote_object.object_id
-        except AttributeError:
-            pass
+    def object_id(self) -> typing.Optional[cdp.runtime.RemoteObjectId]:
+        if self.remote_object is None:
+            return None
+        return self.remote_object.object_id
 
     async def click(self):
         """
@@ -392,15 +417,16 @@ class Element:
         :return:
         :rtype:
         """
-        self._remote_object = await self._tab.send(
+        resolved: cdp.runtime.RemoteObject = await self._tab.send(
             cdp.dom.resolve_node(backend_node_id=self.backend_node_id)
         )
-        arguments = [cdp.runtime.CallArgument(object_id=self._remote_object.object_id)]
+        self._remote_object = resolved
+        arguments = [cdp.runtime.CallArgument(object_id=resolved.object_id)]
         await self.flash(0.25)
         await self._tab.send(
             cdp.runtime.call_function_on(
                 "(el) => el.click()",
-                object_id=self._remote_object.object_id,
+                object_id=resolved.object_id,
                 arguments=arguments,
                 await_promise=True,
                 user_gesture=True,
@@ -409,21 +435,28 @@ class Element:
         )
 
     async def get_js_attributes(self):
-        return ContraDict(
-            json.loads(
-                await self.apply(
-                    """
-            function (e) {
-                let o = {}
-                for(let k in e){
-                    o[k] = e[k]
+        # in the main world: the properties set by the scripts of the page are not
+        # visible from the isolated world
+        resolved: cdp.runtime.RemoteObject = await self._tab.send(
+            cdp.dom.resolve_node(backend_node_id=self.backend_node_id)
+        )
+        self._remote_object = resolved
+        remote_object, _ = await self._tab.send(
+            cdp.runtime.call_function_on(
+                """
+            function () {
+                const attributes = {};
+                for (const k in this) {
+                    attributes[k] = this[k];
                 }
-                return JSON.stringify(o)
+                return JSON.stringify(attributes);
             }
-            """
-                )
+            """,
+                object_id=resolved.object_id,
+                return_by_value=True,
             )
         )
+        return ContraDict(json.loads(remote_object.value or "{}"))
 
     def __await__(self):
         return self.update().__await__()
@@ -455,18 +488,17 @@ class Element:
         :return:
         :rtype:
         """
-        self._remote_object = await self._tab.send(
+        resolved: cdp.runtime.RemoteObject = await self._tab.send(
             cdp.dom.resolve_node(backend_node_id=self.backend_node_id)
         )
+        self._remote_object = resolved
         result: typing.Tuple[
             cdp.runtime.RemoteObject, typing.Any
         ] = await self._tab.send(
             cdp.runtime.call_function_on(
                 js_function,
-                object_id=self._remote_object.object_id,
-                arguments=[
-                    cdp.runtime.CallArgument(object_id=self._remote_object.object_id)
-                ],
+                object_id=resolved.object_id,
+                arguments=[cdp.runtime.CallArgument(object_id=resolved.object_id)],
                 return_by_value=True,
                 user_gesture=True,
             )
@@ -486,7 +518,7 @@ class Element:
             # await self.update()
         try:
             quads = await self.tab.send(
-                cdp.dom.get_content_quads(object_id=self.remote_object.object_id)
+                cdp.dom.get_content_quads(object_id=self.object_id)
             )
             if not quads:
                 raise Exception("could not find position for %s " % self)
@@ -533,29 +565,26 @@ class Element:
 
         logger.debug("clicking on location %.2f, %.2f" % center)
 
-        await asyncio.gather(
-            self._tab.send(
-                cdp.input_.dispatch_mouse_event(
-                    "mousePressed",
-                    x=center[0],
-                    y=center[1],
-                    modifiers=modifiers,
-                    button=cdp.input_.MouseButton(button),
-                    buttons=buttons,
-                    click_count=1,
-                )
+        await self._tab.send_many(
+            cdp.input_.dispatch_mouse_event(
+                "mousePressed",
+                x=center[0],
+                y=center[1],
+                modifiers=modifiers,
+                button=cdp.input_.MouseButton(button),
+                buttons=buttons,
+                click_count=1,
             ),
-            self._tab.send(
-                cdp.input_.dispatch_mouse_event(
-                    "mouseReleased",
-                    x=center[0],
-                    y=center[1],
-                    modifiers=modifiers,
-                    button=cdp.input_.MouseButton(button),
-                    buttons=buttons,
-                    click_count=1,
-                )
+            cdp.input_.dispatch_mouse_event(
+                "mouseReleased",
+                x=center[0],
+                y=center[1],
+                modifiers=modifiers,
+                button=cdp.input_.MouseButton(button),
+                buttons=buttons,
+                click_count=1,
             ),
+            return_exceptions=False,
         )
         try:
             await self.flash()
@@ -656,15 +685,17 @@ class Element:
                 for i in range(steps + 1)
             ]
 
-            for point in pathway:
-                await self._tab.send(
+            await self._tab.send_many(
+                *(
                     cdp.input_.dispatch_mouse_event(
                         "mouseMoved",
                         x=point[0],
                         y=point[1],
                     )
-                )
-                await asyncio.sleep(0)
+                    for point in pathway
+                ),
+                return_exceptions=False,
+            )
 
         await self._tab.send(
             cdp.input_.dispatch_mouse_event(
@@ -702,10 +733,10 @@ class Element:
         :return: None
         """
         await self.apply("(elem) => elem.focus()")
-        [
-            await self._tab.send(cdp.input_.dispatch_key_event("char", text=char))
-            for char in list(text)
-        ]
+        await self._tab.send_many(
+            *(cdp.input_.dispatch_key_event("char", text=char) for char in text),
+            return_exceptions=False,
+        )
 
     async def send_file(self, *file_paths: PathLike):
         """
@@ -893,15 +924,6 @@ class Element:
         :return:
         :rtype:
         """
-        from .connection import ProtocolException
-
-        if not self.remote_object:
-            try:
-                self._remote_object = await self.tab.send(
-                    cdp.dom.resolve_node(backend_node_id=self.backend_node_id)
-                )
-            except ProtocolException:
-                return
         try:
             pos = await self.get_position()
 
@@ -920,51 +942,7 @@ class Element:
             pos.center[1] - 8,
             duration,
         )
-        script = (
-            """
-            (targetElement) => {{
-                var css = document.styleSheets[0];
-                for( let css of [...document.styleSheets]) {{
-                    try {{
-                        css.insertRule(`
-                        @keyframes show-pointer-ani {{
-                              0% {{ opacity: 1; transform: scale(2, 2);}}
-                              25% {{ transform: scale(5,5) }}
-                              50% {{ transform: scale(3, 3);}}
-                              75%: {{ transform: scale(2,2) }}
-                              100% {{ transform: scale(1, 1); opacity: 0;}}
-                        }}`,css.cssRules.length);
-                        break;
-                    }} catch (e) {{
-                        console.log(e)
-                    }}
-                }};
-                var _d = document.createElement('div');
-                _d.style = `{0:s}`;
-                _d.id = `{1:s}`;
-                document.body.insertAdjacentElement('afterBegin', _d);
-                                
-                setTimeout( () => document.getElementById('{1:s}').remove(), {2:d});
-            }}
-            """.format(
-                style,
-                secrets.token_hex(8),
-                int(duration * 1000),
-            )
-            .replace("  ", "")
-            .replace("\n", "")
-        )
-
-        arguments = [cdp.runtime.CallArgument(object_id=self._remote_object.object_id)]
-        await self._tab.send(
-            cdp.runtime.call_function_on(
-                script,
-                object_id=self._remote_object.object_id,
-                arguments=arguments,
-                await_promise=True,
-                user_gesture=True,
-            )
-        )
+        await self._tab.isolated_world.call("flash", style, int(duration * 1000))
 
     async def highlight_overlay(self):
         """
@@ -977,7 +955,7 @@ class Element:
         if getattr(self, "_is_highlighted", False):
             del self._is_highlighted
             await self.tab.send(cdp.overlay.hide_highlight())
-            await self.tab.send(cdp.dom.disable())
+            await self.tab._disable_dom()
             await self.tab.send(cdp.overlay.disable())
             return
         await self.tab.send(cdp.dom.enable())
@@ -1032,52 +1010,18 @@ class Element:
             )
         )
         await self("pause")
-        await self.apply(
-            """
-            function extractVid(vid) {{
-                    
-                      var duration = {duration:.1f}; 
-                      var stream = vid.captureStream();
-                      var mr = new MediaRecorder(stream, {{audio:true, video:true}})
-                      mr.ondataavailable  = function(e) {{
-                          vid['_recording'] = false
-                          var blob = e.data;
-                          f = new File([blob], {{name: {filename}, type:'octet/stream'}});
-                          var objectUrl = URL.createObjectURL(f);
-                          var link = document.createElement('a');
-                          link.setAttribute('href', objectUrl)
-                          link.setAttribute('download', {filename})
-                          link.style.display = 'none'
-
-                          document.body.appendChild(link)
-
-                          link.click()
-
-                          document.body.removeChild(link)
-                       }}
-                       
-                       mr.start()
-                       vid.addEventListener('ended' , (e) => mr.stop())
-                       vid.addEventListener('pause' , (e) => mr.stop())
-                       vid.addEventListener('abort', (e) => mr.stop())
-                       
-                       
-                       if ( duration ) {{ 
-                            setTimeout(() => {{ vid.pause(); vid.play() }}, duration);
-                       }}
-                       vid['_recording'] = true
-                  ;}}
-                
-            """.format(
-                filename=f'"{filename}"' if filename else 'document.title + ".mp4"',
-                duration=int(duration * 1000) if duration else 0,
-            )
+        await self._tab.isolated_world.call(
+            "recordVideo",
+            filename,
+            int(duration * 1000) if duration else 0,
+            element=self,
         )
         await self("play")
         await self._tab
 
     async def is_recording(self):
-        return await self.apply('(vid) => vid["_recording"]')
+        remote_object = await self._tab.isolated_world.call("isRecording", element=self)
+        return remote_object.value
 
     def _make_attrs(self):
         sav = None
@@ -1167,6 +1111,6 @@ async def resolve_node(tab: Tab, node_id: cdp.dom.NodeId):
     remote_obj: cdp.runtime.RemoteObject = await tab.send(
         cdp.dom.resolve_node(node_id=node_id)
     )
-    node_id: cdp.dom.NodeId = await tab.send(cdp.dom.request_node(remote_obj.object_id))
+    node_id = await tab.send(cdp.dom.request_node(remote_obj.object_id))
     node: cdp.dom.Node = await tab.send(cdp.dom.describe_node(node_id))
     return node
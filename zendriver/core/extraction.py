@@ -0,0 +1,218 @@
+"""
+extracts records from the page with a declarative schema, in the page itself.
+
+the schema is checked and completed in python, and sent as json to a single function of
+the library of :py:mod:`zendriver.core.isolated_world`, which queries the records and their
+fields and returns plain json: one round trip for all records of a page, instead of
+fetching the document and walking the elements from python.
+
+.. code-block::
+
+    products = await tab.extract(
+        {
+            "selector": ".product",
+            "fields": {
+                "title": "h2",
+                "url": {"selector": "a", "property": "href"},
+                "price": {"selector": ".price", "attribute": "data-amount"},
+                "description": {"selector": ".description", "html": True},
+                "tags": {"selector": ".tag", "all": True},
+                "variants": {
+                    "selector": ".variant",
+                    "all": True,
+                    "fields": {"name": ".name", "sku": {"attribute": "data-sku"}},
+                },
+            },
+        }
+    )
+
+a schema has the css ``selector`` of the elements of the records (without one, the whole
+document is the only record), and the ``fields`` of a record, by name. a field is a css
+selector, or a dict of:
+
+- ``selector``: the css selector of the element of the field, matched within the element of
+  the record like ``Element.querySelector``. without one, the element of the record itself.
+- ``attribute``: the value of this attribute of the element
+- ``property``: the value of this DOM property of the element (eg. "href", which is an
+  absolute url, "value" or "checked"), which should be json serializable
+- ``html``: when True, the inner html of the element
+- ``fields``: the fields of a nested record, with the element as its element
+- ``all``: when True, a list of the values of all matches of the selector
+
+by default the value of a field is the trimmed text content of the element. when its
+selector matches nothing, the value is None (or an empty list, with ``all``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+if typing.TYPE_CHECKING:
+    from .tab import Tab
+
+#: the keys of a field of a schema
+FIELD_KEYS = ("selector", "attribute", "property", "html", "fields", "all")
+
+#: the number of records of a batch of :py:func:`extract_batches`
+BATCH_SIZE = 1000
+
+SCRIPT = """
+(schema, start, count) => {
+    const value = (element, field) => {
+        if (field.fields !== null) return record(element, field.fields);
+        if (field.attribute !== null) return element.getAttribute(field.attribute);
+        if (field.property !== null) {
+            const value = element[field.property];
+            return value === undefined ? null : value;
+        }
+        if (field.html) return element.innerHTML;
+        return element.textContent.trim();
+    };
+    const record = (root, fields) => {
+        const result = {};
+        for (const [name, field] of Object.entries(fields)) {
+            if (field.all) {
+                const elements = field.selector === null
+                    ? [root] : root.querySelectorAll(field.selector);
+                result[name] = Array.from(elements, (element) => value(element, field));
+            } else {
+                const element = field.selector === null
+                    ? root : root.querySelector(field.selector);
+                result[name] = element === null ? null : value(element, field);
+            }
+        }
+        return result;
+    };
+    const roots = schema.selector === null
+        ? [document.documentElement] : document.querySelectorAll(schema.selector);
+    const end = count == null ? roots.length : Math.min(start + count, roots.length);
+    const records = [];
+    for (let i = start; i < end; i++) {
+        records.push(record(roots[i], schema.fields));
+    }
+    return records;
+}
+"""
+
+
+def compile_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    checks a schema, and returns it with all keys of every field, see
+    :py:mod:`zendriver.core.extraction`
+
+    :raises ValueError: when the schema is invalid
+    """
+    if not isinstance(schema, dict):
+        raise ValueError("a schema should be a dict, not %r" % (schema,))
+    unknown = set(schema) - {"selector", "fields"}
+    if unknown:
+        raise ValueError("unknown keys in schema: %s" % ", ".join(sorted(unknown)))
+    selector = schema.get("selector")
+    if selector is not None and not isinstance(selector, str):
+        raise ValueError("the selector of a schema should be a string")
+    return {"selector": selector, "fields": _compile_fields(schema.get("fields"), "")}
+
+
+def _compile_fields(fields: Any, path: str) -> Dict[str, Any]:
+    if not isinstance(fields, dict) or not fields:
+        raise ValueError(
+            "the fields of %s should be a non-empty dict"
+            % ("field %s" % path if path else "a schema")
+        )
+    return {
+        name: _compile_field(field, "%s.%s" % (path, name) if path else name)
+        for name, field in fields.items()
+    }
+
+
+def _compile_field(field: Any, path: str) -> Dict[str, Any]:
+    if isinstance(field, str):
+        field = {"selector": field}
+    if not isinstance(field, dict):
+        raise ValueError(
+            "field %s should be a css selector or a dict, not %r" % (path, field)
+        )
+    unknown = set(field) - set(FIELD_KEYS)
+    if unknown:
+        raise ValueError(
+            "unknown keys in field %s: %s" % (path, ", ".join(sorted(unknown)))
+        )
+    for key in ("selector", "attribute", "property"):
+        if field.get(key) is not None and not isinstance(field[key], str):
+            raise ValueError("the %s of field %s should be a string" % (key, path))
+    kinds = [
+        key for key in ("attribute", "property", "html", "fields") if field.get(key)
+    ]
+    if len(kinds) > 1:
+        raise ValueError("field %s can only have one of %s" % (path, ", ".join(kinds)))
+    fields = field.get("fields")
+    return {
+        "selector": field.get("selector"),
+        "attribute": field.get("attribute"),
+        "property": field.get("property"),
+        "html": bool(field.get("html")),
+        "fields": _compile_fields(fields, path) if fields is not None else None,
+        "all": bool(field.get("all")),
+    }
+
+
+async def extract(
+    tab: Tab,
+    schema: Dict[str, Any],
+    start: int = 0,
+    count: Optional[int] = None,
+    compiled: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    returns the records of <schema> in the page of <tab>
+
+    :param tab: the tab
+    :param schema: the schema, see :py:mod:`zendriver.core.extraction`
+    :param start: the index of the first record
+    :param count: the number of records at most, by default all
+    :param compiled: whether the schema was already compiled by :py:func:`compile_schema`
+    :raises ValueError: when the schema is invalid
+    :raises ProtocolException: when a selector is invalid
+    """
+    remote_object = await tab.isolated_world.call(
+        "extract", schema if compiled else compile_schema(schema), start, count
+    )
+    return remote_object.value or []
+
+
+async def extract_batches(
+    tab: Tab, schema: Dict[str, Any], batch_size: int = BATCH_SIZE
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    yields the records of <schema> in the page of <tab>, in batches of <batch_size>.
+    each batch is one round trip, and the next batch is fetched while the records of the
+    current one are processed.
+
+    the elements of the records are queried again for every batch, so records added to or
+    removed from the page in between shift the records of the following batches.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    compiled = compile_schema(schema)
+    pending = asyncio.ensure_future(extract(tab, compiled, 0, batch_size, True))
+    start = 0
+    try:
+        while True:
+            records = await pending
+            if len(records) < batch_size:
+                if records:
+                    yield records
+                return
+            start += len(records)
+            pending = asyncio.ensure_future(
+                extract(tab, compiled, start, batch_size, True)
+            )
+            yield records
+    finally:
+        if not pending.done():
+            pending.cancel()
+        elif not pending.cancelled():
+            # retrieved, when the iteration is stopped before the batch is awaited
+            pending.exception()
@@ -0,0 +1,339 @@
+"""
+a library of javascript helpers, installed once per document in an isolated world of the
+page, and called by name.
+
+an isolated world shares the DOM with the page, but not its javascript: the helpers, and
+the properties and observers they use, are invisible to the scripts of the page, and the
+page can't tamper with the builtins they rely on. the library is registered with
+``Page.addScriptToEvaluateOnNewDocument``, so new documents have it from the start, and
+installed in the current document when the world is created for it.
+
+the execution context of the world of every frame is cached, and created again when a call
+finds it gone (eg. after a navigation). the contexts are not tracked with the
+``Runtime.executionContextCreated/Destroyed`` events, as those need ``Runtime.enable``,
+which pages can detect.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+from typing import Any, Dict, Optional
+
+from .. import cdp
+from . import extraction, text_search, waiter
+from .connection import (
+    CommandTimeoutException,
+    ConnectionClosedException,
+    ProtocolException,
+)
+
+if typing.TYPE_CHECKING:
+    from .element import Element
+    from .tab import Tab
+
+logger = logging.getLogger(__name__)
+
+#: the name of the isolated world, and of the library in it
+WORLD = "zendriver"
+
+LIBRARY = """
+globalThis.%(world)s = (() => {
+    const findText = %(find_text)s;
+    const wait = %(wait)s;
+    const checks = %(checks)s;
+    const extract = %(extract)s;
+    // the parent of a node like in DOM.getDocument: the host of a shadow root, and the
+    // element of the iframe of a same-origin document
+    const parentOf = (node) => {
+        if (node.parentNode) return node.parentNode;
+        if (node.host) return node.host;
+        return (node.defaultView && node.defaultView.frameElement) || null;
+    };
+    // the video elements being recorded
+    const recording = new WeakSet();
+    return {
+        findText,
+        // every node followed by its ancestors and null
+        findTextWithAncestors: (query, mode, tag) =>
+            findText(query, mode, tag).flatMap((node) => {
+                const chain = [node];
+                for (let parent = parentOf(node); parent; parent = parentOf(parent)) {
+                    chain.push(parent);
+                }
+                chain.push(null);
+                return chain;
+            }),
+        extract,
+        wait: (check, args, timeout, initial, interval) =>
+            wait(() => checks[check](...args), timeout, initial, interval),
+        flash(style, duration) {
+            for (const css of document.styleSheets) {
+                try {
+                    css.insertRule(`
+                        @keyframes show-pointer-ani {
+                            0%% { opacity: 1; transform: scale(2, 2); }
+                            25%% { transform: scale(5, 5); }
+                            50%% { transform: scale(3, 3); }
+                            75%% { transform: scale(2, 2); }
+                            100%% { transform: scale(1, 1); opacity: 0; }
+                        }`, css.cssRules.length);
+                    break;
+                } catch (e) {}
+            }
+            const dot = document.createElement("div");
+            dot.style = style;
+            document.body.insertAdjacentElement("afterBegin", dot);
+            setTimeout(() => dot.remove(), duration);
+        },
+        async downloadFile(url, name) {
+            const response = await fetch(url);
+            const href = URL.createObjectURL(await response.blob());
+            const anchor = document.createElement("a");
+            anchor.href = href;
+            anchor.download = name;
+            document.body.appendChild(anchor);
+            anchor.click();
+            setTimeout(() => {
+                document.body.removeChild(anchor);
+                URL.revokeObjectURL(href);
+            }, 500);
+        },
+        recordVideo(video, filename, duration) {
+            filename = filename || document.title + ".mp4";
+            const recorder = new MediaRecorder(video.captureStream(), {audio: true, video: true});
+            recorder.ondataavailable = (e) => {
+                recording.delete(video);
+                const file = new File([e.data], filename, {type: "octet/stream"});
+                const link = document.createElement("a");
+                link.setAttribute("href", URL.createObjectURL(file));
+                link.setAttribute("download", filename);
+                link.style.display = "none";
+                document.body.appendChild(link);
+                link.click();
+                document.body.removeChild(link);
+            };
+            recorder.start();
+            video.addEventListener("ended", () => recorder.stop());
+            video.addEventListener("pause", () => recorder.stop());
+            video.addEventListener("abort", () => recorder.stop());
+            if (duration) {
+                setTimeout(() => { video.pause(); video.play(); }, duration);
+            }
+            recording.add(video);
+        },
+        isRecording: (video) => recording.has(video),
+    };
+})();
+""" % {
+    "world": WORLD,
+    "find_text": text_search.SCRIPT,
+    "wait": waiter.SCRIPT,
+    "checks": waiter.CHECKS,
+    "extract": extraction.SCRIPT,
+}
+
+
+def _is_stale(error: ProtocolException) -> bool:
+    """whether a command failed because the execution context is gone"""
+    if isinstance(error, (CommandTimeoutException, ConnectionClosedException)):
+        return False
+    message = (error.message or "").lower()
+    return "cannot find" in message and "context" in message
+
+
+class IsolatedWorld:
+    """
+    the helper library of a tab, see :py:mod:`zendriver.core.isolated_world`.
+
+    .. code-block::
+
+        await tab.isolated_world.call("flash", "position:absolute;...", 500)
+    """
+
+    def __init__(self, tab: Tab):
+        self.tab = tab
+        # execution context of the world, by frame id
+        self._contexts: Dict[cdp.page.FrameId, cdp.runtime.ExecutionContextId] = {}
+        self._main_frame: Optional[cdp.page.FrameId] = None
+        self._registered = False
+        # identifies the protocol session the execution contexts belong to
+        self._session: Any = None
+
+    def _current_session(self) -> Any:
+        # a reconnect replaces the listener, attaching to a target changes the session
+        return self.tab._root.listener, self.tab.session_id
+
+    async def context(
+        self, frame_id: Optional[cdp.page.FrameId] = None
+    ) -> cdp.runtime.ExecutionContextId:
+        """
+        returns the execution context of the world in a frame (by default the main frame),
+        creating the world and installing the library when needed
+        """
+        if self._session != self._current_session():
+            self.forget()
+        if frame_id is None:
+            if self._main_frame is None:
+                frame_tree = await self.tab.send(cdp.page.get_frame_tree())
+                self._main_frame = frame_tree.frame.id_
+            frame_id = self._main_frame
+        context = self._contexts.get(frame_id)
+        if context is not None:
+            return context
+        if not self._registered:
+            # replayed by the connection after a reconnect
+            await self.tab.send(
+                cdp.page.add_script_to_evaluate_on_new_document(
+                    LIBRARY, world_name=WORLD
+                )
+            )
+            self._registered = True
+        context = await self.tab.send(
+            cdp.page.create_isolated_world(frame_id, world_name=WORLD)
+        )
+        installed, _ = await self.tab.send(
+            cdp.runtime.evaluate(
+                "typeof %s" % WORLD, context_id=context, return_by_value=True
+            )
+        )
+        if installed.value == "undefined":
+            _, errors = await self.tab.send(
+                cdp.runtime.evaluate(LIBRARY, context_id=context)
+            )
+            if errors:
+                raise ProtocolException(errors)
+        self._contexts[frame_id] = context
+        # taken once connected, the first command opens the connection
+        self._session = self._current_session()
+        return context
+
+    def forget(self):
+        """forgets the execution contexts, they are created again when needed"""
+        self._contexts.clear()
+        self._main_frame = None
+
+    async def call(
+        self,
+        function: str,
+        *args: Any,
+        element: Optional[Element] = None,
+        await_promise: bool = False,
+        return_by_value: bool = True,
+        serialization_options: Optional[cdp.runtime.SerializationOptions] = None,
+        timeout: Optional[float] = None,
+    ) -> cdp.runtime.RemoteObject:
+        """
+        calls a function of the library with json serializable arguments
+
+        :param function: the name of the function, eg. "flash"
+        :param args: the arguments
+        :param element: when given, passed as the first argument
+        :param await_promise: whether to wait for the promise the function returns
+        :param return_by_value: whether to return the result as json
+        :param serialization_options: see ``Runtime.callFunctionOn``
+        :param timeout: the command timeout, see :py:meth:`Connection.send`
+        :return: the result
+        :raises ProtocolException: when the function throws
+        """
+        try:
+            return await self._call(
+                function,
+                args,
+                element,
+                await_promise,
+                return_by_value,
+                serialization_options,
+                timeout,
+            )
+        except ProtocolException as e:
+            if not _is_stale(e):
+                raise
+            logger.debug("execution context of %s is gone: %s", WORLD, e)
+            self.forget()
+        return await self._call(
+            function,
+            args,
+            element,
+            await_promise,
+            return_by_value,
+            serialization_options,
+            timeout,
+        )
+
+    async def _call(
+        self,
+        function: str,
+        args: typing.Sequence[Any],
+        element: Optional[Element],
+        await_promise: bool,
+        return_by_value: bool,
+        serialization_options: Optional[cdp.runtime.SerializationOptions],
+        timeout: Optional[float],
+    ) -> cdp.runtime.RemoteObject:
+        context = await self.context()
+        arguments = [cdp.runtime.CallArgument(value=arg) for arg in args]
+        object_id = None
+        if element is not None:
+            remote_object = await self._resolve(element, context)
+            object_id = remote_object.object_id
+            arguments.insert(0, cdp.runtime.CallArgument(object_id=object_id))
+        result, errors = await self.tab.send(
+            cdp.runtime.call_function_on(
+                "function (...args) { return %s.%s(...args) }" % (WORLD, function),
+                object_id=object_id,
+                execution_context_id=context if object_id is None else None,
+                arguments=arguments,
+                await_promise=await_promise,
+                return_by_value=return_by_value,
+                user_gesture=True,
+                serialization_options=serialization_options,
+            ),
+            timeout=timeout,
+        )
+        if errors:
+            raise ProtocolException(errors)
+        return result
+
+    async def _resolve(
+        self, element: Element, context: cdp.runtime.ExecutionContextId
+    ) -> cdp.runtime.RemoteObject:
+        """the object of an element in the world"""
+        try:
+            return await self.tab.send(
+                cdp.dom.resolve_node(
+                    backend_node_id=element.backend_node_id,
+                    execution_context_id=context,
+                )
+            )
+        except ProtocolException as e:
+            if _is_stale(e):
+                raise
+            # the element may be in the document of an iframe
+            frame_id = await self._frame_of(element)
+            if frame_id is None:
+                raise
+        return await self.tab.send(
+            cdp.dom.resolve_node(
+                backend_node_id=element.backend_node_id,
+                execution_context_id=await self.context(frame_id),
+            )
+        )
+
+    async def _frame_of(self, element: Element) -> Optional[cdp.page.FrameId]:
+        """the frame of the document of an element in a same-origin iframe"""
+        remote_object = await self.tab.send(
+            cdp.dom.resolve_node(backend_node_id=element.backend_node_id)
+        )
+        frame_element, errors = await self.tab.send(
+            cdp.runtime.call_function_on(
+                "function () { return this.ownerDocument.defaultView.frameElement }",
+                object_id=remote_object.object_id,
+            )
+        )
+        if errors or not frame_element.object_id:
+            return None
+        node = await self.tab.send(
+            cdp.dom.describe_node(object_id=frame_element.object_id)
+        )
+        return node.frame_id
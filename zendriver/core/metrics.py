@@ -0,0 +1,308 @@
+"""
+protocol metrics of a connection: command latency per method, messages and bytes sent and
+received, commands in flight, events per method and the time spent in event handlers.
+
+collecting metrics is opt-in, using ``Config(metrics=True)`` or by assigning a
+:py:class:`Metrics` to :py:attr:`Connection.metrics`. flattened sessions report to the
+metrics of the connection they are multiplexed over.
+
+.. code-block::
+
+    browser = await zendriver.start(metrics=True)
+    ...
+    print(browser.connection.metrics.snapshot()["commands"]["DOM.querySelector"])
+    print(browser.connection.metrics.to_prometheus())
+"""
+
+from __future__ import annotations
+
+import bisect
+import collections
+import math
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .connection import Connection
+
+#: upper bounds in seconds of the latency buckets, like the default prometheus buckets
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    math.inf,
+)
+
+
+class Histogram:
+    """a histogram of durations in seconds, with fixed buckets"""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        estimates the q-quantile (0 <= q <= 1), by interpolating within the bucket
+        it falls in, like prometheus' histogram_quantile().
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for bound, count in zip(self.bounds, self.counts):
+            if count and cumulative + count >= rank:
+                upper = min(bound, self.max)
+                if upper <= lower:
+                    return upper
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = bound
+        return self.max
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class Metrics:
+    """
+    collects the protocol metrics of a connection. the connection calls the record_*
+    methods, users read them using :py:meth:`snapshot` or :py:meth:`to_prometheus`.
+    """
+
+    def __init__(self, connection: Optional[Connection] = None):
+        self._connection: Optional[Callable[[], Optional[Connection]]] = (
+            weakref.ref(connection) if connection is not None else None
+        )
+        self.reset()
+
+    def reset(self):
+        """clears all collected metrics"""
+        self.started = time.time()
+        self.messages_in = 0
+        self.messages_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        #: method => latency histogram of the responses
+        self.commands: Dict[str, Histogram] = collections.defaultdict(Histogram)
+        #: method => number of error responses
+        self.command_errors: Dict[str, int] = collections.defaultdict(int)
+        #: method => number of commands which timed out or lost their connection
+        self.command_failures: Dict[str, int] = collections.defaultdict(int)
+        #: method => number of received events
+        self.events: Dict[str, int] = collections.defaultdict(int)
+        #: handler name => histogram of the time spent handling an event
+        self.handlers: Dict[str, Histogram] = collections.defaultdict(Histogram)
+
+    def record_sent(self, size: int):
+        self.messages_out += 1
+        self.bytes_out += size
+
+    def record_received(self, size: int):
+        self.messages_in += 1
+        self.bytes_in += size
+
+    def record_response(self, method: str, seconds: float, error: bool = False):
+        self.commands[method].observe(seconds)
+        if error:
+            self.command_errors[method] += 1
+
+    def record_failure(self, method: str):
+        self.command_failures[method] += 1
+
+    def record_event(self, method: str):
+        self.events[method] += 1
+
+    def record_handler(self, name: str, seconds: float):
+        self.handlers[name].observe(seconds)
+
+    @property
+    def connection(self) -> Optional[Connection]:
+        return self._connection() if self._connection else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """returns the current metrics as a json compatible dict"""
+        elapsed = max(time.time() - self.started, 1e-9)
+        connection = self.connection
+        in_flight = len(connection.mapper) if connection is not None else 0
+        handler_queues: Dict[str, int] = {}
+        if connection is not None:
+            for c in (connection, *connection.sessions.values()):
+                for handler, worker in c._handler_workers.items():
+                    name = handler_name(handler)
+                    handler_queues[name] = handler_queues.get(name, 0) + worker.pending
+        events_total = sum(self.events.values())
+        return {
+            "uptime": elapsed,
+            "messages_in": self.messages_in,
+            "messages_out": self.messages_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "in_flight": in_flight,
+            "events_total": events_total,
+            "events_per_second": events_total / elapsed,
+            "commands": {
+                method: dict(
+                    histogram.to_json(), errors=self.command_errors.get(method, 0)
+                )
+                for method, histogram in sorted(self.commands.items())
+            },
+            "command_failures": dict(sorted(self.command_failures.items())),
+            "events": dict(sorted(self.events.items())),
+            "handlers": {
+                name: dict(histogram.to_json(), pending=handler_queues.get(name, 0))
+                for name, histogram in sorted(self.handlers.items())
+            },
+        }
+
+    def to_prometheus(
+        self, prefix: str = "zendriver", labels: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        returns the metrics in the prometheus text exposition format.
+
+        :param prefix: prefix of the metric names
+        :param labels: labels added to every sample, eg. {"browser": "worker-1"}
+        """
+        base = dict(labels or {})
+        lines: List[str] = []
+
+        def sample(name: str, value: float, **extra: str):
+            lines.append(
+                "%s_%s%s %s" % (prefix, name, _labels({**base, **extra}), _num(value))
+            )
+
+        def header(name: str, kind: str, help: str):
+            lines.append("# HELP %s_%s %s" % (prefix, name, help))
+            lines.append("# TYPE %s_%s %s" % (prefix, name, kind))
+
+        def histogram(name: str, histogram: Histogram, **extra: str):
+            cumulative = 0
+            for bound, count in zip(histogram.bounds, histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else _num(bound)
+                sample(name + "_bucket", cumulative, **extra, le=le)
+            sample(name + "_sum", histogram.sum, **extra)
+            sample(name + "_count", histogram.count, **extra)
+
+        connection = self.connection
+        for name, value, help in (
+            ("messages_received_total", self.messages_in, "protocol messages received"),
+            ("messages_sent_total", self.messages_out, "protocol messages sent"),
+            (
+                "received_bytes_total",
+                self.bytes_in,
+                "bytes of protocol messages received",
+            ),
+            ("sent_bytes_total", self.bytes_out, "bytes of protocol messages sent"),
+        ):
+            header(name, "counter", help)
+            sample(name, value)
+        header("commands_in_flight", "gauge", "commands awaiting their response")
+        sample(
+            "commands_in_flight",
+            len(connection.mapper) if connection is not None else 0,
+        )
+
+        header("command_duration_seconds", "histogram", "command latency by method")
+        for method, h in sorted(self.commands.items()):
+            histogram("command_duration_seconds", h, method=method)
+        header("command_errors_total", "counter", "error responses by method")
+        for method, count in sorted(self.command_errors.items()):
+            sample("command_errors_total", count, method=method)
+        header(
+            "command_failures_total",
+            "counter",
+            "commands which timed out or lost their connection, by method",
+        )
+        for method, count in sorted(self.command_failures.items()):
+            sample("command_failures_total", count, method=method)
+
+        header("events_received_total", "counter", "events received by method")
+        for method, count in sorted(self.events.items()):
+            sample("events_received_total", count, method=method)
+
+        header("handler_duration_seconds", "histogram", "event handler time by handler")
+        for name, h in sorted(self.handlers.items()):
+            histogram("handler_duration_seconds", h, handler=name)
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} in={self.messages_in} out={self.messages_out} "
+            f"commands={sum(h.count for h in self.commands.values())} "
+            f"events={sum(self.events.values())}>"
+        )
+
+
+def handler_name(handler: Callable) -> str:
+    """the name under which the time spent in a handler is recorded"""
+    name = getattr(handler, "__qualname__", None) or type(handler).__qualname__
+    module = getattr(handler, "__module__", None)
+    return "%s.%s" % (module, name) if module else name
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(
+            '%s="%s"'
+            % (
+                key,
+                str(value)
+                .replace("\\", "\\\\")
+                .replace("\n", "\\n")
+                .replace('"', '\\"'),
+            )
+            for key, value in labels.items()
+        )
+        + "}"
+    )
+
+
+def _num(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,98 @@
+"""
+an index of a document tree, as returned by ``DOM.getDocument(-1, True)``, to look up its
+nodes by node id or backend node id, and their parents, without walking the tree.
+
+the index is built once per fetched tree and shared by the :py:class:`~zendriver.Element`
+objects created from that tree.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, Optional
+
+from .. import cdp
+
+
+def child_nodes(node: cdp.dom.Node) -> Iterator[cdp.dom.Node]:
+    """yields the children of a node, including its shadow roots and content document"""
+    if node.shadow_roots:
+        yield from node.shadow_roots
+    if node.children:
+        yield from node.children
+    if node.content_document is not None:
+        yield node.content_document
+
+
+class NodeIndex:
+    """
+    maps the node ids and backend node ids of the nodes of a tree to the nodes, and the
+    nodes to their parent. shadow roots and the content documents of iframes are part of
+    the tree, their parent being the host or iframe node.
+
+    like :py:func:`zendriver.core.util.filter_recurse`, only the descendants of the
+    root are looked up, not the root itself.
+    """
+
+    def __init__(self, root: cdp.dom.Node):
+        self.root = root
+        self._nodes: Dict[cdp.dom.NodeId, cdp.dom.Node] = {}
+        self._backend_nodes: Dict[cdp.dom.BackendNodeId, cdp.dom.Node] = {}
+        self._parents: Dict[cdp.dom.NodeId, cdp.dom.Node] = {}
+        self.add_descendants(root)
+
+    def add(self, node: cdp.dom.Node, parent: cdp.dom.Node):
+        """adds <node> and its descendants, <node> being a child of <parent>"""
+        self._nodes[node.node_id] = node
+        self._backend_nodes[node.backend_node_id] = node
+        self._parents[node.node_id] = parent
+        self.add_descendants(node)
+
+    def add_descendants(self, node: cdp.dom.Node):
+        """adds the descendants of <node>"""
+        # iterative, documents can be deeper than the recursion limit
+        stack = [node]
+        while stack:
+            parent = stack.pop()
+            for child in child_nodes(parent):
+                self._nodes[child.node_id] = child
+                self._backend_nodes[child.backend_node_id] = child
+                self._parents[child.node_id] = parent
+                stack.append(child)
+
+    def remove(self, node: cdp.dom.Node):
+        """removes <node> and its descendants"""
+        stack = [node]
+        while stack:
+            removed = stack.pop()
+            if self._nodes.get(removed.node_id) is removed:
+                del self._nodes[removed.node_id]
+                self._parents.pop(removed.node_id, None)
+            if self._backend_nodes.get(removed.backend_node_id) is removed:
+                del self._backend_nodes[removed.backend_node_id]
+            stack.extend(child_nodes(removed))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[cdp.dom.Node]:
+        return iter(self._nodes.values())
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._nodes
+
+    def node(self, node_id: Optional[cdp.dom.NodeId]) -> Optional[cdp.dom.Node]:
+        """returns the node with the node id, or None"""
+        return self._nodes.get(node_id)  # type: ignore[arg-type]
+
+    def backend_node(
+        self, backend_node_id: Optional[cdp.dom.BackendNodeId]
+    ) -> Optional[cdp.dom.Node]:
+        """returns the node with the backend node id, or None"""
+        return self._backend_nodes.get(backend_node_id)  # type: ignore[arg-type]
+
+    def parent(self, node: cdp.dom.Node) -> Optional[cdp.dom.Node]:
+        """
+        returns the node whose child, shadow root or content document <node> is,
+        or None for the root and nodes not in the tree
+        """
+        return self._parents.get(node.node_id)
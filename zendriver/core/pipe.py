@@ -0,0 +1,166 @@
+"""
+transport for the devtools protocol over the pipes of a browser launched with
+``--remote-debugging-pipe``.
+
+the browser reads commands from file descriptor 3 and writes responses and events to
+file descriptor 4. every message is a json document terminated by a NUL byte.
+this is only available on posix systems.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Union
+
+try:
+    import fcntl
+except ImportError:
+    # not available on windows, where the pipe transport isn't supported
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+#: the file descriptors the browser uses for the devtools pipes
+BROWSER_READ_FD = 3
+BROWSER_WRITE_FD = 4
+
+
+class PipeClosedError(ConnectionError):
+    """raised when the browser closed its end of the pipe"""
+
+
+class PipeTransport:
+    """
+    sends and receives protocol messages over the devtools pipes of a browser process.
+    it has the parts of the websocket interface used by :py:class:`Connection`.
+
+    .. code-block::
+
+        fds = PipeTransport.create_pipes()
+        process = await asyncio.create_subprocess_exec(
+            exe, "--remote-debugging-pipe", preexec_fn=fds.preexec_fn, ...
+        )
+        transport = await PipeTransport.open(fds)
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        self._reader = reader
+        self._writer = writer
+        self._closed = False
+
+    @classmethod
+    def create_pipes(cls) -> PipeFds:
+        """creates the pipes to pass to the browser process"""
+        return PipeFds()
+
+    @classmethod
+    async def open(cls, fds: PipeFds, limit: int = 2**28) -> PipeTransport:
+        """
+        connects to our ends of the pipes, after the browser process was started.
+
+        :param fds: the pipes the browser process was started with
+        :param limit: maximum size of a message in bytes
+        """
+        loop = asyncio.get_running_loop()
+        fds.close_browser_ends()
+        reader = asyncio.StreamReader(limit=limit)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            os.fdopen(fds.read_fd, "rb", buffering=0),
+        )
+        write_transport, write_protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()),
+            os.fdopen(fds.write_fd, "wb", buffering=0),
+        )
+        writer = asyncio.StreamWriter(write_transport, write_protocol, None, loop)
+        return cls(reader, writer)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed or self._writer.is_closing()
+
+    async def send(self, message: Union[str, bytes]):
+        if self.closed:
+            raise PipeClosedError("the devtools pipe is closed")
+        if isinstance(message, str):
+            message = message.encode()
+        try:
+            self._writer.write(message + b"\0")
+            await self._writer.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self._closed = True
+            raise PipeClosedError("the devtools pipe is closed") from e
+
+    async def recv(self) -> bytes:
+        try:
+            message = await self._reader.readuntil(b"\0")
+        except asyncio.IncompleteReadError as e:
+            self._closed = True
+            raise PipeClosedError("the browser closed the devtools pipe") from e
+        return message[:-1]
+
+    async def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self._reader.feed_eof()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} closed={self.closed}>"
+
+
+class PipeFds:
+    """
+    the two pipes between us and the browser process. :py:meth:`preexec_fn` moves the
+    browser ends of the pipes to the file descriptors 3 and 4 in the child process.
+    """
+
+    def __init__(self):
+        # we write commands to the browser, the browser writes to us
+        self._browser_read, self.write_fd = os.pipe()
+        self.read_fd, self._browser_write = os.pipe()
+        for fd in (self.write_fd, self.read_fd):
+            os.set_inheritable(fd, False)
+
+    def preexec_fn(self):
+        """runs in the child process, before the browser is executed"""
+        # first move both ends out of the way, in case one of them is 3 or 4 already
+        browser_read = fcntl.fcntl(self._browser_read, fcntl.F_DUPFD, 10)
+        browser_write = fcntl.fcntl(self._browser_write, fcntl.F_DUPFD, 10)
+        # dup2 makes the new descriptors inheritable
+        os.dup2(browser_read, BROWSER_READ_FD)
+        os.dup2(browser_write, BROWSER_WRITE_FD)
+        os.close(browser_read)
+        os.close(browser_write)
+
+    def close_browser_ends(self):
+        """closes our copy of the browser ends, once the browser process has them"""
+        for fd in (self._browser_read, self._browser_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._browser_read = self._browser_write = -1
+
+    def close(self):
+        """closes all pipes, when the browser process could not be started"""
+        self.close_browser_ends()
+        for fd in (self.read_fd, self.write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} read={self.read_fd} write={self.write_fd}>"
@@ -0,0 +1,372 @@
+"""
+records the protocol traffic of connections to a file, and replays it without a browser.
+
+a recording has one json object per line, for every message sent or received::
+
+    {"t": 0.012, "c": "/devtools/browser/7d1f...", "d": ">", "m": {"id": 1, "method": ...}}
+
+``t`` is the number of seconds since the recording started, ``c`` the connection (the path
+of its websocket url), ``d`` the direction (``>`` sent, ``<`` received) and ``m`` the message.
+files ending with ``.gz`` are compressed with gzip, files ending with ``.zst`` with zstandard
+(which needs the zstandard package).
+
+the messages are written to the file every second (see :py:class:`Recorder`), and when the
+recording is closed by ``Browser.stop()``. when the process ends without closing it (a crash,
+a kill, or a script that doesn't stop the browser), the messages of the last second are lost,
+and a compressed recording lacks its end: :py:func:`read_recording` reads such recordings up
+to their last complete message.
+
+.. code-block::
+
+    # record
+    browser = await zendriver.start(record="session.jsonl.gz")
+
+    # replay, no browser needed
+    async with ReplayServer("session.jsonl.gz") as server:
+        browser = await zendriver.start(host=server.host, port=server.port)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import gzip
+import io
+import json
+import logging
+import time
+import urllib.parse
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+import websockets
+import websockets.exceptions
+
+from .config import PathLike
+
+logger = logging.getLogger(__name__)
+
+SENT = ">"
+RECEIVED = "<"
+
+
+def _open(path: PathLike, mode: str) -> IO[str]:
+    """opens a recording for reading ("r") or writing ("w"), compressed by its suffix"""
+    name = str(path)
+    if name.endswith(".gz"):
+        return gzip.open(name, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    if name.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard is needed for .zst recordings: pip install zstandard"
+            ) from None
+        raw = open(name, mode + "b")
+        stream: Any
+        if mode == "w":
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(name, mode, encoding="utf-8")
+
+
+def connection_label(websocket_url: str) -> str:
+    """the name of a connection in a recording: the path of its websocket url"""
+    parts = urllib.parse.urlsplit(websocket_url)
+    if parts.scheme == "pipe":
+        # replayed over a websocket, like a browser connection
+        return "/devtools/browser/%s" % parts.netloc
+    return parts.path or websocket_url
+
+
+def read_recording(path: PathLike) -> Iterator[Dict[str, Any]]:
+    """
+    yields the entries of a recording. a recording that was not closed is read up to its
+    last complete message.
+    """
+    with _open(path, "r") as f:
+        try:
+            for line in f:
+                if not line.endswith("\n"):
+                    logger.warning("%s ends with an incomplete message", path)
+                    return
+                if line.strip():
+                    yield json.loads(line)
+        except EOFError:
+            # a compressed recording without its end
+            logger.warning("%s was not closed, and ends abruptly", path)
+
+
+class Recorder:
+    """
+    writes the messages of one or more connections to a recording. the messages are
+    written as they were sent or received, without encoding them again.
+    """
+
+    def __init__(self, path: PathLike, flush_interval: Optional[float] = 1.0):
+        """
+        :param path: file to write to. a .gz or .zst suffix compresses it.
+        :param flush_interval: seconds after which received messages are written to the
+            file, so a process that ends without closing the recording loses no more than
+            these. when None, or outside of an event loop, only :py:meth:`flush` and
+            :py:meth:`close` write them.
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self._file: Optional[IO[str]] = _open(path, "w")
+        self._start = time.perf_counter()
+        self._labels: Dict[str, str] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.count = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def record(self, websocket_url: str, direction: str, message: Union[str, bytes]):
+        """
+        writes a message to the recording.
+
+        :param websocket_url: the url of the connection
+        :param direction: :py:data:`SENT` or :py:data:`RECEIVED`
+        :param message: the json encoded message
+        """
+        if self._file is None:
+            return
+        label = self._labels.get(websocket_url)
+        if label is None:
+            label = self._labels[websocket_url] = json.dumps(
+                connection_label(websocket_url)
+            )
+        if isinstance(message, bytes):
+            message = message.decode()
+        self._file.write(
+            '{"t":%.6f,"c":%s,"d":"%s","m":%s}\n'
+            % (time.perf_counter() - self._start, label, direction, message)
+        )
+        self.count += 1
+        if self._flush_handle is None and self.flush_interval is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._flush_handle = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self):
+        """writes the messages recorded so far to the file"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.path} messages={self.count}>"
+
+
+class _Reply:
+    """
+    a recorded response to a command, and the events received after it.
+    these are kept encoded, to answer without encoding large responses again.
+    """
+
+    __slots__ = ("body", "events")
+
+    def __init__(self, response: Dict[str, Any]):
+        response = {k: v for k, v in response.items() if k not in ("id", "sessionId")}
+        # the members after the id and session of the answer
+        self.body = json.dumps(response)[1:]
+        self.events: List[str] = []
+
+    def answer(self, command: Dict[str, Any]) -> str:
+        head = '{"id":%d' % command["id"]
+        if "sessionId" in command:
+            head += ',"sessionId":%s' % json.dumps(command["sessionId"])
+        return head + ("," + self.body if self.body != "}" else "}")
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(params or {}, sort_keys=True, separators=(",", ":"))
+
+
+class ReplayServer:
+    """
+    impersonates a browser using a recording: it serves /json/version and the websockets
+    of the recorded connections, and answers commands with the recorded responses.
+
+    commands are matched by connection, method, params and session. when a command was
+    recorded multiple times, its responses are returned in recorded order, repeating the
+    last one. a command without an exact match gets the response of the first recorded
+    command with the same method, or an error response when there is none.
+    the events received after a command are sent after its response.
+    """
+
+    def __init__(self, path: PathLike, host: str = "127.0.0.1", port: int = 0):
+        self.path = path
+        self.host = host
+        self.port = port
+        #: (connection, method, params, session) => replies in recorded order
+        self.replies: Dict[Tuple[str, str, str, Optional[str]], Deque[_Reply]] = (
+            collections.defaultdict(collections.deque)
+        )
+        #: method => first recorded reply, used when there is no exact match
+        self.fallback: Dict[str, _Reply] = {}
+        #: connection => events received before the first command
+        self.initial_events: Dict[str, List[str]] = collections.defaultdict(list)
+        self.connections: List[str] = []
+        self.unmatched = 0
+        self._server: Optional[Any] = None
+        self._load()
+
+    @property
+    def websocket_url(self) -> str:
+        """the url of the recorded browser connection on this server"""
+        browser = next(
+            (c for c in self.connections if c.startswith("/devtools/browser/")),
+            "/devtools/browser/replay",
+        )
+        return f"ws://{self.host}:{self.port}{browser}"
+
+    def _load(self):
+        pending: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        last: Dict[str, _Reply] = {}
+        for entry in read_recording(self.path):
+            label, message = entry["c"], entry["m"]
+            if label not in self.connections:
+                self.connections.append(label)
+            if entry["d"] == SENT:
+                pending[label, message.get("id")] = message
+                continue
+            if "id" not in message:
+                if label in last:
+                    last[label].events.append(json.dumps(message))
+                else:
+                    self.initial_events[label].append(json.dumps(message))
+                continue
+            command = pending.pop((label, message["id"]), None)
+            if command is None:
+                continue
+            reply = _Reply(message)
+            key = (
+                label,
+                command["method"],
+                _params_key(command.get("params")),
+                command.get("sessionId"),
+            )
+            self.replies[key].append(reply)
+            self.fallback.setdefault(command["method"], reply)
+            last[label] = reply
+
+    def _find(self, label: str, command: Dict[str, Any]) -> Optional[_Reply]:
+        method: str = command["method"]
+        key = (
+            label,
+            method,
+            _params_key(command.get("params")),
+            command.get("sessionId"),
+        )
+        replies = self.replies.get(key)
+        if replies:
+            return replies.popleft() if len(replies) > 1 else replies[0]
+        return self.fallback.get(method)
+
+    async def start(self) -> ReplayServer:
+        self._server = await websockets.serve(
+            self._handler,
+            self.host,
+            self.port,
+            max_size=2**28,
+            process_request=self._process_request,
+        )
+        self.port = next(iter(self._server.sockets)).getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def _process_request(self, path: str, request_headers: Any):
+        """answers the http endpoints of the browser, which zendriver uses to connect"""
+        if not path.startswith("/json"):
+            return None
+        endpoint = path.split("?")[0].rstrip("/")
+        if endpoint == "/json/version":
+            body: Any = {
+                "Browser": "zendriver-replay",
+                "Protocol-Version": "1.3",
+                "webSocketDebuggerUrl": self.websocket_url,
+            }
+        elif endpoint in ("/json", "/json/list"):
+            body = [
+                {
+                    "id": c.rsplit("/", 1)[-1],
+                    "type": "page",
+                    "webSocketDebuggerUrl": f"ws://{self.host}:{self.port}{c}",
+                }
+                for c in self.connections
+                if c.startswith("/devtools/page/")
+            ]
+        else:
+            return (404, [], b"")
+        return (
+            200,
+            [("Content-Type", "application/json")],
+            json.dumps(body).encode(),
+        )
+
+    async def _handler(self, websocket, path=None):
+        label = path or websocket.path
+        try:
+            for event in self.initial_events.get(label, ()):
+                await websocket.send(event)
+            async for frame in websocket:
+                command = json.loads(frame)
+                reply = self._find(label, command)
+                if reply is None:
+                    self.unmatched += 1
+                    logger.debug("no recorded response for %s", command.get("method"))
+                    reply = _Reply(
+                        {
+                            "error": {
+                                "code": -32601,
+                                "message": "no recorded response for %s"
+                                % command.get("method"),
+                            }
+                        }
+                    )
+                await websocket.send(reply.answer(command))
+                for event in reply.events:
+                    await websocket.send(event)
+                # let other connections have a go, like a browser would
+                await asyncio.sleep(0)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} {self.path} "
+            f"commands={sum(len(r) for r in self.replies.values())}>"
+        )
@@ -0,0 +1,324 @@
+"""
+columnar page snapshots, from ``DOMSnapshot.captureSnapshot``.
+
+the snapshot of all documents of a page (the main document, iframes, ...) is taken in a
+single round trip, and kept the way the browser sends it: every property of the nodes is
+a column, with one entry per node, and strings are indexes into a table of the distinct
+strings. this takes a fraction of the memory of a tree of :py:class:`cdp.dom.Node`, and
+filtering compares each distinct string once instead of once per node.
+
+.. code-block::
+
+    snapshot = await tab.snapshot()
+    links = snapshot.find(tag="a", visible=True)
+    urls = [snapshot.attribute(i, "href") for i in links]
+    elements = await snapshot.elements(links[:10])
+"""
+
+from __future__ import annotations
+
+import array
+import typing
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .. import cdp
+from . import element
+
+if typing.TYPE_CHECKING:
+    from .tab import Tab
+
+#: computed styles captured by default, used by ``find(visible=True)``
+COMPUTED_STYLES = ("display", "visibility")
+
+
+class Snapshot:
+    """
+    the nodes of all documents of a page, numbered from 0 in document order,
+    the documents one after the other. the root of an iframe's document has the iframe
+    as parent, shadow roots are flattened into the tree of their host.
+
+    the columns are arrays with one entry per node. string columns hold indexes into
+    :py:attr:`strings`, -1 meaning none.
+    """
+
+    def __init__(
+        self,
+        documents: List[dict],
+        strings: List[str],
+        computed_styles: Sequence[str] = COMPUTED_STYLES,
+        tab: Optional[Tab] = None,
+    ):
+        """
+        :param documents: the ``documents`` of the result of ``DOMSnapshot.captureSnapshot``
+        :param strings: the ``strings`` of the result
+        :param computed_styles: the computed styles the snapshot was captured with
+        :param tab: the tab the snapshot is of, to create elements from
+        """
+        self.tab = tab
+        #: the distinct strings of the snapshot
+        self.strings = strings
+        #: the names of the computed styles of :py:meth:`style`
+        self.computed_styles = list(computed_styles)
+        #: url, title and frame id of every document
+        self.documents: List[Dict[str, Optional[str]]] = []
+        #: the index of the document of every node
+        self.document = array.array("i")
+        self.parent = array.array("i")
+        self.node_type = array.array("i")
+        self.node_name = array.array("i")
+        self.node_value = array.array("i")
+        self.backend_node_id = array.array("i")
+        #: the attribute names and values of node i are
+        #: attribute_strings[attribute_offsets[i]:attribute_offsets[i + 1]]
+        self.attribute_offsets = array.array("i", [0])
+        self.attribute_strings = array.array("i")
+        #: the value of input and textarea nodes
+        self.input_value: Dict[int, int] = {}
+        #: the nodes which are clickable
+        self.clickable: Set[int] = set()
+        #: the index into the layout columns of every node, -1 when it has no layout box
+        self.layout = array.array("i")
+        #: x, y, width and height of every layout box
+        self.bounds = array.array("d")
+        #: the computed styles of every layout box, in the order of computed_styles
+        self.styles = array.array("i")
+        self._string_indexes: Optional[Dict[str, int]] = None
+        self._children: Optional[Tuple[array.array, array.array]] = None
+
+        content_documents: List[Tuple[int, int]] = []
+        roots = []
+        for number, document in enumerate(documents):
+            start = len(self.node_type)
+            roots.append(start)
+            self.documents.append(
+                {
+                    "url": self.string(document.get("documentURL", -1)),
+                    "title": self.string(document.get("title", -1)),
+                    "frame_id": self.string(document.get("frameId", -1)),
+                }
+            )
+            nodes = document.get("nodes", {})
+            count = len(nodes.get("backendNodeId", ()))
+            self.document.extend([number] * count)
+            self.parent.extend(
+                p + start if p >= 0 else -1 for p in nodes.get("parentIndex", ())
+            )
+            self.node_type.extend(nodes.get("nodeType", ()))
+            self.node_name.extend(nodes.get("nodeName", ()))
+            self.node_value.extend(nodes.get("nodeValue", ()))
+            self.backend_node_id.extend(nodes.get("backendNodeId", ()))
+            offset = self.attribute_offsets[-1]
+            for attributes in nodes.get("attributes", [[]] * count):
+                self.attribute_strings.extend(attributes)
+                offset += len(attributes)
+                self.attribute_offsets.append(offset)
+            for rare in ("textValue", "inputValue"):
+                data = nodes.get(rare, {})
+                for i, value in zip(data.get("index", ()), data.get("value", ())):
+                    self.input_value[i + start] = value
+            self.clickable.update(
+                i + start for i in nodes.get("isClickable", {}).get("index", ())
+            )
+            data = nodes.get("contentDocumentIndex", {})
+            for i, value in zip(data.get("index", ()), data.get("value", ())):
+                content_documents.append((i + start, value))
+
+            layout_start = len(self.bounds) // 4
+            self.layout.extend([-1] * count)
+            layout = document.get("layout", {})
+            for entry, i in enumerate(layout.get("nodeIndex", ())):
+                self.layout[i + start] = layout_start + entry
+            for bounds in layout.get("bounds", ()):
+                self.bounds.extend(bounds[:4])
+            width = len(self.computed_styles)
+            for styles in layout.get("styles", ()):
+                self.styles.extend(styles[:width])
+                if len(styles) < width:
+                    self.styles.extend([-1] * (width - len(styles)))
+
+        for iframe, number in content_documents:
+            if number < len(roots):
+                self.parent[roots[number]] = iframe
+
+    def __len__(self) -> int:
+        return len(self.node_type)
+
+    def string(self, index: int) -> Optional[str]:
+        """the string at an index of the string table, None for -1"""
+        return self.strings[index] if index >= 0 else None
+
+    def string_index(self, value: str) -> int:
+        """the index of a string in the string table, -1 when it isn't there"""
+        if self._string_indexes is None:
+            self._string_indexes = {s: i for i, s in enumerate(self.strings)}
+        return self._string_indexes.get(value, -1)
+
+    def strings_where(self, predicate: Callable[[str], bool]) -> Set[int]:
+        """the indexes of the strings for which predicate(string) is True"""
+        return {i for i, s in enumerate(self.strings) if predicate(s)}
+
+    def name(self, i: int) -> str:
+        """the node name of node i, eg. DIV or #text"""
+        return self.strings[self.node_name[i]]
+
+    def value(self, i: int) -> Optional[str]:
+        """the node value of node i (the text of text nodes)"""
+        return self.string(self.node_value[i])
+
+    def attributes(self, i: int) -> Dict[str, str]:
+        """the attributes of node i"""
+        strings = self.strings
+        pairs = self.attribute_strings[
+            self.attribute_offsets[i] : self.attribute_offsets[i + 1]
+        ]
+        return {
+            strings[pairs[j]]: strings[pairs[j + 1]] for j in range(0, len(pairs), 2)
+        }
+
+    def attribute(self, i: int, name: str) -> Optional[str]:
+        """the value of an attribute of node i, None when it doesn't have it"""
+        index = self.string_index(name)
+        if index < 0:
+            return None
+        end = self.attribute_offsets[i + 1]
+        for j in range(self.attribute_offsets[i], end, 2):
+            if self.attribute_strings[j] == index:
+                return self.strings[self.attribute_strings[j + 1]]
+        return None
+
+    def bounds_of(self, i: int) -> Optional[Tuple[float, float, float, float]]:
+        """x, y, width and height of the layout box of node i, None when it has none"""
+        layout = self.layout[i]
+        if layout < 0:
+            return None
+        x, y, width, height = self.bounds[layout * 4 : layout * 4 + 4]
+        return x, y, width, height
+
+    def style(self, i: int, name: str) -> Optional[str]:
+        """a computed style of node i, which must be one of computed_styles"""
+        layout = self.layout[i]
+        if layout < 0:
+            return None
+        column = self.computed_styles.index(name)
+        return self.string(self.styles[layout * len(self.computed_styles) + column])
+
+    def children(self, i: int) -> List[int]:
+        """the child nodes of node i"""
+        if self._children is None:
+            # the children of all nodes, grouped by parent
+            counts = [0] * (len(self) + 1)
+            for parent in self.parent:
+                if parent >= 0:
+                    counts[parent + 1] += 1
+            for n in range(len(self)):
+                counts[n + 1] += counts[n]
+            offsets = array.array("i", counts)
+            children = array.array("i", [0] * counts[-1])
+            position = list(counts)
+            for child, parent in enumerate(self.parent):
+                if parent >= 0:
+                    children[position[parent]] = child
+                    position[parent] += 1
+            self._children = (offsets, children)
+        offsets, children = self._children
+        return list(children[offsets[i] : offsets[i + 1]])
+
+    def text(self, i: int) -> str:
+        """the text of node i and its descendants, like the textContent of an element"""
+        parts = []
+        stack = [i]
+        while stack:
+            node = stack.pop()
+            if self.node_type[node] == 3:
+                parts.append(self.strings[self.node_value[node]])
+            stack.extend(reversed(self.children(node)))
+        return "".join(parts)
+
+    def find(
+        self,
+        tag: Optional[str] = None,
+        attributes: Optional[Dict[str, Optional[str]]] = None,
+        text: Optional[str] = None,
+        visible: Optional[bool] = None,
+    ) -> List[int]:
+        """
+        returns the nodes which match all of the given criteria, in document order
+
+        :param tag: the tag name of the nodes, eg. "a"
+        :param attributes: attributes the nodes have; a value of None matches any value
+        :param text: text the nodes contain, case insensitive: the parents of the text nodes
+                     containing it
+        :param visible: when True, only nodes with a layout box with an area, which aren't
+                        hidden; when False, only the others
+        """
+        candidates: Iterable[int]
+        if text is not None:
+            lowered = text.lower()
+            matches = self.strings_where(lambda s: lowered in s.lower())
+            parents = dict.fromkeys(
+                self.parent[i]
+                for i, value in enumerate(self.node_value)
+                if value in matches and self.node_type[i] == 3 and self.parent[i] >= 0
+            )
+            candidates = sorted(parents)
+        else:
+            candidates = range(len(self))
+        if tag is not None:
+            names = self.strings_where(lambda s: s.lower() == tag.lower())
+            node_name = self.node_name
+            candidates = [i for i in candidates if node_name[i] in names]
+        for name, value in (attributes or {}).items():
+            candidates = self._with_attribute(candidates, name, value)
+        if visible is not None:
+            candidates = [i for i in candidates if self.is_visible(i) == visible]
+        return list(candidates)
+
+    def _with_attribute(
+        self, candidates: Iterable[int], name: str, value: Optional[str]
+    ) -> List[int]:
+        name_index = self.string_index(name)
+        value_index = self.string_index(value) if value is not None else None
+        if name_index < 0 or value_index == -1:
+            return []
+        offsets = self.attribute_offsets
+        strings = self.attribute_strings
+        found = []
+        for i in candidates:
+            for j in range(offsets[i], offsets[i + 1], 2):
+                if strings[j] == name_index:
+                    if value_index is None or strings[j + 1] == value_index:
+                        found.append(i)
+                    break
+        return found
+
+    def is_visible(self, i: int) -> bool:
+        """whether node i has a layout box with an area, and isn't hidden"""
+        bounds = self.bounds_of(i)
+        if bounds is None or bounds[2] <= 0 or bounds[3] <= 0:
+            return False
+        if "visibility" in self.computed_styles:
+            return self.style(i, "visibility") not in ("hidden", "collapse")
+        return True
+
+    async def elements(self, nodes: Iterable[int]) -> List[element.Element]:
+        """
+        returns the elements of nodes of the snapshot, by their backend node id.
+        nodes which are no longer in the page are left out.
+
+        with the dom mirror of the tab enabled, the elements are created from the mirror,
+        otherwise each node is described by the browser, in a single round trip, and
+        ``await element.update()`` is needed to use .parent and .children.
+        """
+        if self.tab is None:
+            raise RuntimeError("the snapshot has no tab to create elements for")
+        ids = [cdp.dom.BackendNodeId(self.backend_node_id[i]) for i in nodes]
+        return await self.tab._elements(ids)
@@ -1,21 +1,48 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import pathlib
 import typing
 import warnings
-from typing import List, Optional, Tuple, Union
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import zendriver.core.browser
 
 from .. import cdp
-from . import element, util
+from . import element, extraction, text_search, waiter
 from .config import PathLike
-from .connection import Connection, ProtocolException
+from .connection import (
+    CommandTimeoutException,
+    Connection,
+    ConnectionClosedException,
+    ProtocolException,
+    _command,
+)
+from .dom_mirror import DOMMirror
+from .isolated_world import IsolatedWorld
+from .node_index import NodeIndex
+from .snapshot import COMPUTED_STYLES, Snapshot
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# numbers the object groups of apply_all, which are released when done
+_object_groups = itertools.count()
+
 
 class Tab(Connection):
     """
@@ -128,6 +155,10 @@ class Tab(Connection):
     ):
         super().__init__(websocket_url, target, browser, **kwargs)
         self.browser = browser
+        #: the local copy of the document, see :py:meth:`enable_dom_mirror`
+        self.dom_mirror: Optional[DOMMirror] = None
+        #: the javascript helpers of zendriver, invisible to the page
+        self.isolated_world = IsolatedWorld(self)
         self._dom = None
         self._window_id = None
 
@@ -194,25 +225,15 @@ class Tab(Connection):
         :param timeout: raise timeout exception when after this many seconds nothing is found.
         :type timeout: float,int
         """
-        loop = asyncio.get_running_loop()
-        start_time = loop.time()
-
         text = text.strip()
-
-        item = await self.find_element_by_text(
-            text, best_match, return_enclosing_element
-        )
-        while not item:
-            await self
-            item = await self.find_element_by_text(
+        return await self._wait_for(
+            lambda: self.find_element_by_text(
                 text, best_match, return_enclosing_element
-            )
-            if loop.time() - start_time > timeout:
-                raise asyncio.TimeoutError(
-                    "time ran out while waiting for text: %s" % text
-                )
-            await self.sleep(0.5)
-        return item
+            ),
+            waiter.text_check(text),
+            timeout,
+            "time ran out while waiting for text: %s" % text,
+        )
 
     async def select(
         self,
@@ -230,21 +251,13 @@ class Tab(Connection):
         :type timeout: float,int
 
         """
-        loop = asyncio.get_running_loop()
-        start_time = loop.time()
-
         selector = selector.strip()
-        item = await self.query_selector(selector)
-
-        while not item:
-            await self
-            item = await self.query_selector(selector)
-            if loop.time() - start_time > timeout:
-                raise asyncio.TimeoutError(
-                    "time ran out while waiting for %s" % selector
-                )
-            await self.sleep(0.5)
-        return item
+        return await self._wait_for(
+            lambda: self.query_selector(selector),
+            waiter.selector_check(selector),
+            timeout,
+            "time ran out while waiting for %s" % selector,
+        )
 
     async def find_all(
         self,
@@ -261,21 +274,13 @@ class Tab(Connection):
         :param timeout: raise timeout exception when after this many seconds nothing is found.
         :type timeout: float,int
         """
-        loop = asyncio.get_running_loop()
-        now = loop.time()
-
         text = text.strip()
-        items = await self.find_elements_by_text(text)
-
-        while not items:
-            await self
-            items = await self.find_elements_by_text(text)
-            if loop.time() - now > timeout:
-                raise asyncio.TimeoutError(
-                    "time ran out while waiting for text: %s" % text
-                )
-            await self.sleep(0.5)
-        return items
+        return await self._wait_for(
+            lambda: self.find_elements_by_text(text),
+            waiter.text_check(text),
+            timeout,
+            "time ran out while waiting for text: %s" % text,
+        )
 
     async def select_all(
         self, selector: str, timeout: Union[int, float] = 10, include_frames=False
@@ -292,27 +297,60 @@ class Tab(Connection):
         :param include_frames: whether to include results in iframes.
         :type include_frames: bool
         """
+        selector = selector.strip()
 
+        async def query() -> List[element.Element]:
+            items = []
+            if include_frames:
+                frames = await self.query_selector_all("iframe")
+                # unfortunately, asyncio.gather here is not an option
+                for fr in frames:
+                    items.extend(await fr.query_selector_all(selector))
+            items.extend(await self.query_selector_all(selector))
+            return items
+
+        return await self._wait_for(
+            query,
+            waiter.selector_check(selector, include_frames),
+            timeout,
+            "time ran out while waiting for %s" % selector,
+        )
+
+    async def _wait_for(
+        self,
+        query: Callable[[], Awaitable[Optional[T]]],
+        check: waiter.Check,
+        timeout: Optional[Union[int, float]],
+        message: str,
+    ) -> T:
+        """
+        returns the result of query() once it is found, querying again whenever
+        <check> becomes true in the page, see
+        :py:mod:`zendriver.core.waiter`.
+
+        :raises asyncio.TimeoutError: with <message>, after <timeout> seconds
+                                      (None to wait forever)
+        """
         loop = asyncio.get_running_loop()
-        now = loop.time()
-        selector = selector.strip()
-        items = []
-        if include_frames:
-            frames = await self.query_selector_all("iframe")
-            # unfortunately, asyncio.gather here is not an option
-            for fr in frames:
-                items.extend(await fr.query_selector_all(selector))
-
-        items.extend(await self.query_selector_all(selector))
-        while not items:
-            await self
-            items = await self.query_selector_all(selector)
-            if loop.time() - now > timeout:
-                raise asyncio.TimeoutError(
-                    "time ran out while waiting for %s" % selector
-                )
-            await self.sleep(0.5)
-        return items
+        deadline = loop.time() + timeout if timeout is not None else None
+        result = await query()
+        initial = True
+        while not result:
+            if deadline is None:
+                remaining = 60.0
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(message)
+            try:
+                matched = await waiter.wait_until(self, check, remaining, initial)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(message) from None
+            # when the check matched but the query found nothing, only wait for
+            # the next change, instead of querying again and again
+            initial = not matched
+            result = await query()
+        return result
 
     async def get(
         self, url="chrome://welcome", new_tab: bool = False, new_window: bool = False
@@ -342,6 +380,50 @@ class Tab(Connection):
             await self
             return self
 
+    async def enable_dom_mirror(self) -> DOMMirror:
+        """
+        keeps a local copy of the document, updated by the DOM events of the tab,
+        which the query helpers (query_selector(_all), find_element(s)_by_text,
+        get_content and Element.update) use instead of fetching the whole
+        document for every call.
+
+        while the mirror is enabled, don't send ``DOM.getDocument`` or ``DOM.disable``
+        yourself, use ``tab.dom_mirror.get_document()`` to get the document.
+
+        :return: the mirror
+        :rtype: DOMMirror
+        """
+        if self.dom_mirror is None:
+            mirror = DOMMirror(self)
+            await mirror.start()
+            self.dom_mirror = mirror
+        return self.dom_mirror
+
+    async def disable_dom_mirror(self):
+        """stops keeping a local copy of the document, see :py:meth:`enable_dom_mirror`"""
+        if self.dom_mirror is not None:
+            mirror, self.dom_mirror = self.dom_mirror, None
+            await mirror.stop()
+
+    async def _get_document(self) -> cdp.dom.Node:
+        """the whole document, from the dom mirror when enabled"""
+        if self.dom_mirror is not None:
+            return await self.dom_mirror.get_document()
+        return await self.send(cdp.dom.get_document(-1, True))
+
+    def _node_index(self, doc: Union[cdp.dom.Node, element.Element]) -> NodeIndex:
+        """the index of a fetched document, or of the node of an element"""
+        node = doc.node if isinstance(doc, element.Element) else doc
+        mirror = self.dom_mirror
+        if mirror is not None and mirror.index is not None and node is mirror.document:
+            return mirror.index
+        return NodeIndex(node)
+
+    async def _disable_dom(self):
+        # the dom mirror needs the events of the DOM domain
+        if self.dom_mirror is None:
+            await self.send(cdp.dom.disable())
+
     async def query_selector_all(
         self,
         selector: str,
@@ -362,7 +444,7 @@ class Tab(Connection):
         """
 
         if not _node:
-            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+            doc: cdp.dom.Node = await self._get_document()
         else:
             doc = _node
             if _node.node_name == "IFRAME":
@@ -388,19 +470,23 @@ class Tab(Connection):
                     )
                     return await self.query_selector_all(selector, _node)
             else:
-                await self.send(cdp.dom.disable())
+                if "could not find node" in e.message.lower():
+                    # the document changed since it was fetched, callers retry
+                    return []
+                await self._disable_dom()
                 raise
         if not node_ids:
             return []
         items = []
+        index = self._node_index(doc)
 
         for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
-            # we pass along the retrieved document tree,
+            node = index.node(nid)
+            # we pass along the retrieved document tree and its index,
             # to improve performance
             if not node:
                 continue
-            elem = element.create(node, self, doc)
+            elem = element.create(node, self, doc, index)
             items.append(elem)
 
         return items
@@ -421,7 +507,7 @@ class Tab(Connection):
         selector = selector.strip()
 
         if not _node:
-            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+            doc: cdp.dom.Node = await self._get_document()
         else:
             doc = _node
             if _node.node_name == "IFRAME":
@@ -445,14 +531,18 @@ class Tab(Connection):
                     )
                     return await self.query_selector(selector, _node)
             else:
-                await self.send(cdp.dom.disable())
+                if "could not find node" in e.message.lower():
+                    # the document changed since it was fetched, callers retry
+                    return
+                await self._disable_dom()
                 raise
         if not node_id:
             return
-        node = util.filter_recurse(doc, lambda n: n.node_id == node_id)
+        index = self._node_index(doc)
+        node = index.node(node_id)
         if not node:
             return
-        return element.create(node, self, doc)
+        return element.create(node, self, doc, index)
 
     async def find_elements_by_text(
         self,
@@ -464,6 +554,14 @@ class Tab(Connection):
         please note: this may (or will) also return any other element (like inline scripts),
         which happen to contain that text.
 
+        the search runs in the page, see :py:mod:`zendriver.core.text_search`. it
+        descends into open shadow roots and same-origin iframes, and like
+        ``DOM.performSearch`` a css selector or xpath expression also matches the
+        elements it selects. the elements come with their direct children and their
+        ancestors (.parent, .parent.parent, ...), but not the rest of the document:
+        unless the dom mirror is enabled, ``await element.update()`` is needed to browse
+        the siblings or descendants further down.
+
         :param text:
         :type text:
         :param tag_hint: when provided, narrows down search to only elements which match given tag eg: a, div, script, span
@@ -472,72 +570,13 @@ class Tab(Connection):
         :rtype:
         """
         text = text.strip()
-        doc = await self.send(cdp.dom.get_document(-1, True))
-        search_id, nresult = await self.send(cdp.dom.perform_search(text, True))
-        if nresult:
-            node_ids = await self.send(
-                cdp.dom.get_search_results(search_id, 0, nresult)
-            )
-        else:
-            node_ids = []
-
-        await self.send(cdp.dom.discard_search_results(search_id))
-
-        items = []
-        for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
-            if not node:
-                node = await self.send(cdp.dom.resolve_node(node_id=nid))
-                if not node:
-                    continue
-                # remote_object = await self.send(cdp.dom.resolve_node(backend_node_id=node.backend_node_id))
-                # node_id = await self.send(cdp.dom.request_node(object_id=remote_object.object_id))
-            try:
-                elem = element.create(node, self, doc)
-            except:  # noqa
-                continue
-            if elem.node_type == 3:
-                # if found element is a text node (which is plain text, and useless for our purpose),
-                # we return the parent element of the node (which is often a tag which can have text between their
-                # opening and closing tags (that is most tags, except for example "img" and "video", "br")
-
-                if not elem.parent:
-                    # check if parent actually has a parent and update it to be absolutely sure
-                    await elem.update()
-
-                items.append(
-                    elem.parent or elem
-                )  # when it really has no parent, use the text node itself
-                continue
-            else:
-                # just add the element itself
-                items.append(elem)
-
-        # since we already fetched the entire doc, including shadow and frames
-        # let's also search through the iframes
-        iframes = util.filter_recurse_all(doc, lambda node: node.node_name == "IFRAME")
-        if iframes:
-            iframes_elems = [
-                element.create(iframe, self, iframe.content_document)
-                for iframe in iframes
-            ]
-            for iframe_elem in iframes_elems:
-                if iframe_elem.content_document:
-                    iframe_text_nodes = util.filter_recurse_all(
-                        iframe_elem,
-                        lambda node: node.node_type == 3  # noqa
-                        and text.lower() in node.node_value.lower(),
-                    )
-                    if iframe_text_nodes:
-                        iframe_text_elems = [
-                            element.create(text_node, self, iframe_elem.tree)
-                            for text_node in iframe_text_nodes
-                        ]
-                        items.extend(
-                            text_node.parent for text_node in iframe_text_elems
-                        )
-        await self.send(cdp.dom.disable())
-        return items or []
+        found = await text_search.find_text_with_ancestors(
+            self, text, text_search.ALL, tag_hint
+        )
+        return await self._elements(
+            [backend_node_id for backend_node_id, _ in found],
+            ancestor_ids=[ancestor_ids for _, ancestor_ids in found],
+        )
 
     async def find_element_by_text(
         self,
@@ -548,10 +587,13 @@ class Tab(Connection):
         """
         finds and returns the first element containing <text>, or best match
 
+        the search runs in the page, see :py:mod:`zendriver.core.text_search`, and only the
+        element found and its ancestors are fetched, like for
+        :py:meth:`find_elements_by_text`.
+
         :param text:
         :type text:
-        :param best_match:  when True, which is MUCH more expensive (thus much slower),
-                            will find the closest match based on length.
+        :param best_match:  when True, will find the closest match based on length.
                             this could help tremendously, when for example you search for "login", you'd probably want the login button element,
                             and not thousands of scripts,meta,headings containing a string of "login".
 
@@ -561,76 +603,203 @@ class Tab(Connection):
         :return:
         :rtype:
         """
-        doc = await self.send(cdp.dom.get_document(-1, True))
         text = text.strip()
-        search_id, nresult = await self.send(cdp.dom.perform_search(text, True))
+        mode = text_search.BEST if best_match else text_search.FIRST
+        found = await text_search.find_text_with_ancestors(self, text, mode)
+        items = await self._elements(
+            [backend_node_id for backend_node_id, _ in found],
+            ancestor_ids=[ancestor_ids for _, ancestor_ids in found],
+        )
+        if not items:
+            return None
+        return items[0]
 
-        node_ids = await self.send(cdp.dom.get_search_results(search_id, 0, nresult))
-        await self.send(cdp.dom.discard_search_results(search_id))
+    async def _elements(
+        self,
+        backend_node_ids: Sequence[cdp.dom.BackendNodeId],
+        depth: Optional[int] = None,
+        ancestor_ids: Optional[Sequence[Sequence[cdp.dom.BackendNodeId]]] = None,
+    ) -> List[element.Element]:
+        """
+        the elements of nodes by backend node id, leaving out the nodes which are no
+        longer in the page. they are taken from the dom mirror when it is enabled, the
+        others are described by the browser (with <depth> levels of children) in a single
+        round trip.
+
+        <ancestor_ids> are the backend node ids of the ancestors of the nodes, the parent
+        first, which are described in the same round trip and chained as the .parent of
+        the elements which are not in the dom mirror.
+        """
+        nodes: List[Optional[cdp.dom.Node]] = [None] * len(backend_node_ids)
+        doc: Optional[cdp.dom.Node] = None
+        index: Optional[NodeIndex] = None
+        if self.dom_mirror is not None:
+            doc = await self.dom_mirror.get_document()
+            index = self._node_index(doc)
+            for i, backend_node_id in enumerate(backend_node_ids):
+                if backend_node_id == doc.backend_node_id:
+                    nodes[i] = doc
+                else:
+                    nodes[i] = index.backend_node(backend_node_id)
+        in_mirror = [node is not None for node in nodes]
+        missing = [i for i, node in enumerate(nodes) if node is None]
+        ancestors: Dict[cdp.dom.BackendNodeId, Optional[cdp.dom.Node]] = {}
+        if ancestor_ids is not None:
+            for i in missing:
+                for ancestor_id in ancestor_ids[i]:
+                    ancestors[ancestor_id] = None
+        if missing:
+            results = await self.send_many(
+                *(
+                    cdp.dom.describe_node(
+                        backend_node_id=backend_node_ids[i],
+                        depth=depth,
+                        pierce=True if depth is not None else None,
+                    )
+                    for i in missing
+                ),
+                *(
+                    cdp.dom.describe_node(backend_node_id=ancestor_id)
+                    for ancestor_id in ancestors
+                ),
+            )
+            for i, result in zip(missing, results):
+                if isinstance(result, cdp.dom.Node):
+                    nodes[i] = result
+            for ancestor_id, result in zip(ancestors, results[len(missing) :]):
+                if isinstance(result, cdp.dom.Node):
+                    ancestors[ancestor_id] = result
+        # the elements of the ancestors, shared by the nodes which have them in common
+        created: Dict[cdp.dom.BackendNodeId, element.Element] = {}
+
+        def parent_of(i: int) -> Optional[element.Element]:
+            if ancestor_ids is None:
+                return None
+            parent = None
+            # from the top down, so every ancestor is created with its own parent.
+            # an ancestor which is gone breaks the chain above it.
+            for ancestor_id in reversed(ancestor_ids[i]):
+                node = ancestors.get(ancestor_id)
+                if node is None:
+                    parent = None
+                elif ancestor_id in created:
+                    parent = created[ancestor_id]
+                else:
+                    parent = created[ancestor_id] = element.create(
+                        node, self, parent=parent
+                    )
+            return parent
 
-        if not node_ids:
-            node_ids = []
         items = []
-        for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
-            try:
-                elem = element.create(node, self, doc)
-            except:  # noqa
+        for i, (node, mirrored) in enumerate(zip(nodes, in_mirror)):
+            if node is None:
                 continue
-            if elem.node_type == 3:
-                # if found element is a text node (which is plain text, and useless for our purpose),
-                # we return the parent element of the node (which is often a tag which can have text between their
-                # opening and closing tags (that is most tags, except for example "img" and "video", "br")
-
-                if not elem.parent:
-                    # check if parent actually has a parent and update it to be absolutely sure
-                    await elem.update()
-
-                items.append(
-                    elem.parent or elem
-                )  # when it really has no parent, use the text node itself
+            if mirrored:
+                items.append(element.create(node, self, doc, index))
                 continue
-            else:
-                # just add the element itself
-                items.append(elem)
-
-        # since we already fetched the entire doc, including shadow and frames
-        # let's also search through the iframes
-        iframes = util.filter_recurse_all(doc, lambda node: node.node_name == "IFRAME")
-        if iframes:
-            iframes_elems = [
-                element.create(iframe, self, iframe.content_document)
-                for iframe in iframes
-            ]
-            for iframe_elem in iframes_elems:
-                iframe_text_nodes = util.filter_recurse_all(
-                    iframe_elem,
-                    lambda node: node.node_type == 3  # noqa
-                    and text.lower() in node.node_value.lower(),
-                )
-                if iframe_text_nodes:
-                    iframe_text_elems = [
-                        element.create(text_node, self, iframe_elem.tree)
-                        for text_node in iframe_text_nodes
-                    ]
-                    items.extend(text_node.parent for text_node in iframe_text_elems)
-        try:
-            if not items:
-                return
-            if best_match:
-                closest_by_length = min(
-                    items, key=lambda el: abs(len(text) - len(el.text_all))
+            items.append(element.create(node, self, parent=parent_of(i)))
+        return items
+
+    async def apply_all(
+        self, elements: Sequence[element.Element], js_function: str
+    ) -> List[typing.Any]:
+        """
+        like :py:meth:`Element.apply`, for many elements at once: the elements are
+        resolved in a single round trip, and js_function is called for all of them by a
+        single function call in the page.
+
+        .. code-block::
+
+            links = await tab.select_all("a")
+            urls = await tab.apply_all(links, "(a) => a.href")
+            visible = await tab.apply_all(links, "(a) => a.checkVisibility()")
+            await tab.apply_all(buttons, "(button) => button.click()")
+
+        :param elements: the elements
+        :param js_function: the js function which receives an element, eg. '(e) => e.value'.
+                            a returned promise is awaited.
+        :return: the json serializable result for every element, in order. for an element
+                 which is no longer in the page, or for which js_function throws, a
+                 ProtocolException is in place of its result.
+        """
+        if not elements:
+            return []
+        group = "zendriver-apply-all-%d" % next(_object_groups)
+        results: List[typing.Any] = await self.send_many(
+            *(
+                cdp.dom.resolve_node(
+                    backend_node_id=elem.backend_node_id, object_group=group
                 )
-                elem = closest_by_length or items[0]
+                for elem in elements
+            )
+        )
+        resolved = [
+            i
+            for i, result in enumerate(results)
+            if isinstance(result, cdp.runtime.RemoteObject) and result.object_id
+        ]
+        object_ids = [results[i].object_id for i in resolved]
+        function_declaration = (
+            """
+            async function (...elements) {
+                const apply = (%s);
+                return Promise.all(elements.map(async (element) => {
+                    try {
+                        return {value: await apply(element)};
+                    } catch (e) {
+                        return {error: String(e)};
+                    }
+                }));
+            }
+            """
+            % js_function
+        )
 
-                return elem
-            else:
-                # naively just return the first result
-                for elem in items:
-                    if elem:
-                        return elem
+        def call(ids: List[cdp.runtime.RemoteObjectId]):
+            return cdp.runtime.call_function_on(
+                function_declaration,
+                object_id=ids[0],
+                arguments=[cdp.runtime.CallArgument(object_id=id_) for id_ in ids],
+                await_promise=True,
+                return_by_value=True,
+                user_gesture=True,
+            )
+
+        try:
+            if not object_ids:
+                return results
+            try:
+                calls = [await self.send(call(object_ids))]
+            except ProtocolException as e:
+                if isinstance(e, (CommandTimeoutException, ConnectionClosedException)):
+                    raise
+                # the elements are in the documents of different frames, which can't
+                # be passed to one call. call for each, still in a single round trip.
+                logger.debug("apply_all: calling for each element: %s", e)
+                calls = await self.send_many(*(call([id_]) for id_ in object_ids))
+            outcomes: List[typing.Any] = []
+            for outcome in calls:
+                if isinstance(outcome, ProtocolException):
+                    outcomes.append({"error": outcome})
+                    continue
+                remote_object, errors = outcome
+                if errors:
+                    # eg. a syntax error in js_function
+                    raise ProtocolException(errors)
+                outcomes.extend(remote_object.value)
+            for i, outcome in zip(resolved, outcomes):
+                if "error" in outcome:
+                    error = outcome["error"]
+                    results[i] = (
+                        error
+                        if isinstance(error, ProtocolException)
+                        else ProtocolException(error)
+                    )
+                else:
+                    results[i] = outcome.get("value")
+            return results
         finally:
-            await self.send(cdp.dom.disable())
+            self.feed_cdp(cdp.runtime.release_object_group(group))
 
     async def back(self):
         """
@@ -691,9 +860,11 @@ class Tab(Connection):
 
     async def js_dumps(
         self, obj_name: str, return_by_value: Optional[bool] = True
-    ) -> typing.Union[
-        typing.Dict,
-        typing.Tuple[cdp.runtime.RemoteObject, cdp.runtime.ExceptionDetails],
+    ) -> typing.Optional[
+        typing.Union[
+            typing.Dict,
+            typing.Tuple[cdp.runtime.RemoteObject, cdp.runtime.ExceptionDetails],
+        ]
     ]:
         """
         dump given js object with its properties and values as a dict
@@ -864,8 +1035,8 @@ class Tab(Connection):
         if return_by_value:
             if remote_object.value:
                 return remote_object.value
-        else:
-            return remote_object, exception_details
+            return None
+        return remote_object, exception_details
 
     async def close(self):
         """
@@ -874,7 +1045,13 @@ class Tab(Connection):
         :rtype:
         """
         if self.target and self.target.target_id:
-            await self.send(cdp.target.close_target(target_id=self.target.target_id))
+            try:
+                await self.send(
+                    cdp.target.close_target(target_id=self.target.target_id)
+                )
+            except ConnectionClosedException:
+                # the target may close its connection before it responds
+                pass
 
     async def get_window(self) -> Tuple[cdp.browser.WindowID, cdp.browser.Bounds]:
         """
@@ -893,11 +1070,91 @@ class Tab(Connection):
         :return:
         :rtype:
         """
-        doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+        doc: cdp.dom.Node = await self._get_document()
         return await self.send(
             cdp.dom.get_outer_html(backend_node_id=doc.backend_node_id)
         )
 
+    async def snapshot(
+        self, computed_styles: Sequence[str] = COMPUTED_STYLES
+    ) -> Snapshot:
+        """
+        takes a snapshot of all documents of the page (including iframes) in a single
+        round trip, using DOMSnapshot.captureSnapshot: node types, names, values,
+        attributes, layout bounds and computed styles, as columns over a shared table
+        of strings. see :py:class:`~zendriver.core.snapshot.Snapshot`.
+
+        .. code-block::
+
+            snapshot = await tab.snapshot()
+            for i in snapshot.find(tag="a", visible=True):
+                print(snapshot.text(i), snapshot.attribute(i, "href"))
+
+        :param computed_styles: the computed styles to capture for every node with a layout box
+        :type computed_styles: Sequence[str]
+        :return: the snapshot
+        :rtype: Snapshot
+        """
+        # the raw result; parsing it into cdp objects would wrap every single entry
+        result = await self.send(
+            _command(
+                "DOMSnapshot.captureSnapshot",
+                {"computedStyles": list(computed_styles)},
+            )
+        )
+        return Snapshot(result["documents"], result["strings"], computed_styles, self)
+
+    async def extract(
+        self, schema: Dict[str, typing.Any]
+    ) -> List[Dict[str, typing.Any]]:
+        """
+        extracts records from the page with a declarative schema, in a single round trip:
+        the schema is run by one function in the page, which returns plain json.
+        see :py:mod:`~zendriver.core.extraction` for the schema.
+
+        .. code-block::
+
+            products = await tab.extract(
+                {
+                    "selector": ".product",
+                    "fields": {
+                        "title": "h2",
+                        "url": {"selector": "a", "property": "href"},
+                        "tags": {"selector": ".tag", "all": True},
+                    },
+                }
+            )
+
+        :param schema: the schema
+        :type schema: dict
+        :return: a record for every match of the selector of the schema, in document order
+        :rtype: List[dict]
+        :raises ValueError: when the schema is invalid
+        """
+        return await extraction.extract(self, schema)
+
+    async def extract_iter(
+        self, schema: Dict[str, typing.Any], batch_size: int = extraction.BATCH_SIZE
+    ) -> AsyncIterator[Dict[str, typing.Any]]:
+        """
+        like :py:meth:`extract`, for very large result sets: yields the records, which are
+        fetched in batches of <batch_size>, one round trip each. the next batch is fetched
+        while the records of the current one are processed.
+
+        .. code-block::
+
+            async for product in tab.extract_iter(schema):
+                print(product["title"])
+
+        :param schema: the schema, see :py:mod:`~zendriver.core.extraction`
+        :type schema: dict
+        :param batch_size: the number of records of a batch
+        :type batch_size: int
+        """
+        async for records in extraction.extract_batches(self, schema, batch_size):
+            for record in records:
+                yield record
+
     async def maximize(self):
         """
         maximize page/tab/window
@@ -1085,30 +1342,23 @@ class Tab(Connection):
         :return:
         :rtype: Element
         :raises: asyncio.TimeoutError
+        :raises ValueError: when neither selector nor text is given
         """
-        loop = asyncio.get_running_loop()
-        now = loop.time()
         if selector:
-            item = await self.query_selector(selector)
-            while not item:
-                item = await self.query_selector(selector)
-                if loop.time() - now > timeout:
-                    raise asyncio.TimeoutError(
-                        "time ran out while waiting for %s" % selector
-                    )
-                await self.sleep(0.5)
-                # await self.sleep(0.5)
-            return item
+            return await self._wait_for(
+                lambda: self.query_selector(selector),
+                waiter.selector_check(selector),
+                timeout,
+                "time ran out while waiting for %s" % selector,
+            )
         if text:
-            item = await self.find_element_by_text(text)
-            while not item:
-                item = await self.find_element_by_text(text)
-                if loop.time() - now > timeout:
-                    raise asyncio.TimeoutError(
-                        "time ran out while waiting for text: %s" % text
-                    )
-                await self.sleep(0.5)
-            return item
+            return await self._wait_for(
+                lambda: self.find_element_by_text(text),
+                waiter.text_check(text),
+                timeout,
+                "time ran out while waiting for text: %s" % text,
+            )
+        raise ValueError("either selector or text must be given")
 
     async def download_file(self, url: str, filename: Optional[PathLike] = None):
         """
@@ -1130,44 +1380,7 @@ class Tab(Connection):
             filename = url.rsplit("/")[-1]
             filename = filename.split("?")[0]
 
-        code = """
-         (elem) => {
-            async function _downloadFile(
-              imageSrc,
-              nameOfDownload,
-            ) {
-              const response = await fetch(imageSrc);
-              const blobImage = await response.blob();
-              const href = URL.createObjectURL(blobImage);
-
-              const anchorElement = document.createElement('a');
-              anchorElement.href = href;
-              anchorElement.download = nameOfDownload;
-
-              document.body.appendChild(anchorElement);
-              anchorElement.click();
-
-              setTimeout(() => {
-                document.body.removeChild(anchorElement);
-                window.URL.revokeObjectURL(href);
-                }, 500);
-            }
-            _downloadFile('%s', '%s')
-            }
-            """ % (
-            url,
-            filename,
-        )
-
-        body = (await self.query_selector_all("body"))[0]
-        await body.update()
-        await self.send(
-            cdp.runtime.call_function_on(
-                code,
-                object_id=body.object_id,
-                arguments=[cdp.runtime.CallArgument(object_id=body.object_id)],
-            )
-        )
+        await self.isolated_world.call("downloadFile", url, str(filename))
 
     async def save_screenshot(
         self,
@@ -1339,19 +1552,19 @@ class Tab(Connection):
         # there must be a better way...
         origin = "/".join(self.url.split("/", 3)[:-1])
 
-        await asyncio.gather(
-            *[
-                self.send(
-                    cdp.dom_storage.set_dom_storage_item(
-                        storage_id=cdp.dom_storage.StorageId(
-                            is_local_storage=True, security_origin=origin
-                        ),
-                        key=str(key),
-                        value=str(val),
-                    )
+        storage_id = cdp.dom_storage.StorageId(
+            is_local_storage=True, security_origin=origin
+        )
+        await self.send_many(
+            *(
+                cdp.dom_storage.set_dom_storage_item(
+                    storage_id=storage_id,
+                    key=str(key),
+                    value=str(val),
                 )
                 for key, val in items.items()
-            ]
+            ),
+            return_exceptions=False,
         )
 
     def __call__(
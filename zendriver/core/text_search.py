@@ -0,0 +1,201 @@
+"""
+finds nodes by text in the page itself, with a single call of the library of
+:py:mod:`zendriver.core.isolated_world`.
+
+the script walks the document with a TreeWalker, descending into open shadow roots and
+the documents of same-origin iframes, and matches like ``DOM.performSearch`` does: the
+text of text nodes, and the names and attribute names and values of elements, case
+insensitive. a text node matches as its enclosing element. a query which is a css
+selector or an xpath expression also matches the elements it selects, after the text
+matches.
+
+the nodes are sent back with deep serialization, which includes their backend node id,
+so nothing of the document is transferred but the ids of the matches, and only the
+matches are turned into elements.
+"""
+
+from __future__ import annotations
+
+import typing
+from typing import Dict, List, Optional, Tuple
+
+from .. import cdp
+
+if typing.TYPE_CHECKING:
+    from .tab import Tab
+
+#: return every match, in document order
+ALL = "all"
+#: return the first match
+FIRST = "first"
+#: return the match whose text length is closest to the length of the text searched for
+BEST = "best"
+
+SCRIPT = """
+(query, mode, tag) => {
+    const needle = query.toLowerCase();
+    const contains = (value) => value != null && value.toLowerCase().includes(needle);
+    const show = NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT;
+    const found = new Set();
+    const matches = [];
+    const add = (node) => {
+        if (found.has(node)) return;
+        if (tag && node.localName !== tag) return;
+        found.add(node);
+        matches.push(node);
+    };
+    const matchesElement = (element) => {
+        if (contains(element.nodeName)) return true;
+        for (const attribute of element.attributes) {
+            if (contains(attribute.name) || contains(attribute.value)) return true;
+        }
+        return false;
+    };
+    // the documents and shadow roots walked, for the css selector and xpath matches
+    const roots = [];
+    // returns true when done
+    const walk = (root) => {
+        roots.push(root);
+        const walker = (root.ownerDocument || root).createTreeWalker(root, show);
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            if (node.nodeType === Node.TEXT_NODE) {
+                if (contains(node.data)) add(node.parentElement || node);
+            } else {
+                if (matchesElement(node)) add(node);
+                if (node.shadowRoot && walk(node.shadowRoot)) return true;
+                if (node.contentDocument && walk(node.contentDocument)) return true;
+            }
+            if (mode === "first" && matches.length) return true;
+        }
+        return false;
+    };
+    walk(document);
+    if (mode !== "first" || !matches.length) {
+        for (const root of roots) {
+            try {
+                for (const node of root.querySelectorAll(query)) add(node);
+            } catch (e) {}
+            if (root.nodeType === Node.DOCUMENT_NODE) {
+                try {
+                    const result = root.evaluate(
+                        query, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                    );
+                    for (let i = 0; i < result.snapshotLength; i++) {
+                        const node = result.snapshotItem(i);
+                        // text and attribute nodes match as their element
+                        const element = node.nodeType === Node.ELEMENT_NODE
+                            ? node : node.parentElement || node.ownerElement;
+                        if (element) add(element);
+                    }
+                } catch (e) {}
+            }
+            if (mode === "first" && matches.length) break;
+        }
+    }
+    if (mode !== "best" || matches.length < 2) {
+        return matches.slice(0, mode === "all" ? matches.length : 1);
+    }
+    // the length of the text of the descendants, joined by spaces, like Element.text_all
+    const textLength = (root) => {
+        let length = 0;
+        let count = 0;
+        const visit = (root) => {
+            const walker = (root.ownerDocument || root).createTreeWalker(root, show);
+            for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                if (node.nodeType === Node.TEXT_NODE) {
+                    length += node.data.length;
+                    count++;
+                } else if (node.shadowRoot) {
+                    visit(node.shadowRoot);
+                }
+            }
+        };
+        visit(root);
+        return length + Math.max(count - 1, 0);
+    };
+    let best = matches[0];
+    let distance = Infinity;
+    for (const node of matches) {
+        const d = Math.abs(query.length - textLength(node));
+        if (d < distance) {
+            best = node;
+            distance = d;
+        }
+    }
+    return [best];
+}
+"""
+
+
+async def find_text(
+    tab: Tab, text: str, mode: str = ALL, tag: Optional[str] = None
+) -> List[cdp.dom.BackendNodeId]:
+    """
+    returns the backend node ids of the nodes containing <text>
+
+    :param tab: the tab to search in
+    :param text: the text to search for, case insensitive
+    :param mode: ALL, FIRST or BEST
+    :param tag: when given, only elements with this tag name, eg. "a"
+    """
+    ids = await _call(tab, "findText", text, mode, tag)
+    return [backend_node_id for backend_node_id in ids if backend_node_id is not None]
+
+
+async def find_text_with_ancestors(
+    tab: Tab, text: str, mode: str = ALL, tag: Optional[str] = None
+) -> List[Tuple[cdp.dom.BackendNodeId, List[cdp.dom.BackendNodeId]]]:
+    """
+    like :py:func:`find_text`, returns the backend node ids of the nodes containing <text>,
+    each with the backend node ids of its ancestors, the parent first, up to the document
+    of the page. like in ``DOM.getDocument``, the parent of a shadow root is its host and
+    the parent of the document of a same-origin iframe is the iframe element.
+    """
+    ids = await _call(tab, "findTextWithAncestors", text, mode, tag)
+    found = []
+    chain: List[cdp.dom.BackendNodeId] = []
+    # every chain ends with null
+    for backend_node_id in ids:
+        if backend_node_id is not None:
+            chain.append(backend_node_id)
+            continue
+        if chain:
+            found.append((chain[0], chain[1:]))
+        chain = []
+    return found
+
+
+async def _call(
+    tab: Tab, function: str, text: str, mode: str, tag: Optional[str]
+) -> List[Optional[cdp.dom.BackendNodeId]]:
+    """the backend node ids of the nodes returned by <function> of the library"""
+    remote_object = await tab.isolated_world.call(
+        function,
+        text,
+        mode,
+        tag.lower() if tag else None,
+        return_by_value=False,
+        serialization_options=cdp.runtime.SerializationOptions(
+            serialization="deep",
+            additional_parameters={"maxNodeDepth": 0, "includeShadowTree": "none"},
+        ),
+    )
+    serialized = remote_object.deep_serialized_value
+    if serialized is None or not serialized.value:
+        return []
+    ids: List[Optional[cdp.dom.BackendNodeId]] = []
+    # a node met more than once has its value only in one place, the others refer to it
+    references: Dict[int, cdp.dom.BackendNodeId] = {}
+    for item in serialized.value:
+        backend_node_id = None
+        if item.get("type") == "node":
+            value = item.get("value", {})
+            reference = item.get("weakLocalObjectReference")
+            if "backendNodeId" in value:
+                backend_node_id = cdp.dom.BackendNodeId(value["backendNodeId"])
+                if reference is not None:
+                    references[reference] = backend_node_id
+            elif reference is not None:
+                backend_node_id = references.get(reference)
+        ids.append(backend_node_id)
+    return ids
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
 import types
 import typing
@@ -271,11 +272,22 @@ def compare_target_info(
     :return:
     :rtype:
     """
-    d1 = info1.__dict__
-    d2 = info2.__dict__
+    d1 = fields_dict(info1)
+    d2 = fields_dict(info2)
     return [(k, v, d2[k]) for (k, v) in d1.items() if d2[k] != v]
 
 
+def fields_dict(obj: typing.Any) -> typing.Dict[str, typing.Any]:
+    """
+    returns the fields of a cdp object and their values, like its __dict__ would.
+    the cdp types have __slots__ instead of a __dict__.
+
+    :param obj: instance of a cdp type, eg. cdp.target.TargetInfo
+    :return: field name => value
+    """
+    return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+
+
 def loop():
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
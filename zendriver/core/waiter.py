@@ -0,0 +1,126 @@
+"""
+waits in the page for a selector or text to match, instead of polling from python.
+
+a MutationObserver, in the isolated world of :py:mod:`zendriver.core.isolated_world`,
+re-evaluates a check whenever the document changes, and the
+``Runtime.callFunctionOn(awaitPromise=True)`` which installed it returns the moment the
+check is true. a recheck every second covers changes the observer doesn't see, in shadow
+roots and iframes. the wait ends early, returning False, when the document is replaced
+(eg. by a navigation), after which the caller queries the new document and waits again.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+from typing import Any, List, Tuple
+
+from .. import cdp
+from .connection import (
+    CommandTimeoutException,
+    ConnectionClosedException,
+    ProtocolException,
+)
+
+if typing.TYPE_CHECKING:
+    from .tab import Tab
+
+logger = logging.getLogger(__name__)
+
+#: the name of a check of CHECKS, and its arguments
+Check = Tuple[str, List[Any]]
+
+#: milliseconds between rechecks of changes the mutation observer doesn't see
+RECHECK_INTERVAL = 1000
+
+SCRIPT = """
+(check, timeout, initial, interval) => new Promise((resolve) => {
+    if (initial && check()) {
+        resolve(true);
+        return;
+    }
+    let timer = null;
+    let recheck = null;
+    const observer = new MutationObserver(() => {
+        if (check()) done(true);
+    });
+    const done = (result) => {
+        observer.disconnect();
+        clearTimeout(timer);
+        clearInterval(recheck);
+        resolve(result);
+    };
+    observer.observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true,
+    });
+    timer = setTimeout(() => done(false), timeout);
+    recheck = setInterval(() => {
+        if (check()) done(true);
+    }, interval);
+})
+"""
+
+
+#: the checks, which may use the findText function of the library
+CHECKS = """
+{
+    selector: (selector, includeFrames) => {
+        if (document.querySelector(selector) !== null) return true;
+        return includeFrames && [...document.querySelectorAll("iframe")].some(
+            (frame) => frame.contentDocument && frame.contentDocument.querySelector(selector) !== null
+        );
+    },
+    text: (query) => findText(query, "first", null).length > 0,
+}
+"""
+
+
+def selector_check(selector: str, include_frames: bool = False) -> Check:
+    """the check of a css selector, optionally also in the documents of same-origin iframes"""
+    return "selector", [selector, include_frames]
+
+
+def text_check(text: str) -> Check:
+    """the check of a text, matching like :py:mod:`zendriver.core.text_search`"""
+    return "text", [text]
+
+
+async def wait_until(tab: Tab, check: Check, timeout: float, initial=True) -> bool:
+    """
+    waits until <check> is true in the page of <tab>
+
+    :param tab: the tab
+    :param check: the check, evaluated on every change of the document
+    :param timeout: the number of seconds to wait at most
+    :param initial: whether to return at once when <check> is already true. when False,
+                    only a change of the document ends the wait.
+    :return: True when <check> became true, False when the timeout passed or the document
+             was replaced
+    :raises asyncio.TimeoutError: when the browser doesn't respond within the timeout
+    """
+    name, args = check
+    try:
+        remote_object = await tab.isolated_world.call(
+            "wait",
+            name,
+            args,
+            int(timeout * 1000),
+            initial,
+            RECHECK_INTERVAL,
+            await_promise=True,
+            # timers of background tabs may be throttled
+            timeout=timeout + 1,
+        )
+    except (CommandTimeoutException, ConnectionClosedException):
+        raise
+    except ProtocolException as e:
+        if e.args and isinstance(e.args[0], cdp.runtime.ExceptionDetails):
+            # thrown by the check, eg. an invalid selector
+            raise
+        # eg. "Execution context was destroyed." after a navigation
+        logger.debug("wait ended by: %s", e)
+        return False
+    return remote_object.value is True